@@ -0,0 +1,163 @@
+"""Alert write throughput: per-row ORM writes against the bulk repository paths.
+
+Seeds ``--stakeholders`` stakeholders in the Postgres at ``DATABASE_URL``,
+which must already be migrated (``alembic upgrade head``), then writes
+``--alerts`` alerts for them three ways: ORM ``add_all``, multi-row
+``INSERT`` and ``COPY``. It then moves them PENDING -> SENT -> DELIVERED,
+once with one ``UPDATE`` per row and once with ``id = ANY(...)`` chunks.
+Reports rows/second for each. The seeded rows are deleted afterwards.
+
+    python benchmarks/alert_bulk_writes.py --alerts 50000 --insert-chunk 5000 --update-chunk 10000
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import random
+import sys
+import time
+import uuid
+from collections.abc import Awaitable, Callable
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from sqlalchemy import delete, insert, select, update  # noqa: E402
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, create_async_engine  # noqa: E402
+
+from src.config import settings  # noqa: E402
+from src.models.alert import Alert, AlertPriority, AlertStatus, AlertType  # noqa: E402
+from src.models.stakeholder import Stakeholder, StakeholderType  # noqa: E402
+from src.repositories import AlertRepository, alert_row  # noqa: E402
+
+BENCH_JURISDICTION = "Bench Alerts, CO"
+
+
+def _alerts(stakeholder_ids: list[uuid.UUID], count: int) -> list[dict]:
+    return [
+        {
+            "id": str(uuid.uuid4()),
+            "stakeholder_id": str(random.choice(stakeholder_ids)),
+            "priority": random.choice(list(AlertPriority)).value,
+            "alert_type": random.choice(list(AlertType)).value,
+            "headline": "Benchmark alert",
+            "summary": "Summary. " * 20,
+            "related_project_ids": ["bench_proj_1"],
+            "recommended_actions": ["Review the change"],
+            "source_data": {"event_type": "policy_update", "topics": ["VAWA"]},
+        }
+        for _ in range(count)
+    ]
+
+
+async def _seed(engine: AsyncEngine, count: int) -> list[uuid.UUID]:
+    ids = [uuid.uuid4() for _ in range(count)]
+    async with engine.begin() as conn:
+        await conn.execute(
+            insert(Stakeholder),
+            [
+                {
+                    "id": sid,
+                    "stakeholder_type": StakeholderType.DEVELOPER,
+                    "organization": f"Bench Org {n}",
+                    "jurisdiction": BENCH_JURISDICTION,
+                    "interests": [],
+                    "notification_channels": ["email"],
+                }
+                for n, sid in enumerate(ids)
+            ],
+        )
+    return ids
+
+
+async def _clear_alerts(engine: AsyncEngine) -> None:
+    bench = select(Stakeholder.id).where(Stakeholder.jurisdiction == BENCH_JURISDICTION)
+    async with engine.begin() as conn:
+        await conn.execute(delete(Alert).where(Alert.stakeholder_id.in_(bench)))
+
+
+async def _cleanup(engine: AsyncEngine) -> None:
+    await _clear_alerts(engine)
+    async with engine.begin() as conn:
+        await conn.execute(
+            delete(Stakeholder).where(Stakeholder.jurisdiction == BENCH_JURISDICTION)
+        )
+
+
+async def _timed(label: str, rows: int, work: Callable[[], Awaitable[object]]) -> None:
+    start = time.perf_counter()
+    await work()
+    elapsed = time.perf_counter() - start
+    print(f"  {label:<28} {rows:>8} rows  {elapsed:8.3f} s  {rows / elapsed:>10,.0f} rows/s")
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--alerts", type=int, default=50_000)
+    parser.add_argument("--stakeholders", type=int, default=1_000)
+    parser.add_argument("--insert-chunk", type=int, default=settings.alert_insert_chunk_size)
+    parser.add_argument("--update-chunk", type=int, default=settings.alert_update_chunk_size)
+    args = parser.parse_args()
+
+    engine = create_async_engine(settings.database_url)
+    stakeholder_ids = await _seed(engine, args.stakeholders)
+    try:
+        print(f"insert {args.alerts} alerts (chunks of {args.insert_chunk}):")
+        alerts = _alerts(stakeholder_ids, args.alerts)
+
+        async def _orm() -> None:
+            async with AsyncSession(engine) as session:
+                session.add_all(alert_row(alert) for alert in alerts)
+                await session.commit()
+
+        await _timed("ORM add_all", len(alerts), _orm)
+        for method in ("values", "copy"):
+            await _clear_alerts(engine)
+
+            async def _bulk(method: str = method) -> None:
+                async with AsyncSession(engine) as session:
+                    await AlertRepository(session).insert_many(
+                        alerts, method=method, chunk_size=args.insert_chunk
+                    )
+
+            await _timed(f"insert_many ({method})", len(alerts), _bulk)
+
+        ids = [uuid.UUID(alert["id"]) for alert in alerts]
+        print(f"status transitions PENDING -> SENT -> DELIVERED (chunks of {args.update_chunk}):")
+
+        async def _per_row() -> None:
+            async with AsyncSession(engine) as session:
+                for status in (AlertStatus.SENT, AlertStatus.DELIVERED):
+                    for alert_id in ids:
+                        await session.execute(
+                            update(Alert).where(Alert.id == alert_id).values(status=status)
+                        )
+                    await session.commit()
+
+        async def _set_based() -> None:
+            async with AsyncSession(engine) as session:
+                repo = AlertRepository(session)
+                for previous, status in (
+                    (AlertStatus.PENDING, AlertStatus.SENT),
+                    (AlertStatus.SENT, AlertStatus.DELIVERED),
+                ):
+                    await repo.set_status(
+                        ids, status, from_status=previous, chunk_size=args.update_chunk
+                    )
+
+        await _timed("UPDATE per row", 2 * len(ids), _per_row)
+        async with engine.begin() as conn:
+            await conn.execute(
+                update(Alert)
+                .where(Alert.stakeholder_id.in_(stakeholder_ids))
+                .values(status=AlertStatus.PENDING)
+            )
+        await _timed("UPDATE ... id = ANY(...)", 2 * len(ids), _set_based)
+    finally:
+        await _cleanup(engine)
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
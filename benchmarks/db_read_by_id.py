@@ -0,0 +1,134 @@
+"""Read-by-id latency for ``GET /api/v1/content/{id}`` under concurrency.
+
+Seeds ``--rows`` content rows in the Postgres at ``DATABASE_URL``, which
+must already be migrated (``alembic upgrade head``), then sends requests
+in-process with ``--concurrency`` in flight. Each run uses either an
+engine with SQLAlchemy's default pool (5 + 10 overflow) and statement
+cache, or one built from the ``DB_*`` settings. Reports p50/p99 latency for each. The
+seeded rows are deleted afterwards.
+
+    python benchmarks/db_read_by_id.py --requests 5000 --concurrency 50
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import random
+import statistics
+import sys
+import time
+import uuid
+from collections.abc import AsyncIterator
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from httpx import ASGITransport, AsyncClient  # noqa: E402
+from sqlalchemy import delete  # noqa: E402
+from sqlalchemy.ext.asyncio import (  # noqa: E402
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
+
+from src.api.dependencies import get_repositories  # noqa: E402
+from src.api.endpoints import app  # noqa: E402
+from src.config import settings  # noqa: E402
+from src.database import engine_options  # noqa: E402
+from src.models.content import Content  # noqa: E402
+from src.repositories import Repositories, content_row  # noqa: E402
+
+
+def _percentile(values: list[float], pct: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct))]
+
+
+async def _seed(engine: AsyncEngine, rows: int) -> list[uuid.UUID]:
+    ids = [uuid.uuid4() for _ in range(rows)]
+    async with AsyncSession(engine) as session:
+        session.add_all(
+            content_row(
+                {
+                    "id": content_id,
+                    "content_type": "Policy_Brief",
+                    "audience": "City_Council",
+                    "jurisdiction": "Denver, CO",
+                    "headline": f"Benchmark brief {n}",
+                    "body": "Body text. " * 200,
+                    "source_data": {"friction_scores": [847, 623, 501]},
+                }
+            )
+            for n, content_id in enumerate(ids)
+        )
+        await session.commit()
+    return ids
+
+
+async def _cleanup(engine: AsyncEngine, ids: list[uuid.UUID]) -> None:
+    async with engine.begin() as conn:
+        await conn.execute(delete(Content).where(Content.id.in_(ids)))
+
+
+async def _run(
+    engine: AsyncEngine, ids: list[uuid.UUID], total: int, concurrency: int
+) -> list[float]:
+    sessions = async_sessionmaker(engine, expire_on_commit=False)
+
+    async def _repositories() -> AsyncIterator[Repositories]:
+        async with sessions() as session:
+            yield Repositories(session)
+
+    app.dependency_overrides[get_repositories] = _repositories
+    latencies: list[float] = []
+    limit = asyncio.Semaphore(concurrency)
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://bench") as client:
+
+        async def _one() -> None:
+            async with limit:
+                start = time.perf_counter()
+                resp = await client.get(f"/api/v1/content/{random.choice(ids)}")
+                latencies.append(time.perf_counter() - start)
+                resp.raise_for_status()
+
+        # Warm the pool and statement caches before measuring.
+        await asyncio.gather(*(_one() for _ in range(concurrency)))
+        latencies.clear()
+        await asyncio.gather(*(_one() for _ in range(total)))
+    app.dependency_overrides.pop(get_repositories, None)
+    return latencies
+
+
+def _report(label: str, latencies: list[float]) -> None:
+    print(
+        f"  {label:<10} p50 {statistics.median(latencies) * 1000:7.3f} ms   "
+        f"p99 {_percentile(latencies, 0.99) * 1000:7.3f} ms"
+    )
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=5000)
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--rows", type=int, default=1000)
+    args = parser.parse_args()
+
+    tuned = create_async_engine(settings.database_url, **engine_options(settings.database_url))
+    default = create_async_engine(settings.database_url)
+    ids = await _seed(tuned, args.rows)
+    try:
+        print(
+            f"GET /api/v1/content/{{id}}, {args.requests} requests, {args.concurrency} in flight:"
+        )
+        _report("default", await _run(default, ids, args.requests, args.concurrency))
+        _report("tuned", await _run(tuned, ids, args.requests, args.concurrency))
+    finally:
+        await _cleanup(tuned, ids)
+        await default.dispose()
+        await tuned.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,144 @@
+"""Page latency by depth: ``OFFSET`` pagination against keyset cursors.
+
+Seeds ``--rows`` content rows in the Postgres at ``DATABASE_URL``, which must
+already be migrated (``alembic upgrade head``). Their jurisdiction starts
+with ``Bench``. For each ``--depths`` page number the script times fetching
+that page of ``GET /api/v1/content``'s default projection two ways: with
+``OFFSET`` and with ``ContentRepository.page`` from the cursor of the page
+before. It reports p50/p99 for each. The seeded rows are deleted afterwards.
+
+    python benchmarks/keyset_pagination.py --rows 200000 --limit 50 --depths 1 100 1000 3000
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import random
+import statistics
+import sys
+import time
+import uuid
+from collections.abc import Awaitable, Callable
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from sqlalchemy import delete, insert, select, text  # noqa: E402
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, create_async_engine  # noqa: E402
+
+from src.api.endpoints import CONTENT_LIST_FIELDS  # noqa: E402
+from src.config import settings  # noqa: E402
+from src.models.content import AudienceType, Content, ContentStatus, ContentType  # noqa: E402
+from src.repositories import ContentRepository, encode_cursor  # noqa: E402
+
+JURISDICTION = "Bench Pages, CO"
+CHUNK = 5000
+
+
+def _percentile(values: list[float], pct: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct))]
+
+
+async def _seed(engine: AsyncEngine, rows: int) -> None:
+    start = datetime.now(timezone.utc)
+    values = [
+        {
+            "id": uuid.uuid4(),
+            "content_type": random.choice(list(ContentType)),
+            "audience": random.choice(list(AudienceType)),
+            "jurisdiction": JURISDICTION,
+            "headline": f"Benchmark content {n}",
+            "body": "Body text. " * 200,
+            "status": ContentStatus.DRAFT,
+            "version": 1,
+            "source_data": {"friction_scores": [847, 623, 501]},
+            "created_at": start - timedelta(seconds=n),
+        }
+        for n in range(rows)
+    ]
+    async with engine.begin() as conn:
+        for offset in range(0, rows, CHUNK):
+            await conn.execute(insert(Content), values[offset : offset + CHUNK])
+        await conn.execute(text("ANALYZE content"))
+
+
+async def _time(runs: int, query: Callable[[], Awaitable[object]]) -> list[float]:
+    latencies = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        await query()
+        latencies.append(time.perf_counter() - start)
+    return latencies
+
+
+def _report(label: str, latencies: list[float]) -> None:
+    print(
+        f"    {label:<7} p50 {statistics.median(latencies) * 1000:8.3f} ms   "
+        f"p99 {_percentile(latencies, 0.99) * 1000:8.3f} ms"
+    )
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=200_000)
+    parser.add_argument("--limit", type=int, default=50)
+    parser.add_argument("--depths", type=int, nargs="+", default=[1, 100, 1000, 3000])
+    parser.add_argument("--runs", type=int, default=50)
+    args = parser.parse_args()
+
+    engine = create_async_engine(settings.database_url)
+    await _seed(engine, args.rows)
+    columns = [Content.__table__.c[name] for name in CONTENT_LIST_FIELDS]
+    try:
+        async with AsyncSession(engine) as session:
+            repo = ContentRepository(session)
+            for depth in args.depths:
+                offset = (depth - 1) * args.limit
+                if offset >= args.rows:
+                    continue
+                cursor = None
+                if offset:
+                    # The cursor the previous page would have handed out.
+                    last = (
+                        await session.execute(
+                            select(Content.created_at, Content.id)
+                            .where(Content.jurisdiction == JURISDICTION)
+                            .order_by(Content.created_at.desc(), Content.id.desc())
+                            .offset(offset - 1)
+                            .limit(1)
+                        )
+                    ).one()
+                    cursor = encode_cursor(last.created_at, last.id)
+
+                by_offset = (
+                    select(*columns)
+                    .where(Content.jurisdiction == JURISDICTION)
+                    .order_by(Content.created_at.desc(), Content.id.desc())
+                    .offset(offset)
+                    .limit(args.limit)
+                )
+                print(f"  page {depth}:")
+                _report(
+                    "offset",
+                    await _time(args.runs, lambda q=by_offset: session.execute(q)),
+                )
+                _report(
+                    "keyset",
+                    await _time(
+                        args.runs,
+                        lambda c=cursor: repo.page(
+                            CONTENT_LIST_FIELDS, args.limit, c, jurisdiction=JURISDICTION
+                        ),
+                    ),
+                )
+    finally:
+        async with engine.begin() as conn:
+            await conn.execute(delete(Content).where(Content.jurisdiction == JURISDICTION))
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,196 @@
+"""Latency of the hot repository queries with and without the 0002 indexes.
+
+Seeds stakeholders, alerts and content into the Postgres at
+``DATABASE_URL``, which must already be migrated (``alembic upgrade
+head``). The seeded jurisdictions all start with ``Bench``. The script
+then times each query pattern with the indexes in place, and again inside
+a transaction that drops them and is rolled back. It reports p50/p99 for
+each pattern. The seeded rows are deleted afterwards.
+
+    python benchmarks/query_indexes.py --stakeholders 20000 --alerts 200000 --content 50000
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import random
+import statistics
+import sys
+import time
+import uuid
+from collections.abc import Awaitable, Callable
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from sqlalchemy import delete, insert, select, text  # noqa: E402
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncSession, create_async_engine  # noqa: E402
+
+from src.config import settings  # noqa: E402
+from src.models.alert import Alert, AlertPriority, AlertStatus, AlertType  # noqa: E402
+from src.models.content import AudienceType, Content, ContentStatus, ContentType  # noqa: E402
+from src.models.stakeholder import Stakeholder, StakeholderType  # noqa: E402
+from src.repositories import (  # noqa: E402
+    AlertRepository,
+    ContentRepository,
+    StakeholderRepository,
+)
+
+INDEXES = (
+    "ix_alerts_stakeholder_status_created",
+    "ix_content_jurisdiction_type_status",
+    "ix_stakeholders_jurisdiction_created_id",
+    "ix_stakeholders_interests",
+    "ix_stakeholders_projects",
+)
+TOPICS = [f"topic_{n}" for n in range(40)]
+JURISDICTIONS = [f"Bench City {n}, CO" for n in range(200)]
+CHUNK = 5000
+
+
+def _percentile(values: list[float], pct: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct))]
+
+
+async def _insert(conn: AsyncConnection, model: type, rows: list[dict]) -> None:
+    for start in range(0, len(rows), CHUNK):
+        await conn.execute(insert(model), rows[start : start + CHUNK])
+
+
+async def _seed(conn: AsyncConnection, args: argparse.Namespace) -> list[uuid.UUID]:
+    stakeholder_ids = [uuid.uuid4() for _ in range(args.stakeholders)]
+    await _insert(
+        conn,
+        Stakeholder,
+        [
+            {
+                "id": sid,
+                "stakeholder_type": StakeholderType.DEVELOPER,
+                "organization": f"Bench Org {n}",
+                "jurisdiction": random.choice(JURISDICTIONS),
+                "interests": random.sample(TOPICS, 3),
+                "notification_channels": ["email"],
+                "projects": [{"project_id": f"bench_proj_{n}", "location": "Bench"}],
+            }
+            for n, sid in enumerate(stakeholder_ids)
+        ],
+    )
+    await _insert(
+        conn,
+        Alert,
+        [
+            {
+                "id": uuid.uuid4(),
+                "stakeholder_id": random.choice(stakeholder_ids),
+                "priority": random.choice(list(AlertPriority)),
+                "alert_type": random.choice(list(AlertType)),
+                "headline": "Benchmark alert",
+                "summary": "Summary.",
+                "action_required": False,
+                "related_project_ids": [],
+                "status": random.choice(list(AlertStatus)),
+                "source_data": {"topics": random.sample(TOPICS, 2)},
+            }
+            for _ in range(args.alerts)
+        ],
+    )
+    await _insert(
+        conn,
+        Content,
+        [
+            {
+                "id": uuid.uuid4(),
+                "content_type": random.choice(list(ContentType)),
+                "audience": random.choice(list(AudienceType)),
+                "jurisdiction": random.choice(JURISDICTIONS),
+                "headline": "Benchmark content",
+                "body": "Body.",
+                "status": random.choice(list(ContentStatus)),
+                "version": 1,
+                "source_data": {"topics": random.sample(TOPICS, 2)},
+            }
+            for _ in range(args.content)
+        ],
+    )
+    for table in ("stakeholders", "alerts", "content"):
+        await conn.execute(text(f"ANALYZE {table}"))
+    return stakeholder_ids
+
+
+async def _cleanup(conn: AsyncConnection) -> None:
+    bench = select(Stakeholder.id).where(Stakeholder.jurisdiction.like("Bench %"))
+    await conn.execute(delete(Alert).where(Alert.stakeholder_id.in_(bench)))
+    await conn.execute(delete(Content).where(Content.jurisdiction.like("Bench %")))
+    await conn.execute(delete(Stakeholder).where(Stakeholder.jurisdiction.like("Bench %")))
+
+
+def _queries(
+    session: AsyncSession, stakeholder_ids: list[uuid.UUID]
+) -> dict[str, Callable[[], Awaitable[object]]]:
+    stakeholders = StakeholderRepository(session)
+    alerts = AlertRepository(session)
+    content = ContentRepository(session)
+    return {
+        "alerts by stakeholder+status": lambda: alerts.for_stakeholder(
+            random.choice(stakeholder_ids), status=AlertStatus.PENDING
+        ),
+        "content by juris+type+status": lambda: content.find(
+            random.choice(JURISDICTIONS), ContentType.POLICY_BRIEF, ContentStatus.DRAFT
+        ),
+        "stakeholders by jurisdiction": lambda: stakeholders.find(
+            jurisdiction=random.choice(JURISDICTIONS)
+        ),
+        "stakeholders by interest": lambda: stakeholders.find(interests=[random.choice(TOPICS)]),
+        "stakeholders by project": lambda: stakeholders.find(
+            project_id=f"bench_proj_{random.randrange(len(stakeholder_ids))}"
+        ),
+    }
+
+
+async def _time(conn: AsyncConnection, stakeholder_ids: list[uuid.UUID], runs: int) -> None:
+    session = AsyncSession(bind=conn)
+    for name, query in _queries(session, stakeholder_ids).items():
+        latencies = []
+        for _ in range(runs):
+            start = time.perf_counter()
+            await query()
+            latencies.append(time.perf_counter() - start)
+            session.expunge_all()
+        print(
+            f"  {name:<30} p50 {statistics.median(latencies) * 1000:8.3f} ms   "
+            f"p99 {_percentile(latencies, 0.99) * 1000:8.3f} ms"
+        )
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--stakeholders", type=int, default=20_000)
+    parser.add_argument("--alerts", type=int, default=200_000)
+    parser.add_argument("--content", type=int, default=50_000)
+    parser.add_argument("--runs", type=int, default=200)
+    args = parser.parse_args()
+
+    engine = create_async_engine(settings.database_url)
+    async with engine.begin() as conn:
+        stakeholder_ids = await _seed(conn, args)
+    try:
+        async with engine.connect() as conn:
+            print("with indexes:")
+            await _time(conn, stakeholder_ids, args.runs)
+            await conn.rollback()
+
+            print("without indexes (dropped inside a rolled-back transaction):")
+            for index in INDEXES:
+                await conn.execute(text(f"DROP INDEX {index}"))
+            await _time(conn, stakeholder_ids, args.runs)
+            await conn.rollback()
+    finally:
+        async with engine.begin() as conn:
+            await _cleanup(conn)
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,91 @@
+"""Per-request overhead of building generators vs. the app-scoped service container.
+
+Part one times constructing each handler's generator the way handlers used
+to, once per request, against looking up the shared ``Services`` container.
+Part two sends requests in-process to ``POST /api/v1/alerts/generate``
+(an empty stakeholder list, so no upstream or database calls) in both modes
+and reports latency percentiles. No network or API keys are needed.
+
+    python benchmarks/service_container.py --requests 2000
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import statistics
+import sys
+import time
+import timeit
+from pathlib import Path
+from types import SimpleNamespace
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from httpx import ASGITransport, AsyncClient  # noqa: E402
+
+from src.analysis.comparative_analysis import ComparativeAnalyzer  # noqa: E402
+from src.api.dependencies import get_services, open_services  # noqa: E402
+from src.api.endpoints import app  # noqa: E402
+from src.generators.alerts import AlertGenerator  # noqa: E402
+from src.generators.policy_brief import PolicyBriefGenerator  # noqa: E402
+
+
+def _percentile(values: list[float], pct: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct))]
+
+
+def _construction(number: int) -> None:
+    open_services(app)
+    print(f"construction, mean of {number}:")
+    for name, factory in (
+        ("PolicyBriefGenerator()", PolicyBriefGenerator),
+        ("AlertGenerator()", AlertGenerator),
+        ("ComparativeAnalyzer()", ComparativeAnalyzer),
+        ("container lookup", lambda: open_services(app).policy_brief),
+    ):
+        seconds = timeit.timeit(factory, number=number) / number
+        print(f"  {name:<24} {seconds * 1e6:9.1f} us")
+
+
+async def _requests(total: int, per_request: bool) -> list[float]:
+    if per_request:
+        # What the handler did before: a fresh generator, and with it a fresh
+        # Anthropic client and connection pool, on every request.
+        app.dependency_overrides[get_services] = lambda: SimpleNamespace(alerts=AlertGenerator())
+    else:
+        app.dependency_overrides.pop(get_services, None)
+        open_services(app)
+    latencies: list[float] = []
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://bench") as client:
+        for _ in range(total):
+            start = time.perf_counter()
+            resp = await client.post("/api/v1/alerts/generate", json={"stakeholder_ids": []})
+            latencies.append(time.perf_counter() - start)
+            resp.raise_for_status()
+    app.dependency_overrides.pop(get_services, None)
+    return latencies
+
+
+def _report(label: str, latencies: list[float]) -> None:
+    print(
+        f"  {label:<12} p50 {statistics.median(latencies) * 1000:7.3f} ms   "
+        f"p99 {_percentile(latencies, 0.99) * 1000:7.3f} ms"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--construct", type=int, default=500)
+    args = parser.parse_args()
+
+    _construction(args.construct)
+    print(f"POST /api/v1/alerts/generate, {args.requests} requests:")
+    _report("per-request", asyncio.run(_requests(args.requests, per_request=True)))
+    _report("container", asyncio.run(_requests(args.requests, per_request=False)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,113 @@
+"""Burst benchmark for webhook ingestion on a single uvicorn worker.
+
+Starts ``uvicorn src.api.endpoints:app`` with one worker, fires a burst of
+HousingEar webhooks at it and reports sustained requests/second and latency
+percentiles. Requires the Redis instance in ``REDIS_URL``.
+
+    python benchmarks/webhook_burst.py --requests 20000 --concurrency 200 --duplicates 0.1
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import random
+import statistics
+import subprocess
+import sys
+import time
+import uuid
+from collections import Counter
+
+import httpx
+
+
+def _percentile(values: list[float], pct: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct))]
+
+
+async def _wait_until_up(base_url: str, timeout: float = 20.0) -> None:
+    deadline = time.monotonic() + timeout
+    async with httpx.AsyncClient() as client:
+        while time.monotonic() < deadline:
+            try:
+                if (await client.get(f"{base_url}/health")).status_code == 200:
+                    return
+            except httpx.TransportError:
+                pass
+            await asyncio.sleep(0.2)
+    raise RuntimeError("uvicorn did not start in time")
+
+
+async def _burst(base_url: str, total: int, concurrency: int, duplicates: float) -> None:
+    event_ids = [f"evt_{uuid.uuid4().hex}" for _ in range(total)]
+    for i in range(1, total):
+        if random.random() < duplicates:
+            event_ids[i] = event_ids[random.randrange(i)]
+
+    queue: asyncio.Queue[str] = asyncio.Queue()
+    for event_id in event_ids:
+        queue.put_nowait(event_id)
+
+    latencies: list[float] = []
+    statuses: Counter[str] = Counter()
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+
+    async with httpx.AsyncClient(base_url=base_url, limits=limits, timeout=30) as client:
+
+        async def _worker() -> None:
+            while not queue.empty():
+                event_id = queue.get_nowait()
+                start = time.perf_counter()
+                resp = await client.post(
+                    "/api/v1/webhooks/housing-ear",
+                    json={
+                        "event_id": event_id,
+                        "event_type": "policy_update",
+                        "jurisdiction": "Denver, CO",
+                        "topics": ["Parking"],
+                    },
+                )
+                latencies.append(time.perf_counter() - start)
+                body = resp.json() if resp.status_code == 202 else {}
+                statuses[f"{resp.status_code}:{body.get('status', '-')}"] += 1
+
+        started = time.perf_counter()
+        await asyncio.gather(*(_worker() for _ in range(concurrency)))
+        elapsed = time.perf_counter() - started
+
+    print(f"requests:     {total}")
+    print(f"concurrency:  {concurrency}")
+    print(f"elapsed:      {elapsed:.2f}s")
+    print(f"throughput:   {total / elapsed:,.0f} req/s")
+    print(f"latency p50:  {statistics.median(latencies) * 1000:.2f} ms")
+    print(f"latency p99:  {_percentile(latencies, 0.99) * 1000:.2f} ms")
+    print(f"responses:    {dict(statuses)}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=10_000)
+    parser.add_argument("--concurrency", type=int, default=100)
+    parser.add_argument("--duplicates", type=float, default=0.1, help="fraction of retries")
+    parser.add_argument("--port", type=int, default=8765)
+    args = parser.parse_args()
+
+    server = subprocess.Popen(
+        [
+            sys.executable, "-m", "uvicorn", "src.api.endpoints:app",
+            "--port", str(args.port), "--workers", "1", "--log-level", "warning",
+        ]
+    )
+    base_url = f"http://127.0.0.1:{args.port}"
+    try:
+        asyncio.run(_wait_until_up(base_url))
+        asyncio.run(_burst(base_url, args.requests, args.concurrency, args.duplicates))
+    finally:
+        server.terminate()
+        server.wait()
+
+
+if __name__ == "__main__":
+    main()
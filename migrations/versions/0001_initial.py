@@ -0,0 +1,193 @@
+"""Initial schema: stakeholders, campaigns, content and alerts.
+
+Revision ID: 0001
+Revises:
+Create Date: 2026-10-17
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+revision = "0001"
+down_revision = None
+branch_labels = None
+depends_on = None
+
+# SQLAlchemy stores Python enums by member name.
+STAKEHOLDER_TYPE = (
+    "PHA_EXECUTIVE_DIRECTOR",
+    "CITY_COUNCIL",
+    "DEVELOPER",
+    "HUD_REGIONAL_OFFICE",
+    "STATE_AGENCY",
+)
+ALERT_FREQUENCY = ("IMMEDIATE", "DAILY_DIGEST", "WEEKLY_DIGEST", "MONTHLY_SUMMARY")
+ALERT_THRESHOLD = ("LOW", "MEDIUM", "HIGH", "URGENT_ONLY")
+CAMPAIGN_STATUS = ("PLANNING", "ACTIVE", "PAUSED", "COMPLETED", "ARCHIVED")
+CONTENT_TYPE = (
+    "POLICY_BRIEF",
+    "STAKEHOLDER_REPORT",
+    "BLOG_POST",
+    "ALERT",
+    "MODEL_ORDINANCE",
+    "TESTIMONY",
+    "OP_ED",
+    "INFOGRAPHIC",
+    "SOCIAL_MEDIA",
+)
+AUDIENCE_TYPE = (
+    "PHA_BOARD",
+    "CITY_COUNCIL",
+    "STATE_LEGISLATURE",
+    "DEVELOPERS",
+    "GENERAL_PUBLIC",
+    "HUD_OFFICIALS",
+    "MEDIA",
+)
+CONTENT_STATUS = ("DRAFT", "IN_REVIEW", "APPROVED", "PUBLISHED", "ARCHIVED", "REJECTED")
+ALERT_PRIORITY = ("URGENT", "HIGH", "MEDIUM", "LOW")
+ALERT_TYPE = (
+    "FEDERAL_REGISTER_CHANGE",
+    "EMERGING_TREND",
+    "MEETING_AGENDA",
+    "FRICTION_SCORE_CHANGE",
+    "PROJECT_IMPACT",
+    "POLICY_UPDATE",
+    "DEADLINE_REMINDER",
+)
+ALERT_STATUS = ("PENDING", "SENT", "DELIVERED", "READ", "ACTED_ON", "DISMISSED")
+
+ENUMS = {
+    "stakeholdertype": STAKEHOLDER_TYPE,
+    "alertfrequency": ALERT_FREQUENCY,
+    "alertthreshold": ALERT_THRESHOLD,
+    "campaignstatus": CAMPAIGN_STATUS,
+    "contenttype": CONTENT_TYPE,
+    "audiencetype": AUDIENCE_TYPE,
+    "contentstatus": CONTENT_STATUS,
+    "alertpriority": ALERT_PRIORITY,
+    "alerttype": ALERT_TYPE,
+    "alertstatus": ALERT_STATUS,
+}
+
+
+def _enum(name: str) -> postgresql.ENUM:
+    # Each type is used by one column, so create_table creates it.
+    return postgresql.ENUM(*ENUMS[name], name=name)
+
+
+def _timestamps(updated: bool = True) -> list[sa.Column]:
+    columns = [
+        sa.Column(
+            "created_at", sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False
+        )
+    ]
+    if updated:
+        columns.append(
+            sa.Column(
+                "updated_at",
+                sa.DateTime(timezone=True),
+                server_default=sa.func.now(),
+                nullable=False,
+            )
+        )
+    return columns
+
+
+def upgrade() -> None:
+    op.create_table(
+        "stakeholders",
+        sa.Column("id", postgresql.UUID(as_uuid=True), primary_key=True),
+        sa.Column("stakeholder_type", _enum("stakeholdertype"), nullable=False),
+        sa.Column("organization", sa.String(255), nullable=False),
+        sa.Column("jurisdiction", sa.String(255), nullable=False),
+        sa.Column("contact_name", sa.String(255)),
+        sa.Column("contact_email", sa.String(255)),
+        sa.Column("interests", postgresql.ARRAY(sa.String()), nullable=False),
+        sa.Column("notification_frequency", _enum("alertfrequency"), nullable=False),
+        sa.Column("notification_channels", postgresql.ARRAY(sa.String()), nullable=False),
+        sa.Column("alert_threshold", _enum("alertthreshold"), nullable=False),
+        sa.Column("projects", postgresql.JSON()),
+        sa.Column("metadata", postgresql.JSON()),
+        *_timestamps(),
+    )
+
+    op.create_table(
+        "campaigns",
+        sa.Column("id", postgresql.UUID(as_uuid=True), primary_key=True),
+        sa.Column("name", sa.String(255), nullable=False),
+        sa.Column("description", sa.Text()),
+        sa.Column("jurisdiction", sa.String(255), nullable=False),
+        sa.Column("target_audience", postgresql.ARRAY(sa.String()), nullable=False),
+        sa.Column("policy_goals", postgresql.JSON()),
+        sa.Column("content_sequence", postgresql.JSON()),
+        sa.Column("stakeholder_ids", postgresql.ARRAY(sa.String()), nullable=False),
+        sa.Column("metrics", postgresql.JSON()),
+        sa.Column("status", _enum("campaignstatus"), nullable=False),
+        sa.Column("total_touches", sa.Integer(), nullable=False),
+        sa.Column("current_step", sa.Integer(), nullable=False),
+        sa.Column("start_date", sa.DateTime(timezone=True)),
+        sa.Column("end_date", sa.DateTime(timezone=True)),
+        *_timestamps(),
+    )
+
+    op.create_table(
+        "content",
+        sa.Column("id", postgresql.UUID(as_uuid=True), primary_key=True),
+        sa.Column("content_type", _enum("contenttype"), nullable=False),
+        sa.Column("audience", _enum("audiencetype"), nullable=False),
+        sa.Column("jurisdiction", sa.String(255), nullable=False),
+        sa.Column("headline", sa.String(500), nullable=False),
+        sa.Column("executive_summary", sa.Text()),
+        sa.Column("body", sa.Text(), nullable=False),
+        sa.Column("call_to_action", sa.Text()),
+        sa.Column("source_data", postgresql.JSON()),
+        sa.Column("supporting_data", postgresql.JSON()),
+        sa.Column("distribution_config", postgresql.JSON()),
+        sa.Column("seo_keywords", postgresql.JSON()),
+        sa.Column("status", _enum("contentstatus"), nullable=False),
+        sa.Column("generated_by", sa.String(255)),
+        sa.Column("reviewed_by", sa.String(255)),
+        sa.Column(
+            "stakeholder_id", postgresql.UUID(as_uuid=True), sa.ForeignKey("stakeholders.id")
+        ),
+        sa.Column("campaign_id", postgresql.UUID(as_uuid=True), sa.ForeignKey("campaigns.id")),
+        sa.Column("version", sa.Integer(), nullable=False),
+        sa.Column("parent_content_id", postgresql.UUID(as_uuid=True), sa.ForeignKey("content.id")),
+        *_timestamps(),
+        sa.Column("published_at", sa.DateTime(timezone=True)),
+    )
+
+    op.create_table(
+        "alerts",
+        sa.Column("id", postgresql.UUID(as_uuid=True), primary_key=True),
+        sa.Column(
+            "stakeholder_id",
+            postgresql.UUID(as_uuid=True),
+            sa.ForeignKey("stakeholders.id"),
+            nullable=False,
+        ),
+        sa.Column("priority", _enum("alertpriority"), nullable=False),
+        sa.Column("alert_type", _enum("alerttype"), nullable=False),
+        sa.Column("headline", sa.String(500), nullable=False),
+        sa.Column("summary", sa.Text(), nullable=False),
+        sa.Column("action_required", sa.Boolean(), nullable=False),
+        sa.Column("action_deadline", sa.DateTime(timezone=True)),
+        sa.Column("related_project_ids", postgresql.ARRAY(sa.String()), nullable=False),
+        sa.Column("recommended_actions", postgresql.JSON()),
+        sa.Column("source_data", postgresql.JSON()),
+        sa.Column("status", _enum("alertstatus"), nullable=False),
+        sa.Column("sent_at", sa.DateTime(timezone=True)),
+        sa.Column("read_at", sa.DateTime(timezone=True)),
+        *_timestamps(updated=False),
+    )
+
+
+def downgrade() -> None:
+    for table in ("alerts", "content", "campaigns", "stakeholders"):
+        op.drop_table(table)
+    for name in ENUMS:
+        op.execute(f"DROP TYPE IF EXISTS {name}")
@@ -0,0 +1,82 @@
+"""Indexes for the hot query paths; JSONB for filtered JSON columns.
+
+- alerts by (stakeholder_id, status, created_at)
+- content by (jurisdiction, content_type, status)
+- stakeholders by jurisdiction, by interest (GIN on the ARRAY) and by
+  project id (GIN ``jsonb_path_ops`` on ``projects``)
+
+``source_data``, ``supporting_data`` and ``projects`` become JSONB, which is
+stored parsed and supports containment (``@>``) queries and GIN indexes.
+The type change rewrites each table under an exclusive lock.
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-17
+"""
+
+from __future__ import annotations
+
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+revision = "0002"
+down_revision = "0001"
+branch_labels = None
+depends_on = None
+
+JSONB_COLUMNS = (
+    ("content", "source_data"),
+    ("content", "supporting_data"),
+    ("alerts", "source_data"),
+    ("stakeholders", "projects"),
+)
+
+
+def upgrade() -> None:
+    for table, column in JSONB_COLUMNS:
+        op.alter_column(
+            table,
+            column,
+            type_=postgresql.JSONB(),
+            existing_type=postgresql.JSON(),
+            postgresql_using=f"{column}::jsonb",
+        )
+
+    op.create_index(
+        "ix_alerts_stakeholder_status_created",
+        "alerts",
+        ["stakeholder_id", "status", "created_at"],
+    )
+    op.create_index(
+        "ix_content_jurisdiction_type_status",
+        "content",
+        ["jurisdiction", "content_type", "status"],
+    )
+    op.create_index("ix_stakeholders_jurisdiction", "stakeholders", ["jurisdiction"])
+    op.create_index(
+        "ix_stakeholders_interests", "stakeholders", ["interests"], postgresql_using="gin"
+    )
+    op.create_index(
+        "ix_stakeholders_projects",
+        "stakeholders",
+        ["projects"],
+        postgresql_using="gin",
+        postgresql_ops={"projects": "jsonb_path_ops"},
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_stakeholders_projects", table_name="stakeholders")
+    op.drop_index("ix_stakeholders_interests", table_name="stakeholders")
+    op.drop_index("ix_stakeholders_jurisdiction", table_name="stakeholders")
+    op.drop_index("ix_content_jurisdiction_type_status", table_name="content")
+    op.drop_index("ix_alerts_stakeholder_status_created", table_name="alerts")
+
+    for table, column in JSONB_COLUMNS:
+        op.alter_column(
+            table,
+            column,
+            type_=postgresql.JSON(),
+            existing_type=postgresql.JSONB(),
+            postgresql_using=f"{column}::json",
+        )
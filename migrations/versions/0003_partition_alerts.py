@@ -0,0 +1,120 @@
+"""Partition ``alerts`` by month on ``created_at``.
+
+``alerts`` becomes a table range-partitioned by calendar month (UTC), with one
+partition per month named ``alerts_yYYYYmMM``. Partitions are created from the
+month of the oldest existing alert through three months ahead; after that,
+``src.distribution.partitions`` creates upcoming months and archives old ones.
+A partitioned table's primary key must include the partition key, so the key
+becomes ``(id, created_at)``. Existing rows are copied into the new table
+under an exclusive lock.
+
+``content`` is not partitioned: ``content.parent_content_id`` references
+``content.id``, and a foreign key needs a unique constraint on ``id`` alone,
+which a partitioned table cannot have.
+
+Downgrading copies the rows still attached back into a plain table; archived
+months are not restored.
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-17
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+revision = "0003"
+down_revision = "0002"
+branch_labels = None
+depends_on = None
+
+MONTHS_AHEAD = 3
+INDEX = "ix_alerts_stakeholder_status_created"
+COLUMNS = (
+    "id, stakeholder_id, priority, alert_type, headline, summary, action_required, "
+    "action_deadline, related_project_ids, recommended_actions, source_data, status, "
+    "sent_at, read_at, created_at"
+)
+
+
+def _enum(name: str) -> postgresql.ENUM:
+    # The types were created in 0001.
+    return postgresql.ENUM(name=name, create_type=False)
+
+
+def _create_alerts(partitioned: bool) -> None:
+    primary_key = ("id", "created_at") if partitioned else ("id",)
+    options = {"postgresql_partition_by": "RANGE (created_at)"} if partitioned else {}
+    op.create_table(
+        "alerts",
+        sa.Column("id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column(
+            "stakeholder_id",
+            postgresql.UUID(as_uuid=True),
+            sa.ForeignKey("stakeholders.id"),
+            nullable=False,
+        ),
+        sa.Column("priority", _enum("alertpriority"), nullable=False),
+        sa.Column("alert_type", _enum("alerttype"), nullable=False),
+        sa.Column("headline", sa.String(500), nullable=False),
+        sa.Column("summary", sa.Text(), nullable=False),
+        sa.Column("action_required", sa.Boolean(), nullable=False),
+        sa.Column("action_deadline", sa.DateTime(timezone=True)),
+        sa.Column("related_project_ids", postgresql.ARRAY(sa.String()), nullable=False),
+        sa.Column("recommended_actions", postgresql.JSON()),
+        sa.Column("source_data", postgresql.JSONB()),
+        sa.Column("status", _enum("alertstatus"), nullable=False),
+        sa.Column("sent_at", sa.DateTime(timezone=True)),
+        sa.Column("read_at", sa.DateTime(timezone=True)),
+        sa.Column(
+            "created_at", sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False
+        ),
+        sa.PrimaryKeyConstraint(*primary_key, name="alerts_pkey"),
+        **options,
+    )
+    op.create_index(INDEX, "alerts", ["stakeholder_id", "status", "created_at"])
+
+
+def _replace_alerts(old_name: str, partitioned: bool) -> None:
+    op.drop_index(INDEX, table_name="alerts")
+    op.rename_table("alerts", old_name)
+    op.execute(f"ALTER TABLE {old_name} RENAME CONSTRAINT alerts_pkey TO {old_name}_pkey")
+    _create_alerts(partitioned)
+
+
+def upgrade() -> None:
+    _replace_alerts("alerts_unpartitioned", partitioned=True)
+    op.execute(
+        f"""
+        DO $$
+        DECLARE
+            month date;
+            last_month date := (date_trunc('month', now() AT TIME ZONE 'UTC')
+                                + interval '{MONTHS_AHEAD} months')::date;
+        BEGIN
+            SELECT date_trunc('month', coalesce(min(created_at), now()) AT TIME ZONE 'UTC')::date
+              INTO month FROM alerts_unpartitioned;
+            WHILE month <= last_month LOOP
+                EXECUTE format(
+                    'CREATE TABLE %I PARTITION OF alerts FOR VALUES FROM (%L) TO (%L)',
+                    'alerts_' || to_char(month, '"y"YYYY"m"MM'),
+                    to_char(month, 'YYYY-MM-DD 00:00:00+00'),
+                    to_char(month + interval '1 month', 'YYYY-MM-DD 00:00:00+00')
+                );
+                month := (month + interval '1 month')::date;
+            END LOOP;
+        END $$
+        """
+    )
+    op.execute(f"INSERT INTO alerts ({COLUMNS}) SELECT {COLUMNS} FROM alerts_unpartitioned")
+    op.drop_table("alerts_unpartitioned")
+
+
+def downgrade() -> None:
+    _replace_alerts("alerts_partitioned", partitioned=False)
+    op.execute(f"INSERT INTO alerts ({COLUMNS}) SELECT {COLUMNS} FROM alerts_partitioned")
+    # Dropping the parent drops its attached partitions too.
+    op.drop_table("alerts_partitioned")
@@ -0,0 +1,51 @@
+"""Indexes for keyset pagination on ``(created_at, id)``.
+
+The list endpoints page newest first with ``(created_at, id) < (:created_at,
+:id)``. Each of these indexes serves that as one range scan, so a deep page
+costs the same as the first:
+
+- content, alerts and stakeholders by ``(created_at, id)``
+- content and stakeholders by ``(jurisdiction, created_at, id)``
+- alerts by ``(stakeholder_id, created_at, id)``
+
+``ix_stakeholders_jurisdiction`` is replaced: its column is a prefix of the new
+jurisdiction index.
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-17
+"""
+
+from __future__ import annotations
+
+from alembic import op
+
+revision = "0004"
+down_revision = "0003"
+branch_labels = None
+depends_on = None
+
+INDEXES = (
+    ("ix_content_created_id", "content", ["created_at", "id"]),
+    ("ix_content_jurisdiction_created_id", "content", ["jurisdiction", "created_at", "id"]),
+    ("ix_alerts_created_id", "alerts", ["created_at", "id"]),
+    ("ix_alerts_stakeholder_created_id", "alerts", ["stakeholder_id", "created_at", "id"]),
+    ("ix_stakeholders_created_id", "stakeholders", ["created_at", "id"]),
+    (
+        "ix_stakeholders_jurisdiction_created_id",
+        "stakeholders",
+        ["jurisdiction", "created_at", "id"],
+    ),
+)
+
+
+def upgrade() -> None:
+    for name, table, columns in INDEXES:
+        op.create_index(name, table, columns)
+    op.drop_index("ix_stakeholders_jurisdiction", table_name="stakeholders")
+
+
+def downgrade() -> None:
+    op.create_index("ix_stakeholders_jurisdiction", "stakeholders", ["jurisdiction"])
+    for name, table, _ in reversed(INDEXES):
+        op.drop_index(name, table_name=table)
@@ -2,18 +2,25 @@
 
 from __future__ import annotations
 
+import logging
 from typing import Any
 
 from src.integrations.claude_api import ClaudeContentGenerator
 from src.integrations.housing_lens_client import HousingLensClient
 
+logger = logging.getLogger(__name__)
+
 
 class ComparativeAnalyzer:
     """Rank and compare jurisdictions on friction scores and policy outcomes."""
 
-    def __init__(self) -> None:
-        self.lens = HousingLensClient()
-        self.llm = ClaudeContentGenerator()
+    def __init__(
+        self,
+        lens: HousingLensClient | None = None,
+        llm: ClaudeContentGenerator | None = None,
+    ) -> None:
+        self.lens = lens or HousingLensClient()
+        self.llm = llm or ClaudeContentGenerator()
 
     async def analyze(
         self,
@@ -24,12 +31,17 @@ class ComparativeAnalyzer:
         """Run a comparative analysis across *jurisdictions*.
 
         Returns a dict with ranking, peer_group, best_practices,
-        opportunity_gaps, narrative_summary, and visualization_config.
+        opportunity_gaps, narrative_summary, visualization_config, and
+        errors (jurisdictions whose scores could not be fetched).
         """
-        # Fetch scores for every jurisdiction.
-        scores_by_jur: dict[str, list[dict[str, Any]]] = {}
-        for jur in jurisdictions:
-            scores_by_jur[jur] = await self.lens.get_friction_scores(jur, topics)
+        # Fetch scores for every jurisdiction concurrently.
+        batch = await self.lens.get_friction_scores_many(jurisdictions, topics)
+        if batch.errors and not batch.scores:
+            raise next(iter(batch.errors.values()))
+        for jur, exc in batch.errors.items():
+            logger.warning("Excluding %s from comparison: %s", jur, exc)
+        scores_by_jur = batch.scores
+        jurisdictions = [j for j in jurisdictions if j in scores_by_jur]
 
         ranking = _rank(scores_by_jur, metric)
         peer_group = _identify_peers(jurisdictions, ranking)
@@ -49,7 +61,7 @@ class ComparativeAnalyzer:
                 f"Gaps: {opportunity_gaps}\n\n"
                 "Write a two-paragraph narrative summary."
             ),
-            max_tokens=1024,
+            task="narrative_summary",
         )
 
         viz = _build_viz_config(ranking, metric)
@@ -61,6 +73,7 @@ class ComparativeAnalyzer:
             "opportunity_gaps": opportunity_gaps,
             "narrative_summary": narrative,
             "visualization_config": viz,
+            "errors": {jur: str(exc) for jur, exc in batch.errors.items()},
         }
 
 
@@ -5,13 +5,15 @@ from __future__ import annotations
 from typing import Any
 
 from src.integrations.housing_lens_client import HousingLensClient
+from src.utils.task_graph import Step, run_steps
+from src.utils.timing import StageTimer
 
 
 class ImpactCalculator:
     """Translate friction scores into human-readable financial and timeline impacts."""
 
-    def __init__(self) -> None:
-        self.lens = HousingLensClient()
+    def __init__(self, lens: HousingLensClient | None = None) -> None:
+        self.lens = lens or HousingLensClient()
 
     async def calculate(
         self,
@@ -19,9 +21,20 @@ class ImpactCalculator:
         topics: list[str] | None = None,
         unit_count: int = 1,
     ) -> dict[str, Any]:
-        """Return an impact summary for a jurisdiction."""
-        friction = await self.lens.get_friction_scores(jurisdiction, topics)
-        costs = await self.lens.get_cost_estimates(jurisdiction, topics)
+        """Return an impact summary for a jurisdiction, with per-stage ``timings``."""
+        timer = StageTimer()
+        # Friction scores and cost estimates are independent; fetch them together.
+        results = await run_steps(
+            {
+                "friction_scores": Step(
+                    lambda: self.lens.get_friction_scores(jurisdiction, topics)
+                ),
+                "cost_estimates": Step(lambda: self.lens.get_cost_estimates(jurisdiction, topics)),
+            },
+            timer,
+        )
+        friction = results["friction_scores"]
+        costs = results["cost_estimates"]
 
         total_cost = sum(c.get("estimated_cost", 0) for c in costs)
         total_delay_days = sum(c.get("delay_days", 0) for c in costs)
@@ -39,6 +52,7 @@ class ImpactCalculator:
             "top_cost_drivers": top_cost_drivers,
             "friction_scores": friction,
             "narrative": _build_narrative(jurisdiction, total_cost, total_delay_days, top_cost_drivers),
+            "timings": timer.as_dict(),
         }
 
 
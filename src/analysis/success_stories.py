@@ -2,11 +2,14 @@
 
 from __future__ import annotations
 
+import logging
 from typing import Any
 
 from src.integrations.housing_ear_client import HousingEarClient
 from src.integrations.housing_lens_client import HousingLensClient
 
+logger = logging.getLogger(__name__)
+
 
 class SuccessStoryFinder:
     """Identify jurisdictions with low friction in areas where others struggle."""
@@ -31,12 +34,14 @@ class SuccessStoryFinder:
             if s.get("topic")
         ]
 
+        candidates = [c for c in candidate_jurisdictions if c != target_jurisdiction]
+        batch = await self.lens.get_friction_scores_many(candidates, high_friction_topics)
+        for candidate, exc in batch.errors.items():
+            logger.warning("Skipping %s in success-story search: %s", candidate, exc)
+
         stories: list[dict[str, Any]] = []
-        for candidate in candidate_jurisdictions:
-            if candidate == target_jurisdiction:
-                continue
-            candidate_scores = await self.lens.get_friction_scores(candidate, high_friction_topics)
-            for cs in candidate_scores:
+        for candidate in candidates:
+            for cs in batch.scores.get(candidate, []):
                 topic = cs.get("topic")
                 if topic in high_friction_topics and cs.get("friction_score", 999) < 300:
                     stories.append({
@@ -0,0 +1,170 @@
+"""Process-wide services shared by the API handlers.
+
+The lifespan builds one ``Services`` container per process, and handlers
+receive it through ``Depends(get_services)``. As a result, every request
+reuses the same Anthropic client, with its connection pool, and the same
+HousingLens and HousingEar clients. Nothing is rebuilt per request. If the
+lifespan has not run (for example in tests or ad-hoc scripts), the
+container is built on first use.
+
+The generators are stateless between calls. Per-request options such as
+``force_fresh`` are passed as call arguments, never set as attributes.
+
+Database access is per request instead: ``Depends(get_repositories)``
+gives a handler repositories over its own session from the shared pool.
+"""
+
+from __future__ import annotations
+
+import logging
+import uuid
+from collections.abc import AsyncIterator
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Any
+
+from fastapi import FastAPI, Request
+
+from src.analysis.comparative_analysis import ComparativeAnalyzer
+from src.analysis.impact_calculator import ImpactCalculator
+from src.database import async_session
+from src.generators.alerts import AlertGenerator
+from src.generators.model_ordinance import ModelOrdinanceGenerator
+from src.generators.policy_brief import PolicyBriefGenerator
+from src.generators.public_content import PublicContentGenerator
+from src.generators.stakeholder_report import StakeholderReportGenerator
+from src.generators.testimony import TestimonyGenerator
+from src.integrations.claude_api import ClaudeContentGenerator, GenerationRequest
+from src.integrations.housing_ear_client import HousingEarClient
+from src.integrations.housing_lens_client import HousingLensClient
+from src.models.content import ContentType
+from src.models.schemas import ContentGenerateRequest
+from src.repositories import Repositories
+
+logger = logging.getLogger(__name__)
+
+ContentGenerator = (
+    PolicyBriefGenerator | PublicContentGenerator | TestimonyGenerator | ModelOrdinanceGenerator
+)
+
+
+@dataclass
+class Services:
+    llm: ClaudeContentGenerator
+    lens: HousingLensClient
+    ear: HousingEarClient
+    policy_brief: PolicyBriefGenerator
+    public_content: PublicContentGenerator
+    testimony: TestimonyGenerator
+    model_ordinance: ModelOrdinanceGenerator
+    stakeholder_report: StakeholderReportGenerator
+    alerts: AlertGenerator
+    comparative: ComparativeAnalyzer
+    impact: ImpactCalculator
+
+    @classmethod
+    def build(cls) -> Services:
+        llm = ClaudeContentGenerator()
+        lens = HousingLensClient()
+        ear = HousingEarClient()
+        return cls(
+            llm=llm,
+            lens=lens,
+            ear=ear,
+            policy_brief=PolicyBriefGenerator(llm, lens),
+            public_content=PublicContentGenerator(llm, lens),
+            testimony=TestimonyGenerator(llm, lens),
+            model_ordinance=ModelOrdinanceGenerator(llm, lens),
+            stakeholder_report=StakeholderReportGenerator(llm, lens),
+            alerts=AlertGenerator(llm, ear, lens),
+            comparative=ComparativeAnalyzer(lens, llm),
+            impact=ImpactCalculator(lens),
+        )
+
+    async def prepare_content(
+        self, req: ContentGenerateRequest
+    ) -> tuple[ContentGenerator, GenerationRequest, dict[str, Any]]:
+        """Pick the generator for *req*, fetch its data and build the LLM request."""
+        generator: ContentGenerator
+        if req.content_type == ContentType.POLICY_BRIEF:
+            generator = self.policy_brief
+            request, context = await generator.prepare(
+                jurisdiction=req.jurisdiction,
+                audience=req.audience,
+                friction_data=req.friction_data or None,
+                topics=req.topics or None,
+            )
+        elif req.content_type == ContentType.TESTIMONY:
+            generator = self.testimony
+            request, context = await generator.prepare(
+                jurisdiction=req.jurisdiction,
+                audience=req.audience,
+                friction_data=req.friction_data or None,
+                topics=req.topics or None,
+            )
+        elif req.content_type == ContentType.MODEL_ORDINANCE:
+            generator = self.model_ordinance
+            request, context = await generator.prepare(
+                target_jurisdiction=req.jurisdiction,
+                topic=req.topics[0] if req.topics else "",
+                friction_data=req.friction_data or None,
+            )
+        else:
+            generator = self.public_content
+            request, context = await generator.prepare(
+                jurisdiction=req.jurisdiction,
+                content_type=req.content_type.value.lower(),
+                friction_data=req.friction_data or None,
+                topics=req.topics or None,
+            )
+        return generator, request, context
+
+    async def generate_content(self, req: ContentGenerateRequest) -> dict[str, Any]:
+        """Generate the content *req* asks for, ready for ``ContentResponse``."""
+        generator, request, context = await self.prepare_content(req)
+        raw_text = await generator.llm.run(request, force_fresh=req.force_fresh)
+        result = await generator.assemble(context, raw_text, force_fresh=req.force_fresh)
+        return finalize_content(result)
+
+    async def aclose(self) -> None:
+        await self.llm.aclose()
+
+
+def finalize_content(result: dict[str, Any]) -> dict[str, Any]:
+    # Ensure required fields for the response model.
+    result.setdefault("id", str(uuid.uuid4()))
+    result.setdefault("version", 1)
+    result.setdefault("created_at", datetime.now(timezone.utc).isoformat())
+    return result
+
+
+def open_services(app: FastAPI) -> Services:
+    """Build the container for *app* (once) and return it."""
+    services = getattr(app.state, "services", None)
+    if services is None:
+        services = Services.build()
+        app.state.services = services
+        logger.info("Built API service container.")
+    return services
+
+
+async def close_services(app: FastAPI) -> None:
+    services = getattr(app.state, "services", None)
+    if services is not None:
+        app.state.services = None
+        await services.aclose()
+
+
+def get_services(request: Request) -> Services:
+    """FastAPI dependency returning the process-wide ``Services``."""
+    return open_services(request.app)
+
+
+async def get_repositories() -> AsyncIterator[Repositories]:
+    """FastAPI dependency: repositories over a session scoped to the request.
+
+    The session takes a pooled connection only when the handler first
+    queries, so endpoints that never touch the database do not hold one.
+    """
+    async with async_session() as session:
+        yield Repositories(session)
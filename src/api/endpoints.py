@@ -2,20 +2,30 @@
 
 from __future__ import annotations
 
+import json
+import logging
 import uuid
-from datetime import datetime, timezone
-
-from fastapi import FastAPI, HTTPException, Query
-
-from src.analysis.comparative_analysis import ComparativeAnalyzer
-from src.analysis.impact_calculator import ImpactCalculator
-from src.generators.alerts import AlertGenerator
-from src.generators.model_ordinance import ModelOrdinanceGenerator
-from src.generators.policy_brief import PolicyBriefGenerator
-from src.generators.public_content import PublicContentGenerator
-from src.generators.stakeholder_report import StakeholderReportGenerator
-from src.generators.testimony import TestimonyGenerator
-from src.models.content import AudienceType, ContentType
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from dataclasses import asdict
+from typing import Any
+
+from fastapi import Depends, FastAPI, HTTPException, Query
+from fastapi.responses import JSONResponse, StreamingResponse
+from pydantic import BaseModel
+
+from src.distribution.job_store import job_store
+from src.distribution.scheduler import generate_content_task
+from src.distribution.stakeholder_index import stakeholder_to_profile
+from src.integrations.cache import lens_cache
+from src.integrations.claude_api import llm_usage
+from src.integrations.http_pool import http_pool
+from src.integrations.llm_cache import llm_cache
+from src.integrations.model_router import model_router
+from src.integrations.rate_limiter import claude_limiter
+from src.integrations.single_flight import ecosystem_requests
+from src.models.alert import AlertPriority, AlertStatus
+from src.models.content import AudienceType, ContentStatus, ContentType
 from src.models.schemas import (
     AlertGenerateRequest,
     AlertResponse,
@@ -26,16 +36,52 @@ from src.models.schemas import (
     ContentGenerateRequest,
     ContentResponse,
     ContentReviewAction,
+    JobResponse,
+    PageResponse,
     StakeholderCreate,
     StakeholderResponse,
 )
-
+from src.models.stakeholder import StakeholderType
+from src.repositories import Page, Repositories, decode_cursor
+
+from src.api.dependencies import (
+    Services,
+    close_services,
+    finalize_content,
+    get_repositories,
+    get_services,
+    open_services,
+)
 from src.api.webhooks import router as webhooks_router
 
+logger = logging.getLogger(__name__)
+
+# Columns the list endpoints load when ``fields`` is not given; large text and
+# JSON columns are only loaded on request.
+CONTENT_LIST_FIELDS = tuple(
+    f for f in ContentResponse.model_fields if f not in ("body", "source_data", "supporting_data")
+)
+ALERT_LIST_FIELDS = tuple(AlertResponse.model_fields)
+STAKEHOLDER_LIST_FIELDS = tuple(f for f in StakeholderResponse.model_fields if f != "projects")
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """Open process-wide resources on startup and release them on shutdown."""
+    await http_pool.open()
+    open_services(app)
+    try:
+        yield
+    finally:
+        await close_services(app)
+        await http_pool.close()
+
+
 app = FastAPI(
     title="HousingSpeak API",
     description="Advocacy & Communication Automation for the HousingMind ecosystem",
     version="0.1.0",
+    lifespan=lifespan,
 )
 app.include_router(webhooks_router)
 
@@ -50,60 +96,177 @@ async def health() -> dict[str, str]:
     return {"status": "ok"}
 
 
+@app.get("/metrics")
+async def metrics() -> dict[str, Any]:
+    """Operational counters used to size pools and caches."""
+    return {
+        "http_pool": http_pool.snapshot(),
+        "lens_cache": lens_cache.snapshot() if lens_cache is not None else None,
+        "llm_cache": llm_cache.snapshot() if llm_cache is not None else None,
+        "llm_usage": llm_usage.snapshot(),
+        "claude_rate_limiter": claude_limiter.snapshot() if claude_limiter is not None else None,
+        "model_routing": model_router.snapshot(),
+        "single_flight": ecosystem_requests.snapshot(),
+    }
+
+
 # ---------------------------------------------------------------------------
 # Content Generation
 # ---------------------------------------------------------------------------
 
 
+def _sse(event: str, data: Any) -> str:
+    return f"event: {event}\ndata: {json.dumps(data, default=str)}\n\n"
+
+
+def _projection(fields: str | None, schema: type[BaseModel], default: tuple[str, ...]) -> list[str]:
+    """Columns named in a ``fields=a,b`` list parameter, checked against *schema*."""
+    if fields is None:
+        return list(default)
+    names = [name.strip() for name in fields.split(",") if name.strip()]
+    unknown = sorted(set(names) - set(schema.model_fields))
+    if unknown:
+        raise HTTPException(status_code=422, detail=f"Unknown fields: {', '.join(unknown)}")
+    return names
+
+
+def _check_cursor(cursor: str | None) -> None:
+    if cursor is not None:
+        try:
+            decode_cursor(cursor)
+        except ValueError as exc:
+            raise HTTPException(status_code=400, detail="Invalid cursor") from exc
+
+
 @app.post("/api/v1/content/generate", response_model=ContentResponse)
-async def generate_content(req: ContentGenerateRequest) -> dict:
-    """Generate advocacy content based on friction data and audience."""
-    generator: PolicyBriefGenerator | PublicContentGenerator | TestimonyGenerator | ModelOrdinanceGenerator
-
-    if req.content_type == ContentType.POLICY_BRIEF:
-        generator = PolicyBriefGenerator()
-        result = await generator.generate(
-            jurisdiction=req.jurisdiction,
-            audience=req.audience,
-            friction_data=req.friction_data or None,
-            topics=req.topics or None,
-        )
-    elif req.content_type == ContentType.TESTIMONY:
-        gen_test = TestimonyGenerator()
-        result = await gen_test.generate(
-            jurisdiction=req.jurisdiction,
-            audience=req.audience,
-            friction_data=req.friction_data or None,
-            topics=req.topics or None,
-        )
-    elif req.content_type == ContentType.MODEL_ORDINANCE:
-        gen_ord = ModelOrdinanceGenerator()
-        result = await gen_ord.generate(
-            target_jurisdiction=req.jurisdiction,
-            topic=req.topics[0] if req.topics else "",
-            friction_data=req.friction_data or None,
-        )
-    else:
-        gen_pub = PublicContentGenerator()
-        result = await gen_pub.generate(
-            jurisdiction=req.jurisdiction,
-            content_type=req.content_type.value.lower(),
-            friction_data=req.friction_data or None,
-            topics=req.topics or None,
+async def generate_content(
+    req: ContentGenerateRequest,
+    services: Services = Depends(get_services),
+    repos: Repositories = Depends(get_repositories),
+    run_async: bool = Query(False, alias="async"),
+) -> Any:
+    """Generate advocacy content based on friction data and audience.
+
+    With ``?async=true`` the request is handed to a Celery worker and the
+    response is ``202 Accepted`` with the job to poll at
+    ``GET /api/v1/jobs/{id}``. Resubmitting an identical request returns
+    the job already under way.
+    """
+    if not run_async:
+        result = await services.generate_content(req)
+        await repos.content.add(
+            result, stakeholder_id=req.stakeholder_id, campaign_id=req.campaign_id
         )
+        return result
 
-    # Ensure required fields for the response model.
-    result.setdefault("id", str(uuid.uuid4()))
-    result.setdefault("version", 1)
-    result.setdefault("created_at", datetime.now(timezone.utc).isoformat())
-    return result
+    job, created = await job_store.submit(
+        "content",
+        req.model_dump(mode="json"),
+        callback_url=str(req.callback_url) if req.callback_url else None,
+        dedupe=not req.force_fresh,
+    )
+    if created:
+        try:
+            generate_content_task.delay(
+                req.content_type.value, req.jurisdiction, req.audience.value, job_id=job.id
+            )
+        except Exception as exc:
+            logger.exception("Could not enqueue content job %s.", job.id)
+            await job_store.mark_failed(job, f"enqueue failed: {exc}")
+            raise HTTPException(status_code=503, detail="Job queue unavailable") from exc
+    payload = JobResponse.model_validate(asdict(job)).model_dump(mode="json")
+    return JSONResponse(payload, status_code=202, headers={"Location": f"/api/v1/jobs/{job.id}"})
+
+
+@app.get("/api/v1/jobs/{job_id}", response_model=JobResponse)
+async def get_job(job_id: str) -> dict:
+    """Status of an asynchronous job, with its result once it has finished."""
+    job = await job_store.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Job not found")
+    return asdict(job)
+
+
+@app.post("/api/v1/content/generate/stream")
+async def generate_content_stream(
+    req: ContentGenerateRequest,
+    services: Services = Depends(get_services),
+    repos: Repositories = Depends(get_repositories),
+) -> StreamingResponse:
+    """Generate content as Server-Sent Events.
+
+    Emits ``delta`` events with text as Claude writes it, then one
+    ``complete`` event carrying the same payload ``/content/generate``
+    returns. A failure mid-stream is reported as an ``error`` event.
+    """
+    generator, request, context = await services.prepare_content(req)
+
+    async def _events() -> AsyncIterator[str]:
+        parts: list[str] = []
+        try:
+            async for delta in generator.llm.stream(
+                **request.prompt_kwargs(), force_fresh=req.force_fresh
+            ):
+                parts.append(delta)
+                yield _sse("delta", {"text": delta})
+            text = "".join(parts)
+            result = finalize_content(
+                await generator.assemble(context, text, force_fresh=req.force_fresh)
+            )
+            payload = ContentResponse.model_validate(result).model_dump(mode="json")
+            await repos.content.add(
+                result, stakeholder_id=req.stakeholder_id, campaign_id=req.campaign_id
+            )
+            yield _sse("complete", payload)
+        except Exception as exc:
+            logger.exception("Streaming generation failed.")
+            yield _sse("error", {"detail": str(exc)})
+
+    return StreamingResponse(
+        _events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@app.get("/api/v1/content", response_model=PageResponse)
+async def list_content(
+    jurisdiction: str | None = None,
+    content_type: ContentType | None = None,
+    status: ContentStatus | None = None,
+    stakeholder_id: uuid.UUID | None = None,
+    fields: str | None = Query(None, description="Comma-separated columns to include"),
+    limit: int = Query(50, ge=1, le=200),
+    cursor: str | None = None,
+    repos: Repositories = Depends(get_repositories),
+) -> Page:
+    """Content newest first, one keyset page at a time.
+
+    ``body``, ``source_data`` and ``supporting_data`` are only returned when
+    named in ``fields``.
+    """
+    columns = _projection(fields, ContentResponse, CONTENT_LIST_FIELDS)
+    _check_cursor(cursor)
+    return await repos.content.page(
+        columns,
+        limit,
+        cursor,
+        jurisdiction=jurisdiction,
+        content_type=content_type,
+        status=status,
+        stakeholder_id=stakeholder_id,
+    )
 
 
 @app.get("/api/v1/content/{content_id}", response_model=ContentResponse)
-async def get_content(content_id: uuid.UUID) -> dict:
+async def get_content(
+    content_id: uuid.UUID, repos: Repositories = Depends(get_repositories)
+) -> Any:
     """Retrieve a previously generated content item."""
-    # Placeholder — would query the database in production.
-    raise HTTPException(status_code=404, detail="Content not found")
+    content = await repos.content.get(content_id)
+    if content is None:
+        raise HTTPException(status_code=404, detail="Content not found")
+    return content
 
 
 @app.post("/api/v1/content/{content_id}/review")
@@ -127,22 +290,30 @@ async def review_content(content_id: uuid.UUID, action: ContentReviewAction) ->
 async def generate_stakeholder_report(
     stakeholder_id: uuid.UUID | None = None,
     jurisdiction: str = Query(default=""),
+    services: Services = Depends(get_services),
+    repos: Repositories = Depends(get_repositories),
 ) -> dict:
-    """Generate a tailored stakeholder report."""
-    generator = StakeholderReportGenerator()
-    # In production, fetch stakeholder from DB by ID.
-    stakeholder = {
-        "id": str(stakeholder_id or uuid.uuid4()),
-        "organization": "Stakeholder Org",
-        "jurisdiction": jurisdiction or "Denver, CO",
-        "interests": [],
-        "projects": [],
-        "stakeholder_type": "PHA_Executive_Director",
-    }
-    result = await generator.generate(stakeholder=stakeholder)
-    result.setdefault("id", str(uuid.uuid4()))
-    result.setdefault("version", 1)
-    result.setdefault("created_at", datetime.now(timezone.utc).isoformat())
+    """Generate a tailored stakeholder report.
+
+    Without a ``stakeholder_id`` the report is a generic one for
+    *jurisdiction*.
+    """
+    if stakeholder_id is not None:
+        row = await repos.stakeholders.get(stakeholder_id)
+        if row is None:
+            raise HTTPException(status_code=404, detail="Stakeholder not found")
+        stakeholder = stakeholder_to_profile(row)
+    else:
+        stakeholder = {
+            "id": str(uuid.uuid4()),
+            "organization": "Stakeholder Org",
+            "jurisdiction": jurisdiction or "Denver, CO",
+            "interests": [],
+            "projects": [],
+            "stakeholder_type": "PHA_Executive_Director",
+        }
+    result = finalize_content(await services.stakeholder_report.generate(stakeholder=stakeholder))
+    await repos.content.add(result, stakeholder_id=stakeholder_id)
     return result
 
 
@@ -152,26 +323,55 @@ async def generate_stakeholder_report(
 
 
 @app.post("/api/v1/alerts/generate", response_model=list[AlertResponse])
-async def generate_alerts(req: AlertGenerateRequest) -> list[dict]:
-    """Generate personalized alerts for stakeholders."""
-    generator = AlertGenerator()
-    # In production, fetch stakeholder profiles from DB.
-    stakeholder_profiles: list[dict] = []
+async def generate_alerts(
+    req: AlertGenerateRequest,
+    services: Services = Depends(get_services),
+    repos: Repositories = Depends(get_repositories),
+) -> Any:
+    """Generate and store personalized alerts for the stakeholders in ``stakeholder_ids``.
+
+    At most ``alert_generate_max_stakeholders`` may be named, since the
+    alerts are written within the request. Otherwise alerts are generated
+    by the event workers for the stakeholders each webhook event affects.
+    """
+    rows = await repos.stakeholders.get_many(req.stakeholder_ids)
     since = req.since.isoformat() if req.since else None
-    alerts = await generator.generate_alerts(stakeholder_profiles, since=since)
+    alerts = await services.alerts.generate_alerts(
+        [stakeholder_to_profile(row) for row in rows], since=since
+    )
+    await repos.alerts.insert_many(alerts)
     return alerts
 
 
+@app.get("/api/v1/alerts", response_model=PageResponse)
+async def list_alerts(
+    stakeholder_id: uuid.UUID | None = None,
+    status: AlertStatus | None = None,
+    priority: AlertPriority | None = None,
+    fields: str | None = Query(None, description="Comma-separated columns to include"),
+    limit: int = Query(50, ge=1, le=200),
+    cursor: str | None = None,
+    repos: Repositories = Depends(get_repositories),
+) -> Page:
+    """Alerts newest first, one keyset page at a time."""
+    columns = _projection(fields, AlertResponse, ALERT_LIST_FIELDS)
+    _check_cursor(cursor)
+    return await repos.alerts.page(
+        columns, limit, cursor, stakeholder_id=stakeholder_id, status=status, priority=priority
+    )
+
+
 # ---------------------------------------------------------------------------
 # Comparative Analysis
 # ---------------------------------------------------------------------------
 
 
 @app.post("/api/v1/analysis/comparative", response_model=ComparativeAnalysisResponse)
-async def comparative_analysis(req: ComparativeAnalysisRequest) -> dict:
+async def comparative_analysis(
+    req: ComparativeAnalysisRequest, services: Services = Depends(get_services)
+) -> dict:
     """Run a comparative benchmarking analysis across jurisdictions."""
-    analyzer = ComparativeAnalyzer()
-    return await analyzer.analyze(
+    return await services.comparative.analyze(
         jurisdictions=req.jurisdictions,
         metric=req.metric,
         topics=req.topics or None,
@@ -187,49 +387,63 @@ async def comparative_analysis(req: ComparativeAnalysisRequest) -> dict:
 async def calculate_impact(
     jurisdiction: str = Query(...),
     unit_count: int = Query(default=1),
+    services: Services = Depends(get_services),
 ) -> dict:
     """Calculate the financial and timeline impact of friction."""
-    calc = ImpactCalculator()
-    return await calc.calculate(jurisdiction=jurisdiction, unit_count=unit_count)
+    return await services.impact.calculate(jurisdiction=jurisdiction, unit_count=unit_count)
 
 
 # ---------------------------------------------------------------------------
-# Stakeholders (CRUD placeholders)
+# Stakeholders
 # ---------------------------------------------------------------------------
 
 
 @app.post("/api/v1/stakeholders", response_model=StakeholderResponse, status_code=201)
-async def create_stakeholder(data: StakeholderCreate) -> dict:
+async def create_stakeholder(
+    data: StakeholderCreate, repos: Repositories = Depends(get_repositories)
+) -> Any:
     """Register a new stakeholder profile."""
-    now = datetime.now(timezone.utc)
-    return {
-        "id": str(uuid.uuid4()),
-        **data.model_dump(),
-        "created_at": now.isoformat(),
-        "updated_at": now.isoformat(),
-    }
+    # The stakeholder index picks the new row up through its ORM events.
+    return await repos.stakeholders.add(data)
+
+
+@app.get("/api/v1/stakeholders", response_model=PageResponse)
+async def list_stakeholders(
+    jurisdiction: str | None = None,
+    stakeholder_type: StakeholderType | None = None,
+    fields: str | None = Query(None, description="Comma-separated columns to include"),
+    limit: int = Query(50, ge=1, le=200),
+    cursor: str | None = None,
+    repos: Repositories = Depends(get_repositories),
+) -> Page:
+    """Stakeholders newest first, one keyset page at a time.
+
+    ``projects`` is only returned when named in ``fields``.
+    """
+    columns = _projection(fields, StakeholderResponse, STAKEHOLDER_LIST_FIELDS)
+    _check_cursor(cursor)
+    return await repos.stakeholders.page(
+        columns, limit, cursor, jurisdiction=jurisdiction, stakeholder_type=stakeholder_type
+    )
 
 
 @app.get("/api/v1/stakeholders/{stakeholder_id}", response_model=StakeholderResponse)
-async def get_stakeholder(stakeholder_id: uuid.UUID) -> dict:
-    raise HTTPException(status_code=404, detail="Stakeholder not found")
+async def get_stakeholder(
+    stakeholder_id: uuid.UUID, repos: Repositories = Depends(get_repositories)
+) -> Any:
+    stakeholder = await repos.stakeholders.get(stakeholder_id)
+    if stakeholder is None:
+        raise HTTPException(status_code=404, detail="Stakeholder not found")
+    return stakeholder
 
 
 # ---------------------------------------------------------------------------
-# Campaigns (CRUD placeholders)
+# Campaigns
 # ---------------------------------------------------------------------------
 
 
 @app.post("/api/v1/campaigns", response_model=CampaignResponse, status_code=201)
-async def create_campaign(data: CampaignCreate) -> dict:
-    now = datetime.now(timezone.utc)
-    return {
-        "id": str(uuid.uuid4()),
-        **data.model_dump(),
-        "status": "planning",
-        "total_touches": 0,
-        "current_step": 0,
-        "start_date": None,
-        "end_date": None,
-        "created_at": now.isoformat(),
-    }
+async def create_campaign(
+    data: CampaignCreate, repos: Repositories = Depends(get_repositories)
+) -> Any:
+    return await repos.campaigns.add(data)
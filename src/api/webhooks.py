@@ -1,44 +1,64 @@
-"""Webhook handlers for incoming events from HousingLens and HousingEar."""
+"""Webhook handlers for incoming events from HousingLens and HousingEar.
+
+Ingestion is deliberately cheap: validate the payload, append it to the
+event stream under an idempotency key, and acknowledge with 202. Alert
+generation happens in the event workers (see ``src.distribution.event_worker``).
+Upstream retries of an event already seen inside the dedupe window are
+acknowledged without being queued again.
+"""
 
 from __future__ import annotations
 
+import hashlib
+import json
 import logging
 from typing import Any
 
-from fastapi import APIRouter, Request
+from fastapi import APIRouter, BackgroundTasks
 
-from src.generators.alerts import AlertGenerator
+from src.distribution.event_queue import event_queue
+from src.integrations.cache import lens_cache
+from src.models.schemas import WebhookAck, WebhookEvent
 
 router = APIRouter(prefix="/api/v1/webhooks", tags=["webhooks"])
 logger = logging.getLogger(__name__)
 
 
-@router.post("/housing-lens")
-async def housing_lens_webhook(request: Request) -> dict[str, str]:
-    """Receive push notifications from HousingLens (friction score changes, new trends)."""
-    payload: dict[str, Any] = await request.json()
-    event_type = payload.get("event_type", "unknown")
-    logger.info("HousingLens webhook received: %s", event_type)
+def idempotency_key(source: str, payload: dict[str, Any]) -> str:
+    """Return ``source:event_id`` or, without an event id, a hash of the payload."""
+    event_id = payload.get("event_id")
+    if event_id:
+        return f"{source}:{event_id}"
+    canonical = json.dumps(payload, sort_keys=True, separators=(",", ":"), default=str)
+    return f"{source}:sha256:{hashlib.sha256(canonical.encode('utf-8')).hexdigest()}"
 
-    if event_type == "friction_score_change":
-        # Trigger alert generation for affected stakeholders.
-        generator = AlertGenerator()
-        affected_jurisdiction = payload.get("jurisdiction", "")
-        # In production, look up stakeholders by jurisdiction and generate alerts.
-        _ = generator, affected_jurisdiction
 
-    return {"status": "received", "event_type": event_type}
+@router.post("/housing-lens", status_code=202, response_model=WebhookAck)
+async def housing_lens_webhook(event: WebhookEvent, background: BackgroundTasks) -> dict[str, Any]:
+    """Receive push notifications from HousingLens (friction score changes, new trends)."""
+    if event.event_type == "friction_score_change" and event.jurisdiction and lens_cache:
+        # Cached scores/estimates for this jurisdiction are now out of date.
+        background.add_task(lens_cache.invalidate, jurisdiction=event.jurisdiction)
+    return await _ingest("housing_lens", event)
 
 
-@router.post("/housing-ear")
-async def housing_ear_webhook(request: Request) -> dict[str, str]:
+@router.post("/housing-ear", status_code=202, response_model=WebhookAck)
+async def housing_ear_webhook(event: WebhookEvent) -> dict[str, Any]:
     """Receive push notifications from HousingEar (policy updates, meeting agendas)."""
-    payload: dict[str, Any] = await request.json()
-    event_type = payload.get("event_type", "unknown")
-    logger.info("HousingEar webhook received: %s", event_type)
+    return await _ingest("housing_ear", event)
 
-    if event_type in ("federal_register_change", "meeting_agenda", "policy_update"):
-        generator = AlertGenerator()
-        _ = generator
 
-    return {"status": "received", "event_type": event_type}
+async def _ingest(source: str, event: WebhookEvent) -> dict[str, Any]:
+    payload = event.model_dump(mode="json", exclude_none=True)
+    key = idempotency_key(source, payload)
+    stream_id = await event_queue.publish(source, payload, idempotency_key=key)
+    if stream_id is None:
+        logger.info("Duplicate %s webhook dropped: %s", source, key)
+        return {"status": "duplicate", "event_type": event.event_type, "idempotency_key": key}
+    logger.debug("%s webhook queued: %s (%s)", source, event.event_type, stream_id)
+    return {
+        "status": "queued",
+        "event_type": event.event_type,
+        "idempotency_key": key,
+        "stream_id": stream_id,
+    }
@@ -1,11 +1,35 @@
 """Database engine and session configuration."""
 
+from typing import Any
+
+from sqlalchemy.engine import make_url
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import DeclarativeBase
 
 from src.config import settings
 
-engine = create_async_engine(settings.database_url, echo=False)
+
+def engine_options(url: str) -> dict[str, Any]:
+    """Pool and driver options for an engine on *url*, taken from ``settings``."""
+    options: dict[str, Any] = {
+        "echo": False,
+        "pool_size": settings.db_pool_size,
+        "max_overflow": settings.db_max_overflow,
+        "pool_timeout": settings.db_pool_timeout_seconds,
+        "pool_recycle": settings.db_pool_recycle_seconds,
+        "pool_pre_ping": settings.db_pool_pre_ping,
+    }
+    if make_url(url).get_driver_name() == "asyncpg":
+        # SQLAlchemy prepares every statement through its own per-connection
+        # cache; asyncpg's cache covers anything it runs directly.
+        options["connect_args"] = {
+            "prepared_statement_cache_size": settings.db_statement_cache_size,
+            "statement_cache_size": settings.db_statement_cache_size,
+        }
+    return options
+
+
+engine = create_async_engine(settings.database_url, **engine_options(settings.database_url))
 async_session = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
 
 
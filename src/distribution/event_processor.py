@@ -0,0 +1,199 @@
+"""Turn a queued webhook event into alerts for the stakeholders it affects."""
+
+from __future__ import annotations
+
+import logging
+import uuid
+from datetime import datetime, timedelta, timezone
+from typing import Any
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from src.config import settings
+from src.database import async_session
+from src.distribution.event_queue import QueuedEvent
+from src.distribution.stakeholder_index import StakeholderIndex, stakeholder_index
+from src.generators.alerts import AlertGenerationError, AlertGenerator
+from src.integrations.cache import lens_cache
+from src.integrations.distribution_channels import DistributionManager
+from src.integrations.rate_limiter import Priority
+from src.models.alert import AlertStatus
+from src.models.stakeholder import AlertFrequency
+from src.repositories import AlertRepository
+
+logger = logging.getLogger(__name__)
+
+# Event types that warrant stakeholder alerts.
+ALERTABLE_EVENTS = {
+    "housing_lens": {"friction_score_change", "trend_alert"},
+    "housing_ear": {"federal_register_change", "meeting_agenda", "policy_update"},
+}
+
+
+# Namespace for the uuid5 alert ids derived from (event id, stakeholder id).
+ALERT_ID_NAMESPACE = uuid.UUID("5b0e7f3c-1d2a-4c8e-9f6b-3a7d2e1c4b90")
+
+
+def alert_id(event_id: str, stakeholder_id: str) -> str:
+    """The id of the alert *event_id* produces for *stakeholder_id*.
+
+    The same on every delivery of the event, so a redelivered event maps
+    onto the rows it already wrote.
+    """
+    return str(uuid.uuid5(ALERT_ID_NAMESPACE, f"{event_id}:{stakeholder_id}"))
+
+
+def event_scope(payload: dict[str, Any]) -> tuple[str | None, list[str], list[str]]:
+    """Extract (jurisdiction, topics, project_ids) from a webhook payload."""
+    topics = list(payload.get("topics") or [])
+    if payload.get("topic"):
+        topics.append(payload["topic"])
+    project_ids = [str(p) for p in payload.get("project_ids") or []]
+    return payload.get("jurisdiction") or None, topics, project_ids
+
+
+def is_alertable(source: str, event_type: str) -> bool:
+    return event_type in ALERTABLE_EVENTS.get(source, set())
+
+
+class EventProcessor:
+    """Generate alerts only for the stakeholders an event touches.
+
+    Stakeholders with ``IMMEDIATE`` notification frequency are notified
+    right away; everyone else's alerts stay pending for their digest.
+    Alerts are stored in bulk as pending before any are sent, and the ones
+    delivered are then marked sent with one set-based update. Pass
+    ``sessions=None`` to skip persistence.
+
+    Processing is idempotent per event: alert ids come from ``alert_id``
+    and ``created_at`` from the event's receipt time, rows already stored
+    are skipped, and only alerts still pending are sent. A redelivered
+    event therefore neither duplicates alerts nor re-emails stakeholders
+    (unless it failed between sending and marking the alerts sent).
+
+    If alerts could not be generated for some stakeholders, the others'
+    alerts are still stored and sent, and the ``AlertGenerationError`` is
+    then re-raised so the event is retried or dead-lettered.
+    """
+
+    def __init__(
+        self,
+        generator: AlertGenerator | None = None,
+        index: StakeholderIndex | None = None,
+        distributor: DistributionManager | None = None,
+        sessions: async_sessionmaker[AsyncSession] | None = async_session,
+    ) -> None:
+        if generator is None:
+            generator = AlertGenerator()
+            # Background work yields rate-limit headroom to interactive requests.
+            generator.llm.priority = Priority.BATCH
+        self.generator = generator
+        self.index = index or stakeholder_index
+        self._distributor = distributor
+        self.sessions = sessions
+
+    @property
+    def distributor(self) -> DistributionManager:
+        if self._distributor is None:
+            self._distributor = DistributionManager()
+        return self._distributor
+
+    async def process(self, event: QueuedEvent) -> list[dict[str, Any]]:
+        if not is_alertable(event.source, event.event_type):
+            return []
+
+        jurisdiction = event.payload.get("jurisdiction")
+        if event.event_type == "friction_score_change" and jurisdiction and lens_cache:
+            # Make sure this worker does not draft alerts from stale scores.
+            await lens_cache.invalidate(jurisdiction=jurisdiction)
+
+        affected = self.index.match(*event_scope(event.payload))
+        profiles = self.index.profiles(affected)
+        if not profiles:
+            logger.info("Event %s (%s) affects no stakeholders.", event.id, event.event_type)
+            return []
+
+        failure: AlertGenerationError | None = None
+        try:
+            alerts = await self.generator.generate_alerts(profiles, since=_since(event))
+        except AlertGenerationError as exc:
+            # Keep the alerts that were generated, then fail the event so it is retried.
+            alerts, failure = exc.alerts, exc
+        created_at = _received(event)
+        for alert in alerts:
+            alert["id"] = alert_id(event.id, str(alert["stakeholder_id"]))
+            alert["created_at"] = created_at.isoformat()
+        if self.sessions is not None:
+            async with self.sessions() as session:
+                repo = AlertRepository(session)
+                await repo.insert_many(alerts, skip_existing=True)
+                stored = await repo.statuses([a["id"] for a in alerts], created_at=created_at)
+            for alert in alerts:
+                status = stored.get(uuid.UUID(alert["id"]))
+                if status is not None:
+                    alert["status"] = status.value
+
+        by_id = {p["id"]: p for p in profiles}
+        sent = []
+        for alert in alerts:
+            if (alert.get("status") or AlertStatus.PENDING.value) != AlertStatus.PENDING.value:
+                continue
+            stakeholder = by_id.get(alert.get("stakeholder_id"), {})
+            immediate = stakeholder.get("notification_frequency") == AlertFrequency.IMMEDIATE.value
+            if immediate and await self._notify_now(alert, stakeholder):
+                sent.append(alert["id"])
+
+        if sent and self.sessions is not None:
+            async with self.sessions() as session:
+                await AlertRepository(session).set_status(
+                    sent, AlertStatus.SENT, from_status=AlertStatus.PENDING
+                )
+
+        logger.info(
+            "Event %s (%s): %d stakeholders affected, %d alerts generated.",
+            event.id,
+            event.event_type,
+            len(profiles),
+            len(alerts),
+        )
+        if failure is not None:
+            raise failure
+        return alerts
+
+    async def _notify_now(self, alert: dict[str, Any], stakeholder: dict[str, Any]) -> bool:
+        """Email *alert* to *stakeholder*; return whether it was delivered."""
+        email = stakeholder.get("contact_email")
+        if not email:
+            return False
+        results = await self.distributor.distribute(
+            {"to_emails": [email], "subject": alert["headline"], "body": alert["summary"]},
+            channels=["email"],
+        )
+        if not all(r.success for r in results):
+            return False
+        alert["status"] = "sent"
+        alert["sent_at"] = datetime.now(timezone.utc).isoformat()
+        return True
+
+
+def _received(event: QueuedEvent) -> datetime:
+    """When the event was queued: its ``received_at``, else its stream id's timestamp."""
+    try:
+        return datetime.fromisoformat(event.received_at)
+    except ValueError:
+        pass
+    try:
+        return datetime.fromtimestamp(int(event.id.split("-")[0]) / 1000, tz=timezone.utc)
+    except ValueError:
+        return datetime.now(timezone.utc)
+
+
+def _since(event: QueuedEvent) -> str | None:
+    """Look back from the event so upstream queries include the change itself."""
+    if event.payload.get("since"):
+        return str(event.payload["since"])
+    try:
+        received = datetime.fromisoformat(event.received_at)
+    except ValueError:
+        return None
+    return (received - timedelta(minutes=settings.event_lookback_minutes)).isoformat()
@@ -0,0 +1,214 @@
+"""Durable webhook event queue backed by a Redis stream.
+
+Webhooks append events with ``XADD``; alert workers consume them through a
+consumer group so every event is delivered to one worker and stays pending
+until acknowledged. Events a crashed worker left unacknowledged are
+reclaimed after ``event_claim_idle_ms``; events that keep failing are moved
+to a dead-letter stream after ``event_max_attempts``.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Any
+
+import redis.asyncio as redis
+from redis.exceptions import ResponseError
+
+from src.config import settings
+
+logger = logging.getLogger(__name__)
+
+STREAM_KEY = "housingspeak:events"
+DEAD_LETTER_KEY = "housingspeak:events:dead"
+ATTEMPTS_KEY = "housingspeak:events:attempts"
+PROCESSED_PREFIX = "housingspeak:events:processed:"
+DEDUPE_PREFIX = "housingspeak:events:seen:"
+CONSUMER_GROUP = "alert-workers"
+
+# Claim the idempotency key and append the event in one round trip; a key
+# that is already claimed means the event is a duplicate and nothing is added.
+_PUBLISH_ONCE = """
+if redis.call('SET', KEYS[1], '1', 'NX', 'EX', ARGV[1]) then
+    return redis.call('XADD', KEYS[2], 'MAXLEN', '~', ARGV[2], '*',
+                      'source', ARGV[3], 'payload', ARGV[4], 'received_at', ARGV[5],
+                      'idempotency_key', ARGV[6])
+end
+return false
+"""
+
+
+@dataclass
+class QueuedEvent:
+    id: str
+    source: str
+    event_type: str
+    payload: dict[str, Any]
+    received_at: str
+
+
+def _decode(value: Any) -> str:
+    return value.decode("utf-8") if isinstance(value, bytes) else str(value)
+
+
+def decode_entry(entry_id: Any, fields: dict[Any, Any]) -> QueuedEvent:
+    """Turn a raw stream entry into a ``QueuedEvent``."""
+    decoded = {_decode(k): _decode(v) for k, v in fields.items()}
+    payload = json.loads(decoded.get("payload", "{}"))
+    return QueuedEvent(
+        id=_decode(entry_id),
+        source=decoded.get("source", "unknown"),
+        event_type=payload.get("event_type", "unknown"),
+        payload=payload,
+        received_at=decoded.get("received_at", ""),
+    )
+
+
+def stream_id_at(moment: datetime) -> str:
+    """Return the smallest stream id at or after *moment*."""
+    return f"{int(moment.timestamp() * 1000)}-0"
+
+
+class EventQueue:
+    """Redis-stream event queue with consumer-group delivery."""
+
+    def __init__(self, client: redis.Redis | None = None, stream: str = STREAM_KEY) -> None:
+        self._redis = client or redis.from_url(settings.redis_url)
+        self.stream = stream
+        self._group_ready = False
+        self._publish_once = self._redis.register_script(_PUBLISH_ONCE)
+
+    async def ensure_group(self) -> None:
+        if self._group_ready:
+            return
+        try:
+            await self._redis.xgroup_create(self.stream, CONSUMER_GROUP, id="0", mkstream=True)
+        except ResponseError as exc:
+            if "BUSYGROUP" not in str(exc):
+                raise
+        self._group_ready = True
+
+    async def publish(
+        self, source: str, payload: dict[str, Any], idempotency_key: str | None = None
+    ) -> str | None:
+        """Append an event and return its stream id.
+
+        With an *idempotency_key*, an event already seen within
+        ``webhook_dedupe_window_seconds`` is dropped and ``None`` returned.
+        """
+        received_at = datetime.now(timezone.utc).isoformat()
+        if idempotency_key is None:
+            entry_id = await self._redis.xadd(
+                self.stream,
+                {"source": source, "payload": json.dumps(payload), "received_at": received_at},
+                maxlen=settings.event_stream_maxlen,
+                approximate=True,
+            )
+            return _decode(entry_id)
+
+        entry_id = await self._publish_once(
+            keys=[f"{DEDUPE_PREFIX}{idempotency_key}", self.stream],
+            args=[
+                settings.webhook_dedupe_window_seconds,
+                settings.event_stream_maxlen,
+                source,
+                json.dumps(payload),
+                received_at,
+                idempotency_key,
+            ],
+        )
+        return _decode(entry_id) if entry_id else None
+
+    async def read(
+        self, consumer: str, count: int = 10, block_ms: int = 5000
+    ) -> list[QueuedEvent]:
+        """Return the next events for *consumer*.
+
+        Events abandoned by other consumers are reclaimed first; otherwise
+        this blocks up to *block_ms* for new ones.
+        """
+        await self.ensure_group()
+        _, claimed, *_ = await self._redis.xautoclaim(
+            self.stream,
+            CONSUMER_GROUP,
+            consumer,
+            min_idle_time=settings.event_claim_idle_ms,
+            start_id="0-0",
+            count=count,
+        )
+        if claimed:
+            return [decode_entry(eid, fields) for eid, fields in claimed if fields]
+
+        response = await self._redis.xreadgroup(
+            CONSUMER_GROUP, consumer, {self.stream: ">"}, count=count, block=block_ms
+        )
+        return [decode_entry(eid, fields) for _, entries in response for eid, fields in entries]
+
+    async def ack(self, event: QueuedEvent) -> None:
+        await self._redis.xack(self.stream, CONSUMER_GROUP, event.id)
+        await self._redis.hdel(ATTEMPTS_KEY, event.id)
+
+    async def record_failure(self, event: QueuedEvent) -> bool:
+        """Count a failed attempt; dead-letter the event once it runs out of retries.
+
+        Returns ``True`` when the event was dead-lettered.
+        """
+        attempts = await self._redis.hincrby(ATTEMPTS_KEY, event.id, 1)
+        if attempts < settings.event_max_attempts:
+            return False
+        await self._redis.xadd(
+            DEAD_LETTER_KEY,
+            {"event_id": event.id, "source": event.source, "payload": json.dumps(event.payload)},
+            maxlen=settings.event_stream_maxlen,
+            approximate=True,
+        )
+        await self.ack(event)
+        logger.error("Event %s dead-lettered after %d attempts.", event.id, attempts)
+        return True
+
+    async def dead_lettered_since(self, moment: datetime, batch_size: int = 500) -> set[str]:
+        """Ids of the events dead-lettered after *moment*.
+
+        An event is dead-lettered after it arrives, so this covers every
+        event received since *moment* that has been given up on.
+        """
+        ids: set[str] = set()
+        start = stream_id_at(moment)
+        while True:
+            entries = await self._redis.xrange(DEAD_LETTER_KEY, min=start, count=batch_size)
+            for _, fields in entries:
+                decoded = {_decode(k): _decode(v) for k, v in fields.items()}
+                ids.add(decoded.get("event_id", ""))
+            if len(entries) < batch_size:
+                return ids
+            start = "(" + _decode(entries[-1][0])
+
+    async def mark_processed(self, event: QueuedEvent) -> None:
+        ttl = settings.event_processed_ttl_seconds
+        await self._redis.set(f"{PROCESSED_PREFIX}{event.id}", "1", ex=ttl)
+
+    async def is_processed(self, event: QueuedEvent) -> bool:
+        return bool(await self._redis.exists(f"{PROCESSED_PREFIX}{event.id}"))
+
+    async def since(self, moment: datetime, batch_size: int = 500) -> list[QueuedEvent]:
+        """Return every event still in the stream that arrived after *moment*."""
+        events: list[QueuedEvent] = []
+        start = stream_id_at(moment)
+        while True:
+            entries = await self._redis.xrange(self.stream, min=start, count=batch_size)
+            events.extend(decode_entry(eid, fields) for eid, fields in entries)
+            if len(entries) < batch_size:
+                return events
+            start = "(" + _decode(entries[-1][0])
+
+    async def depth(self) -> dict[str, int]:
+        """Return stream length and the number of delivered-but-unacked events."""
+        await self.ensure_group()
+        pending = await self._redis.xpending(self.stream, CONSUMER_GROUP)
+        return {"length": await self._redis.xlen(self.stream), "pending": pending["pending"]}
+
+
+event_queue = EventQueue()
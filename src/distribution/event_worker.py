@@ -0,0 +1,89 @@
+"""Long-running consumer that turns queued webhook events into alerts.
+
+Run one or more per deployment::
+
+    python -m src.distribution.event_worker
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+import signal
+import socket
+import time
+
+from src.config import settings
+from src.database import async_session
+from src.distribution.event_processor import EventProcessor
+from src.distribution.event_queue import EventQueue, QueuedEvent, event_queue
+from src.distribution.stakeholder_index import stakeholder_index
+from src.integrations.http_pool import http_pool
+
+logger = logging.getLogger(__name__)
+
+
+async def handle_event(queue: EventQueue, processor: EventProcessor, event: QueuedEvent) -> None:
+    """Process one event, acknowledging it on success or recording the failure."""
+    if await queue.is_processed(event):
+        await queue.ack(event)
+        return
+    try:
+        await processor.process(event)
+    except Exception:
+        logger.exception("Processing event %s failed.", event.id)
+        await queue.record_failure(event)
+        return
+    await queue.mark_processed(event)
+    await queue.ack(event)
+
+
+async def run_worker(
+    consumer: str,
+    queue: EventQueue | None = None,
+    processor: EventProcessor | None = None,
+    stop: asyncio.Event | None = None,
+) -> None:
+    queue = queue or event_queue
+    processor = processor or EventProcessor()
+    stop = stop or asyncio.Event()
+    logger.info("Event worker %s started.", consumer)
+    refreshed = time.monotonic()
+    while not stop.is_set():
+        if time.monotonic() - refreshed >= settings.stakeholder_index_refresh_seconds:
+            refreshed = time.monotonic()
+            await _refresh_index()
+        events = await queue.read(consumer)
+        for event in events:
+            await handle_event(queue, processor, event)
+    logger.info("Event worker %s stopped.", consumer)
+
+
+async def _refresh_index() -> None:
+    """Pick up stakeholders created or changed by the API since the last check."""
+    try:
+        async with async_session() as session:
+            await stakeholder_index.refresh_if_changed(session)
+    except Exception:
+        logger.warning("Could not refresh the stakeholder index.", exc_info=True)
+
+
+async def main() -> None:
+    stop = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(sig, stop.set)
+
+    await http_pool.open()
+    try:
+        async with async_session() as session:
+            await stakeholder_index.rebuild(session)
+        await run_worker(f"{socket.gethostname()}-{os.getpid()}", stop=stop)
+    finally:
+        await http_pool.close()
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    asyncio.run(main())
@@ -0,0 +1,256 @@
+"""State of asynchronous generation jobs.
+
+``POST /api/v1/content/generate?async=true`` records a job here and hands
+it to a Celery worker. The worker stores the outcome, and clients poll
+``GET /api/v1/jobs/{id}`` or receive it by webhook callback. Each job
+expires after ``job_ttl_seconds``.
+
+Submitting the same request again while its job is queued, running or
+has succeeded returns the existing job instead of starting a new one.
+Failed jobs, and requests with ``force_fresh``, are not deduplicated. A
+job's callback URLs are kept apart from its record, so every submitter of
+a deduplicated request is called back; one that finds the job already
+finished gets the result in its response instead. A job still running
+``job_running_timeout_seconds`` after it started is reported as failed,
+so a worker that died mid-job does not hold the request until the job
+expires.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import enum
+import hashlib
+import hmac
+import ipaddress
+import json
+import logging
+import socket
+import uuid
+from dataclasses import asdict, dataclass, field, fields
+from datetime import datetime, timedelta, timezone
+from typing import Any
+
+import httpx
+
+from src.config import settings
+from src.integrations.cache import MemoryCacheBackend, RedisCacheBackend
+
+logger = logging.getLogger(__name__)
+
+JOB_PREFIX = "housingspeak:job:"
+DEDUPE_PREFIX = "housingspeak:job:dedupe:"
+MAX_CALLBACKS = 20
+SIGNATURE_HEADER = "X-HousingSpeak-Signature"
+
+
+class JobStatus(str, enum.Enum):
+    QUEUED = "queued"
+    RUNNING = "running"
+    SUCCEEDED = "succeeded"
+    FAILED = "failed"
+
+
+FINISHED = frozenset({JobStatus.SUCCEEDED, JobStatus.FAILED})
+
+
+def _now() -> str:
+    return datetime.now(timezone.utc).isoformat()
+
+
+@dataclass
+class Job:
+    id: str
+    kind: str
+    request: dict[str, Any]
+    status: JobStatus = JobStatus.QUEUED
+    result: dict[str, Any] | None = None
+    error: str | None = None
+    created_at: str = field(default_factory=_now)
+    updated_at: str = field(default_factory=_now)
+    started_at: str | None = None
+
+
+_JOB_FIELDS = frozenset(f.name for f in fields(Job))
+
+
+def request_fingerprint(kind: str, request: dict[str, Any]) -> str:
+    """Hash of a job request, ignoring fields that do not change its result."""
+    material = {k: v for k, v in request.items() if k not in ("callback_url", "force_fresh")}
+    encoded = json.dumps([kind, material], sort_keys=True, default=str)
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+class JobStore:
+    """Jobs kept in a cache backend supporting ``get``/``set``/``add``/``delete``."""
+
+    def __init__(
+        self,
+        backend: MemoryCacheBackend | RedisCacheBackend,
+        ttl: float = 86_400.0,
+        running_timeout: float = 900.0,
+    ) -> None:
+        self.backend = backend
+        self.ttl = ttl
+        self.running_timeout = running_timeout
+
+    async def submit(
+        self,
+        kind: str,
+        request: dict[str, Any],
+        callback_url: str | None = None,
+        dedupe: bool = True,
+    ) -> tuple[Job, bool]:
+        """Record a new job, or return the live job for the same request.
+
+        Returns the job and whether it was newly created (and so still
+        needs to be enqueued). *callback_url* is added to the returned
+        job's callbacks unless that job has already finished.
+        """
+        job = Job(id=str(uuid.uuid4()), kind=kind, request=request)
+        # Saved before the dedupe key can point at it, so a concurrent
+        # submitter never finds the key without the job.
+        await self.save(job)
+        if dedupe:
+            dedupe_key = DEDUPE_PREFIX + request_fingerprint(kind, request)
+            if not await self.backend.add(dedupe_key, job.id, self.ttl):
+                existing = await self.get(await self.backend.get(dedupe_key) or "")
+                if existing is not None and existing.status != JobStatus.FAILED:
+                    if callback_url and existing.status not in FINISHED:
+                        await self.add_callback(existing.id, callback_url)
+                        # The worker may have finished before the callback was
+                        # added; the caller then gets the result from this job.
+                        existing = await self.get(existing.id) or existing
+                    # The record saved above was never used.
+                    await self.backend.delete(JOB_PREFIX + job.id)
+                    return existing, False
+                await self.backend.set(dedupe_key, job.id, self.ttl)
+        if callback_url:
+            await self.add_callback(job.id, callback_url)
+        return job, True
+
+    async def get(self, job_id: str) -> Job | None:
+        """The job, reported as failed if it has overrun ``running_timeout``."""
+        data = await self.backend.get(JOB_PREFIX + job_id) if job_id else None
+        if not data:
+            return None
+        values = {k: v for k, v in data.items() if k in _JOB_FIELDS}
+        job = Job(**{**values, "status": JobStatus(data["status"])})
+        if job.status == JobStatus.RUNNING and job.started_at:
+            deadline = datetime.fromisoformat(job.started_at) + timedelta(
+                seconds=self.running_timeout
+            )
+            if datetime.now(timezone.utc) > deadline:
+                job.status = JobStatus.FAILED
+                job.error = f"worker did not finish within {self.running_timeout:g}s"
+        return job
+
+    async def save(self, job: Job) -> None:
+        job.updated_at = _now()
+        await self.backend.set(JOB_PREFIX + job.id, asdict(job), self.ttl)
+
+    async def mark_running(self, job: Job) -> None:
+        job.status, job.started_at = JobStatus.RUNNING, _now()
+        await self.save(job)
+
+    async def mark_succeeded(self, job: Job, result: dict[str, Any]) -> None:
+        job.status, job.result, job.error = JobStatus.SUCCEEDED, result, None
+        await self.save(job)
+
+    async def mark_failed(self, job: Job, error: str) -> None:
+        job.status, job.error = JobStatus.FAILED, error
+        await self.save(job)
+
+    def _callback_key(self, job_id: str, slot: int) -> str:
+        return f"{JOB_PREFIX}{job_id}:callback:{slot}"
+
+    async def add_callback(self, job_id: str, url: str) -> bool:
+        """Add *url* to the job's callbacks; return False if they are full.
+
+        Each URL claims the lowest free numbered slot with ``add``, so
+        concurrent submitters never overwrite each other.
+        """
+        for slot in range(MAX_CALLBACKS):
+            key = self._callback_key(job_id, slot)
+            if await self.backend.add(key, url, self.ttl) or await self.backend.get(key) == url:
+                return True
+        logger.warning("Job %s already has %d callbacks; dropping %s.", job_id, MAX_CALLBACKS, url)
+        return False
+
+    async def callbacks(self, job_id: str) -> list[str]:
+        urls = []
+        for slot in range(MAX_CALLBACKS):
+            url = await self.backend.get(self._callback_key(job_id, slot))
+            if url is None:
+                break
+            urls.append(url)
+        return urls
+
+    async def notify(self, job: Job, client: httpx.AsyncClient | None = None) -> int:
+        """Deliver the finished *job* to each of its callbacks; return how many accepted it."""
+        delivered = 0
+        for url in await self.callbacks(job.id):
+            delivered += await deliver_callback(job, url, client)
+        return delivered
+
+
+def sign_payload(body: bytes, secret: str) -> str:
+    return "sha256=" + hmac.new(secret.encode("utf-8"), body, hashlib.sha256).hexdigest()
+
+
+async def resolves_publicly(host: str) -> bool:
+    """Whether every address *host* resolves to is globally routable.
+
+    Checked before each delivery, so a name that validated when the job
+    was submitted cannot later be pointed at an internal address.
+    """
+    try:
+        infos = await asyncio.get_running_loop().getaddrinfo(host, 443, type=socket.SOCK_STREAM)
+    except OSError:
+        return False
+    addresses = {ipaddress.ip_address(info[4][0].split("%")[0]) for info in infos}
+    return bool(addresses) and all(address.is_global for address in addresses)
+
+
+async def deliver_callback(job: Job, url: str, client: httpx.AsyncClient | None = None) -> bool:
+    """POST the finished *job* to *url*; return whether it was accepted.
+
+    The body is signed with ``job_callback_secret`` when one is configured.
+    Delivery failures are logged and do not affect the job, which stays
+    available for polling.
+    """
+    host = httpx.URL(url).host
+    if not await resolves_publicly(host):
+        logger.warning("Callback for job %s skipped: %s is not a public host.", job.id, host)
+        return False
+    body = json.dumps(asdict(job), default=str).encode("utf-8")
+    headers = {"Content-Type": "application/json"}
+    if settings.job_callback_secret:
+        headers[SIGNATURE_HEADER] = sign_payload(body, settings.job_callback_secret)
+    try:
+        if client is None:
+            async with httpx.AsyncClient(timeout=settings.job_callback_timeout_seconds) as owned:
+                resp = await owned.post(url, content=body, headers=headers)
+        else:
+            resp = await client.post(url, content=body, headers=headers)
+        resp.raise_for_status()
+    except httpx.HTTPError as exc:
+        logger.warning("Callback for job %s to %s failed: %s", job.id, url, exc)
+        return False
+    return True
+
+
+def build_job_store() -> JobStore:
+    backend: MemoryCacheBackend | RedisCacheBackend
+    if settings.job_store_backend == "memory":
+        backend = MemoryCacheBackend()
+    else:
+        backend = RedisCacheBackend(settings.redis_url)
+    return JobStore(
+        backend,
+        ttl=settings.job_ttl_seconds,
+        running_timeout=settings.job_running_timeout_seconds,
+    )
+
+
+job_store = build_job_store()
@@ -0,0 +1,161 @@
+"""Monthly ``alerts`` partitions: create them ahead of time, archive old ones.
+
+``alerts`` is range-partitioned on ``created_at`` by calendar month (UTC),
+one table per month named ``alerts_yYYYYmMM`` (migration 0003). There is no
+default partition, so an insert into a month with no partition fails.
+``ensure_partitions`` creates the current month and the next
+``alert_partition_months_ahead``. ``archive_partitions`` handles months older
+than ``alert_retention_months``: each is detached, written to a gzipped CSV
+under ``alert_archive_dir``, and dropped. Queries bounded on ``created_at``
+only scan the months they cover.
+"""
+
+from __future__ import annotations
+
+import gzip
+import logging
+import re
+from datetime import date, datetime, timezone
+from pathlib import Path
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine
+
+from src.config import settings
+
+logger = logging.getLogger(__name__)
+
+PARENT = "alerts"
+PARTITION_NAME = re.compile(r"^alerts_y(\d{4})m(\d{2})$")
+
+
+def month_start(day: date) -> date:
+    return day.replace(day=1)
+
+
+def add_months(month: date, months: int) -> date:
+    index = month.year * 12 + month.month - 1 + months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def partition_name(month: date) -> str:
+    return f"{PARENT}_y{month.year:04d}m{month.month:02d}"
+
+
+def partition_month(name: str) -> date | None:
+    """The month a partition named *name* holds, or None for other tables."""
+    match = PARTITION_NAME.match(name)
+    if match is None:
+        return None
+    return date(int(match[1]), int(match[2]), 1)
+
+
+def upcoming_months(today: date, months_ahead: int) -> list[date]:
+    """The current month and the *months_ahead* after it."""
+    return [add_months(month_start(today), n) for n in range(months_ahead + 1)]
+
+
+def expired(names: list[str], today: date, retention_months: int) -> list[str]:
+    """Partitions in *names* whose whole month is older than the retention window."""
+    cutoff = add_months(month_start(today), -retention_months)
+    months = {name: partition_month(name) for name in names}
+    return sorted(name for name, month in months.items() if month is not None and month < cutoff)
+
+
+def _bound(month: date) -> str:
+    return f"{month.isoformat()} 00:00:00+00"
+
+
+async def partition_tables(conn: AsyncConnection) -> tuple[set[str], set[str]]:
+    """Names of the attached partitions, and of every table named like one.
+
+    A table in the second set but not the first was detached by an archive
+    run that did not finish.
+    """
+    attached = await conn.scalars(
+        text(
+            "SELECT c.relname FROM pg_inherits i JOIN pg_class c ON c.oid = i.inhrelid "
+            "WHERE i.inhparent = CAST(:parent AS regclass)"
+        ),
+        {"parent": PARENT},
+    )
+    tables = await conn.scalars(
+        text(
+            "SELECT relname FROM pg_class "
+            "WHERE relkind = 'r' AND relname LIKE :prefix AND pg_table_is_visible(oid)"
+        ),
+        {"prefix": f"{PARENT}_y%"},
+    )
+    named = {name for name in tables if PARTITION_NAME.match(name)}
+    return set(attached), named
+
+
+async def ensure_partitions(
+    engine: AsyncEngine, today: date | None = None, months_ahead: int | None = None
+) -> list[str]:
+    """Create any missing partitions for the coming months; return the new names."""
+    today = today or datetime.now(timezone.utc).date()
+    if months_ahead is None:
+        months_ahead = settings.alert_partition_months_ahead
+    created = []
+    async with engine.begin() as conn:
+        attached, _ = await partition_tables(conn)
+        for month in upcoming_months(today, months_ahead):
+            name = partition_name(month)
+            if name in attached:
+                continue
+            # Names and bounds are built from dates, so they are safe to inline.
+            await conn.execute(
+                text(
+                    f"CREATE TABLE {name} PARTITION OF {PARENT} "
+                    f"FOR VALUES FROM ('{_bound(month)}') TO ('{_bound(add_months(month, 1))}')"
+                )
+            )
+            created.append(name)
+    if created:
+        logger.info("Created alert partitions: %s", ", ".join(created))
+    return created
+
+
+async def _export(engine: AsyncEngine, name: str, archive_dir: Path) -> Path:
+    """Write partition *name* to ``<archive_dir>/<name>.csv.gz`` with ``COPY``."""
+    archive_dir.mkdir(parents=True, exist_ok=True)
+    path = archive_dir / f"{name}.csv.gz"
+    partial = path.with_name(path.name + ".partial")
+    async with engine.connect() as conn:
+        raw = (await conn.get_raw_connection()).driver_connection
+        with gzip.open(partial, "wb") as out:
+            await raw.copy_from_table(name, output=out, format="csv", header=True)
+    partial.replace(path)
+    return path
+
+
+async def archive_partitions(
+    engine: AsyncEngine,
+    today: date | None = None,
+    retention_months: int | None = None,
+    archive_dir: Path | str | None = None,
+) -> list[Path]:
+    """Detach, archive and drop partitions past retention; return the archive files.
+
+    Each partition is dropped only after its archive file is complete, so a
+    failed run leaves a detached table that the next run archives.
+    """
+    today = today or datetime.now(timezone.utc).date()
+    if retention_months is None:
+        retention_months = settings.alert_retention_months
+    archive_dir = Path(archive_dir or settings.alert_archive_dir)
+    async with engine.connect() as conn:
+        attached, named = await partition_tables(conn)
+
+    archived = []
+    for name in expired(sorted(named), today, retention_months):
+        if name in attached:
+            async with engine.begin() as conn:
+                await conn.execute(text(f"ALTER TABLE {PARENT} DETACH PARTITION {name}"))
+        path = await _export(engine, name, archive_dir)
+        async with engine.begin() as conn:
+            await conn.execute(text(f"DROP TABLE {name}"))
+        logger.info("Archived alert partition %s to %s.", name, path)
+        archived.append(path)
+    return archived
@@ -4,14 +4,25 @@ from __future__ import annotations
 
 import asyncio
 import logging
+from datetime import datetime, timedelta, timezone
+from typing import TYPE_CHECKING
 
 from celery import Celery
 from celery.schedules import crontab
+from celery.signals import worker_process_init, worker_process_shutdown
 
 from src.config import settings
+from src.integrations.http_pool import http_pool
+
+if TYPE_CHECKING:
+    from src.api.dependencies import Services
+    from src.models.content import AudienceType, ContentType
 
 logger = logging.getLogger(__name__)
 
+# Marks a stakeholder as emailed for one digest run (``<prefix><job_key>:<id>``).
+DIGEST_SENT_PREFIX = "housingspeak:digest-sent:"
+
 app = Celery("housingspeak", broker=settings.redis_url, backend=settings.redis_url)
 
 app.conf.beat_schedule = {
@@ -23,68 +34,289 @@ app.conf.beat_schedule = {
         "task": "src.distribution.scheduler.scan_and_alert",
         "schedule": crontab(hour=7, minute=0),
     },
+    "alert-partition-maintenance": {
+        "task": "src.distribution.scheduler.maintain_alert_partitions",
+        "schedule": crontab(hour=2, minute=30),
+    },
 }
 app.conf.timezone = "US/Mountain"
 
 
-def _run_async(coro):  # type: ignore[no-untyped-def]
-    """Run an async coroutine inside a Celery sync task."""
-    loop = asyncio.new_event_loop()
+# One event loop per worker process, so the shared HTTP pool (which is bound
+# to the loop that opened it) survives across tasks.
+_worker_loop: asyncio.AbstractEventLoop | None = None
+_worker_services: Services | None = None
+
+
+def _get_worker_loop() -> asyncio.AbstractEventLoop:
+    global _worker_loop
+    if _worker_loop is None or _worker_loop.is_closed():
+        _worker_loop = asyncio.new_event_loop()
+        _worker_loop.run_until_complete(http_pool.open())
+    return _worker_loop
+
+
+@worker_process_init.connect
+def _open_worker_resources(**_: object) -> None:
+    _get_worker_loop()
+
+
+@worker_process_shutdown.connect
+def _close_worker_resources(**_: object) -> None:
+    global _worker_loop, _worker_services
+    if _worker_loop is None or _worker_loop.is_closed():
+        return
     try:
-        return loop.run_until_complete(coro)
+        if _worker_services is not None:
+            _worker_loop.run_until_complete(_worker_services.aclose())
+            _worker_services = None
+        _worker_loop.run_until_complete(http_pool.close())
     finally:
-        loop.close()
+        _worker_loop.close()
+        _worker_loop = None
+
+
+def _get_worker_services() -> Services:
+    """Generators and clients shared by every task in this worker process."""
+    global _worker_services
+    if _worker_services is None:
+        from src.api.dependencies import Services
+
+        _worker_services = Services.build()
+    return _worker_services
+
+
+def _run_async(coro):  # type: ignore[no-untyped-def]
+    """Run an async coroutine inside a Celery sync task."""
+    return _get_worker_loop().run_until_complete(coro)
 
 
 @app.task(name="src.distribution.scheduler.generate_weekly_digest")
 def generate_weekly_digest() -> None:
-    """Generate and send weekly digest emails to all stakeholders."""
+    """Generate and send weekly digest emails to all stakeholders.
+
+    All reports are generated through one Message Batch keyed by ISO week,
+    so a task retried after a worker restart picks up the batch it already
+    submitted instead of paying for a second one. Each delivered email is
+    recorded per week and stakeholder, and a retry skips the stakeholders
+    already emailed.
+    """
+    from src.database import async_session
+    from src.distribution.stakeholder_index import stakeholder_index
     from src.generators.stakeholder_report import StakeholderReportGenerator
+    from src.integrations.claude_api import batch_state_store
+    from src.integrations.distribution_channels import DistributionManager
+    from src.models.stakeholder import AlertFrequency
 
     async def _run() -> None:
-        generator = StakeholderReportGenerator()
-        # In production, fetch stakeholders from the database.
         logger.info("Weekly digest generation started.")
-        # Placeholder: iterate stakeholders and generate/send reports.
-        _ = generator  # ensure import is used
-        logger.info("Weekly digest generation completed.")
+        async with async_session() as session:
+            await stakeholder_index.rebuild(session)
+        stakeholders = [
+            s
+            for s in stakeholder_index.all_profiles()
+            if s.get("notification_frequency") == AlertFrequency.WEEKLY_DIGEST.value
+        ]
+        if not stakeholders:
+            logger.info("Weekly digest: no subscribed stakeholders.")
+            return
+
+        year, week, _ = datetime.now(timezone.utc).isocalendar()
+        job_key = f"weekly-digest:{year}-W{week:02d}"
+        unsent = [
+            s
+            for s in stakeholders
+            if not await batch_state_store.get(_digest_sent_key(job_key, s["id"]))
+        ]
+        if len(unsent) < len(stakeholders):
+            logger.info(
+                "Weekly digest: %d stakeholders already emailed for %s.",
+                len(stakeholders) - len(unsent),
+                job_key,
+            )
+        if not unsent:
+            return
+
+        generator = StakeholderReportGenerator()
+        reports = await generator.generate_many(unsent, job_key=job_key)
+
+        by_id = {s["id"]: s for s in unsent}
+        distributor = DistributionManager()
+        sent = 0
+        for report in reports:
+            email = by_id[report["stakeholder_id"]].get("contact_email")
+            if not email:
+                continue
+            results = await distributor.distribute(
+                {"to_emails": [email], "subject": report["headline"], "body": report["body"]},
+                channels=["email"],
+            )
+            if all(r.success for r in results):
+                await batch_state_store.set(
+                    _digest_sent_key(job_key, report["stakeholder_id"]),
+                    True,
+                    settings.llm_batch_state_ttl_seconds,
+                )
+                sent += 1
+        logger.info(
+            "Weekly digest generation completed: %d reports, %d emailed.", len(reports), sent
+        )
 
     _run_async(_run())
 
 
+def _digest_sent_key(job_key: str, stakeholder_id: str) -> str:
+    return f"{DIGEST_SENT_PREFIX}{job_key}:{stakeholder_id}"
+
+
 @app.task(name="src.distribution.scheduler.scan_and_alert")
 def scan_and_alert() -> None:
-    """Scan for new policy changes and generate stakeholder alerts."""
-    from src.generators.alerts import AlertGenerator
+    """Reconcile webhook events from the last 24 hours that were never processed.
+
+    Alerts are normally generated by the event workers as webhooks arrive;
+    this daily pass only replays events they missed. Dead-lettered events
+    are skipped. A failing event is logged and counted as a failed attempt,
+    and the pass moves on to the next one.
+    """
+    from src.database import async_session
+    from src.distribution.event_processor import EventProcessor
+    from src.distribution.event_queue import event_queue
+    from src.distribution.stakeholder_index import stakeholder_index
 
     async def _run() -> None:
-        generator = AlertGenerator()
-        logger.info("Daily alert scan started.")
-        # Placeholder: fetch stakeholders from DB and generate alerts.
-        _ = generator
-        logger.info("Daily alert scan completed.")
+        logger.info("Daily alert reconciliation started.")
+        async with async_session() as session:
+            await stakeholder_index.rebuild(session)
+
+        now = datetime.now(timezone.utc)
+        # Leave recent events to the workers that are still within their claim window.
+        cutoff = now - timedelta(milliseconds=settings.event_claim_idle_ms)
+        processor = EventProcessor()
+        start = now - timedelta(hours=24)
+        dead = await event_queue.dead_lettered_since(start)
+        replayed = failed = 0
+        for event in await event_queue.since(start):
+            if event.received_at and datetime.fromisoformat(event.received_at) > cutoff:
+                continue
+            if event.id in dead or await event_queue.is_processed(event):
+                continue
+            try:
+                await processor.process(event)
+            except Exception:
+                logger.exception("Replaying event %s failed.", event.id)
+                await event_queue.record_failure(event)
+                failed += 1
+                continue
+            await event_queue.mark_processed(event)
+            replayed += 1
+        logger.info(
+            "Daily alert reconciliation completed: %d events replayed, %d failed.",
+            replayed,
+            failed,
+        )
+
+    _run_async(_run())
+
+
+@app.task(name="src.distribution.scheduler.maintain_alert_partitions")
+def maintain_alert_partitions() -> None:
+    """Create the coming months' alert partitions and archive expired ones.
+
+    Runs daily; both steps are idempotent, and a run that fails part way is
+    finished by the next one.
+    """
+    from src.database import engine
+    from src.distribution.partitions import archive_partitions, ensure_partitions
+
+    async def _run() -> None:
+        created = await ensure_partitions(engine)
+        archived = await archive_partitions(engine)
+        logger.info(
+            "Alert partition maintenance: %d created, %d archived.", len(created), len(archived)
+        )
 
     _run_async(_run())
 
 
 @app.task(name="src.distribution.scheduler.generate_content")
-def generate_content_task(content_type: str, jurisdiction: str, audience: str) -> dict:
-    """On-demand content generation task."""
-    from src.generators.policy_brief import PolicyBriefGenerator
-    from src.generators.public_content import PublicContentGenerator
+def generate_content_task(
+    content_type: str, jurisdiction: str, audience: str, job_id: str | None = None
+) -> dict:
+    """On-demand content generation task.
+
+    With a *job_id* the full request is read from the job store. The content
+    is saved to the database, and the outcome is written back to the job
+    and delivered to its callback URLs.
+    """
+    from src.database import async_session
+    from src.distribution.job_store import FINISHED, job_store
+    from src.models.schemas import ContentGenerateRequest, ContentResponse
+    from src.repositories import ContentRepository
+
+    async def _run_job(job_id: str) -> dict:
+        job = await job_store.get(job_id)
+        if job is None:
+            logger.warning("Content job %s expired before it ran.", job_id)
+            return {}
+        if job.status in FINISHED:
+            return job.result or {}
+        await job_store.mark_running(job)
+        try:
+            req = ContentGenerateRequest.model_validate(job.request)
+            result = await _get_worker_services().generate_content(req)
+            payload = ContentResponse.model_validate(result).model_dump(mode="json")
+            async with async_session() as session:
+                await ContentRepository(session).add(
+                    result, stakeholder_id=req.stakeholder_id, campaign_id=req.campaign_id
+                )
+        except Exception as exc:
+            logger.exception("Content job %s failed.", job_id)
+            await job_store.mark_failed(job, str(exc) or type(exc).__name__)
+            await job_store.notify(job)
+            return {}
+        await job_store.mark_succeeded(job, payload)
+        await job_store.notify(job)
+        return payload
 
     async def _run() -> dict:
-        if content_type in ("Policy_Brief", "policy_brief"):
-            from src.models.content import AudienceType
+        kind = _content_type(content_type)
+        req = ContentGenerateRequest(
+            content_type=kind,
+            audience=_audience(audience, kind),
+            jurisdiction=jurisdiction,
+        )
+        return await _get_worker_services().generate_content(req)
 
-            gen = PolicyBriefGenerator()
-            return await gen.generate(
-                jurisdiction=jurisdiction, audience=AudienceType(audience)
-            )
-        else:
-            gen_pub = PublicContentGenerator()
-            return await gen_pub.generate(
-                jurisdiction=jurisdiction, content_type=content_type
-            )
+    return _run_async(_run_job(job_id) if job_id else _run())
+
+
+def _content_type(value: str) -> ContentType:
+    """Accept ``policy_brief`` as well as the enum value ``Policy_Brief``."""
+    from src.models.content import ContentType
+
+    for member in ContentType:
+        if value.lower() == member.value.lower():
+            return member
+    raise ValueError(f"Unknown content type: {value!r}")
+
+
+def _audience(value: str, content_type: ContentType) -> AudienceType:
+    """The audience for *content_type*, matched like ``_content_type``.
+
+    Public content is always written for the general public, so *value* is
+    not used for it.
+    """
+    from src.models.content import AudienceType, ContentType
 
-    return _run_async(_run())
+    public = (
+        ContentType.BLOG_POST,
+        ContentType.INFOGRAPHIC,
+        ContentType.OP_ED,
+        ContentType.SOCIAL_MEDIA,
+    )
+    if content_type in public:
+        return AudienceType.GENERAL_PUBLIC
+    for member in AudienceType:
+        if value.lower() == member.value.lower():
+            return member
+    raise ValueError(f"Unknown audience: {value!r}")
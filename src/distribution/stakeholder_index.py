@@ -0,0 +1,251 @@
+"""In-memory inverted index from change events to interested stakeholders.
+
+Maps jurisdiction → topic → stakeholder ids (plus topic and project
+lookups) so webhook events can be routed without scanning every
+``Stakeholder`` row. Changes written through the ORM in this process are
+applied when their transaction commits and dropped if it (or the savepoint
+they were made in) rolls back. The event workers pick up writes from other
+processes, such as the API, with ``refresh_if_changed``, which rebuilds the
+index when the table's version (row count and latest ``updated_at``) moves.
+The API does not load the index; it has no reads that need it.
+"""
+
+from __future__ import annotations
+
+import logging
+from typing import Any
+
+from sqlalchemy import event, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, SessionTransaction, object_session
+
+from src.models.stakeholder import Stakeholder
+
+logger = logging.getLogger(__name__)
+
+# Stakeholders with no declared interests want to hear about every topic.
+ANY_TOPIC = "*"
+
+# ``Session.info`` key for index changes waiting on their transaction.
+_PENDING = "stakeholder_index_changes"
+
+
+def _norm(value: str) -> str:
+    return value.strip().casefold()
+
+
+class StakeholderIndex:
+    """Incrementally maintained jurisdiction/topic/project → stakeholder id index."""
+
+    def __init__(self) -> None:
+        self.clear()
+        self.version: tuple[int, Any] | None = None
+
+    def clear(self) -> None:
+        self._by_jurisdiction_topic: dict[str, dict[str, set[str]]] = {}
+        self._by_jurisdiction: dict[str, set[str]] = {}
+        self._by_topic: dict[str, set[str]] = {}
+        self._by_project: dict[str, set[str]] = {}
+        self._profiles: dict[str, dict[str, Any]] = {}
+        self._postings: dict[str, tuple[set[str], set[str], set[str]]] = {}
+
+    def __len__(self) -> int:
+        return len(self._profiles)
+
+    def __contains__(self, stakeholder_id: object) -> bool:
+        return str(stakeholder_id) in self._profiles
+
+    def upsert(self, profile: dict[str, Any]) -> None:
+        """Add or replace a stakeholder profile (dict shaped like ``StakeholderResponse``)."""
+        sid = str(profile["id"])
+        self.remove(sid)
+
+        projects = profile.get("projects") or []
+        jurisdictions = {_norm(profile.get("jurisdiction") or "")}
+        jurisdictions |= {_norm(p.get("location") or "") for p in projects}
+        jurisdictions.discard("")
+        topics = {_norm(t) for t in profile.get("interests") or [] if t} or {ANY_TOPIC}
+        project_ids = {str(p["project_id"]) for p in projects if p.get("project_id")}
+
+        for jur in jurisdictions:
+            self._by_jurisdiction.setdefault(jur, set()).add(sid)
+            by_topic = self._by_jurisdiction_topic.setdefault(jur, {})
+            for topic in topics:
+                by_topic.setdefault(topic, set()).add(sid)
+        for topic in topics:
+            self._by_topic.setdefault(topic, set()).add(sid)
+        for pid in project_ids:
+            self._by_project.setdefault(pid, set()).add(sid)
+
+        self._profiles[sid] = profile
+        self._postings[sid] = (jurisdictions, topics, project_ids)
+
+    def remove(self, stakeholder_id: str) -> None:
+        sid = str(stakeholder_id)
+        postings = self._postings.pop(sid, None)
+        self._profiles.pop(sid, None)
+        if postings is None:
+            return
+        jurisdictions, topics, project_ids = postings
+        for jur in jurisdictions:
+            _discard(self._by_jurisdiction, jur, sid)
+            by_topic = self._by_jurisdiction_topic.get(jur, {})
+            for topic in topics:
+                _discard(by_topic, topic, sid)
+            if not by_topic:
+                self._by_jurisdiction_topic.pop(jur, None)
+        for topic in topics:
+            _discard(self._by_topic, topic, sid)
+        for pid in project_ids:
+            _discard(self._by_project, pid, sid)
+
+    def match(
+        self,
+        jurisdiction: str | None = None,
+        topics: list[str] | None = None,
+        project_ids: list[str] | None = None,
+    ) -> set[str]:
+        """Return ids of stakeholders affected by an event.
+
+        A stakeholder matches when the event's jurisdiction covers them
+        (their own or one of their project locations) and the event's
+        topics overlap their interests — or when the event names one of
+        their projects. An event without a jurisdiction is treated as
+        national and matched on topic alone.
+        """
+        wanted = {_norm(t) for t in topics or [] if t}
+        if jurisdiction:
+            jur = _norm(jurisdiction)
+            if wanted:
+                by_topic = self._by_jurisdiction_topic.get(jur, {})
+                matched = set(by_topic.get(ANY_TOPIC, ()))
+                for topic in wanted:
+                    matched |= by_topic.get(topic, set())
+            else:
+                matched = set(self._by_jurisdiction.get(jur, ()))
+        elif wanted:
+            matched = set(self._by_topic.get(ANY_TOPIC, ()))
+            for topic in wanted:
+                matched |= self._by_topic.get(topic, set())
+        else:
+            matched = set()
+
+        for pid in project_ids or []:
+            matched |= self._by_project.get(str(pid), set())
+        return matched
+
+    def profiles(self, stakeholder_ids: set[str] | list[str]) -> list[dict[str, Any]]:
+        """Return the indexed profiles for *stakeholder_ids* (unknown ids are skipped)."""
+        return [self._profiles[sid] for sid in stakeholder_ids if sid in self._profiles]
+
+    def all_profiles(self) -> list[dict[str, Any]]:
+        return list(self._profiles.values())
+
+    async def rebuild(self, session: AsyncSession) -> int:
+        """Reload the whole index from the ``stakeholders`` table."""
+        version = await _table_version(session)
+        rows = (await session.execute(select(Stakeholder))).scalars().all()
+        self.clear()
+        for row in rows:
+            self.upsert(stakeholder_to_profile(row))
+        self.version = version
+        logger.info("Stakeholder index rebuilt with %d stakeholders.", len(rows))
+        return len(rows)
+
+    async def refresh_if_changed(self, session: AsyncSession) -> bool:
+        """Rebuild when another process has changed ``stakeholders`` since the last build."""
+        if await _table_version(session) == self.version:
+            return False
+        await self.rebuild(session)
+        return True
+
+
+async def _table_version(session: AsyncSession) -> tuple[int, Any]:
+    # Inserts and updates move max(updated_at); deletes change the count.
+    row = (await session.execute(select(func.count(), func.max(Stakeholder.updated_at)))).one()
+    return row[0], row[1]
+
+
+def _discard(postings: dict[str, set[str]], key: str, sid: str) -> None:
+    ids = postings.get(key)
+    if ids is None:
+        return
+    ids.discard(sid)
+    if not ids:
+        del postings[key]
+
+
+def stakeholder_to_profile(row: Stakeholder) -> dict[str, Any]:
+    """Convert a ``Stakeholder`` row into the profile dict used by generators."""
+    return {
+        "id": str(row.id),
+        "stakeholder_type": getattr(row.stakeholder_type, "value", row.stakeholder_type),
+        "organization": row.organization,
+        "jurisdiction": row.jurisdiction,
+        "contact_name": row.contact_name,
+        "contact_email": row.contact_email,
+        "interests": list(row.interests or []),
+        "notification_frequency": getattr(
+            row.notification_frequency, "value", row.notification_frequency
+        ),
+        "notification_channels": list(row.notification_channels or []),
+        "alert_threshold": getattr(row.alert_threshold, "value", row.alert_threshold),
+        "projects": list(row.projects or []),
+    }
+
+
+stakeholder_index = StakeholderIndex()
+
+
+def _defer(target: Stakeholder, profile: dict[str, Any] | None) -> None:
+    """Queue an upsert (or, with no *profile*, a removal) until the write commits.
+
+    Each change is tagged with the savepoint it was made in, if any, so a
+    rolled-back savepoint drops only its own changes.
+    """
+    session = object_session(target)
+    if session is None:
+        return
+    savepoint = session.get_nested_transaction()
+    session.info.setdefault(_PENDING, []).append((savepoint, str(target.id), profile))
+
+
+def _within(transaction: SessionTransaction | None, savepoint: SessionTransaction) -> bool:
+    while transaction is not None:
+        if transaction is savepoint:
+            return True
+        transaction = transaction.parent
+    return False
+
+
+@event.listens_for(Stakeholder, "after_insert")
+@event.listens_for(Stakeholder, "after_update")
+def _index_stakeholder(_mapper: Any, _connection: Any, target: Stakeholder) -> None:
+    _defer(target, stakeholder_to_profile(target))
+
+
+@event.listens_for(Stakeholder, "after_delete")
+def _unindex_stakeholder(_mapper: Any, _connection: Any, target: Stakeholder) -> None:
+    _defer(target, None)
+
+
+@event.listens_for(Session, "after_commit")
+def _apply_committed(session: Session) -> None:
+    if session.in_nested_transaction():
+        # A released savepoint; its changes wait for the outer commit.
+        return
+    for _, sid, profile in session.info.pop(_PENDING, []):
+        if profile is None:
+            stakeholder_index.remove(sid)
+        else:
+            stakeholder_index.upsert(profile)
+
+
+@event.listens_for(Session, "after_soft_rollback")
+def _discard_rolled_back(session: Session, previous_transaction: SessionTransaction) -> None:
+    if not previous_transaction.nested:
+        session.info.pop(_PENDING, None)
+        return
+    # Only the savepoint rolled back; changes made outside it still stand.
+    pending = session.info.get(_PENDING, [])
+    pending[:] = [c for c in pending if not _within(c[0], previous_transaction)]
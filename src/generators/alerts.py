@@ -2,85 +2,223 @@
 
 from __future__ import annotations
 
+import asyncio
+import logging
 import uuid
+from collections.abc import Awaitable, Sequence
 from datetime import datetime, timezone
 from typing import Any
 
-from src.integrations.claude_api import ClaudeContentGenerator
+from src.config import settings
+from src.integrations.claude_api import ALERT_PROMPT, ClaudeContentGenerator
 from src.integrations.housing_ear_client import HousingEarClient
 from src.integrations.housing_lens_client import HousingLensClient
+from src.integrations.prompt_registry import prompt_registry
 from src.models.alert import AlertPriority, AlertType
+from src.utils.timing import StageTimer
+
+logger = logging.getLogger(__name__)
+
+# (jurisdiction, sorted interests, since) — stakeholders sharing one see the same changes.
+QuerySignature = tuple[str, tuple[str, ...], str | None]
+# (federal register changes, policy updates, trend alerts)
+ChangeSet = tuple[list[dict[str, Any]], list[dict[str, Any]], list[dict[str, Any]]]
+
+
+class AlertGenerationError(ExceptionGroup[Exception]):
+    """Alerts could not be generated for some stakeholders.
+
+    ``exceptions`` holds one error per failed stakeholder; ``alerts`` holds
+    the alerts generated for the others.
+    """
+
+    alerts: list[dict[str, Any]]
+
+    def __new__(
+        cls,
+        message: str,
+        exceptions: Sequence[Exception],
+        alerts: list[dict[str, Any]] | None = None,
+    ) -> AlertGenerationError:
+        self = super().__new__(cls, message, exceptions)
+        self.alerts = alerts or []
+        return self
 
 
 class AlertGenerator:
     """Generate personalized alerts based on stakeholder interests and projects."""
 
-    def __init__(self) -> None:
-        self.llm = ClaudeContentGenerator()
-        self.ear = HousingEarClient()
-        self.lens = HousingLensClient()
+    def __init__(
+        self,
+        llm: ClaudeContentGenerator | None = None,
+        ear: HousingEarClient | None = None,
+        lens: HousingLensClient | None = None,
+    ) -> None:
+        self.llm = llm or ClaudeContentGenerator()
+        self.ear = ear or HousingEarClient()
+        self.lens = lens or HousingLensClient()
+        self.last_run_timings: dict[str, dict[str, float]] = {}
 
     async def generate_alerts(
         self,
         stakeholder_profiles: list[dict[str, Any]],
         since: str | None = None,
+        skip_failures: bool = False,
     ) -> list[dict[str, Any]]:
-        """Scan for changes and produce per-stakeholder alerts."""
-        alerts: list[dict[str, Any]] = []
+        """Scan for changes and produce per-stakeholder alerts.
 
-        for stakeholder in stakeholder_profiles:
-            jurisdiction = stakeholder.get("jurisdiction", "")
-            interests = stakeholder.get("interests", [])
+        Stakeholders sharing a query signature (jurisdiction, interests,
+        since) share one set of upstream fetches. Fetches and Claude calls
+        run concurrently under separate semaphores, and alerts are returned
+        in the same order as *stakeholder_profiles*. Per-stage timings for
+        the run are left in ``last_run_timings``.
 
-            # Gather change data from HousingEar + HousingLens.
-            fed_changes = await self.ear.get_federal_register_changes(
-                jurisdiction=jurisdiction, topics=interests, since=since
-            )
-            policy_updates = await self.ear.get_policy_updates(
-                jurisdiction=jurisdiction, since=since
-            )
-            trend_alerts = await self.lens.get_trend_alerts(
-                jurisdiction=jurisdiction, since=since
+        If any stakeholder's fetch or summary fails, every stakeholder is
+        still attempted and an ``AlertGenerationError`` is then raised. With
+        *skip_failures*, failed stakeholders are logged and left out instead.
+        """
+        timer = StageTimer()
+        upstream_limit = asyncio.Semaphore(settings.alert_upstream_concurrency)
+        llm_limit = asyncio.Semaphore(settings.alert_llm_concurrency)
+
+        # Plan: fetch each distinct signature once, then fan results back out.
+        plan = _plan_fetches(stakeholder_profiles, since)
+        fetched = await asyncio.gather(
+            *(self._fetch_changes(sig, upstream_limit, timer) for sig in plan),
+            return_exceptions=True,
+        )
+        changes_for: list[ChangeSet | BaseException] = [([], [], [])] * len(stakeholder_profiles)
+        for indexes, changes in zip(plan.values(), fetched):
+            for idx in indexes:
+                changes_for[idx] = changes
+
+        results = await asyncio.gather(
+            *(
+                self._alert_for(stakeholder, changes, llm_limit, timer)
+                for stakeholder, changes in zip(stakeholder_profiles, changes_for)
+            ),
+            return_exceptions=True,
+        )
+
+        alerts: list[dict[str, Any]] = []
+        errors: list[Exception] = []
+        for stakeholder, result in zip(stakeholder_profiles, results):
+            if isinstance(result, Exception):
+                logger.error(
+                    "Alert generation failed for stakeholder %s: %s", stakeholder.get("id"), result
+                )
+                errors.append(result)
+            elif isinstance(result, BaseException):
+                raise result
+            elif result is not None:
+                alerts.append(result)
+
+        self.last_run_timings = timer.as_dict()
+        if errors and not skip_failures:
+            raise AlertGenerationError(
+                f"Alert generation failed for {len(errors)} of "
+                f"{len(stakeholder_profiles)} stakeholders",
+                errors,
+                alerts,
             )
+        logger.info(
+            "Generated %d alerts for %d stakeholders (%d distinct queries): %s",
+            len(alerts),
+            len(stakeholder_profiles),
+            len(plan),
+            self.last_run_timings,
+        )
+        return alerts
 
-            # Skip if nothing new.
-            if not fed_changes and not policy_updates and not trend_alerts:
-                continue
+    async def _fetch_changes(
+        self,
+        signature: QuerySignature,
+        upstream_limit: asyncio.Semaphore,
+        timer: StageTimer,
+    ) -> ChangeSet:
+        jurisdiction, interests, since = signature
 
-            # Determine priority and type from the changes.
-            priority, alert_type = _classify(fed_changes, policy_updates, trend_alerts)
+        async def _limited(coro: Awaitable[list[dict[str, Any]]]) -> list[dict[str, Any]]:
+            async with upstream_limit:
+                return await coro
 
-            # Use Claude to draft a human-friendly summary.
-            all_changes = fed_changes + policy_updates + trend_alerts
-            summary_text = await self.llm.generate_alert_summary(
-                changes=all_changes,
-                stakeholder_context=stakeholder,
+        # Gather change data from HousingEar + HousingLens in parallel.
+        with timer.stage("upstream_fetch"):
+            return await asyncio.gather(
+                _limited(
+                    self.ear.get_federal_register_changes(
+                        jurisdiction=jurisdiction, topics=list(interests), since=since
+                    )
+                ),
+                _limited(self.ear.get_policy_updates(jurisdiction=jurisdiction, since=since)),
+                _limited(self.lens.get_trend_alerts(jurisdiction=jurisdiction, since=since)),
             )
 
-            alert = {
-                "id": str(uuid.uuid4()),
-                "stakeholder_id": stakeholder.get("id"),
-                "priority": priority.value,
-                "alert_type": alert_type.value,
-                "headline": _build_headline(all_changes, jurisdiction),
-                "summary": summary_text,
-                "action_required": priority in (AlertPriority.URGENT, AlertPriority.HIGH),
-                "action_deadline": _infer_deadline(fed_changes),
-                "related_project_ids": [
-                    p.get("project_id", "") for p in stakeholder.get("projects", [])
-                ],
-                "recommended_actions": _recommend_actions(priority, alert_type),
-                "source_data": {
-                    "federal_changes": fed_changes,
-                    "policy_updates": policy_updates,
-                    "trend_alerts": trend_alerts,
-                },
-                "status": "pending",
-                "created_at": datetime.now(timezone.utc).isoformat(),
-            }
-            alerts.append(alert)
+    async def _alert_for(
+        self,
+        stakeholder: dict[str, Any],
+        changes: ChangeSet | BaseException,
+        llm_limit: asyncio.Semaphore,
+        timer: StageTimer,
+    ) -> dict[str, Any] | None:
+        if isinstance(changes, BaseException):
+            raise changes
+        jurisdiction = stakeholder.get("jurisdiction", "")
+        fed_changes, policy_updates, trend_alerts = changes
 
-        return alerts
+        # Skip if nothing new.
+        if not fed_changes and not policy_updates and not trend_alerts:
+            return None
+
+        # Determine priority and type from the changes.
+        priority, alert_type = _classify(fed_changes, policy_updates, trend_alerts)
+
+        # Use Claude to draft a human-friendly summary.
+        all_changes = fed_changes + policy_updates + trend_alerts
+        async with llm_limit:
+            with timer.stage("llm_summary"):
+                summary_text = await self.llm.generate_alert_summary(
+                    changes=all_changes,
+                    stakeholder_context=stakeholder,
+                )
+
+        return {
+            "id": str(uuid.uuid4()),
+            "stakeholder_id": stakeholder.get("id"),
+            "priority": priority.value,
+            "alert_type": alert_type.value,
+            "headline": _build_headline(all_changes, jurisdiction),
+            "summary": summary_text,
+            "action_required": priority in (AlertPriority.URGENT, AlertPriority.HIGH),
+            "action_deadline": _infer_deadline(fed_changes),
+            "related_project_ids": [
+                p.get("project_id", "") for p in stakeholder.get("projects", [])
+            ],
+            "recommended_actions": _recommend_actions(priority, alert_type),
+            "source_data": {
+                "federal_changes": fed_changes,
+                "policy_updates": policy_updates,
+                "trend_alerts": trend_alerts,
+                "prompt_version": prompt_registry.version(ALERT_PROMPT),
+            },
+            "status": "pending",
+            "created_at": datetime.now(timezone.utc).isoformat(),
+        }
+
+
+def _query_signature(stakeholder: dict[str, Any], since: str | None) -> QuerySignature:
+    interests = tuple(sorted(set(stakeholder.get("interests") or [])))
+    return stakeholder.get("jurisdiction", ""), interests, since
+
+
+def _plan_fetches(
+    stakeholder_profiles: list[dict[str, Any]], since: str | None
+) -> dict[QuerySignature, list[int]]:
+    """Group stakeholder indexes by the upstream query they need."""
+    plan: dict[QuerySignature, list[int]] = {}
+    for idx, stakeholder in enumerate(stakeholder_profiles):
+        plan.setdefault(_query_signature(stakeholder, since), []).append(idx)
+    return plan
 
 
 def _classify(
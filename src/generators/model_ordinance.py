@@ -5,7 +5,7 @@ from __future__ import annotations
 import uuid
 from typing import Any
 
-from src.integrations.claude_api import ClaudeContentGenerator
+from src.integrations.claude_api import ClaudeContentGenerator, GenerationRequest
 from src.integrations.housing_lens_client import HousingLensClient
 from src.models.content import AudienceType, ContentType
 
@@ -13,9 +13,13 @@ from src.models.content import AudienceType, ContentType
 class ModelOrdinanceGenerator:
     """Generate draft model ordinance text adapted from peer jurisdictions."""
 
-    def __init__(self) -> None:
-        self.llm = ClaudeContentGenerator()
-        self.lens = HousingLensClient()
+    def __init__(
+        self,
+        llm: ClaudeContentGenerator | None = None,
+        lens: HousingLensClient | None = None,
+    ) -> None:
+        self.llm = llm or ClaudeContentGenerator()
+        self.lens = lens or HousingLensClient()
 
     async def generate(
         self,
@@ -29,6 +33,19 @@ class ModelOrdinanceGenerator:
         If *source_jurisdiction* is provided, the ordinance will be framed as
         an adaptation of that jurisdiction's approach.
         """
+        request, context = await self.prepare(
+            target_jurisdiction, source_jurisdiction, topic, friction_data
+        )
+        return await self.assemble(context, await self.llm.run(request))
+
+    async def prepare(
+        self,
+        target_jurisdiction: str,
+        source_jurisdiction: str | None = None,
+        topic: str = "",
+        friction_data: list[dict[str, Any]] | None = None,
+    ) -> tuple[GenerationRequest, dict[str, Any]]:
+        """Fetch the ordinance's data and build its LLM request."""
         if not friction_data:
             friction_data = await self.lens.get_friction_scores(
                 target_jurisdiction, [topic] if topic else None
@@ -36,7 +53,7 @@ class ModelOrdinanceGenerator:
 
         source_label = source_jurisdiction or "best-practice jurisdictions"
 
-        raw_text = await self.llm.generate(
+        request = GenerationRequest(
             system_prompt=(
                 "You are a municipal legislative drafter creating model ordinance "
                 "language for housing policy reform. Write clear, precise legal "
@@ -54,10 +71,23 @@ class ModelOrdinanceGenerator:
                 )
                 + "\n\nProduce the full ordinance text."
             ),
-            max_tokens=4096,
-            temperature=0.5,
+            audience=AudienceType.CITY_COUNCIL.value,
+            task="ordinance",
         )
+        context = {
+            "target_jurisdiction": target_jurisdiction,
+            "source_jurisdiction": source_jurisdiction,
+            "topic": topic,
+            "friction_data": friction_data,
+        }
+        return request, context
 
+    async def assemble(
+        self, context: dict[str, Any], raw_text: str, force_fresh: bool = False
+    ) -> dict[str, Any]:
+        """Turn the generated text into the content dict."""
+        target_jurisdiction = context["target_jurisdiction"]
+        topic = context["topic"]
         return {
             "id": str(uuid.uuid4()),
             "content_type": ContentType.MODEL_ORDINANCE.value,
@@ -66,8 +96,8 @@ class ModelOrdinanceGenerator:
             "headline": f"Model Ordinance — {topic or 'Housing Reform'} ({target_jurisdiction})",
             "body": raw_text,
             "source_data": {
-                "friction_data": friction_data,
-                "source_jurisdiction": source_jurisdiction,
+                "friction_data": context["friction_data"],
+                "source_jurisdiction": context["source_jurisdiction"],
                 "topic": topic,
             },
             "generated_by": "model_ordinance_generator_v1",
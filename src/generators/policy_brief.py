@@ -5,17 +5,29 @@ from __future__ import annotations
 import uuid
 from typing import Any
 
-from src.integrations.claude_api import ClaudeContentGenerator
+from src.integrations.claude_api import (
+    POLICY_BRIEF_PROMPT,
+    ClaudeContentGenerator,
+    GenerationRequest,
+    policy_brief_request,
+)
 from src.integrations.housing_lens_client import HousingLensClient
+from src.integrations.prompt_registry import prompt_registry
 from src.models.content import AudienceType, ContentType
+from src.utils.task_graph import Step, run_steps
+from src.utils.timing import StageTimer
 
 
 class PolicyBriefGenerator:
     """Generate policy reform recommendations grounded in friction scores."""
 
-    def __init__(self) -> None:
-        self.llm = ClaudeContentGenerator()
-        self.lens = HousingLensClient()
+    def __init__(
+        self,
+        llm: ClaudeContentGenerator | None = None,
+        lens: HousingLensClient | None = None,
+    ) -> None:
+        self.llm = llm or ClaudeContentGenerator()
+        self.lens = lens or HousingLensClient()
 
     async def generate(
         self,
@@ -30,41 +42,89 @@ class PolicyBriefGenerator:
         If *friction_data* is not supplied the generator fetches it from
         HousingLens for the given *jurisdiction* and *topics*.
         """
-        if not friction_data:
-            friction_data = await self.lens.get_friction_scores(jurisdiction, topics)
+        request, context = await self.prepare(
+            jurisdiction, audience, friction_data, topics, additional_context
+        )
+        with context["timer"].stage("llm_generation"):
+            raw_text = await self.llm.run(request)
+        return await self.assemble(context, raw_text)
 
-        # Rank by friction score descending and keep the top 5 issues.
-        top_issues = sorted(
-            friction_data, key=lambda d: d.get("friction_score", 0), reverse=True
-        )[:5]
+    async def prepare(
+        self,
+        jurisdiction: str,
+        audience: AudienceType,
+        friction_data: list[dict[str, Any]] | None = None,
+        topics: list[str] | None = None,
+        additional_context: str | None = None,
+    ) -> tuple[GenerationRequest, dict[str, Any]]:
+        """Fetch the brief's data and build its LLM request.
 
-        # Fetch cost estimates to enrich the brief.
-        cost_data = await self.lens.get_cost_estimates(
-            jurisdiction, [i.get("topic", "") for i in top_issues]
-        )
+        Returns the request and the context ``assemble`` needs afterwards.
+        """
+        timer = StageTimer()
+
+        async def _friction() -> list[dict[str, Any]]:
+            return friction_data or await self.lens.get_friction_scores(jurisdiction, topics)
+
+        async def _costs_for_top_issues(
+            friction_scores: list[dict[str, Any]],
+        ) -> list[dict[str, Any]]:
+            return await self.lens.get_cost_estimates(
+                jurisdiction, _topics(_top_issues(friction_scores))
+            )
+
+        async def _costs_for_request_topics() -> list[dict[str, Any]]:
+            return await self.lens.get_cost_estimates(jurisdiction, topics)
+
+        # With the topics known up front, costs are fetched alongside the
+        # friction scores instead of waiting for them.
+        steps = {"friction_scores": Step(_friction)}
+        if topics and not friction_data:
+            steps["cost_estimates"] = Step(_costs_for_request_topics)
+        else:
+            steps["cost_estimates"] = Step(_costs_for_top_issues, after=("friction_scores",))
+        results = await run_steps(steps, timer)
+
+        # Rank by friction score descending and keep the top 5 issues.
+        top_issues = _top_issues(results["friction_scores"])
+        top_topics = set(_topics(top_issues))
+        cost_data = [c for c in results["cost_estimates"] if c.get("topic") in top_topics]
 
         # Build the LLM prompt payload combining friction + cost data.
         enriched_data = _merge_cost_data(top_issues, cost_data)
 
-        raw_text = await self.llm.generate_policy_brief(
-            friction_data=enriched_data,
-            jurisdiction=jurisdiction,
-            audience=audience.value,
-        )
+        request = policy_brief_request(enriched_data, jurisdiction, audience.value)
+        context = {
+            "jurisdiction": jurisdiction,
+            "audience": audience,
+            "top_issues": top_issues,
+            "cost_data": cost_data,
+            "timer": timer,
+        }
+        return request, context
 
+    async def assemble(
+        self, context: dict[str, Any], raw_text: str, force_fresh: bool = False
+    ) -> dict[str, Any]:
+        """Turn the generated text into the content dict."""
+        top_issues = context["top_issues"]
         return {
             "id": str(uuid.uuid4()),
             "content_type": ContentType.POLICY_BRIEF.value,
-            "audience": audience.value,
-            "jurisdiction": jurisdiction,
+            "audience": context["audience"].value,
+            "jurisdiction": context["jurisdiction"],
             "headline": _extract_headline(raw_text),
             "executive_summary": _extract_section(raw_text, "Executive Summary"),
             "body": raw_text,
             "call_to_action": _extract_section(raw_text, "Implementation Roadmap"),
             "source_data": {
                 "friction_scores": [i.get("friction_score") for i in top_issues],
-                "topics": [i.get("topic", "") for i in top_issues],
-                "cost_estimates": cost_data,
+                "topics": _topics(top_issues),
+                "cost_estimates": context["cost_data"],
+            },
+            "supporting_data": {
+                "prompt_version": prompt_registry.version(POLICY_BRIEF_PROMPT),
+                "timings": context["timer"].as_dict(),
             },
             "generated_by": "policy_brief_generator_v1",
             "status": "draft",
@@ -76,6 +136,14 @@ class PolicyBriefGenerator:
 # ---------------------------------------------------------------------------
 
 
+def _top_issues(friction_data: list[dict[str, Any]], limit: int = 5) -> list[dict[str, Any]]:
+    return sorted(friction_data, key=lambda d: d.get("friction_score", 0), reverse=True)[:limit]
+
+
+def _topics(issues: list[dict[str, Any]]) -> list[str]:
+    return [i.get("topic", "") for i in issues]
+
+
 def _merge_cost_data(
     issues: list[dict[str, Any]], costs: list[dict[str, Any]]
 ) -> list[dict[str, Any]]:
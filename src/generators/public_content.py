@@ -2,13 +2,24 @@
 
 from __future__ import annotations
 
+import asyncio
+import logging
 import uuid
+from dataclasses import dataclass
 from typing import Any
 
-from src.integrations.claude_api import ClaudeContentGenerator
+from src.integrations.claude_api import (
+    PUBLIC_CONTENT_PROMPT,
+    ClaudeContentGenerator,
+    GenerationRequest,
+    public_content_request,
+)
 from src.integrations.housing_lens_client import HousingLensClient
+from src.integrations.prompt_registry import prompt_registry
 from src.models.content import AudienceType, ContentType
 
+logger = logging.getLogger(__name__)
+
 CONTENT_TYPE_MAP = {
     "blog_post": ContentType.BLOG_POST,
     "infographic": ContentType.INFOGRAPHIC,
@@ -18,12 +29,33 @@ CONTENT_TYPE_MAP = {
 }
 
 
+@dataclass(frozen=True)
+class SocialPlatform:
+    max_chars: int
+    guidance: str
+
+
+# Platforms that get a variant for ``social_media`` content. Add an entry
+# here to generate one more post per request; they run concurrently.
+SOCIAL_PLATFORMS: dict[str, SocialPlatform] = {
+    "twitter": SocialPlatform(280, "Lead with the most striking number."),
+    "linkedin": SocialPlatform(3000, "Professional tone."),
+}
+
+# How often an over-length variant is regenerated before it is trimmed.
+SOCIAL_VARIANT_RETRIES = 1
+
+
 class PublicContentGenerator:
     """Create accessible public advocacy content from technical data."""
 
-    def __init__(self) -> None:
-        self.llm = ClaudeContentGenerator()
-        self.lens = HousingLensClient()
+    def __init__(
+        self,
+        llm: ClaudeContentGenerator | None = None,
+        lens: HousingLensClient | None = None,
+    ) -> None:
+        self.llm = llm or ClaudeContentGenerator()
+        self.lens = lens or HousingLensClient()
 
     async def generate(
         self,
@@ -31,20 +63,51 @@ class PublicContentGenerator:
         content_type: str = "blog_post",
         friction_data: list[dict[str, Any]] | None = None,
         topics: list[str] | None = None,
+        force_fresh: bool = False,
     ) -> dict[str, Any]:
+        request, context = await self.prepare(jurisdiction, content_type, friction_data, topics)
+        raw_text = await self.llm.run(request, force_fresh=force_fresh)
+        return await self.assemble(context, raw_text, force_fresh=force_fresh)
+
+    async def prepare(
+        self,
+        jurisdiction: str,
+        content_type: str = "blog_post",
+        friction_data: list[dict[str, Any]] | None = None,
+        topics: list[str] | None = None,
+    ) -> tuple[GenerationRequest, dict[str, Any]]:
+        """Fetch the content's data and build its LLM request."""
         if not friction_data:
             friction_data = await self.lens.get_friction_scores(jurisdiction, topics)
 
-        raw_text = await self.llm.generate_public_content(
-            friction_data=friction_data,
-            content_type=content_type,
-            jurisdiction=jurisdiction,
+        request = public_content_request(
+            friction_data, content_type, jurisdiction, AudienceType.GENERAL_PUBLIC.value
         )
+        context = {
+            "jurisdiction": jurisdiction,
+            "content_type": content_type,
+            "friction_data": friction_data,
+        }
+        return request, context
+
+    async def assemble(
+        self, context: dict[str, Any], raw_text: str, force_fresh: bool = False
+    ) -> dict[str, Any]:
+        """Turn the generated text into the content dict, adding social variants if needed.
+
+        *force_fresh* is passed on to the social variant requests, so they
+        bypass the response cache along with the main text.
+        """
+        jurisdiction = context["jurisdiction"]
+        content_type = context["content_type"]
+        friction_data = context["friction_data"]
 
         # For social media, also generate platform-specific variants.
         social_versions: dict[str, str] | None = None
         if content_type == "social_media":
-            social_versions = await self._generate_social_variants(friction_data, jurisdiction)
+            social_versions = await self._generate_social_variants(
+                friction_data, jurisdiction, force_fresh
+            )
 
         ct = CONTENT_TYPE_MAP.get(content_type, ContentType.BLOG_POST)
 
@@ -57,27 +120,71 @@ class PublicContentGenerator:
             "body": raw_text,
             "call_to_action": _extract_cta(raw_text),
             "source_data": {"friction_data": friction_data},
-            "supporting_data": {"social_media_versions": social_versions},
+            "supporting_data": {
+                "social_media_versions": social_versions,
+                "prompt_version": prompt_registry.version(PUBLIC_CONTENT_PROMPT),
+            },
             "seo_keywords": _extract_keywords(friction_data, jurisdiction),
             "generated_by": f"public_content_generator_v1_{content_type}",
             "status": "draft",
         }
 
     async def _generate_social_variants(
-        self, friction_data: list[dict[str, Any]], jurisdiction: str
+        self, friction_data: list[dict[str, Any]], jurisdiction: str, force_fresh: bool = False
     ) -> dict[str, str]:
-        variants: dict[str, str] = {}
-        for platform in ("twitter", "linkedin"):
-            text = await self.llm.generate(
-                system_prompt=(
-                    f"Write a compelling {platform} post about housing policy barriers. "
-                    f"{'Keep under 280 characters.' if platform == 'twitter' else 'Professional tone.'}"
-                ),
-                user_prompt=f"Jurisdiction: {jurisdiction}\nData: {friction_data[:3]}",
-                max_tokens=512,
+        """Write one post per platform in ``SOCIAL_PLATFORMS``, all at once."""
+        user_prompt = f"Jurisdiction: {jurisdiction}\nData: {friction_data[:3]}"
+        texts = await asyncio.gather(
+            *(
+                self._generate_social_variant(platform, spec, user_prompt, force_fresh)
+                for platform, spec in SOCIAL_PLATFORMS.items()
             )
-            variants[platform] = text
-        return variants
+        )
+        return dict(zip(SOCIAL_PLATFORMS, texts))
+
+    async def _generate_social_variant(
+        self, platform: str, spec: SocialPlatform, user_prompt: str, force_fresh: bool = False
+    ) -> str:
+        """Write a post for *platform*, regenerating it alone if it runs over the limit.
+
+        A post still too long after ``SOCIAL_VARIANT_RETRIES`` retries is
+        trimmed at a word boundary.
+        """
+        system_prompt = (
+            f"Write a compelling {platform} post about housing policy barriers. "
+            f"{spec.guidance} Keep it under {spec.max_chars} characters."
+        )
+        prompt = user_prompt
+        for attempt in range(SOCIAL_VARIANT_RETRIES + 1):
+            text = (
+                await self.llm.generate(
+                    system_prompt=system_prompt,
+                    user_prompt=prompt,
+                    task="social_variant",
+                    force_fresh=force_fresh,
+                )
+            ).strip()
+            if len(text) <= spec.max_chars:
+                return text
+            logger.info(
+                "%s variant is %d characters (limit %d); attempt %d.",
+                platform,
+                len(text),
+                spec.max_chars,
+                attempt + 1,
+            )
+            prompt = (
+                f"{user_prompt}\n\nYour previous draft was {len(text)} characters:\n\n"
+                f"{text}\n\nRewrite it in at most {spec.max_chars} characters."
+            )
+        return _truncate_post(text, spec.max_chars)
+
+
+def _truncate_post(text: str, limit: int) -> str:
+    if len(text) <= limit:
+        return text
+    cut = text[: limit - 3].rsplit(" ", 1)[0] or text[: limit - 3]
+    return cut.rstrip() + "..."
 
 
 def _extract_headline(text: str) -> str:
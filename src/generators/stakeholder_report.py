@@ -2,20 +2,29 @@
 
 from __future__ import annotations
 
+import asyncio
+import logging
 import uuid
 from typing import Any
 
-from src.integrations.claude_api import ClaudeContentGenerator
+from src.config import settings
+from src.integrations.claude_api import ClaudeContentGenerator, GenerationRequest
 from src.integrations.housing_lens_client import HousingLensClient
 from src.models.content import AudienceType, ContentType
 
+logger = logging.getLogger(__name__)
+
 
 class StakeholderReportGenerator:
     """Produce tailored reports for individual stakeholder profiles."""
 
-    def __init__(self) -> None:
-        self.llm = ClaudeContentGenerator()
-        self.lens = HousingLensClient()
+    def __init__(
+        self,
+        llm: ClaudeContentGenerator | None = None,
+        lens: HousingLensClient | None = None,
+    ) -> None:
+        self.llm = llm or ClaudeContentGenerator()
+        self.lens = lens or HousingLensClient()
 
     async def generate(
         self,
@@ -33,6 +42,66 @@ class StakeholderReportGenerator:
             Optional pre-fetched friction data. If omitted, fetched from
             HousingLens.
         """
+        request, relevant = await self.prepare(stakeholder, friction_data)
+        raw_text = await self.llm.run(request)
+        return self.assemble(stakeholder, relevant, raw_text)
+
+    async def generate_many(
+        self,
+        stakeholders: list[dict[str, Any]],
+        job_key: str | None = None,
+    ) -> list[dict[str, Any]]:
+        """Build reports for many stakeholders through one Message Batch.
+
+        Reports come back in stakeholder order; stakeholders whose data fetch
+        or generation failed are logged and left out. Pass a stable
+        *job_key* so a restarted worker resumes the same batch.
+        """
+        limit = asyncio.Semaphore(settings.housing_lens_max_concurrency)
+
+        async def _prepare(
+            stakeholder: dict[str, Any],
+        ) -> tuple[GenerationRequest, list[dict[str, Any]]]:
+            async with limit:
+                return await self.prepare(stakeholder)
+
+        prepared = await asyncio.gather(
+            *(_prepare(s) for s in stakeholders), return_exceptions=True
+        )
+        requests: list[GenerationRequest] = []
+        relevant_by_id: dict[str, list[dict[str, Any]]] = {}
+        for stakeholder, outcome in zip(stakeholders, prepared):
+            if isinstance(outcome, BaseException):
+                logger.error(
+                    "Digest data fetch failed for stakeholder %s: %s",
+                    stakeholder.get("id"),
+                    outcome,
+                )
+                continue
+            request, relevant = outcome
+            requests.append(request)
+            relevant_by_id[request.custom_id] = relevant
+        if not requests:
+            return []
+
+        result = await self.llm.generate_batch(requests, job_key=job_key)
+        for custom_id, error in result.errors.items():
+            logger.error("Digest generation failed for stakeholder %s: %s", custom_id, error)
+        return [
+            self.assemble(stakeholder, relevant_by_id[sid], result.texts[sid])
+            for stakeholder in stakeholders
+            if (sid := _custom_id(stakeholder)) in result.texts and sid in relevant_by_id
+        ]
+
+    async def prepare(
+        self,
+        stakeholder: dict[str, Any],
+        friction_data: list[dict[str, Any]] | None = None,
+    ) -> tuple[GenerationRequest, list[dict[str, Any]]]:
+        """Fetch the data for a report and build its LLM request.
+
+        Returns the request and the friction data it was built from.
+        """
         jurisdiction = stakeholder["jurisdiction"]
         interests = stakeholder.get("interests", [])
         projects = stakeholder.get("projects", [])
@@ -55,7 +124,8 @@ class StakeholderReportGenerator:
             f"Active projects: {len(projects)}\n"
         )
 
-        raw_text = await self.llm.generate(
+        request = GenerationRequest(
+            custom_id=_custom_id(stakeholder),
             system_prompt=(
                 "You are a housing policy analyst creating a customized stakeholder "
                 "report. Focus on the stakeholder's specific interests and active "
@@ -66,22 +136,42 @@ class StakeholderReportGenerator:
                 f"Friction data:\n{_format_items(relevant)}\n\n"
                 "Generate a concise, data-driven stakeholder report."
             ),
+            audience=audience.value,
+            task="stakeholder_report",
         )
+        return request, relevant
 
+    def assemble(
+        self,
+        stakeholder: dict[str, Any],
+        relevant: list[dict[str, Any]],
+        raw_text: str,
+    ) -> dict[str, Any]:
+        """Turn the generated text into the report content dict."""
+        jurisdiction = stakeholder["jurisdiction"]
+        audience = _map_stakeholder_type_to_audience(stakeholder.get("stakeholder_type", ""))
         return {
             "id": str(uuid.uuid4()),
             "content_type": ContentType.STAKEHOLDER_REPORT.value,
             "audience": audience.value,
             "jurisdiction": jurisdiction,
+            "stakeholder_id": stakeholder.get("id"),
             "headline": f"Stakeholder Report — {stakeholder.get('organization', jurisdiction)}",
             "executive_summary": None,
             "body": raw_text,
-            "source_data": {"friction_data": relevant, "stakeholder_interests": interests},
+            "source_data": {
+                "friction_data": relevant,
+                "stakeholder_interests": stakeholder.get("interests", []),
+            },
             "generated_by": "stakeholder_report_generator_v1",
             "status": "draft",
         }
 
 
+def _custom_id(stakeholder: dict[str, Any]) -> str:
+    return str(stakeholder["id"])
+
+
 def _map_stakeholder_type_to_audience(stype: str) -> AudienceType:
     mapping = {
         "PHA_Executive_Director": AudienceType.PHA_BOARD,
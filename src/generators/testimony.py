@@ -5,17 +5,27 @@ from __future__ import annotations
 import uuid
 from typing import Any
 
-from src.integrations.claude_api import ClaudeContentGenerator
+from src.integrations.claude_api import (
+    TESTIMONY_PROMPT,
+    ClaudeContentGenerator,
+    GenerationRequest,
+    testimony_request,
+)
 from src.integrations.housing_lens_client import HousingLensClient
+from src.integrations.prompt_registry import prompt_registry
 from src.models.content import AudienceType, ContentType
 
 
 class TestimonyGenerator:
     """Draft spoken testimony for public hearings and legislative sessions."""
 
-    def __init__(self) -> None:
-        self.llm = ClaudeContentGenerator()
-        self.lens = HousingLensClient()
+    def __init__(
+        self,
+        llm: ClaudeContentGenerator | None = None,
+        lens: HousingLensClient | None = None,
+    ) -> None:
+        self.llm = llm or ClaudeContentGenerator()
+        self.lens = lens or HousingLensClient()
 
     async def generate(
         self,
@@ -26,30 +36,53 @@ class TestimonyGenerator:
         time_limit_minutes: int = 3,
         include_personal_framing: bool = True,
     ) -> dict[str, Any]:
+        request, context = await self.prepare(
+            jurisdiction, audience, friction_data, topics, time_limit_minutes
+        )
+        return await self.assemble(context, await self.llm.run(request))
+
+    async def prepare(
+        self,
+        jurisdiction: str,
+        audience: AudienceType = AudienceType.CITY_COUNCIL,
+        friction_data: list[dict[str, Any]] | None = None,
+        topics: list[str] | None = None,
+        time_limit_minutes: int = 3,
+    ) -> tuple[GenerationRequest, dict[str, Any]]:
+        """Fetch the testimony's data and build its LLM request."""
         if not friction_data:
             friction_data = await self.lens.get_friction_scores(jurisdiction, topics)
 
-        raw_text = await self.llm.generate_testimony(
-            friction_data=friction_data,
-            jurisdiction=jurisdiction,
-            time_limit_minutes=time_limit_minutes,
-        )
+        request = testimony_request(friction_data, jurisdiction, time_limit_minutes, audience.value)
+        context = {
+            "jurisdiction": jurisdiction,
+            "audience": audience,
+            "friction_data": friction_data,
+            "time_limit_minutes": time_limit_minutes,
+        }
+        return request, context
 
+    async def assemble(
+        self, context: dict[str, Any], raw_text: str, force_fresh: bool = False
+    ) -> dict[str, Any]:
+        """Turn the generated text into the content dict."""
+        jurisdiction = context["jurisdiction"]
         word_count = len(raw_text.split())
         estimated_minutes = round(word_count / 150, 1)  # ~150 words/minute spoken
 
         return {
             "id": str(uuid.uuid4()),
             "content_type": ContentType.TESTIMONY.value,
-            "audience": audience.value,
+            "audience": context["audience"].value,
             "jurisdiction": jurisdiction,
             "headline": f"Public Testimony — Housing Barriers in {jurisdiction}",
             "body": raw_text,
-            "source_data": {"friction_data": friction_data},
+            "source_data": {"friction_data": context["friction_data"]},
             "supporting_data": {
                 "word_count": word_count,
                 "estimated_minutes": estimated_minutes,
-                "time_limit_minutes": time_limit_minutes,
+                "time_limit_minutes": context["time_limit_minutes"],
+                "prompt_version": prompt_registry.version(TESTIMONY_PROMPT),
             },
             "generated_by": "testimony_generator_v1",
             "status": "draft",
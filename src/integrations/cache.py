@@ -0,0 +1,268 @@
+"""Response caching for HousingLens lookups.
+
+Entries are keyed on ``(endpoint, normalized params)`` and carry the time
+they were stored. A fresh entry is returned directly; a stale one (past its
+TTL but inside the stale window) is returned immediately while a background
+task refreshes it; anything older is fetched synchronously.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import copy
+import hashlib
+import json
+import logging
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+from dataclasses import asdict, dataclass
+from typing import Any, Protocol
+
+from src.config import settings
+
+logger = logging.getLogger(__name__)
+
+KEY_PREFIX = "housingspeak:cache"
+
+
+def normalize_params(params: dict[str, Any] | None) -> dict[str, str]:
+    """Canonicalize query params so equivalent requests share a key.
+
+    Comma-separated ``topics`` are de-duplicated and sorted; empty values
+    are dropped.
+    """
+    normalized: dict[str, str] = {}
+    for name, value in (params or {}).items():
+        if value is None or value == "":
+            continue
+        if name == "topics":
+            value = ",".join(sorted({t.strip() for t in str(value).split(",") if t.strip()}))
+        normalized[name] = str(value)
+    return dict(sorted(normalized.items()))
+
+
+def cache_key(endpoint: str, params: dict[str, Any] | None = None) -> str:
+    """Return the cache key for *endpoint* and *params*.
+
+    The jurisdiction is kept readable in the key so entries can be
+    invalidated per jurisdiction without knowing the other params.
+    """
+    normalized = normalize_params(params)
+    jurisdiction = normalized.get("jurisdiction", "").lower()
+    digest = hashlib.sha256(json.dumps(normalized).encode("utf-8")).hexdigest()[:16]
+    return f"{KEY_PREFIX}:{endpoint}:{jurisdiction}:{digest}"
+
+
+class CacheBackend(Protocol):
+    async def get(self, key: str) -> Any | None: ...
+
+    async def set(self, key: str, value: Any, ttl: float) -> None: ...
+
+    async def delete_prefix(self, prefix: str) -> int: ...
+
+
+class MemoryCacheBackend:
+    """In-process LRU store with per-entry expiry.
+
+    Values are copied on write and read so callers cannot mutate the cached entry.
+    """
+
+    def __init__(self, max_entries: int = 1024) -> None:
+        self.max_entries = max_entries
+        self._entries: OrderedDict[str, tuple[float, Any]] = OrderedDict()
+
+    async def get(self, key: str) -> Any | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return copy.deepcopy(value)
+
+    async def set(self, key: str, value: Any, ttl: float) -> None:
+        self._entries[key] = (time.monotonic() + ttl, copy.deepcopy(value))
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    async def add(self, key: str, value: Any, ttl: float) -> bool:
+        """Set *key* only if it is absent (or expired); return whether it was set."""
+        if await self.get(key) is not None:
+            return False
+        await self.set(key, value, ttl)
+        return True
+
+    async def delete(self, key: str) -> bool:
+        return self._entries.pop(key, None) is not None
+
+    async def delete_prefix(self, prefix: str) -> int:
+        doomed = [k for k in self._entries if k.startswith(prefix)]
+        for key in doomed:
+            del self._entries[key]
+        return len(doomed)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class RedisCacheBackend:
+    """Redis-backed store shared across API and worker processes.
+
+    Size bounds are delegated to Redis' ``maxmemory-policy allkeys-lru``;
+    every key carries its own expiry.
+    """
+
+    def __init__(self, url: str | None = None) -> None:
+        import redis.asyncio as redis
+
+        self._redis = redis.from_url(url or settings.redis_url)
+
+    async def get(self, key: str) -> Any | None:
+        raw = await self._redis.get(key)
+        return json.loads(raw) if raw is not None else None
+
+    async def set(self, key: str, value: Any, ttl: float) -> None:
+        await self._redis.set(key, json.dumps(value), ex=max(1, int(ttl)))
+
+    async def add(self, key: str, value: Any, ttl: float) -> bool:
+        """Set *key* only if it is absent; return whether it was set."""
+        return bool(await self._redis.set(key, json.dumps(value), ex=max(1, int(ttl)), nx=True))
+
+    async def delete(self, key: str) -> bool:
+        return bool(await self._redis.delete(key))
+
+    async def delete_prefix(self, prefix: str) -> int:
+        deleted = 0
+        pattern = "".join(f"\\{c}" if c in "*?[]\\" else c for c in prefix) + "*"
+        async for key in self._redis.scan_iter(match=pattern, count=500):
+            deleted += await self._redis.delete(key)
+        return deleted
+
+
+@dataclass
+class CacheStats:
+    hits: int = 0
+    stale_hits: int = 0
+    misses: int = 0
+    refreshes: int = 0
+    refresh_errors: int = 0
+    invalidations: int = 0
+
+
+class ResponseCache:
+    """TTL + stale-while-revalidate cache in front of upstream GETs."""
+
+    def __init__(
+        self,
+        backend: CacheBackend,
+        ttls: dict[str, float] | None = None,
+        default_ttl: float = 300.0,
+        stale_seconds: float = 600.0,
+    ) -> None:
+        self.backend = backend
+        self.ttls = ttls or {}
+        self.default_ttl = default_ttl
+        self.stale_seconds = stale_seconds
+        self.stats = CacheStats()
+        self._refreshing: dict[str, asyncio.Task[Any]] = {}
+
+    def ttl_for(self, endpoint: str) -> float:
+        return self.ttls.get(endpoint, self.default_ttl)
+
+    async def get_or_fetch(
+        self,
+        endpoint: str,
+        params: dict[str, Any] | None,
+        fetch: Callable[[], Awaitable[Any]],
+    ) -> Any:
+        """Return the cached value for the request, fetching it when needed."""
+        key = cache_key(endpoint, params)
+        ttl = self.ttl_for(endpoint)
+        entry = await self.backend.get(key)
+        if entry is not None:
+            age = time.time() - entry["stored_at"]
+            if age < ttl:
+                self.stats.hits += 1
+                return entry["value"]
+            if age < ttl + self.stale_seconds:
+                self.stats.stale_hits += 1
+                self._schedule_refresh(key, ttl, fetch)
+                return entry["value"]
+
+        self.stats.misses += 1
+        value = await fetch()
+        await self._store(key, value, ttl)
+        return value
+
+    async def put(self, endpoint: str, params: dict[str, Any] | None, value: Any) -> None:
+        """Seed an entry directly, e.g. from a batched upstream response."""
+        await self._store(cache_key(endpoint, params), value, self.ttl_for(endpoint))
+
+    async def invalidate(self, endpoint: str | None = None, jurisdiction: str | None = None) -> int:
+        """Drop entries for an endpoint and/or jurisdiction (everything if neither)."""
+        prefix = KEY_PREFIX + ":"
+        if endpoint is not None:
+            prefix += f"{endpoint}:"
+            if jurisdiction is not None:
+                prefix += f"{jurisdiction.lower()}:"
+            removed = await self.backend.delete_prefix(prefix)
+        elif jurisdiction is not None:
+            removed = 0
+            for ep in self.ttls:
+                removed += await self.backend.delete_prefix(
+                    f"{KEY_PREFIX}:{ep}:{jurisdiction.lower()}:"
+                )
+        else:
+            removed = await self.backend.delete_prefix(prefix)
+        self.stats.invalidations += removed
+        return removed
+
+    def snapshot(self) -> dict[str, Any]:
+        return {"backend": type(self.backend).__name__, **asdict(self.stats)}
+
+    async def _store(self, key: str, value: Any, ttl: float) -> None:
+        entry = {"stored_at": time.time(), "value": value}
+        await self.backend.set(key, entry, ttl + self.stale_seconds)
+
+    def _schedule_refresh(
+        self, key: str, ttl: float, fetch: Callable[[], Awaitable[Any]]
+    ) -> None:
+        if key in self._refreshing:
+            return
+
+        async def _refresh() -> None:
+            try:
+                value = await fetch()
+                await self._store(key, value, ttl)
+                self.stats.refreshes += 1
+            except Exception:
+                self.stats.refresh_errors += 1
+                logger.warning("Background refresh failed for %s", key, exc_info=True)
+            finally:
+                self._refreshing.pop(key, None)
+
+        self._refreshing[key] = asyncio.ensure_future(_refresh())
+
+
+def build_response_cache() -> ResponseCache | None:
+    """Construct the HousingLens cache from settings (``None`` when disabled)."""
+    backend: CacheBackend
+    if settings.lens_cache_backend == "none":
+        return None
+    if settings.lens_cache_backend == "redis":
+        backend = RedisCacheBackend(settings.redis_url)
+    else:
+        backend = MemoryCacheBackend(max_entries=settings.lens_cache_max_entries)
+    return ResponseCache(
+        backend,
+        ttls=settings.lens_cache_ttl_seconds,
+        default_ttl=settings.lens_cache_default_ttl_seconds,
+        stale_seconds=settings.lens_cache_stale_seconds,
+    )
+
+
+lens_cache = build_response_cache()
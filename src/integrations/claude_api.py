@@ -2,45 +2,556 @@
 
 from __future__ import annotations
 
-from pathlib import Path
+import asyncio
+import logging
+import time
+from collections.abc import AsyncIterator
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timezone
 from typing import Any
 
 import anthropic
+import httpx
 
 from src.config import settings
+from src.integrations.cache import CacheBackend, MemoryCacheBackend, RedisCacheBackend
+from src.integrations.llm_cache import LLMResponseCache, llm_cache, llm_cache_key
+from src.integrations.model_router import ModelRouter, model_router
+from src.integrations.prompt_registry import prompt_registry
+from src.integrations.rate_limiter import (
+    Priority,
+    RateLimiter,
+    Reservation,
+    claude_limiter,
+    estimate_tokens,
+    retry_delay,
+)
 
-PROMPTS_DIR = Path(__file__).resolve().parent.parent.parent / "prompts"
+POLICY_BRIEF_PROMPT = "policy_brief_system_prompt.txt"
+PUBLIC_CONTENT_PROMPT = "public_content_system_prompt.txt"
+TESTIMONY_PROMPT = "testimony_system_prompt.txt"
+ALERT_PROMPT = "alert_generation_prompt.txt"
 
+BATCH_STATE_PREFIX = "housingspeak:batch:"
 
-def _load_prompt(filename: str) -> str:
-    path = PROMPTS_DIR / filename
-    return path.read_text(encoding="utf-8")
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class LLMUsageStats:
+    """Token accounting across requests, including prompt-cache reads and writes."""
+
+    requests: int = 0
+    input_tokens: int = 0
+    output_tokens: int = 0
+    cache_read_input_tokens: int = 0
+    cache_creation_input_tokens: int = 0
+
+    def record(self, usage: Any) -> dict[str, int]:
+        counts = {
+            "input_tokens": getattr(usage, "input_tokens", 0) or 0,
+            "output_tokens": getattr(usage, "output_tokens", 0) or 0,
+            "cache_read_input_tokens": getattr(usage, "cache_read_input_tokens", 0) or 0,
+            "cache_creation_input_tokens": getattr(usage, "cache_creation_input_tokens", 0) or 0,
+        }
+        self.requests += 1
+        for name, value in counts.items():
+            setattr(self, name, getattr(self, name) + value)
+        return counts
+
+    def snapshot(self) -> dict[str, Any]:
+        prompt_tokens = (
+            self.input_tokens + self.cache_read_input_tokens + self.cache_creation_input_tokens
+        )
+        ratio = self.cache_read_input_tokens / prompt_tokens if prompt_tokens else 0.0
+        return {**asdict(self), "cache_read_ratio": round(ratio, 4)}
+
+
+llm_usage = LLMUsageStats()
+
+
+# The shortest prefix, in tokens, each model will cache; a breakpoint after a
+# shorter prefix is accepted but nothing is cached. The first matching
+# fragment of the model name wins, and other models need 1024 tokens.
+MIN_CACHEABLE_TOKENS = (("haiku-4-5", 4096), ("opus-4-5", 4096), ("haiku", 2048))
+DEFAULT_MIN_CACHEABLE_TOKENS = 1024
+
+
+def min_cacheable_tokens(model: str) -> int:
+    for fragment, tokens in MIN_CACHEABLE_TOKENS:
+        if fragment in model:
+            return tokens
+    return DEFAULT_MIN_CACHEABLE_TOKENS
+
+
+def build_system_blocks(
+    system_prompt: str, audience_context: str = "", model: str | None = None
+) -> list[dict[str, Any]]:
+    """Lay out the static system prefix as text blocks, ending in a cache breakpoint.
+
+    The system prompt comes first and the audience context second, so
+    requests for the same prompt and audience share an identical prefix.
+    The breakpoint is only added when the estimated prefix reaches
+    ``min_cacheable_tokens`` for *model* (``anthropic_model`` by default).
+    """
+    blocks: list[dict[str, Any]] = [{"type": "text", "text": system_prompt}]
+    if audience_context:
+        blocks.append({"type": "text", "text": audience_context})
+    prefix_tokens = estimate_tokens(system_prompt + audience_context)
+    cacheable = prefix_tokens >= min_cacheable_tokens(model or settings.anthropic_model)
+    if settings.prompt_cache_enabled and cacheable:
+        blocks[-1]["cache_control"] = {"type": "ephemeral"}
+    return blocks
+
+
+@dataclass
+class GenerationRequest:
+    """A fully built prompt, ready to generate, stream or batch.
+
+    *task* selects the model route; ``max_tokens`` and ``temperature`` left
+    as ``None`` come from it. *custom_id* maps a Message Batch result back
+    to the caller.
+    """
+
+    system_prompt: str
+    user_prompt: str
+    max_tokens: int | None = None
+    temperature: float | None = None
+    audience: str | None = None
+    custom_id: str = ""
+    task: str | None = None
+
+    def prompt_kwargs(self) -> dict[str, Any]:
+        """Keyword arguments for ``ClaudeContentGenerator.generate``/``stream``."""
+        return {
+            "system_prompt": self.system_prompt,
+            "user_prompt": self.user_prompt,
+            "max_tokens": self.max_tokens,
+            "temperature": self.temperature,
+            "audience": self.audience,
+            "task": self.task,
+        }
+
+
+@dataclass
+class BatchOutcome:
+    """Texts of the succeeded requests and error descriptions for the rest, by custom id.
+
+    ``batch_id`` is the most recent batch the results were read from.
+    """
+
+    batch_id: str
+    texts: dict[str, str] = field(default_factory=dict)
+    errors: dict[str, str] = field(default_factory=dict)
+
+
+def _cache_key(
+    model: str,
+    system: list[dict[str, Any]],
+    user_prompt: str,
+    max_tokens: int,
+    temperature: float,
+) -> str:
+    system_text = "\n\n".join(block["text"] for block in system)
+    return llm_cache_key(model, system_text, user_prompt, max_tokens, temperature)
+
+
+def _merge(outcome: BatchOutcome, later: BatchOutcome) -> None:
+    """Fold the results of a later batch for the same job into *outcome*."""
+    outcome.batch_id = later.batch_id
+    outcome.texts.update(later.texts)
+    for custom_id, error in later.errors.items():
+        if custom_id not in outcome.texts:
+            outcome.errors[custom_id] = error
+    for custom_id in later.texts:
+        outcome.errors.pop(custom_id, None)
+
+
+class BatchTimeoutError(RuntimeError):
+    """Raised when a Message Batch has not ended within the allowed time."""
+
+
+def build_batch_state_store() -> CacheBackend:
+    """Where submitted batch ids are kept so a restarted worker can resume them."""
+    if settings.llm_batch_state_backend == "redis":
+        return RedisCacheBackend(settings.redis_url)
+    return MemoryCacheBackend()
+
+
+batch_state_store = build_batch_state_store()
 
 
 class ClaudeContentGenerator:
     """Generates advocacy content using the Anthropic Claude API."""
 
-    def __init__(self, api_key: str | None = None, model: str | None = None) -> None:
+    def __init__(
+        self,
+        api_key: str | None = None,
+        model: str | None = None,
+        cache: LLMResponseCache | None = None,
+        force_fresh: bool = False,
+        http_client: httpx.AsyncClient | None = None,
+        batch_state: CacheBackend | None = None,
+        limiter: RateLimiter | None = None,
+        priority: Priority = Priority.INTERACTIVE,
+        router: ModelRouter | None = None,
+    ) -> None:
         self.api_key = api_key or settings.anthropic_api_key
         self.model = model or settings.anthropic_model
-        self.client = anthropic.AsyncAnthropic(api_key=self.api_key)
+        # Retries are handled here, under the shared rate limiter.
+        self.client = anthropic.AsyncAnthropic(
+            api_key=self.api_key, http_client=http_client, max_retries=0
+        )
+        self.cache = cache or llm_cache
+        self.batch_state = batch_state if batch_state is not None else batch_state_store
+        self.limiter = limiter if limiter is not None else claude_limiter
+        self.priority = priority
+        self.router = router if router is not None else model_router
+        self.force_fresh = force_fresh
+        self.last_usage: dict[str, int] = {}
 
     async def generate(
         self,
         system_prompt: str,
         user_prompt: str,
-        max_tokens: int = 4096,
-        temperature: float = 0.7,
+        max_tokens: int | None = None,
+        temperature: float | None = None,
+        force_fresh: bool = False,
+        audience: str | None = None,
+        task: str | None = None,
     ) -> str:
-        """Send a generation request and return the text response."""
-        message = await self.client.messages.create(
-            model=self.model,
-            max_tokens=max_tokens,
-            system=system_prompt,
-            messages=[{"role": "user", "content": user_prompt}],
-            temperature=temperature,
+        """Send a generation request and return the text response.
+
+        *task* picks the model, ``max_tokens`` and temperature from the
+        routing table (explicit arguments win); if the model is overloaded
+        the route's fallback models are tried in turn. With an *audience*,
+        its profile and tone guidance follow the system prompt in the
+        cacheable prefix. When the response cache is enabled,
+        identical requests are answered from it; *force_fresh* (or
+        ``self.force_fresh``) skips the lookup and overwrites the cached
+        response.
+        """
+        models, max_tokens, temperature = self._route(task, max_tokens, temperature)
+        system = build_system_blocks(
+            system_prompt, prompt_registry.audience_context(audience), models[0]
+        )
+        key, cached = await self._cache_lookup(
+            models[0], system, user_prompt, max_tokens, temperature, force_fresh
+        )
+        if cached is not None:
+            return cached
+
+        params = self._message_params(models[0], system, user_prompt, max_tokens, temperature)
+        attempt = 0
+        while True:
+            reservation = await self._reserve(params)
+            message = None
+            error: anthropic.APIError | None = None
+            try:
+                message = await self.client.messages.create(**params)
+            except anthropic.APIError as exc:
+                error = exc
+            finally:
+                # Settled however the attempt ended, cancellation included.
+                await self._settle(reservation, getattr(message, "usage", None))
+            if error is None:
+                break
+            delay = await self._retry_delay(error, attempt, params, models)
+            if delay is None:
+                raise error
+            attempt += 1
+            await asyncio.sleep(delay)
+        self.router.record(params["model"], fell_back=params["model"] != models[0])
+        usage = getattr(message, "usage", None)
+        self.last_usage = llm_usage.record(usage)
+        text = message.content[0].text
+        if key is not None and self.cache is not None:
+            await self.cache.put(self._answered_key(key, params, models), text)
+        return text
+
+    async def stream(
+        self,
+        system_prompt: str,
+        user_prompt: str,
+        max_tokens: int | None = None,
+        temperature: float | None = None,
+        force_fresh: bool = False,
+        audience: str | None = None,
+        task: str | None = None,
+    ) -> AsyncIterator[str]:
+        """Like ``generate``, but yield text deltas as Claude produces them.
+
+        A response cache hit is yielded as a single delta.
+        """
+        models, max_tokens, temperature = self._route(task, max_tokens, temperature)
+        system = build_system_blocks(
+            system_prompt, prompt_registry.audience_context(audience), models[0]
+        )
+        key, cached = await self._cache_lookup(
+            models[0], system, user_prompt, max_tokens, temperature, force_fresh
+        )
+        if cached is not None:
+            yield cached
+            return
+
+        params = self._message_params(models[0], system, user_prompt, max_tokens, temperature)
+        parts: list[str] = []
+        attempt = 0
+        while True:
+            reservation = await self._reserve(params)
+            message = None
+            error: anthropic.APIError | None = None
+            try:
+                async with self.client.messages.stream(**params) as stream:
+                    async for delta in stream.text_stream:
+                        parts.append(delta)
+                        yield delta
+                    message = await stream.get_final_message()
+            except anthropic.APIError as exc:
+                error = exc
+            finally:
+                # Also reached when the caller stops reading (GeneratorExit).
+                await self._settle(reservation, getattr(message, "usage", None))
+            if error is None:
+                break
+            # Once text has been sent to the caller the stream cannot be replayed.
+            delay = None if parts else await self._retry_delay(error, attempt, params, models)
+            if delay is None:
+                raise error
+            attempt += 1
+            await asyncio.sleep(delay)
+        self.router.record(params["model"], fell_back=params["model"] != models[0])
+        usage = getattr(message, "usage", None)
+        self.last_usage = llm_usage.record(usage)
+        if key is not None and self.cache is not None:
+            await self.cache.put(self._answered_key(key, params, models), "".join(parts))
+
+    async def run(self, request: GenerationRequest, force_fresh: bool = False) -> str:
+        """Generate the text for a prebuilt *request*."""
+        return await self.generate(**request.prompt_kwargs(), force_fresh=force_fresh)
+
+    async def aclose(self) -> None:
+        """Close the Anthropic client's connection pool."""
+        await self.client.close()
+
+    def _route(
+        self, task: str | None, max_tokens: int | None, temperature: float | None
+    ) -> tuple[tuple[str, ...], int, float]:
+        """Resolve the models to try and the sampling settings for *task*."""
+        route = self.router.route(task)
+        return (
+            route.models(self.model),
+            route.max_tokens if max_tokens is None else max_tokens,
+            route.temperature if temperature is None else temperature,
+        )
+
+    async def _reserve(self, params: dict[str, Any]) -> Reservation | None:
+        """Wait for rate-limit capacity for the estimated size of *params*."""
+        if self.limiter is None:
+            return None
+        prompt = "".join(block["text"] for block in params["system"])
+        prompt += "".join(m["content"] for m in params["messages"])
+        return await self.limiter.acquire(
+            estimate_tokens(prompt), params["max_tokens"], self.priority
+        )
+
+    async def _settle(self, reservation: Reservation | None, usage: Any) -> None:
+        """Return what an attempt did not use; ``None`` usage returns it all."""
+        if reservation is not None and self.limiter is not None:
+            await self.limiter.settle(reservation, usage)
+
+    async def _retry_delay(
+        self,
+        exc: anthropic.APIError,
+        attempt: int,
+        params: dict[str, Any],
+        models: tuple[str, ...],
+    ) -> float | None:
+        """Decide whether to retry a failed request, and after how long.
+
+        An overloaded model is swapped in *params* for the next fallback,
+        which is tried straight away.
+        """
+        if _is_overloaded(exc):
+            index = models.index(params["model"])
+            if index + 1 < len(models):
+                logger.warning(
+                    "Claude model %s overloaded; falling back to %s.",
+                    params["model"],
+                    models[index + 1],
+                )
+                params["model"] = models[index + 1]
+                return 0.0
+        delay = retry_delay(exc, attempt)
+        if delay is None or attempt >= settings.claude_max_retries:
+            return None
+        if self.limiter is not None:
+            if isinstance(exc, anthropic.RateLimitError):
+                await self.limiter.penalize(delay)
+            self.limiter.stats.retries += 1
+        logger.warning("Claude request failed (%s); retrying in %.1fs.", type(exc).__name__, delay)
+        return delay
+
+    async def _cache_lookup(
+        self,
+        model: str,
+        system: list[dict[str, Any]],
+        user_prompt: str,
+        max_tokens: int,
+        temperature: float,
+        force_fresh: bool,
+    ) -> tuple[str | None, str | None]:
+        """Return the response cache key for a request and any cached text."""
+        if self.cache is None:
+            return None, None
+        key = _cache_key(model, system, user_prompt, max_tokens, temperature)
+        if force_fresh or self.force_fresh:
+            self.cache.record_bypass()
+            return key, None
+        return key, await self.cache.get(key)
+
+    def _answered_key(self, key: str, params: dict[str, Any], models: tuple[str, ...]) -> str:
+        """Cache *params*' response under the model that answered it.
+
+        That is *key* unless a fallback model answered; its response must
+        not be served later as the primary model's.
+        """
+        if params["model"] == models[0]:
+            return key
+        return _cache_key(
+            params["model"],
+            params["system"],
+            params["messages"][0]["content"],
+            params["max_tokens"],
+            params["temperature"],
+        )
+
+    def _message_params(
+        self,
+        model: str,
+        system: list[dict[str, Any]],
+        user_prompt: str,
+        max_tokens: int,
+        temperature: float,
+    ) -> dict[str, Any]:
+        return {
+            "model": model,
+            "max_tokens": max_tokens,
+            "system": system,
+            "messages": [{"role": "user", "content": user_prompt}],
+            "temperature": temperature,
+        }
+
+    # -- Message Batches ------------------------------------------------------
+
+    async def generate_batch(
+        self,
+        requests: list[GenerationRequest],
+        job_key: str | None = None,
+    ) -> BatchOutcome:
+        """Run *requests* as one Message Batch and wait for the results.
+
+        With a *job_key*, the submitted batch ids are stored so that calling
+        again with the same key (e.g. after a worker restart) resumes
+        polling those batches instead of submitting new ones. Requests the
+        resumed batches do not cover, or that errored in them, go out in a
+        follow-up batch.
+        """
+        batch_ids = await self._resume_batches(job_key) if job_key else []
+        outcome = BatchOutcome(batch_id=batch_ids[-1] if batch_ids else "")
+        for batch_id in batch_ids:
+            logger.info("Resuming Message Batch %s for job %s.", batch_id, job_key)
+            await self.wait_for_batch(batch_id)
+            _merge(outcome, await self.collect_batch(batch_id))
+
+        pending = [req for req in requests if req.custom_id not in outcome.texts]
+        if not pending:
+            return outcome
+        if batch_ids:
+            logger.info(
+                "Job %s: %d of %d requests not generated by its batches; submitting them.",
+                job_key,
+                len(pending),
+                len(requests),
+            )
+        batch_id = await self.submit_batch(pending)
+        if job_key:
+            await self.batch_state.set(
+                BATCH_STATE_PREFIX + job_key,
+                {
+                    "batch_ids": [*batch_ids, batch_id],
+                    "submitted_at": datetime.now(timezone.utc).isoformat(),
+                },
+                settings.llm_batch_state_ttl_seconds,
+            )
+        await self.wait_for_batch(batch_id)
+        _merge(outcome, await self.collect_batch(batch_id))
+        return outcome
+
+    async def submit_batch(self, requests: list[GenerationRequest]) -> str:
+        """Submit *requests* as a Message Batch and return its id."""
+        entries = []
+        for req in requests:
+            models, max_tokens, temperature = self._route(req.task, req.max_tokens, req.temperature)
+            system = build_system_blocks(
+                req.system_prompt, prompt_registry.audience_context(req.audience), models[0]
+            )
+            entries.append(
+                {
+                    "custom_id": req.custom_id,
+                    "params": self._message_params(
+                        models[0], system, req.user_prompt, max_tokens, temperature
+                    ),
+                }
+            )
+        batch = await self.client.messages.batches.create(requests=entries)
+        logger.info("Submitted Message Batch %s with %d requests.", batch.id, len(requests))
+        return batch.id
+
+    async def wait_for_batch(
+        self,
+        batch_id: str,
+        poll_seconds: float | None = None,
+        timeout_seconds: float | None = None,
+    ) -> None:
+        """Poll until the batch has ended; raise ``BatchTimeoutError`` past the timeout."""
+        poll = settings.llm_batch_poll_seconds if poll_seconds is None else poll_seconds
+        timeout = settings.llm_batch_timeout_seconds if timeout_seconds is None else timeout_seconds
+        deadline = time.monotonic() + timeout
+        while True:
+            batch = await self.client.messages.batches.retrieve(batch_id)
+            if batch.processing_status == "ended":
+                return
+            if time.monotonic() >= deadline:
+                raise BatchTimeoutError(f"Message Batch {batch_id} still {batch.processing_status}")
+            await asyncio.sleep(poll)
+
+    async def collect_batch(self, batch_id: str) -> BatchOutcome:
+        """Read the results of an ended batch, keyed by custom id."""
+        outcome = BatchOutcome(batch_id=batch_id)
+        async for entry in await self.client.messages.batches.results(batch_id):
+            result = entry.result
+            if result.type == "succeeded":
+                llm_usage.record(result.message.usage)
+                outcome.texts[entry.custom_id] = result.message.content[0].text
+            elif result.type == "errored":
+                outcome.errors[entry.custom_id] = result.error.error.message
+            else:
+                outcome.errors[entry.custom_id] = result.type
+        logger.info(
+            "Message Batch %s: %d succeeded, %d failed.",
+            batch_id,
+            len(outcome.texts),
+            len(outcome.errors),
         )
-        return message.content[0].text
+        return outcome
+
+    async def _resume_batches(self, job_key: str) -> list[str]:
+        state = await self.batch_state.get(BATCH_STATE_PREFIX + job_key)
+        if not state:
+            return []
+        # Records written before follow-up batches hold a single ``batch_id``.
+        return list(state.get("batch_ids") or [state["batch_id"]])
 
     async def generate_policy_brief(
         self,
@@ -48,53 +559,36 @@ class ClaudeContentGenerator:
         jurisdiction: str,
         audience: str,
     ) -> str:
-        system_prompt = _load_prompt("policy_brief_system_prompt.txt")
-        system_prompt = system_prompt.replace("[AUDIENCE]", audience)
-
-        user_prompt = (
-            f"Generate a policy brief for {jurisdiction} targeting {audience}.\n\n"
-            f"Friction data:\n{_format_friction_data(friction_data)}\n\n"
-            "Please follow the structure outlined in the system prompt."
-        )
-        return await self.generate(system_prompt, user_prompt)
+        return await self.run(policy_brief_request(friction_data, jurisdiction, audience))
 
     async def generate_public_content(
         self,
         friction_data: list[dict[str, Any]],
         content_type: str,
         jurisdiction: str,
+        audience: str | None = None,
     ) -> str:
-        system_prompt = _load_prompt("public_content_system_prompt.txt")
-
-        user_prompt = (
-            f"Generate a {content_type} about housing policy barriers in {jurisdiction}.\n\n"
-            f"Friction data:\n{_format_friction_data(friction_data)}\n\n"
-            "Make the content accessible and compelling for a general audience."
+        return await self.run(
+            public_content_request(friction_data, content_type, jurisdiction, audience)
         )
-        return await self.generate(system_prompt, user_prompt)
 
     async def generate_testimony(
         self,
         friction_data: list[dict[str, Any]],
         jurisdiction: str,
         time_limit_minutes: int = 3,
+        audience: str | None = None,
     ) -> str:
-        system_prompt = _load_prompt("testimony_system_prompt.txt")
-
-        user_prompt = (
-            f"Generate testimony about housing barriers in {jurisdiction}.\n"
-            f"Time limit: {time_limit_minutes} minutes.\n\n"
-            f"Friction data:\n{_format_friction_data(friction_data)}\n\n"
-            "Include personal impact framing and a clear policy recommendation."
+        return await self.run(
+            testimony_request(friction_data, jurisdiction, time_limit_minutes, audience)
         )
-        return await self.generate(system_prompt, user_prompt)
 
     async def generate_alert_summary(
         self,
         changes: list[dict[str, Any]],
         stakeholder_context: dict[str, Any],
     ) -> str:
-        system_prompt = _load_prompt("alert_generation_prompt.txt")
+        system_prompt = prompt_registry.render(ALERT_PROMPT)
 
         user_prompt = (
             f"Generate a stakeholder alert for {stakeholder_context.get('organization', 'N/A')} "
@@ -103,7 +597,59 @@ class ClaudeContentGenerator:
             f"Stakeholder interests: {stakeholder_context.get('interests', [])}\n"
             f"Active projects: {stakeholder_context.get('projects', [])}"
         )
-        return await self.generate(system_prompt, user_prompt, max_tokens=2048)
+        return await self.generate(system_prompt, user_prompt, task="alert_summary")
+
+
+def policy_brief_request(
+    friction_data: list[dict[str, Any]], jurisdiction: str, audience: str
+) -> GenerationRequest:
+    return GenerationRequest(
+        system_prompt=prompt_registry.render(POLICY_BRIEF_PROMPT, audience),
+        user_prompt=(
+            f"Generate a policy brief for {jurisdiction} targeting {audience}.\n\n"
+            f"Friction data:\n{_format_friction_data(friction_data)}\n\n"
+            "Please follow the structure outlined in the system prompt."
+        ),
+        audience=audience,
+        task="policy_brief",
+    )
+
+
+def public_content_request(
+    friction_data: list[dict[str, Any]],
+    content_type: str,
+    jurisdiction: str,
+    audience: str | None = None,
+) -> GenerationRequest:
+    return GenerationRequest(
+        system_prompt=prompt_registry.render(PUBLIC_CONTENT_PROMPT),
+        user_prompt=(
+            f"Generate a {content_type} about housing policy barriers in {jurisdiction}.\n\n"
+            f"Friction data:\n{_format_friction_data(friction_data)}\n\n"
+            "Make the content accessible and compelling for a general audience."
+        ),
+        audience=audience,
+        task="public_content",
+    )
+
+
+def testimony_request(
+    friction_data: list[dict[str, Any]],
+    jurisdiction: str,
+    time_limit_minutes: int = 3,
+    audience: str | None = None,
+) -> GenerationRequest:
+    return GenerationRequest(
+        system_prompt=prompt_registry.render(TESTIMONY_PROMPT),
+        user_prompt=(
+            f"Generate testimony about housing barriers in {jurisdiction}.\n"
+            f"Time limit: {time_limit_minutes} minutes.\n\n"
+            f"Friction data:\n{_format_friction_data(friction_data)}\n\n"
+            "Include personal impact framing and a clear policy recommendation."
+        ),
+        audience=audience,
+        task="testimony",
+    )
 
 
 def _format_friction_data(data: list[dict[str, Any]]) -> str:
@@ -124,3 +670,7 @@ def _format_changes(changes: list[dict[str, Any]]) -> str:
         date = change.get("date", "N/A")
         lines.append(f"- [{date}] {title} (source: {source})")
     return "\n".join(lines) if lines else "No changes to report."
+
+
+def _is_overloaded(exc: BaseException) -> bool:
+    return isinstance(exc, anthropic.APIStatusError) and exc.status_code == 529
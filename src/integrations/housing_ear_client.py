@@ -4,9 +4,10 @@ from __future__ import annotations
 
 from typing import Any
 
-import httpx
-
 from src.config import settings
+from src.integrations.cache import normalize_params
+from src.integrations.http_pool import http_pool
+from src.integrations.single_flight import ecosystem_requests
 
 
 class HousingEarClient:
@@ -18,12 +19,15 @@ class HousingEarClient:
         self._headers = {"Authorization": f"Bearer {self.api_key}"} if self.api_key else {}
 
     async def _get(self, path: str, params: dict[str, Any] | None = None) -> dict[str, Any]:
-        async with httpx.AsyncClient(timeout=30) as client:
-            resp = await client.get(
-                f"{self.base_url}{path}", headers=self._headers, params=params
-            )
-            resp.raise_for_status()
-            return resp.json()
+        # Identical concurrent GETs share a single upstream request.
+        url = f"{self.base_url}{path}"
+        key = f"{url}?{normalize_params(params)}"
+        return await ecosystem_requests.do(key, lambda: self._fetch(url, params))
+
+    async def _fetch(self, url: str, params: dict[str, Any] | None) -> dict[str, Any]:
+        resp = await http_pool.get(url, headers=self._headers, params=params)
+        resp.raise_for_status()
+        return resp.json()
 
     async def get_federal_register_changes(
         self,
@@ -2,28 +2,70 @@
 
 from __future__ import annotations
 
+import asyncio
+import logging
+from dataclasses import dataclass, field
 from typing import Any
 
 import httpx
 
 from src.config import settings
+from src.integrations.cache import ResponseCache, lens_cache, normalize_params
+from src.integrations.http_pool import http_pool
+from src.integrations.single_flight import ecosystem_requests
+
+FRICTION_SCORES_PATH = "/api/v1/friction-scores"
+COST_ESTIMATES_PATH = "/api/v1/cost-estimates"
+FRICTION_SCORES_BATCH_PATH = "/api/v1/friction-scores/batch"
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class FrictionScoreBatch:
+    """Per-jurisdiction results of a multi-jurisdiction fetch.
+
+    Jurisdictions that failed appear in ``errors`` instead of ``scores``.
+    """
+
+    scores: dict[str, list[dict[str, Any]]] = field(default_factory=dict)
+    errors: dict[str, Exception] = field(default_factory=dict)
+
+    @property
+    def ok(self) -> bool:
+        return not self.errors
 
 
 class HousingLensClient:
     """Fetches friction scores, trend alerts, cost estimates, and query patterns."""
 
-    def __init__(self, base_url: str | None = None, api_key: str | None = None) -> None:
+    def __init__(
+        self,
+        base_url: str | None = None,
+        api_key: str | None = None,
+        cache: ResponseCache | None = None,
+    ) -> None:
         self.base_url = (base_url or settings.housing_lens_api_url).rstrip("/")
         self.api_key = api_key or settings.housing_lens_api_key
         self._headers = {"Authorization": f"Bearer {self.api_key}"} if self.api_key else {}
+        # Defaults to the process-wide cache (``None`` when disabled in settings).
+        self.cache = cache or lens_cache
 
     async def _get(self, path: str, params: dict[str, Any] | None = None) -> dict[str, Any]:
-        async with httpx.AsyncClient(timeout=30) as client:
-            resp = await client.get(
-                f"{self.base_url}{path}", headers=self._headers, params=params
-            )
-            resp.raise_for_status()
-            return resp.json()
+        # Identical concurrent GETs share a single upstream request.
+        url = f"{self.base_url}{path}"
+        key = f"{url}?{normalize_params(params)}"
+        return await ecosystem_requests.do(key, lambda: self._fetch(url, params))
+
+    async def _fetch(self, url: str, params: dict[str, Any] | None) -> dict[str, Any]:
+        resp = await http_pool.get(url, headers=self._headers, params=params)
+        resp.raise_for_status()
+        return resp.json()
+
+    async def _cached_get(self, path: str, params: dict[str, Any]) -> dict[str, Any]:
+        if self.cache is None:
+            return await self._get(path, params)
+        return await self.cache.get_or_fetch(path, params, lambda: self._get(path, params))
 
     async def get_friction_scores(
         self, jurisdiction: str, topics: list[str] | None = None
@@ -32,9 +74,75 @@ class HousingLensClient:
         params: dict[str, Any] = {"jurisdiction": jurisdiction}
         if topics:
             params["topics"] = ",".join(topics)
-        data = await self._get("/api/v1/friction-scores", params)
+        data = await self._cached_get(FRICTION_SCORES_PATH, params)
         return data.get("scores", [])
 
+    async def get_friction_scores_many(
+        self,
+        jurisdictions: list[str],
+        topics: list[str] | None = None,
+        max_concurrency: int | None = None,
+    ) -> FrictionScoreBatch:
+        """Return friction scores for several jurisdictions at once.
+
+        Uses the upstream batch endpoint when ``housing_lens_batch_enabled``
+        is set, otherwise fans out per-jurisdiction requests with at most
+        *max_concurrency* in flight. The fan-out is also used when the batch
+        endpoint is missing or cannot be reached. A failing jurisdiction is
+        reported in ``errors`` without failing the others.
+        """
+        unique = list(dict.fromkeys(jurisdictions))
+        if settings.housing_lens_batch_enabled and len(unique) > 1:
+            try:
+                return await self._get_friction_scores_batched(unique, topics)
+            except httpx.HTTPStatusError as exc:
+                if exc.response.status_code not in (404, 405, 501):
+                    raise
+                logger.warning("HousingLens batch endpoint unavailable; fanning out.")
+            except httpx.TransportError as exc:
+                logger.warning("HousingLens batch request failed (%r); fanning out.", exc)
+
+        semaphore = asyncio.Semaphore(max_concurrency or settings.housing_lens_max_concurrency)
+
+        async def _one(jur: str) -> list[dict[str, Any]]:
+            async with semaphore:
+                return await self.get_friction_scores(jur, topics)
+
+        results = await asyncio.gather(*(_one(j) for j in unique), return_exceptions=True)
+        batch = FrictionScoreBatch()
+        for jur, result in zip(unique, results):
+            if isinstance(result, Exception):
+                batch.errors[jur] = result
+            elif isinstance(result, BaseException):
+                raise result
+            else:
+                batch.scores[jur] = result
+        return batch
+
+    async def _get_friction_scores_batched(
+        self, jurisdictions: list[str], topics: list[str] | None
+    ) -> FrictionScoreBatch:
+        params: dict[str, Any] = {"jurisdiction": jurisdictions}
+        if topics:
+            params["topics"] = ",".join(topics)
+        data = await self._get(FRICTION_SCORES_BATCH_PATH, params)
+
+        batch = FrictionScoreBatch()
+        results: dict[str, Any] = data.get("results", {})
+        upstream_errors: dict[str, Any] = data.get("errors", {})
+        for jur in jurisdictions:
+            if jur in results:
+                batch.scores[jur] = results[jur].get("scores", [])
+                if self.cache is not None:
+                    single: dict[str, Any] = {"jurisdiction": jur}
+                    if topics:
+                        single["topics"] = ",".join(topics)
+                    await self.cache.put(FRICTION_SCORES_PATH, single, results[jur])
+            else:
+                reason = upstream_errors.get(jur, "missing from batch response")
+                batch.errors[jur] = LookupError(f"{jur}: {reason}")
+        return batch
+
     async def get_trend_alerts(
         self, jurisdiction: str | None = None, since: str | None = None
     ) -> list[dict[str, Any]]:
@@ -54,7 +162,7 @@ class HousingLensClient:
         params: dict[str, Any] = {"jurisdiction": jurisdiction}
         if topics:
             params["topics"] = ",".join(topics)
-        data = await self._get("/api/v1/cost-estimates", params)
+        data = await self._cached_get(COST_ESTIMATES_PATH, params)
         return data.get("estimates", [])
 
     async def get_query_patterns(self, jurisdiction: str) -> list[dict[str, Any]]:
@@ -0,0 +1,103 @@
+"""Shared, app-scoped HTTP connection pool for the HousingMind ecosystem clients."""
+
+from __future__ import annotations
+
+import logging
+from dataclasses import asdict, dataclass
+from typing import Any
+
+import httpx
+
+from src.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class PoolStats:
+    requests: int = 0
+    hits: int = 0  # request served on an already-open keep-alive connection
+    misses: int = 0  # request that had to open a new TCP/TLS connection
+    fallbacks: int = 0  # request made while the shared pool was closed
+
+
+class SharedHttpPool:
+    """Long-lived ``httpx.AsyncClient`` shared by HousingLens and HousingEar clients.
+
+    The pool is opened once per process (FastAPI lifespan / Celery worker
+    start) and closed on shutdown. When it is not open — in tests or ad-hoc
+    scripts — requests fall back to a short-lived client so callers never
+    have to care about the lifecycle.
+    """
+
+    def __init__(self) -> None:
+        self._client: httpx.AsyncClient | None = None
+        self.stats = PoolStats()
+
+    @property
+    def is_open(self) -> bool:
+        return self._client is not None and not self._client.is_closed
+
+    async def open(self, transport: httpx.AsyncBaseTransport | None = None) -> None:
+        """Create the shared client. Calling ``open`` twice is a no-op."""
+        if self.is_open:
+            return
+        limits = httpx.Limits(
+            max_connections=settings.http_max_connections,
+            max_keepalive_connections=settings.http_max_keepalive_connections,
+            keepalive_expiry=settings.http_keepalive_expiry_seconds,
+        )
+        self._client = httpx.AsyncClient(
+            timeout=settings.http_timeout_seconds,
+            limits=limits,
+            http2=settings.http2_enabled and transport is None,
+            transport=transport,
+        )
+        logger.info(
+            "Shared HTTP pool opened (max_connections=%s, keepalive=%s, http2=%s).",
+            settings.http_max_connections,
+            settings.http_max_keepalive_connections,
+            settings.http2_enabled,
+        )
+
+    async def close(self) -> None:
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+            logger.info("Shared HTTP pool closed.")
+
+    async def get(
+        self,
+        url: str,
+        headers: dict[str, str] | None = None,
+        params: dict[str, Any] | None = None,
+    ) -> httpx.Response:
+        """Issue a GET through the shared pool and record connection reuse."""
+        self.stats.requests += 1
+        if not self.is_open:
+            self.stats.fallbacks += 1
+            async with httpx.AsyncClient(timeout=settings.http_timeout_seconds) as client:
+                return await client.get(url, headers=headers, params=params)
+
+        opened_connection = False
+
+        async def trace(event_name: str, info: dict[str, Any]) -> None:
+            nonlocal opened_connection
+            if event_name.endswith(("connect_tcp.started", "connect_unix_socket.started")):
+                opened_connection = True
+
+        assert self._client is not None
+        resp = await self._client.get(
+            url, headers=headers, params=params, extensions={"trace": trace}
+        )
+        if opened_connection:
+            self.stats.misses += 1
+        else:
+            self.stats.hits += 1
+        return resp
+
+    def snapshot(self) -> dict[str, Any]:
+        return {"open": self.is_open, **asdict(self.stats)}
+
+
+http_pool = SharedHttpPool()
@@ -0,0 +1,180 @@
+"""Content-addressed cache for Claude responses.
+
+A response is keyed on a hash of everything that determines it — model,
+system prompt, user prompt, ``max_tokens`` and temperature — so an
+identical regeneration (or a retry during review) is served without calling
+the API. The cache is opt-in via ``LLM_CACHE_ENABLED``; entries live on
+local disk or in Redis, expire after ``llm_cache_ttl_seconds`` and the disk
+store evicts least-recently-used entries beyond ``llm_cache_max_entries``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import time
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any
+
+from src.config import settings
+from src.integrations.cache import CacheBackend, MemoryCacheBackend, RedisCacheBackend
+
+logger = logging.getLogger(__name__)
+
+KEY_PREFIX = "housingspeak:llm"
+
+
+def llm_cache_key(
+    model: str,
+    system_prompt: str,
+    user_prompt: str,
+    max_tokens: int,
+    temperature: float,
+) -> str:
+    """Return the cache key for one generation request."""
+    material = json.dumps(
+        [model, system_prompt, user_prompt, max_tokens, temperature], ensure_ascii=False
+    )
+    return f"{KEY_PREFIX}:{hashlib.sha256(material.encode('utf-8')).hexdigest()}"
+
+
+class DiskCacheBackend:
+    """One JSON file per entry under *directory*, bounded to *max_entries*.
+
+    Reads touch the file so eviction drops the least recently used entries.
+    File I/O runs in a worker thread to keep the event loop free.
+    """
+
+    def __init__(self, directory: str | Path, max_entries: int = 1024) -> None:
+        self.directory = Path(directory)
+        self.max_entries = max_entries
+
+    def _path(self, key: str) -> Path:
+        return self.directory / f"{hashlib.sha256(key.encode('utf-8')).hexdigest()}.json"
+
+    async def get(self, key: str) -> Any | None:
+        return await asyncio.to_thread(self._get, key)
+
+    async def set(self, key: str, value: Any, ttl: float) -> None:
+        await asyncio.to_thread(self._set, key, value, ttl)
+
+    async def delete_prefix(self, prefix: str) -> int:
+        return await asyncio.to_thread(self._delete_prefix, prefix)
+
+    def _get(self, key: str) -> Any | None:
+        path = self._path(key)
+        try:
+            entry = json.loads(path.read_text(encoding="utf-8"))
+        except (FileNotFoundError, json.JSONDecodeError):
+            return None
+        if entry["expires_at"] <= time.time():
+            path.unlink(missing_ok=True)
+            return None
+        os.utime(path)
+        return entry["value"]
+
+    def _set(self, key: str, value: Any, ttl: float) -> None:
+        self.directory.mkdir(parents=True, exist_ok=True)
+        path = self._path(key)
+        tmp = path.with_suffix(".tmp")
+        entry = {"key": key, "expires_at": time.time() + ttl, "value": value}
+        tmp.write_text(json.dumps(entry), encoding="utf-8")
+        tmp.replace(path)
+        self._evict()
+
+    def _evict(self) -> None:
+        files = list(self.directory.glob("*.json"))
+        excess = len(files) - self.max_entries
+        if excess <= 0:
+            return
+        files.sort(key=lambda p: p.stat().st_mtime)
+        for path in files[:excess]:
+            path.unlink(missing_ok=True)
+
+    def _delete_prefix(self, prefix: str) -> int:
+        deleted = 0
+        for path in self.directory.glob("*.json"):
+            try:
+                key = json.loads(path.read_text(encoding="utf-8")).get("key", "")
+            except (FileNotFoundError, json.JSONDecodeError):
+                continue
+            if key.startswith(prefix):
+                path.unlink(missing_ok=True)
+                deleted += 1
+        return deleted
+
+    def __len__(self) -> int:
+        return len(list(self.directory.glob("*.json"))) if self.directory.exists() else 0
+
+
+@dataclass
+class LLMCacheStats:
+    hits: int = 0
+    misses: int = 0
+    bypassed: int = 0
+    errors: int = 0
+
+
+class LLMResponseCache:
+    """Lookup and store generated text by request hash.
+
+    Backend failures are logged and treated as misses so a broken cache
+    never blocks generation.
+    """
+
+    def __init__(self, backend: CacheBackend, ttl: float = 86_400.0) -> None:
+        self.backend = backend
+        self.ttl = ttl
+        self.stats = LLMCacheStats()
+
+    async def get(self, key: str) -> str | None:
+        try:
+            value = await self.backend.get(key)
+        except Exception:
+            self.stats.errors += 1
+            logger.warning("LLM cache read failed for %s", key, exc_info=True)
+            value = None
+        if value is None:
+            self.stats.misses += 1
+            return None
+        self.stats.hits += 1
+        return value
+
+    async def put(self, key: str, text: str) -> None:
+        try:
+            await self.backend.set(key, text, self.ttl)
+        except Exception:
+            self.stats.errors += 1
+            logger.warning("LLM cache write failed for %s", key, exc_info=True)
+
+    def record_bypass(self) -> None:
+        self.stats.bypassed += 1
+
+    async def clear(self) -> int:
+        return await self.backend.delete_prefix(KEY_PREFIX + ":")
+
+    def snapshot(self) -> dict[str, Any]:
+        return {"backend": type(self.backend).__name__, **asdict(self.stats)}
+
+
+def build_llm_cache() -> LLMResponseCache | None:
+    """Construct the LLM response cache from settings (``None`` when disabled)."""
+    backend: CacheBackend
+    if not settings.llm_cache_enabled:
+        return None
+    if settings.llm_cache_backend == "redis":
+        backend = RedisCacheBackend(settings.redis_url)
+    elif settings.llm_cache_backend == "memory":
+        backend = MemoryCacheBackend(max_entries=settings.llm_cache_max_entries)
+    else:
+        backend = DiskCacheBackend(
+            settings.llm_cache_dir, max_entries=settings.llm_cache_max_entries
+        )
+    return LLMResponseCache(backend, ttl=settings.llm_cache_ttl_seconds)
+
+
+llm_cache = build_llm_cache()
@@ -0,0 +1,110 @@
+"""Per-task model routing for Claude requests.
+
+``config/model_routing.yaml`` maps each generation task (``alert_summary``,
+``social_variant``, ``policy_brief``, ...) to a model, ``max_tokens`` and
+temperature, so high-volume, short outputs can run on a smaller, faster
+model while long-form content keeps the large one. Each route lists
+fallback models tried in order when its model is overloaded.
+
+Unknown tasks, and requests without a task, use the ``default`` route. A
+route without a model uses the generator's own model (``ANTHROPIC_MODEL``).
+"""
+
+from __future__ import annotations
+
+import logging
+from collections import Counter
+from collections.abc import Mapping
+from dataclasses import dataclass
+from pathlib import Path
+from types import MappingProxyType
+from typing import Any
+
+import yaml
+
+from src.config import settings
+from src.utils.tone_adaptation import CONFIG_DIR
+
+logger = logging.getLogger(__name__)
+
+ROUTING_FILE = "model_routing.yaml"
+
+
+@dataclass(frozen=True)
+class ModelRoute:
+    task: str
+    model: str | None
+    max_tokens: int = 4096
+    temperature: float = 0.7
+    fallbacks: tuple[str, ...] = ()
+
+    def models(self, default: str) -> tuple[str, ...]:
+        """The model (or *default* if unset) followed by its fallbacks, without duplicates."""
+        return tuple(dict.fromkeys((self.model or default, *self.fallbacks)))
+
+
+def _build_route(task: str, entry: dict[str, Any], base: ModelRoute | None) -> ModelRoute:
+    return ModelRoute(
+        task=task,
+        model=entry.get("model") or (base.model if base else None),
+        max_tokens=int(entry.get("max_tokens") or (base.max_tokens if base else 4096)),
+        temperature=float(
+            entry["temperature"]
+            if entry.get("temperature") is not None
+            else (base.temperature if base else 0.7)
+        ),
+        fallbacks=tuple(entry.get("fallbacks") or (base.fallbacks if base else ())),
+    )
+
+
+class ModelRouter:
+    """Read-only routing table loaded from *config_dir*."""
+
+    def __init__(self, config_dir: Path = CONFIG_DIR) -> None:
+        self.config_dir = config_dir
+        self.requests_by_model: Counter[str] = Counter()
+        self.fallbacks = 0
+        self.reload()
+
+    def reload(self) -> None:
+        path = self.config_dir / ROUTING_FILE
+        data: dict[str, Any] = {}
+        if path.exists():
+            data = yaml.safe_load(path.read_text(encoding="utf-8")) or {}
+        self.default = _build_route("default", data.get("default") or {}, None)
+        self._routes: Mapping[str, ModelRoute] = MappingProxyType(
+            {
+                task: _build_route(task, entry or {}, self.default)
+                for task, entry in (data.get("tasks") or {}).items()
+            }
+        )
+
+    def route(self, task: str | None) -> ModelRoute:
+        if task is None:
+            return self.default
+        route = self._routes.get(task)
+        if route is None:
+            logger.warning("No model route for task %r; using the default.", task)
+            return self.default
+        return route
+
+    def routes(self) -> dict[str, ModelRoute]:
+        return dict(self._routes)
+
+    def record(self, model: str, fell_back: bool = False) -> None:
+        self.requests_by_model[model] += 1
+        if fell_back:
+            self.fallbacks += 1
+
+    def snapshot(self) -> dict[str, Any]:
+        return {
+            "routes": {
+                task: route.model or settings.anthropic_model
+                for task, route in self._routes.items()
+            },
+            "requests_by_model": dict(self.requests_by_model),
+            "fallbacks": self.fallbacks,
+        }
+
+
+model_router = ModelRouter()
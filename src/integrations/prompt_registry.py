@@ -0,0 +1,173 @@
+"""Immutable registry of LLM system prompts loaded from ``prompts/``.
+
+Prompts are read once at import. Templates containing ``[AUDIENCE]`` are
+pre-rendered for every ``AudienceType``, so generation never touches the
+disk or does string substitution. Each prompt carries a short content hash
+so generated content can record which prompt version produced it.
+
+The registry also pre-builds an audience context block per audience from
+``config/audience_profiles.yaml`` and ``config/tone_guidelines.yaml``; it is
+sent after the system prompt as part of the cacheable request prefix.
+
+Set ``PROMPT_HOT_RELOAD=true`` in development to pick up edits without a
+restart; changed files are detected by mtime on access.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+from collections.abc import Mapping
+from dataclasses import dataclass
+from pathlib import Path
+from types import MappingProxyType
+from typing import Any
+
+import yaml
+
+from src.config import settings
+from src.models.content import AudienceType
+from src.utils.tone_adaptation import CONFIG_DIR, load_tone_guidelines
+
+logger = logging.getLogger(__name__)
+
+PROMPTS_DIR = Path(__file__).resolve().parent.parent.parent / "prompts"
+AUDIENCE_PLACEHOLDER = "[AUDIENCE]"
+
+
+@dataclass(frozen=True)
+class PromptTemplate:
+    name: str
+    text: str
+    version: str
+    variants: Mapping[str, str]
+
+    def render(self, audience: str | None = None) -> str:
+        """Return the prompt, specialised for *audience* when it has a placeholder."""
+        if audience is None or AUDIENCE_PLACEHOLDER not in self.text:
+            return self.text
+        rendered = self.variants.get(audience)
+        if rendered is None:
+            rendered = self.text.replace(AUDIENCE_PLACEHOLDER, audience)
+        return rendered
+
+
+def _build_template(path: Path) -> PromptTemplate:
+    text = path.read_text(encoding="utf-8")
+    variants: dict[str, str] = {}
+    if AUDIENCE_PLACEHOLDER in text:
+        variants = {a.value: text.replace(AUDIENCE_PLACEHOLDER, a.value) for a in AudienceType}
+    return PromptTemplate(
+        name=path.name,
+        text=text,
+        version=hashlib.sha256(text.encode("utf-8")).hexdigest()[:12],
+        variants=MappingProxyType(variants),
+    )
+
+
+def _format_audience_context(
+    profile: dict[str, Any], phrasing: dict[str, str], principles: list[str]
+) -> str:
+    lines = [f"Audience: {profile.get('display_name', '')} — {profile.get('description', '')}"]
+    if profile.get("tone"):
+        lines.append(f"Tone: {str(profile['tone']).replace('_', ' ')}")
+    if profile.get("reading_level_target"):
+        lines.append(f"Target reading level: grade {profile['reading_level_target']}")
+    if profile.get("key_concerns"):
+        lines.append("Key concerns: " + "; ".join(profile["key_concerns"]))
+    prefs = profile.get("language_preferences") or {}
+    if prefs:
+        lines.append(
+            "Language: " + ", ".join(f"{k.replace('_', ' ')} {v}" for k, v in prefs.items())
+        )
+    if phrasing:
+        lines.append("Preferred phrasing:")
+        lines.extend(f'- write "{new}" rather than "{old}"' for old, new in phrasing.items())
+    if principles:
+        lines.append("Writing principles:")
+        lines.extend(f"- {p}" for p in principles)
+    return "\n".join(lines)
+
+
+def _build_audience_contexts(config_dir: Path) -> Mapping[str, str]:
+    path = config_dir / "audience_profiles.yaml"
+    if not path.exists():
+        return MappingProxyType({})
+    profiles = (yaml.safe_load(path.read_text(encoding="utf-8")) or {}).get("audiences", {})
+    tone = load_tone_guidelines(config_dir)
+    phrasing = tone.get("audiences", {})
+    principles = tone.get("general_principles", [])
+    return MappingProxyType(
+        {
+            name: _format_audience_context(profile, phrasing.get(name) or {}, principles)
+            for name, profile in profiles.items()
+        }
+    )
+
+
+class PromptRegistry:
+    """Read-only view over the prompt files in *directory*."""
+
+    def __init__(
+        self,
+        directory: Path = PROMPTS_DIR,
+        hot_reload: bool = False,
+        config_dir: Path = CONFIG_DIR,
+    ) -> None:
+        self.directory = directory
+        self.config_dir = config_dir
+        self.hot_reload = hot_reload
+        self._templates: Mapping[str, PromptTemplate] = MappingProxyType({})
+        self._audience_contexts: Mapping[str, str] = MappingProxyType({})
+        self._mtimes: dict[str, float] = {}
+        self.reload()
+
+    def reload(self) -> None:
+        templates: dict[str, PromptTemplate] = {}
+        mtimes: dict[str, float] = {}
+        for path in sorted(self.directory.glob("*.txt")):
+            templates[path.name] = _build_template(path)
+            mtimes[path.name] = path.stat().st_mtime
+        self._templates = MappingProxyType(templates)
+        self._audience_contexts = _build_audience_contexts(self.config_dir)
+        self._mtimes = mtimes
+
+    def audience_context(self, audience: str | None) -> str:
+        """Return the audience profile and tone guidance block ("" if unknown)."""
+        if audience is None:
+            return ""
+        return self._audience_contexts.get(audience, "")
+
+    def get(self, name: str) -> PromptTemplate:
+        if self.hot_reload:
+            self._reload_if_changed(name)
+        try:
+            return self._templates[name]
+        except KeyError:
+            raise KeyError(f"Unknown prompt: {name}") from None
+
+    def render(self, name: str, audience: str | None = None) -> str:
+        return self.get(name).render(audience)
+
+    def version(self, name: str) -> str:
+        return self.get(name).version
+
+    def versions(self) -> dict[str, str]:
+        return {name: t.version for name, t in self._templates.items()}
+
+    def _reload_if_changed(self, name: str) -> None:
+        path = self.directory / name
+        try:
+            mtime = path.stat().st_mtime
+        except FileNotFoundError:
+            return
+        if self._mtimes.get(name) == mtime:
+            return
+        templates = dict(self._templates)
+        templates[name] = _build_template(path)
+        self._templates = MappingProxyType(templates)
+        self._mtimes[name] = mtime
+        logger.info("Reloaded prompt %s (version %s).", name, templates[name].version)
+
+
+prompt_registry = PromptRegistry(hot_reload=settings.prompt_hot_reload)
@@ -0,0 +1,329 @@
+"""Shared rate limiting for Claude API calls.
+
+Every API and worker process draws from the same three token buckets —
+requests, input tokens and output tokens per minute — kept in Redis so the
+limits hold across the whole deployment. Each request reserves its
+estimated cost up front and gives back what it did not use once the real
+usage is known.
+
+Two priority classes share the buckets: ``interactive`` requests may drain
+them completely, while ``batch`` requests only proceed while at least
+``claude_batch_reserve`` of every bucket is left, so nightly and
+event-driven work cannot starve editors. A 429 blocks every process until
+its ``retry-after`` has passed.
+
+If Redis is unreachable the limiter falls back to an in-process bucket with
+the same limits.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import enum
+import logging
+import math
+import random
+import time
+from dataclasses import asdict, dataclass, field
+from typing import Any, Protocol
+
+import anthropic
+
+from src.config import settings
+
+logger = logging.getLogger(__name__)
+
+BUCKET_KEY = "housingspeak:ratelimit:claude"
+BLOCKED_KEY = "housingspeak:ratelimit:claude:blocked_until"
+
+# Characters per token used for estimating prompt size before sending.
+CHARS_PER_TOKEN = 4
+
+# After a shared-store failure, use the local buckets for this long.
+STORE_RETRY_SECONDS = 30.0
+
+# Refill the request/input/output buckets and take *cost* from them if every
+# bucket keeps at least *floor* of its capacity afterwards. Returns 0 when
+# granted, otherwise the milliseconds to wait. Refunds (mode "refund") add
+# tokens back and ignore the 429 block.
+_TAKE = """
+local t = redis.call('TIME')
+local now = tonumber(t[1]) * 1000 + math.floor(tonumber(t[2]) / 1000)
+local refund = ARGV[8] == 'refund'
+if not refund then
+    local blocked = tonumber(redis.call('GET', KEYS[2]) or '0')
+    if blocked > now then
+        return blocked - now
+    end
+end
+local caps = {tonumber(ARGV[1]), tonumber(ARGV[2]), tonumber(ARGV[3])}
+local costs = {tonumber(ARGV[4]), tonumber(ARGV[5]), tonumber(ARGV[6])}
+local floor = tonumber(ARGV[7])
+local state = redis.call('HMGET', KEYS[1], 'req', 'in', 'out', 'ts')
+local elapsed = math.max(0, now - (tonumber(state[4]) or now))
+local levels = {}
+local wait = 0
+for i = 1, 3 do
+    local level = tonumber(state[i]) or caps[i]
+    level = math.min(caps[i], level + elapsed * caps[i] / 60000)
+    levels[i] = level
+    local need = math.min(caps[i], costs[i] + floor * caps[i])
+    if not refund and level < need then
+        wait = math.max(wait, math.ceil((need - level) * 60000 / caps[i]))
+    end
+end
+if wait == 0 then
+    for i = 1, 3 do
+        levels[i] = math.min(caps[i], levels[i] - costs[i])
+    end
+end
+redis.call('HSET', KEYS[1], 'req', levels[1], 'in', levels[2], 'out', levels[3], 'ts', now)
+redis.call('PEXPIRE', KEYS[1], 120000)
+return wait
+"""
+
+
+class Priority(str, enum.Enum):
+    INTERACTIVE = "interactive"
+    BATCH = "batch"
+
+
+@dataclass(frozen=True)
+class Limits:
+    requests_per_minute: float
+    input_tokens_per_minute: float
+    output_tokens_per_minute: float
+
+    @property
+    def capacities(self) -> tuple[float, float, float]:
+        return (
+            self.requests_per_minute,
+            self.input_tokens_per_minute,
+            self.output_tokens_per_minute,
+        )
+
+
+class BucketStore(Protocol):
+    async def take(self, costs: tuple[float, float, float], floor: float) -> int: ...
+
+    async def refund(self, costs: tuple[float, float, float]) -> None: ...
+
+    async def block(self, seconds: float) -> None: ...
+
+
+class MemoryBucketStore:
+    """Token buckets for a single process."""
+
+    def __init__(self, limits: Limits) -> None:
+        self.limits = limits
+        self._levels = list(limits.capacities)
+        self._stamp = time.monotonic()
+        self._blocked_until = 0.0
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        elapsed = now - self._stamp
+        self._stamp = now
+        for i, cap in enumerate(self.limits.capacities):
+            self._levels[i] = min(cap, self._levels[i] + elapsed * cap / 60)
+
+    async def take(self, costs: tuple[float, float, float], floor: float) -> int:
+        now = time.monotonic()
+        if self._blocked_until > now:
+            return math.ceil((self._blocked_until - now) * 1000)
+        self._refill()
+        wait = 0
+        for level, cap, cost in zip(self._levels, self.limits.capacities, costs):
+            need = min(cap, cost + floor * cap)
+            if level < need:
+                wait = max(wait, math.ceil((need - level) * 60_000 / cap))
+        if wait == 0:
+            self._levels = [level - cost for level, cost in zip(self._levels, costs)]
+        return wait
+
+    async def refund(self, costs: tuple[float, float, float]) -> None:
+        self._refill()
+        self._levels = [
+            min(cap, level + cost)
+            for level, cap, cost in zip(self._levels, self.limits.capacities, costs)
+        ]
+
+    async def block(self, seconds: float) -> None:
+        self._blocked_until = max(self._blocked_until, time.monotonic() + seconds)
+
+
+class RedisBucketStore:
+    """Token buckets shared by every process through Redis."""
+
+    def __init__(self, limits: Limits, url: str | None = None) -> None:
+        import redis.asyncio as redis
+
+        self.limits = limits
+        self._redis = redis.from_url(url or settings.redis_url)
+        self._take = self._redis.register_script(_TAKE)
+
+    async def _run(self, costs: tuple[float, float, float], floor: float, mode: str) -> int:
+        return int(
+            await self._take(
+                keys=[BUCKET_KEY, BLOCKED_KEY],
+                args=[*self.limits.capacities, *costs, floor, mode],
+            )
+        )
+
+    async def take(self, costs: tuple[float, float, float], floor: float) -> int:
+        return await self._run(costs, floor, "take")
+
+    async def refund(self, costs: tuple[float, float, float]) -> None:
+        await self._run((-costs[0], -costs[1], -costs[2]), 0.0, "refund")
+
+    async def block(self, seconds: float) -> None:
+        until = int((time.time() + seconds) * 1000)
+        current = await self._redis.get(BLOCKED_KEY)
+        if current is None or int(current) < until:
+            await self._redis.set(BLOCKED_KEY, until, px=max(1, int(seconds * 1000)))
+
+
+@dataclass
+class LimiterStats:
+    granted: int = 0
+    throttled: int = 0
+    rate_limited: int = 0
+    retries: int = 0
+    store_errors: int = 0
+    waiting: dict[str, int] = field(default_factory=lambda: {p.value: 0 for p in Priority})
+
+
+@dataclass
+class Reservation:
+    """Tokens reserved for one request, settled once real usage is known."""
+
+    input_tokens: int
+    output_tokens: int
+
+
+def estimate_tokens(text: str) -> int:
+    return max(1, math.ceil(len(text) / CHARS_PER_TOKEN))
+
+
+class RateLimiter:
+    """Blocks each Claude call until the shared buckets can afford it."""
+
+    def __init__(
+        self,
+        store: BucketStore,
+        fallback: BucketStore | None = None,
+        batch_reserve: float = 0.2,
+        max_wait_seconds: float = 30.0,
+    ) -> None:
+        self.store = store
+        self.fallback = fallback
+        self.batch_reserve = batch_reserve
+        self.max_wait_seconds = max_wait_seconds
+        self.stats = LimiterStats()
+        self._store_down_until = 0.0
+
+    async def acquire(
+        self,
+        input_tokens: int,
+        output_tokens: int,
+        priority: Priority = Priority.INTERACTIVE,
+    ) -> Reservation:
+        """Wait until a request of the estimated size may be sent."""
+        floor = self.batch_reserve if priority == Priority.BATCH else 0.0
+        costs = (1.0, float(input_tokens), float(output_tokens))
+        self.stats.waiting[priority.value] += 1
+        try:
+            while True:
+                # Interactive callers in this process go first.
+                if priority == Priority.BATCH and self.stats.waiting[Priority.INTERACTIVE.value]:
+                    await asyncio.sleep(0.05)
+                    continue
+                wait_ms = await self._call("take", costs, floor)
+                if wait_ms == 0:
+                    self.stats.granted += 1
+                    return Reservation(input_tokens, output_tokens)
+                self.stats.throttled += 1
+                delay = min(wait_ms / 1000, self.max_wait_seconds)
+                await asyncio.sleep(delay * random.uniform(1.0, 1.2))
+        finally:
+            self.stats.waiting[priority.value] -= 1
+
+    async def settle(self, reservation: Reservation, usage: Any) -> None:
+        """Give back the part of a reservation the response did not use.
+
+        ``None`` usage (a failed request) returns the whole token reservation.
+        """
+        unused_input = reservation.input_tokens - (getattr(usage, "input_tokens", 0) or 0)
+        unused_output = reservation.output_tokens - (getattr(usage, "output_tokens", 0) or 0)
+        if unused_input > 0 or unused_output > 0:
+            refund = (0.0, float(max(0, unused_input)), float(max(0, unused_output)))
+            await self._call("refund", refund)
+
+    async def penalize(self, retry_after: float) -> None:
+        """Hold every caller back after a 429."""
+        self.stats.rate_limited += 1
+        await self._call("block", retry_after)
+
+    async def _call(self, method: str, *args: Any) -> Any:
+        if self.fallback is not None and time.monotonic() < self._store_down_until:
+            return await getattr(self.fallback, method)(*args)
+        try:
+            return await getattr(self.store, method)(*args)
+        except Exception:
+            if self.fallback is None:
+                raise
+            self.stats.store_errors += 1
+            self._store_down_until = time.monotonic() + STORE_RETRY_SECONDS
+            logger.warning("Rate limit store unavailable; using local buckets.", exc_info=True)
+            return await getattr(self.fallback, method)(*args)
+
+    def snapshot(self) -> dict[str, Any]:
+        return {"backend": type(self.store).__name__, **asdict(self.stats)}
+
+
+def retry_delay(exc: BaseException, attempt: int) -> float | None:
+    """Return how long to wait before retrying after *exc*, or ``None`` if it is final.
+
+    Rate limits honor ``retry-after``; overload, server and connection
+    errors back off exponentially. Both add jitter so workers do not retry
+    in lockstep.
+    """
+    if isinstance(exc, anthropic.RateLimitError):
+        header = exc.response.headers.get("retry-after")
+        try:
+            base = float(header) if header is not None else None
+        except ValueError:
+            base = None
+        if base is not None:
+            return base + random.uniform(0, settings.claude_backoff_base_seconds)
+    elif not (
+        isinstance(exc, anthropic.APIConnectionError)
+        or (isinstance(exc, anthropic.APIStatusError) and exc.status_code >= 500)
+    ):
+        return None
+    ceiling = min(
+        settings.claude_backoff_max_seconds, settings.claude_backoff_base_seconds * 2**attempt
+    )
+    return random.uniform(0, ceiling)
+
+
+def build_rate_limiter() -> RateLimiter | None:
+    """Construct the Claude rate limiter from settings (``None`` when disabled)."""
+    if settings.claude_rate_limit_backend == "none":
+        return None
+    limits = Limits(
+        settings.claude_requests_per_minute,
+        settings.claude_input_tokens_per_minute,
+        settings.claude_output_tokens_per_minute,
+    )
+    memory = MemoryBucketStore(limits)
+    if settings.claude_rate_limit_backend == "memory":
+        return RateLimiter(memory, batch_reserve=settings.claude_batch_reserve)
+    return RateLimiter(
+        RedisBucketStore(limits, settings.redis_url),
+        fallback=memory,
+        batch_reserve=settings.claude_batch_reserve,
+    )
+
+
+claude_limiter = build_rate_limiter()
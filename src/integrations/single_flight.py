@@ -0,0 +1,56 @@
+"""Single-flight request coalescing for the ecosystem clients.
+
+Concurrent callers asking for the same key share one in-flight task
+instead of each issuing an identical upstream request.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable
+from dataclasses import asdict, dataclass
+from typing import Any, TypeVar
+
+T = TypeVar("T")
+
+
+@dataclass
+class SingleFlightStats:
+    calls: int = 0
+    executions: int = 0  # calls that actually reached the upstream
+    coalesced: int = 0  # calls that joined an in-flight request instead
+
+
+class SingleFlight:
+    """Deduplicate concurrent calls that share a key."""
+
+    def __init__(self) -> None:
+        self._inflight: dict[str, asyncio.Task[Any]] = {}
+        self.stats = SingleFlightStats()
+
+    async def do(self, key: str, fn: Callable[[], Awaitable[T]]) -> T:
+        """Run *fn* once for all concurrent callers of *key* and share its result.
+
+        The work runs in its own task, so a cancelled caller does not cancel
+        the request for the others still waiting on it.
+        """
+        self.stats.calls += 1
+        task = self._inflight.get(key)
+        if task is None:
+            self.stats.executions += 1
+            task = asyncio.ensure_future(fn())
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        else:
+            self.stats.coalesced += 1
+        return await asyncio.shield(task)
+
+    @property
+    def inflight(self) -> int:
+        return len(self._inflight)
+
+    def snapshot(self) -> dict[str, Any]:
+        return {"inflight": self.inflight, **asdict(self.stats)}
+
+
+ecosystem_requests = SingleFlight()
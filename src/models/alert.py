@@ -6,8 +6,8 @@ import enum
 import uuid
 from datetime import datetime
 
-from sqlalchemy import Boolean, DateTime, Enum, ForeignKey, String, Text, func
-from sqlalchemy.dialects.postgresql import ARRAY, JSON, UUID
+from sqlalchemy import Boolean, DateTime, Enum, ForeignKey, Index, String, Text, func
+from sqlalchemy.dialects.postgresql import ARRAY, JSON, JSONB, UUID
 from sqlalchemy.orm import Mapped, mapped_column
 
 from src.database import Base
@@ -41,6 +41,14 @@ class AlertStatus(str, enum.Enum):
 
 class Alert(Base):
     __tablename__ = "alerts"
+    # Monthly range partitions on created_at (migration 0003), which Postgres
+    # requires to be part of the primary key.
+    __table_args__ = (
+        Index("ix_alerts_stakeholder_status_created", "stakeholder_id", "status", "created_at"),
+        Index("ix_alerts_stakeholder_created_id", "stakeholder_id", "created_at", "id"),
+        Index("ix_alerts_created_id", "created_at", "id"),
+        {"postgresql_partition_by": "RANGE (created_at)"},
+    )
 
     id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True), primary_key=True, default=uuid.uuid4
@@ -56,12 +64,12 @@ class Alert(Base):
     action_deadline: Mapped[datetime | None] = mapped_column(DateTime(timezone=True))
     related_project_ids: Mapped[list[str]] = mapped_column(ARRAY(String), default=list)
     recommended_actions: Mapped[dict | None] = mapped_column(JSON, default=list)
-    source_data: Mapped[dict | None] = mapped_column(JSON, default=dict)
+    source_data: Mapped[dict | None] = mapped_column(JSONB, default=dict)
     status: Mapped[AlertStatus] = mapped_column(
         Enum(AlertStatus), default=AlertStatus.PENDING
     )
     sent_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True))
     read_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True))
     created_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), server_default=func.now()
+        DateTime(timezone=True), primary_key=True, server_default=func.now()
     )
@@ -6,8 +6,8 @@ import enum
 import uuid
 from datetime import datetime
 
-from sqlalchemy import DateTime, Enum, ForeignKey, String, Text, func
-from sqlalchemy.dialects.postgresql import JSON, UUID
+from sqlalchemy import DateTime, Enum, ForeignKey, Index, String, Text, func
+from sqlalchemy.dialects.postgresql import JSON, JSONB, UUID
 from sqlalchemy.orm import Mapped, mapped_column
 
 from src.database import Base
@@ -46,6 +46,11 @@ class AudienceType(str, enum.Enum):
 
 class Content(Base):
     __tablename__ = "content"
+    __table_args__ = (
+        Index("ix_content_jurisdiction_type_status", "jurisdiction", "content_type", "status"),
+        Index("ix_content_jurisdiction_created_id", "jurisdiction", "created_at", "id"),
+        Index("ix_content_created_id", "created_at", "id"),
+    )
 
     id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True), primary_key=True, default=uuid.uuid4
@@ -57,8 +62,8 @@ class Content(Base):
     executive_summary: Mapped[str | None] = mapped_column(Text)
     body: Mapped[str] = mapped_column(Text, nullable=False)
     call_to_action: Mapped[str | None] = mapped_column(Text)
-    source_data: Mapped[dict | None] = mapped_column(JSON, default=dict)
-    supporting_data: Mapped[dict | None] = mapped_column(JSON, default=dict)
+    source_data: Mapped[dict | None] = mapped_column(JSONB, default=dict)
+    supporting_data: Mapped[dict | None] = mapped_column(JSONB, default=dict)
     distribution_config: Mapped[dict | None] = mapped_column(JSON, default=dict)
     seo_keywords: Mapped[dict | None] = mapped_column(JSON, default=list)
     status: Mapped[ContentStatus] = mapped_column(
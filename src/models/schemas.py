@@ -2,11 +2,14 @@
 
 from __future__ import annotations
 
+import ipaddress
 import uuid
 from datetime import datetime
+from typing import Any
 
-from pydantic import BaseModel, Field
+from pydantic import AnyHttpUrl, BaseModel, Field, field_validator
 
+from src.config import settings
 from src.models.alert import AlertPriority, AlertStatus, AlertType
 from src.models.campaign import CampaignStatus
 from src.models.content import AudienceType, ContentStatus, ContentType
@@ -47,6 +50,33 @@ class StakeholderResponse(StakeholderCreate):
 # --- Content Schemas ---
 
 
+def callback_url_error(url: AnyHttpUrl) -> str | None:
+    """Why *url* may not receive job callbacks, or None if it may.
+
+    Callbacks go only to https URLs on public hosts: IP literals must be
+    globally routable, and ``localhost`` is refused. When
+    ``job_callback_allowed_hosts`` is set, the host must also be listed
+    there. Hostnames are resolved again before each delivery.
+    """
+    if url.scheme != "https":
+        return "callback_url must use https"
+    host = (url.host or "").rstrip(".").lower()
+    allowed = {
+        h.strip().lower() for h in settings.job_callback_allowed_hosts.split(",") if h.strip()
+    }
+    if allowed and host not in allowed:
+        return "callback_url host is not allowed"
+    try:
+        address = ipaddress.ip_address(host.strip("[]"))
+    except ValueError:
+        if host == "localhost" or host.endswith(".localhost"):
+            return "callback_url must be a public host"
+        return None
+    if not address.is_global:
+        return "callback_url must be a public host"
+    return None
+
+
 class ContentGenerateRequest(BaseModel):
     content_type: ContentType
     audience: AudienceType
@@ -56,6 +86,18 @@ class ContentGenerateRequest(BaseModel):
     stakeholder_id: uuid.UUID | None = None
     campaign_id: uuid.UUID | None = None
     additional_context: str | None = None
+    force_fresh: bool = False
+    # Only used with ``?async=true``: the finished job is POSTed here.
+    callback_url: AnyHttpUrl | None = None
+
+    @field_validator("callback_url")
+    @classmethod
+    def _public_https(cls, url: AnyHttpUrl | None) -> AnyHttpUrl | None:
+        if url is not None:
+            error = callback_url_error(url)
+            if error:
+                raise ValueError(error)
+        return url
 
 
 class ContentResponse(BaseModel):
@@ -79,6 +121,16 @@ class ContentResponse(BaseModel):
     model_config = {"from_attributes": True}
 
 
+class JobResponse(BaseModel):
+    id: str
+    kind: str
+    status: str
+    result: dict | None = None
+    error: str | None = None
+    created_at: datetime
+    updated_at: datetime
+
+
 class ContentReviewAction(BaseModel):
     action: str = Field(pattern="^(approve|reject|request_changes)$")
     reviewer: str
@@ -107,9 +159,18 @@ class AlertResponse(BaseModel):
 
 
 class AlertGenerateRequest(BaseModel):
-    stakeholder_ids: list[uuid.UUID] | None = None
+    # Other stakeholders get alerts from the event workers as webhooks arrive.
+    stakeholder_ids: list[uuid.UUID] = Field(min_length=1)
     since: datetime | None = None
 
+    @field_validator("stakeholder_ids")
+    @classmethod
+    def _at_most_max(cls, ids: list[uuid.UUID]) -> list[uuid.UUID]:
+        limit = settings.alert_generate_max_stakeholders
+        if len(ids) > limit:
+            raise ValueError(f"at most {limit} stakeholder_ids per request")
+        return ids
+
 
 # --- Campaign Schemas ---
 
@@ -140,6 +201,43 @@ class CampaignResponse(BaseModel):
     model_config = {"from_attributes": True}
 
 
+# --- List Schemas ---
+
+
+class PageResponse(BaseModel):
+    """A page of a list endpoint; pass ``next_cursor`` as ``cursor`` for the next one.
+
+    Items hold ``id``, ``created_at`` and the requested ``fields``.
+    """
+
+    items: list[dict[str, Any]]
+    next_cursor: str | None = None
+
+
+# --- Webhook Schemas ---
+
+
+class WebhookEvent(BaseModel):
+    """Minimal contract for HousingLens/HousingEar webhook payloads.
+
+    Only ``event_type`` is required; event-specific fields are kept as-is.
+    """
+
+    event_type: str = Field(min_length=1, max_length=100)
+    event_id: str | None = Field(default=None, max_length=255)
+    jurisdiction: str | None = None
+    topics: list[str] = Field(default_factory=list)
+
+    model_config = {"extra": "allow"}
+
+
+class WebhookAck(BaseModel):
+    status: str
+    event_type: str
+    idempotency_key: str
+    stream_id: str | None = None
+
+
 # --- Comparative Analysis Schemas ---
 
 
@@ -156,3 +254,4 @@ class ComparativeAnalysisResponse(BaseModel):
     opportunity_gaps: list[dict]
     narrative_summary: str
     visualization_config: dict | None = None
+    errors: dict[str, str] = Field(default_factory=dict)
@@ -6,8 +6,8 @@ import enum
 import uuid
 from datetime import datetime
 
-from sqlalchemy import DateTime, Enum, String, func
-from sqlalchemy.dialects.postgresql import ARRAY, JSON, UUID
+from sqlalchemy import DateTime, Enum, Index, String, func
+from sqlalchemy.dialects.postgresql import ARRAY, JSON, JSONB, UUID
 from sqlalchemy.orm import Mapped, mapped_column
 
 from src.database import Base
@@ -37,6 +37,18 @@ class AlertThreshold(str, enum.Enum):
 
 class Stakeholder(Base):
     __tablename__ = "stakeholders"
+    __table_args__ = (
+        # Serves jurisdiction lookups and keyset pages filtered by jurisdiction.
+        Index("ix_stakeholders_jurisdiction_created_id", "jurisdiction", "created_at", "id"),
+        Index("ix_stakeholders_created_id", "created_at", "id"),
+        Index("ix_stakeholders_interests", "interests", postgresql_using="gin"),
+        Index(
+            "ix_stakeholders_projects",
+            "projects",
+            postgresql_using="gin",
+            postgresql_ops={"projects": "jsonb_path_ops"},
+        ),
+    )
 
     id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True), primary_key=True, default=uuid.uuid4
@@ -56,7 +68,7 @@ class Stakeholder(Base):
     alert_threshold: Mapped[AlertThreshold] = mapped_column(
         Enum(AlertThreshold), default=AlertThreshold.MEDIUM
     )
-    projects: Mapped[dict | None] = mapped_column(JSON, default=list)
+    projects: Mapped[dict | None] = mapped_column(JSONB, default=list)
     metadata_: Mapped[dict | None] = mapped_column("metadata", JSON, default=dict)
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), server_default=func.now()
@@ -0,0 +1,500 @@
+"""Repositories for the persisted models.
+
+Each repository wraps an ``AsyncSession`` and issues a fixed number of
+statements per call, whatever the number of rows involved: reads by id are
+one primary-key ``SELECT``, and lists are loaded with a single query. The
+filters match the indexes from migration 0002. ``page`` methods return lists
+newest first, with keyset pagination on ``(created_at, id)`` served by the
+indexes from migration 0004.
+Alerts are written in bulk: ``COPY`` or multi-row ``INSERT`` for new rows,
+and one ``UPDATE ... WHERE id = ANY(...)`` per chunk for status changes.
+Other inserts fetch server defaults such as ``created_at`` through ``RETURNING``
+instead of a second ``SELECT``. Write methods commit their own transaction.
+"""
+
+from __future__ import annotations
+
+import base64
+import enum
+import json
+import uuid
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Any
+
+from sqlalchemy import ColumnElement, any_, bindparam, func, insert, select, tuple_, update
+from sqlalchemy.dialects.postgresql import ARRAY, UUID
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.config import settings
+from src.database import Base
+from src.models.alert import Alert, AlertPriority, AlertStatus, AlertType
+from src.models.campaign import Campaign
+from src.models.content import AudienceType, Content, ContentStatus, ContentType
+from src.models.schemas import CampaignCreate, StakeholderCreate
+from src.models.stakeholder import Stakeholder, StakeholderType
+
+# Column order for ``COPY`` into ``alerts``; ``read_at`` is never set on insert.
+ALERT_COPY_COLUMNS = (
+    "id",
+    "stakeholder_id",
+    "priority",
+    "alert_type",
+    "headline",
+    "summary",
+    "action_required",
+    "action_deadline",
+    "related_project_ids",
+    "recommended_actions",
+    "source_data",
+    "status",
+    "sent_at",
+    "created_at",
+)
+ALERT_ID_ARRAY = ARRAY(UUID(as_uuid=True))
+
+
+def _uuid(value: Any) -> uuid.UUID | None:
+    if value is None or isinstance(value, uuid.UUID):
+        return value
+    return uuid.UUID(str(value))
+
+
+def _datetime(value: Any) -> datetime | None:
+    if value is None or value == "":
+        return None
+    if not isinstance(value, datetime):
+        value = datetime.fromisoformat(str(value))
+    return value if value.tzinfo else value.replace(tzinfo=timezone.utc)
+
+
+def _with_created_at(row: Any, value: Any) -> Any:
+    # Left unset, ``created_at`` comes from the server default.
+    created_at = _datetime(value)
+    if created_at is not None:
+        row.created_at = created_at
+    return row
+
+
+def content_row(
+    content: dict[str, Any],
+    stakeholder_id: uuid.UUID | str | None = None,
+    campaign_id: uuid.UUID | str | None = None,
+) -> Content:
+    """Build a ``Content`` row from a generator result."""
+    row = Content(
+        id=_uuid(content["id"]),
+        content_type=ContentType(content["content_type"]),
+        audience=AudienceType(content["audience"]),
+        jurisdiction=content["jurisdiction"],
+        headline=content["headline"],
+        executive_summary=content.get("executive_summary"),
+        body=content["body"],
+        call_to_action=content.get("call_to_action"),
+        source_data=content.get("source_data") or {},
+        supporting_data=content.get("supporting_data") or {},
+        status=ContentStatus(content.get("status") or ContentStatus.DRAFT),
+        generated_by=content.get("generated_by"),
+        version=content.get("version") or 1,
+        stakeholder_id=_uuid(stakeholder_id),
+        campaign_id=_uuid(campaign_id),
+    )
+    return _with_created_at(row, content.get("created_at"))
+
+
+def alert_values(alert: dict[str, Any]) -> dict[str, Any]:
+    """Column values for an ``Alert`` row from an ``AlertGenerator`` result."""
+    values = {
+        "id": _uuid(alert.get("id")) or uuid.uuid4(),
+        "stakeholder_id": _uuid(alert["stakeholder_id"]),
+        "priority": AlertPriority(alert["priority"]),
+        "alert_type": AlertType(alert["alert_type"]),
+        "headline": alert["headline"],
+        "summary": alert["summary"],
+        "action_required": bool(alert.get("action_required")),
+        "action_deadline": _datetime(alert.get("action_deadline")),
+        "related_project_ids": [str(p) for p in alert.get("related_project_ids") or []],
+        "recommended_actions": alert.get("recommended_actions") or [],
+        "source_data": alert.get("source_data") or {},
+        "status": AlertStatus(alert.get("status") or AlertStatus.PENDING),
+        "sent_at": _datetime(alert.get("sent_at")),
+    }
+    created_at = _datetime(alert.get("created_at"))
+    if created_at is not None:
+        values["created_at"] = created_at
+    return values
+
+
+def alert_row(alert: dict[str, Any]) -> Alert:
+    """Build an ``Alert`` row from an ``AlertGenerator`` result."""
+    return Alert(**alert_values(alert))
+
+
+def copy_record(values: dict[str, Any]) -> tuple[Any, ...]:
+    """``alert_values`` output as a record for asyncpg's ``COPY``.
+
+    Enums are sent by member name, as SQLAlchemy stores them, and JSON
+    columns as encoded text.
+    """
+    record = []
+    for column in ALERT_COPY_COLUMNS:
+        value = values.get(column)
+        if isinstance(value, enum.Enum):
+            value = value.name
+        elif column in ("recommended_actions", "source_data"):
+            value = json.dumps(value, default=str)
+        record.append(value)
+    return tuple(record)
+
+
+def _chunks(items: list[Any], size: int) -> Iterator[list[Any]]:
+    for start in range(0, len(items), max(1, size)):
+        yield items[start : start + size]
+
+
+@dataclass
+class Page:
+    """One page of a keyset-paginated list; ``next_cursor`` is None on the last page."""
+
+    items: list[dict[str, Any]]
+    next_cursor: str | None = None
+
+
+def encode_cursor(created_at: datetime, row_id: uuid.UUID) -> str:
+    raw = json.dumps([created_at.isoformat(), str(row_id)]).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, uuid.UUID]:
+    """Inverse of ``encode_cursor``; raises ``ValueError`` for a malformed cursor."""
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        raw_created_at, raw_id = json.loads(raw)
+        created_at, row_id = _datetime(raw_created_at), uuid.UUID(raw_id)
+    except (TypeError, ValueError) as exc:
+        raise ValueError(f"Invalid cursor: {cursor!r}") from exc
+    if created_at is None:
+        raise ValueError(f"Invalid cursor: {cursor!r}")
+    return created_at, row_id
+
+
+def _equal(model: type[Base], **values: Any) -> list[ColumnElement[bool]]:
+    """``column = value`` for each of *values* that is not None."""
+    table = model.__table__
+    return [table.c[name] == value for name, value in values.items() if value is not None]
+
+
+async def keyset_page(
+    session: AsyncSession,
+    model: type[Base],
+    conditions: list[ColumnElement[bool]],
+    fields: Iterable[str],
+    limit: int,
+    cursor: str | None = None,
+) -> Page:
+    """Up to *limit* rows of *model* after *cursor*, newest first, loading only *fields*.
+
+    Rows are ordered by ``(created_at, id)`` descending and each page resumes
+    strictly after the last row of the one before, so a deep page is the same
+    index range scan as the first. ``id`` and ``created_at`` are always loaded.
+    Unknown *fields* raise ``KeyError``; a bad *cursor* raises ``ValueError``.
+    """
+    table = model.__table__
+    names = ["id", "created_at", *(f for f in fields if f not in ("id", "created_at"))]
+    stmt = select(*(table.c[name] for name in dict.fromkeys(names))).where(*conditions)
+    if cursor is not None:
+        created_at, row_id = decode_cursor(cursor)
+        stmt = stmt.where(
+            # The plain bound on created_at lets Postgres prune alert partitions.
+            table.c.created_at <= created_at,
+            tuple_(table.c.created_at, table.c.id) < tuple_(created_at, row_id),
+        )
+    stmt = stmt.order_by(table.c.created_at.desc(), table.c.id.desc()).limit(limit + 1)
+    rows = [dict(row) for row in (await session.execute(stmt)).mappings()]
+    if len(rows) <= limit:
+        return Page(rows)
+    last = rows[limit - 1]
+    return Page(rows[:limit], encode_cursor(last["created_at"], last["id"]))
+
+
+class ContentRepository:
+    def __init__(self, session: AsyncSession) -> None:
+        self.session = session
+
+    async def get(self, content_id: uuid.UUID) -> Content | None:
+        return await self.session.get(Content, content_id)
+
+    async def find(
+        self,
+        jurisdiction: str,
+        content_type: ContentType | None = None,
+        status: ContentStatus | None = None,
+        limit: int = 50,
+    ) -> list[Content]:
+        """Newest content for *jurisdiction*, optionally of one type and status."""
+        stmt = select(Content).where(Content.jurisdiction == jurisdiction)
+        if content_type is not None:
+            stmt = stmt.where(Content.content_type == content_type)
+        if status is not None:
+            stmt = stmt.where(Content.status == status)
+        stmt = stmt.order_by(Content.created_at.desc()).limit(limit)
+        return list(await self.session.scalars(stmt))
+
+    async def page(
+        self,
+        fields: Iterable[str],
+        limit: int = 50,
+        cursor: str | None = None,
+        jurisdiction: str | None = None,
+        content_type: ContentType | None = None,
+        status: ContentStatus | None = None,
+        stakeholder_id: uuid.UUID | None = None,
+    ) -> Page:
+        conditions = _equal(
+            Content,
+            jurisdiction=jurisdiction,
+            content_type=content_type,
+            status=status,
+            stakeholder_id=stakeholder_id,
+        )
+        return await keyset_page(self.session, Content, conditions, fields, limit, cursor)
+
+    async def add(
+        self,
+        content: dict[str, Any],
+        stakeholder_id: uuid.UUID | str | None = None,
+        campaign_id: uuid.UUID | str | None = None,
+    ) -> Content:
+        row = content_row(content, stakeholder_id=stakeholder_id, campaign_id=campaign_id)
+        self.session.add(row)
+        await self.session.commit()
+        return row
+
+
+class StakeholderRepository:
+    def __init__(self, session: AsyncSession) -> None:
+        self.session = session
+
+    async def get(self, stakeholder_id: uuid.UUID) -> Stakeholder | None:
+        return await self.session.get(Stakeholder, stakeholder_id)
+
+    async def all(self) -> list[Stakeholder]:
+        return list(await self.session.scalars(select(Stakeholder)))
+
+    async def find(
+        self,
+        jurisdiction: str | None = None,
+        interests: Iterable[str] = (),
+        project_id: str | None = None,
+    ) -> list[Stakeholder]:
+        """Stakeholders in *jurisdiction*, sharing any of *interests*, or tracking *project_id*.
+
+        Interests use the ARRAY overlap operator (``&&``) and projects use
+        JSONB containment (``@>``), so both are served by GIN indexes.
+        """
+        stmt = select(Stakeholder)
+        if jurisdiction is not None:
+            stmt = stmt.where(Stakeholder.jurisdiction == jurisdiction)
+        interests = list(interests)
+        if interests:
+            stmt = stmt.where(Stakeholder.interests.overlap(interests))
+        if project_id is not None:
+            stmt = stmt.where(Stakeholder.projects.contains([{"project_id": project_id}]))
+        return list(await self.session.scalars(stmt))
+
+    async def get_many(self, stakeholder_ids: Iterable[uuid.UUID]) -> list[Stakeholder]:
+        """Load *stakeholder_ids* in one query, in the order given; unknown ids are skipped."""
+        ids = list(dict.fromkeys(stakeholder_ids))
+        if not ids:
+            return []
+        rows = await self.session.scalars(select(Stakeholder).where(Stakeholder.id.in_(ids)))
+        by_id = {row.id: row for row in rows}
+        return [by_id[sid] for sid in ids if sid in by_id]
+
+    async def page(
+        self,
+        fields: Iterable[str],
+        limit: int = 50,
+        cursor: str | None = None,
+        jurisdiction: str | None = None,
+        stakeholder_type: StakeholderType | None = None,
+    ) -> Page:
+        conditions = _equal(
+            Stakeholder, jurisdiction=jurisdiction, stakeholder_type=stakeholder_type
+        )
+        return await keyset_page(self.session, Stakeholder, conditions, fields, limit, cursor)
+
+    async def add(self, data: StakeholderCreate) -> Stakeholder:
+        row = Stakeholder(id=uuid.uuid4(), **data.model_dump())
+        self.session.add(row)
+        await self.session.commit()
+        return row
+
+
+class AlertRepository:
+    def __init__(self, session: AsyncSession) -> None:
+        self.session = session
+
+    async def for_stakeholder(
+        self,
+        stakeholder_id: uuid.UUID,
+        status: AlertStatus | None = None,
+        limit: int = 50,
+        since: datetime | None = None,
+    ) -> list[Alert]:
+        """Newest alerts for one stakeholder, optionally in one status.
+
+        With *since*, only the monthly partitions from then on are scanned.
+        """
+        stmt = select(Alert).where(Alert.stakeholder_id == stakeholder_id)
+        if status is not None:
+            stmt = stmt.where(Alert.status == status)
+        if since is not None:
+            stmt = stmt.where(Alert.created_at >= since)
+        stmt = stmt.order_by(Alert.created_at.desc()).limit(limit)
+        return list(await self.session.scalars(stmt))
+
+    async def page(
+        self,
+        fields: Iterable[str],
+        limit: int = 50,
+        cursor: str | None = None,
+        stakeholder_id: uuid.UUID | None = None,
+        status: AlertStatus | None = None,
+        priority: AlertPriority | None = None,
+    ) -> Page:
+        conditions = _equal(Alert, stakeholder_id=stakeholder_id, status=status, priority=priority)
+        return await keyset_page(self.session, Alert, conditions, fields, limit, cursor)
+
+    async def insert_many(
+        self,
+        alerts: list[dict[str, Any]],
+        method: str | None = None,
+        chunk_size: int | None = None,
+        skip_existing: bool = False,
+    ) -> int:
+        """Insert *alerts* in one transaction and return how many were written.
+
+        With asyncpg the default *method* is ``"copy"``, which streams each
+        chunk with binary ``COPY``. ``"values"`` sends multi-row ``INSERT``
+        statements instead; it is also the fallback on other drivers. Both
+        bypass the ORM unit of work. With *skip_existing*, alerts whose key
+        ``(id, created_at)`` is already stored are left alone with ``ON
+        CONFLICT DO NOTHING``; ``COPY`` cannot do that, so ``"values"`` is
+        always used.
+        """
+        if not alerts:
+            return 0
+        method = "values" if skip_existing else method or settings.alert_bulk_insert_method
+        chunk_size = chunk_size or settings.alert_insert_chunk_size
+        # Neither path applies server defaults per row, so stamp created_at here.
+        now = datetime.now(timezone.utc)
+        rows = [alert_values(alert) for alert in alerts]
+        for values in rows:
+            values.setdefault("created_at", now)
+        written = len(rows)
+        conn = await self.session.connection()
+        if method == "copy" and conn.dialect.driver == "asyncpg":
+            raw = (await conn.get_raw_connection()).driver_connection
+            async with raw.transaction():
+                for chunk in _chunks(rows, chunk_size):
+                    await raw.copy_records_to_table(
+                        Alert.__tablename__,
+                        records=[copy_record(values) for values in chunk],
+                        columns=ALERT_COPY_COLUMNS,
+                    )
+        elif skip_existing:
+            stmt = (
+                pg_insert(Alert)
+                .on_conflict_do_nothing(index_elements=["id", "created_at"])
+                .returning(Alert.id)
+            )
+            written = 0
+            for chunk in _chunks(rows, chunk_size):
+                written += len((await self.session.execute(stmt, chunk)).all())
+        else:
+            for chunk in _chunks(rows, chunk_size):
+                await self.session.execute(insert(Alert), chunk)
+        await self.session.commit()
+        return written
+
+    async def statuses(
+        self, alert_ids: Iterable[uuid.UUID | str], created_at: datetime | None = None
+    ) -> dict[uuid.UUID, AlertStatus]:
+        """The stored status of each of *alert_ids* that exists, in one query.
+
+        Passing the alerts' shared *created_at* lets Postgres read only the
+        partition holding them.
+        """
+        ids = list(dict.fromkeys(_uuid(alert_id) for alert_id in alert_ids))
+        if not ids:
+            return {}
+        stmt = select(Alert.id, Alert.status).where(
+            Alert.id == any_(bindparam("ids", ids, type_=ALERT_ID_ARRAY))
+        )
+        if created_at is not None:
+            stmt = stmt.where(Alert.created_at == created_at)
+        return {row.id: row.status for row in (await self.session.execute(stmt)).all()}
+
+    async def set_status(
+        self,
+        alert_ids: Iterable[uuid.UUID | str],
+        status: AlertStatus,
+        from_status: AlertStatus | None = None,
+        chunk_size: int | None = None,
+    ) -> int:
+        """Move *alert_ids* to *status* with set-based updates; return rows changed.
+
+        Each chunk is one ``UPDATE ... WHERE id = ANY(:ids)``, with the ids
+        bound as a single array, and is committed on its own so row locks
+        are held briefly. With *from_status*, alerts in any other status
+        are left alone. Moving to ``SENT`` or ``READ`` also stamps
+        ``sent_at`` or ``read_at``.
+        """
+        values: dict[str, Any] = {"status": status}
+        if status == AlertStatus.SENT:
+            values["sent_at"] = func.now()
+        elif status == AlertStatus.READ:
+            values["read_at"] = func.now()
+        ids = list(dict.fromkeys(_uuid(alert_id) for alert_id in alert_ids))
+        updated = 0
+        for chunk in _chunks(ids, chunk_size or settings.alert_update_chunk_size):
+            stmt = (
+                update(Alert)
+                .where(Alert.id == any_(bindparam("ids", chunk, type_=ALERT_ID_ARRAY)))
+                .values(**values)
+                .execution_options(synchronize_session=False)
+            )
+            if from_status is not None:
+                stmt = stmt.where(Alert.status == from_status)
+            result = await self.session.execute(stmt)
+            await self.session.commit()
+            updated += result.rowcount
+        return updated
+
+
+class CampaignRepository:
+    def __init__(self, session: AsyncSession) -> None:
+        self.session = session
+
+    async def get(self, campaign_id: uuid.UUID) -> Campaign | None:
+        return await self.session.get(Campaign, campaign_id)
+
+    async def add(self, data: CampaignCreate) -> Campaign:
+        row = Campaign(id=uuid.uuid4(), **data.model_dump())
+        self.session.add(row)
+        await self.session.commit()
+        return row
+
+
+class Repositories:
+    """One repository per model, all sharing *session*."""
+
+    def __init__(self, session: AsyncSession) -> None:
+        self.session = session
+        self.content = ContentRepository(session)
+        self.stakeholders = StakeholderRepository(session)
+        self.alerts = AlertRepository(session)
+        self.campaigns = CampaignRepository(session)
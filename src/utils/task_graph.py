@@ -0,0 +1,59 @@
+"""Run interdependent async steps concurrently.
+
+A step names the steps whose results it needs; it starts as soon as those
+have finished, so independent fetches overlap instead of running one after
+another.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable, Mapping
+from dataclasses import dataclass
+from typing import Any
+
+from src.utils.timing import StageTimer
+
+
+@dataclass(frozen=True)
+class Step:
+    """An async callable receiving the results of *after* as keyword arguments."""
+
+    func: Callable[..., Awaitable[Any]]
+    after: tuple[str, ...] = ()
+
+
+async def run_steps(steps: Mapping[str, Step], timer: StageTimer | None = None) -> dict[str, Any]:
+    """Run *steps* and return their results by name.
+
+    Steps must be listed after the steps they depend on. Each one is timed
+    under its own name when a *timer* is given. If any step fails, the rest
+    are cancelled and the first error is raised.
+    """
+    tasks: dict[str, asyncio.Task[Any]] = {}
+
+    async def _run(name: str, step: Step) -> Any:
+        inputs = {dep: await tasks[dep] for dep in step.after}
+        if timer is None:
+            return await step.func(**inputs)
+        with timer.stage(name):
+            return await step.func(**inputs)
+
+    declared: set[str] = set()
+    for name, step in steps.items():
+        missing = [dep for dep in step.after if dep not in declared]
+        if missing:
+            raise ValueError(f"Step {name!r} depends on undeclared steps {missing}")
+        declared.add(name)
+
+    for name, step in steps.items():
+        tasks[name] = asyncio.create_task(_run(name, step))
+
+    try:
+        await asyncio.gather(*tasks.values())
+    except BaseException:
+        for task in tasks.values():
+            task.cancel()
+        await asyncio.gather(*tasks.values(), return_exceptions=True)
+        raise
+    return {name: task.result() for name, task in tasks.items()}
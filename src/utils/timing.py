@@ -0,0 +1,38 @@
+"""Lightweight per-stage timing for generation pipelines."""
+
+from __future__ import annotations
+
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+
+
+class StageTimer:
+    """Accumulate wall-clock time spent in named stages.
+
+    Stages that run concurrently each accumulate their own elapsed time, so
+    the sum across stages can exceed the total wall time of the pipeline.
+    """
+
+    def __init__(self) -> None:
+        self._started = time.perf_counter()
+        self._totals: dict[str, float] = {}
+        self._counts: dict[str, int] = {}
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self._totals[name] = self._totals.get(name, 0.0) + time.perf_counter() - start
+            self._counts[name] = self._counts.get(name, 0) + 1
+
+    def as_dict(self) -> dict[str, dict[str, float]]:
+        """Return ``{stage: {"seconds": ..., "count": ...}}`` plus the overall wall time."""
+        report = {
+            name: {"seconds": round(total, 4), "count": self._counts[name]}
+            for name, total in self._totals.items()
+        }
+        report["wall"] = {"seconds": round(time.perf_counter() - self._started, 4), "count": 1}
+        return report
@@ -10,9 +10,9 @@ from pathlib import Path
 CONFIG_DIR = Path(__file__).resolve().parent.parent.parent / "config"
 
 
-def load_tone_guidelines() -> dict[str, Any]:
+def load_tone_guidelines(config_dir: Path = CONFIG_DIR) -> dict[str, Any]:
     """Load audience-specific tone guidelines from YAML config."""
-    path = CONFIG_DIR / "tone_guidelines.yaml"
+    path = config_dir / "tone_guidelines.yaml"
     if path.exists():
         return yaml.safe_load(path.read_text(encoding="utf-8")) or {}
     return {}
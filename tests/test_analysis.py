@@ -2,10 +2,12 @@
 
 from __future__ import annotations
 
+import asyncio
+
 import pytest
 
 from src.analysis.comparative_analysis import _avg_metric, _find_gaps, _rank
-from src.analysis.impact_calculator import _build_narrative
+from src.analysis.impact_calculator import ImpactCalculator, _build_narrative
 from src.analysis.peer_matching import PeerMatcher
 
 
@@ -68,3 +70,29 @@ class TestPeerMatcher:
         ]
         peers = await matcher.find_peers(target, candidates)
         assert peers[0]["name"] == "Portland"
+
+
+class TestImpactCalculator:
+    @pytest.mark.asyncio
+    async def test_fetches_concurrently(self) -> None:
+        started: list[str] = []
+
+        class _Lens:
+            async def get_friction_scores(self, jurisdiction, topics=None):
+                started.append("friction")
+                await asyncio.sleep(0.01)
+                assert "costs" in started
+                return [{"topic": "Parking", "friction_score": 800}]
+
+            async def get_cost_estimates(self, jurisdiction, topics=None):
+                started.append("costs")
+                await asyncio.sleep(0.01)
+                return [{"topic": "Parking", "estimated_cost": 1000, "delay_days": 30}]
+
+        calc = ImpactCalculator.__new__(ImpactCalculator)
+        calc.lens = _Lens()
+
+        result = await calc.calculate("Denver, CO", unit_count=10)
+
+        assert result["per_unit_cost"] == 100
+        assert {"friction_scores", "cost_estimates"} <= set(result["timings"])
@@ -2,8 +2,13 @@
 
 from __future__ import annotations
 
+import uuid
+from dataclasses import fields
+from datetime import datetime, timezone
+
 import pytest
 from httpx import ASGITransport, AsyncClient
+from sqlalchemy import inspect
 
 from src.api.endpoints import app
 
@@ -13,6 +18,51 @@ def anyio_backend() -> str:
     return "asyncio"
 
 
+class _MemorySession:
+    """Enough of ``AsyncSession`` for the repositories, kept in a dict."""
+
+    def __init__(self) -> None:
+        self.rows: dict[tuple[type, object], object] = {}
+        self.pending: list[object] = []
+
+    def add(self, row: object) -> None:
+        self.pending.append(row)
+
+    def add_all(self, rows: list[object]) -> None:
+        self.pending.extend(rows)
+
+    async def commit(self) -> None:
+        # Apply column defaults the way a flush would.
+        now = datetime.now(timezone.utc)
+        for row in self.pending:
+            for attr in inspect(type(row)).column_attrs:
+                column = attr.columns[0]
+                if getattr(row, attr.key) is not None:
+                    continue
+                if column.default is not None:
+                    default = column.default
+                    value = default.arg(None) if default.is_callable else default.arg
+                    setattr(row, attr.key, value)
+                elif column.server_default is not None:
+                    setattr(row, attr.key, now)
+            self.rows[(type(row), row.id)] = row
+        self.pending.clear()
+
+    async def get(self, model: type, key: object) -> object | None:
+        return self.rows.get((model, key))
+
+
+@pytest.fixture(autouse=True)
+def memory_repositories(monkeypatch) -> _MemorySession:
+    from src.api.dependencies import get_repositories
+    from src.repositories import Repositories
+
+    session = _MemorySession()
+    repos = Repositories(session)  # type: ignore[arg-type]
+    monkeypatch.setitem(app.dependency_overrides, get_repositories, lambda: repos)
+    return session
+
+
 @pytest.mark.asyncio
 async def test_health_endpoint() -> None:
     transport = ASGITransport(app=app)
@@ -64,3 +114,281 @@ async def test_create_campaign() -> None:
     data = resp.json()
     assert data["name"] == "Test Campaign"
     assert data["status"] == "planning"
+
+
+class _FakeLens:
+    async def get_cost_estimates(self, jurisdiction: str, topics: list[str]) -> list[dict]:
+        return []
+
+
+class _StreamingLLM:
+    def __init__(self, deltas: list[str], fail: bool = False) -> None:
+        self.deltas = deltas
+        self.fail = fail
+
+    async def stream(self, **_: object):
+        for delta in self.deltas:
+            yield delta
+        if self.fail:
+            raise RuntimeError("overloaded")
+
+    async def run(self, _: object, **__: object) -> str:
+        return "".join(self.deltas)
+
+
+def _patch_policy_brief(monkeypatch, llm: _StreamingLLM) -> None:
+    from src.api.dependencies import Services, get_services
+    from src.generators.policy_brief import PolicyBriefGenerator
+
+    unused = {f.name: None for f in fields(Services)}
+    services = Services(**{**unused, "policy_brief": PolicyBriefGenerator(llm, _FakeLens())})  # type: ignore[arg-type]
+    monkeypatch.setitem(app.dependency_overrides, get_services, lambda: services)
+
+
+def _parse_sse(body: str) -> list[tuple[str, dict]]:
+    import json
+
+    events = []
+    for block in body.strip().split("\n\n"):
+        lines = dict(line.split(": ", 1) for line in block.splitlines())
+        events.append((lines["event"], json.loads(lines["data"])))
+    return events
+
+
+_BRIEF_REQUEST = {
+    "content_type": "Policy_Brief",
+    "audience": "City_Council",
+    "jurisdiction": "Denver, CO",
+    "friction_data": [{"topic": "Parking", "friction_score": 847}],
+}
+
+
+@pytest.mark.asyncio
+async def test_generate_content_stream(monkeypatch) -> None:
+    deltas = ["# Parking Costs\n\n", "## Executive Summary\n", "Parking adds cost.\n"]
+    _patch_policy_brief(monkeypatch, _StreamingLLM(deltas))
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as client:
+        resp = await client.post("/api/v1/content/generate/stream", json=_BRIEF_REQUEST)
+
+    assert resp.status_code == 200
+    assert resp.headers["content-type"].startswith("text/event-stream")
+    events = _parse_sse(resp.text)
+    assert [name for name, _ in events] == ["delta", "delta", "delta", "complete"]
+    assert "".join(data["text"] for name, data in events[:-1]) == "".join(deltas)
+    final = events[-1][1]
+    assert final["headline"] == "Parking Costs"
+    assert final["executive_summary"] == "Parking adds cost."
+    assert final["body"] == "".join(deltas)
+
+
+@pytest.mark.asyncio
+async def test_generate_content_stream_reports_errors(monkeypatch) -> None:
+    _patch_policy_brief(monkeypatch, _StreamingLLM(["partial"], fail=True))
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as client:
+        resp = await client.post("/api/v1/content/generate/stream", json=_BRIEF_REQUEST)
+
+    events = _parse_sse(resp.text)
+    assert [name for name, _ in events] == ["delta", "error"]
+    assert events[-1][1]["detail"] == "overloaded"
+
+
+@pytest.mark.asyncio
+async def test_generate_content_matches_stream_payload(monkeypatch) -> None:
+    _patch_policy_brief(monkeypatch, _StreamingLLM(["# Parking Costs\n", "Body.\n"]))
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as client:
+        resp = await client.post("/api/v1/content/generate", json=_BRIEF_REQUEST)
+
+    assert resp.status_code == 200
+    assert resp.json()["headline"] == "Parking Costs"
+
+
+@pytest.mark.asyncio
+async def test_services_built_once_and_closed() -> None:
+    from fastapi import FastAPI
+
+    from src.api.dependencies import close_services, open_services
+
+    local = FastAPI()
+    services = open_services(local)
+    assert open_services(local) is services
+    assert services.policy_brief.llm is services.alerts.llm
+    assert services.impact.lens is services.comparative.lens
+
+    await close_services(local)
+    assert local.state.services is None
+    assert services.llm.client.is_closed()
+
+
+@pytest.mark.asyncio
+async def test_generate_content_async_returns_job(monkeypatch) -> None:
+    from src.api import endpoints
+    from src.distribution.job_store import JobStore
+    from src.integrations.cache import MemoryCacheBackend
+
+    store = JobStore(MemoryCacheBackend(), ttl=60)
+    enqueued: list[dict] = []
+    monkeypatch.setattr(endpoints, "job_store", store)
+    monkeypatch.setattr(
+        endpoints.generate_content_task, "delay", lambda *args, **kwargs: enqueued.append(kwargs)
+    )
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as client:
+        resp = await client.post("/api/v1/content/generate?async=true", json=_BRIEF_REQUEST)
+        again = await client.post("/api/v1/content/generate?async=true", json=_BRIEF_REQUEST)
+        job_id = resp.json()["id"]
+        await store.mark_succeeded(await store.get(job_id), {"headline": "Parking Costs"})
+        polled = await client.get(resp.headers["location"])
+        missing = await client.get("/api/v1/jobs/nope")
+
+    assert resp.status_code == 202
+    assert resp.json()["status"] == "queued"
+    assert again.json()["id"] == job_id
+    assert enqueued == [{"job_id": job_id}]
+    assert polled.json()["status"] == "succeeded"
+    assert polled.json()["result"] == {"headline": "Parking Costs"}
+    assert missing.status_code == 404
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "callback_url",
+    [
+        "http://example.org/hook",
+        "https://127.0.0.1/hook",
+        "https://169.254.169.254/latest/meta-data",
+        "https://[fd00::1]/hook",
+        "https://localhost/hook",
+    ],
+)
+async def test_generate_content_async_rejects_internal_callbacks(callback_url) -> None:
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as client:
+        resp = await client.post(
+            "/api/v1/content/generate?async=true",
+            json={**_BRIEF_REQUEST, "callback_url": callback_url},
+        )
+
+    assert resp.status_code == 422
+
+
+def test_callback_allowlist(monkeypatch) -> None:
+    from src.models import schemas
+
+    monkeypatch.setattr(schemas.settings, "job_callback_allowed_hosts", "hooks.example.org")
+    request = {**_BRIEF_REQUEST, "callback_url": "https://hooks.example.org/done"}
+    assert schemas.ContentGenerateRequest(**request).callback_url is not None
+    with pytest.raises(ValueError, match="not allowed"):
+        schemas.ContentGenerateRequest(**{**request, "callback_url": "https://example.org/"})
+
+
+@pytest.mark.asyncio
+async def test_created_stakeholder_is_stored() -> None:
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as client:
+        created = await client.post(
+            "/api/v1/stakeholders",
+            json={
+                "stakeholder_type": "City_Council",
+                "organization": "Denver City Council",
+                "jurisdiction": "Denver, CO",
+                "interests": ["Parking"],
+            },
+        )
+        fetched = await client.get(f"/api/v1/stakeholders/{created.json()['id']}")
+
+    assert fetched.status_code == 200
+    assert fetched.json()["organization"] == "Denver City Council"
+    assert fetched.json()["interests"] == ["Parking"]
+    assert fetched.json()["notification_frequency"] == "weekly_digest"
+
+
+@pytest.mark.asyncio
+async def test_generate_alerts_needs_a_bounded_stakeholder_list(monkeypatch) -> None:
+    from src.models import schemas
+
+    monkeypatch.setattr(schemas.settings, "alert_generate_max_stakeholders", 2)
+    ids = [str(uuid.uuid4()) for _ in range(3)]
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as client:
+        omitted = await client.post("/api/v1/alerts/generate", json={})
+        empty = await client.post("/api/v1/alerts/generate", json={"stakeholder_ids": []})
+        too_many = await client.post("/api/v1/alerts/generate", json={"stakeholder_ids": ids})
+
+    assert omitted.status_code == 422
+    assert empty.status_code == 422
+    assert too_many.status_code == 422
+    assert "at most 2" in too_many.text
+
+
+@pytest.mark.asyncio
+async def test_generated_content_is_stored(monkeypatch) -> None:
+    _patch_policy_brief(monkeypatch, _StreamingLLM(["# Parking Costs\n", "Body.\n"]))
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as client:
+        generated = await client.post("/api/v1/content/generate", json=_BRIEF_REQUEST)
+        fetched = await client.get(f"/api/v1/content/{generated.json()['id']}")
+        missing = await client.get("/api/v1/content/00000000-0000-0000-0000-000000000000")
+
+    assert fetched.status_code == 200
+    assert fetched.json()["headline"] == "Parking Costs"
+    assert fetched.json()["created_at"] == generated.json()["created_at"]
+    assert missing.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_stakeholder_report_unknown_stakeholder() -> None:
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as client:
+        resp = await client.post(
+            "/api/v1/reports/stakeholder",
+            params={"stakeholder_id": "00000000-0000-0000-0000-000000000000"},
+        )
+    assert resp.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_list_content_pages_with_projection(monkeypatch) -> None:
+    from src.repositories import ContentRepository, Page
+
+    calls = []
+    row_id = uuid.uuid4()
+
+    async def _page(self, fields, limit, cursor, **filters):  # type: ignore[no-untyped-def]
+        calls.append((fields, limit, cursor, filters))
+        created_at = datetime(2026, 10, 1, tzinfo=timezone.utc)
+        return Page([{"id": row_id, "created_at": created_at, "headline": "H"}], "next")
+
+    monkeypatch.setattr(ContentRepository, "page", _page)
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as client:
+        default = await client.get("/api/v1/content", params={"jurisdiction": "Denver, CO"})
+        projected = await client.get(
+            "/api/v1/content", params={"fields": "headline,body", "status": "draft", "limit": 10}
+        )
+
+    assert default.status_code == 200 and projected.status_code == 200
+    assert default.json() == {
+        "items": [{"id": str(row_id), "created_at": "2026-10-01T00:00:00Z", "headline": "H"}],
+        "next_cursor": "next",
+    }
+    # Large columns are only loaded when asked for.
+    assert "body" not in calls[0][0] and "source_data" not in calls[0][0]
+    assert calls[0][3]["jurisdiction"] == "Denver, CO"
+    assert calls[1][:2] == (["headline", "body"], 10)
+    assert calls[1][3]["status"].value == "draft"
+
+
+@pytest.mark.asyncio
+async def test_list_endpoints_reject_bad_fields_and_cursors() -> None:
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as client:
+        bad_field = await client.get("/api/v1/alerts", params={"fields": "headline,password"})
+        bad_cursor = await client.get("/api/v1/stakeholders", params={"cursor": "not-a-cursor"})
+        too_many = await client.get("/api/v1/content", params={"limit": 1000})
+    assert bad_field.status_code == 422
+    assert bad_field.json()["detail"] == "Unknown fields: password"
+    assert bad_cursor.status_code == 400
+    assert too_many.status_code == 422
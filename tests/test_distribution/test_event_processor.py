@@ -0,0 +1,226 @@
+"""Tests for webhook event decoding and processing."""
+
+from __future__ import annotations
+
+import json
+import uuid
+from datetime import datetime, timezone
+from typing import Any
+
+import pytest
+
+from src.distribution.event_processor import (
+    EventProcessor,
+    alert_id,
+    event_scope,
+    is_alertable,
+)
+from src.distribution.event_queue import QueuedEvent, decode_entry, stream_id_at
+from src.distribution.event_worker import handle_event
+from src.distribution.stakeholder_index import StakeholderIndex
+from src.generators.alerts import AlertGenerationError
+from src.integrations.distribution_channels import DistributionResult
+from src.models.alert import AlertStatus
+
+
+class TestEventHelpers:
+    def test_decode_entry(self) -> None:
+        payload = {"event_type": "policy_update", "jurisdiction": "Denver, CO"}
+        event = decode_entry(
+            b"1700000000000-0",
+            {b"source": b"housing_ear", b"payload": json.dumps(payload).encode()},
+        )
+        assert event.id == "1700000000000-0"
+        assert event.event_type == "policy_update"
+        assert event.payload["jurisdiction"] == "Denver, CO"
+
+    def test_stream_id_at(self) -> None:
+        moment = datetime(2026, 1, 1, tzinfo=timezone.utc)
+        assert stream_id_at(moment) == f"{int(moment.timestamp() * 1000)}-0"
+
+    def test_event_scope_merges_topic_fields(self) -> None:
+        scope = event_scope({"jurisdiction": "Denver, CO", "topics": ["VAWA"], "topic": "Parking"})
+        assert scope == ("Denver, CO", ["VAWA", "Parking"], [])
+
+    def test_is_alertable(self) -> None:
+        assert is_alertable("housing_lens", "friction_score_change")
+        assert not is_alertable("housing_lens", "heartbeat")
+
+
+class _FakeGenerator:
+    def __init__(self) -> None:
+        self.seen: list[str] = []
+        self.failing: set[str] = set()
+
+    async def generate_alerts(self, profiles: list[dict], since: str | None = None) -> list[dict]:
+        self.seen = sorted(p["id"] for p in profiles)
+        alerts = [
+            {
+                "id": f"alert-{p['id']}",
+                "stakeholder_id": p["id"],
+                "headline": "H",
+                "summary": "S",
+                "status": "pending",
+            }
+            for p in profiles
+            if p["id"] not in self.failing
+        ]
+        errors = [RuntimeError("529 overloaded") for p in profiles if p["id"] in self.failing]
+        if errors:
+            raise AlertGenerationError("Alert generation failed", errors, alerts)
+        return alerts
+
+
+class _FakeQueue:
+    def __init__(self) -> None:
+        self.failures: list[str] = []
+        self.processed: list[str] = []
+        self.acked: list[str] = []
+
+    async def is_processed(self, event: QueuedEvent) -> bool:
+        return event.id in self.processed
+
+    async def record_failure(self, event: QueuedEvent) -> bool:
+        self.failures.append(event.id)
+        return False
+
+    async def mark_processed(self, event: QueuedEvent) -> None:
+        self.processed.append(event.id)
+
+    async def ack(self, event: QueuedEvent) -> None:
+        self.acked.append(event.id)
+
+
+class _FakeDistributor:
+    def __init__(self) -> None:
+        self.sent: list[dict[str, Any]] = []
+
+    async def distribute(self, content: dict, channels: list[str]) -> list[DistributionResult]:
+        self.sent.append(content)
+        return [DistributionResult(channel="email", success=True)]
+
+
+class _RecordingAlerts:
+    """Stands in for ``AlertRepository``; records the bulk calls and keeps the rows."""
+
+    calls: list[tuple[str, Any]] = []
+    stored: dict[uuid.UUID, AlertStatus] = {}
+
+    def __init__(self, session: object) -> None:
+        pass
+
+    async def insert_many(self, alerts: list[dict], skip_existing: bool = False) -> int:
+        self.calls.append(("insert", sorted((a["id"], a["status"]) for a in alerts)))
+        new = [a for a in alerts if uuid.UUID(a["id"]) not in self.stored]
+        for alert in new:
+            self.stored[uuid.UUID(alert["id"])] = AlertStatus(alert["status"])
+        return len(new)
+
+    async def statuses(self, ids: list[str], created_at: Any = None) -> dict:
+        return {uuid.UUID(i): self.stored[uuid.UUID(i)] for i in ids}
+
+    async def set_status(self, ids: list[str], status: Any, from_status: Any = None) -> int:
+        self.calls.append(("set_status", (ids, status.value, from_status.value)))
+        for alert_id_ in ids:
+            self.stored[uuid.UUID(alert_id_)] = status
+        return len(ids)
+
+
+class _NullSession:
+    async def __aenter__(self) -> object:
+        return self
+
+    async def __aexit__(self, *exc: object) -> None:
+        return None
+
+
+def _processor(monkeypatch) -> tuple[EventProcessor, _FakeGenerator, _FakeDistributor]:
+    monkeypatch.setattr("src.distribution.event_processor.AlertRepository", _RecordingAlerts)
+    monkeypatch.setattr(_RecordingAlerts, "calls", [])
+    monkeypatch.setattr(_RecordingAlerts, "stored", {})
+    index = StakeholderIndex()
+    index.upsert({
+        "id": "a", "jurisdiction": "Denver, CO", "interests": ["VAWA"],
+        "notification_frequency": "immediate", "contact_email": "a@example.org",
+    })
+    index.upsert({
+        "id": "b", "jurisdiction": "Denver, CO", "interests": [],
+        "notification_frequency": "weekly_digest", "contact_email": "b@example.org",
+    })
+    index.upsert({"id": "c", "jurisdiction": "Austin, TX", "interests": []})
+    generator, distributor = _FakeGenerator(), _FakeDistributor()
+    processor = EventProcessor(
+        generator,
+        index,
+        distributor,
+        sessions=_NullSession,  # type: ignore[arg-type]
+    )
+    return processor, generator, distributor
+
+
+EVENT = QueuedEvent(
+    id="1-0",
+    source="housing_ear",
+    event_type="policy_update",
+    payload={"event_type": "policy_update", "jurisdiction": "Denver, CO", "topics": ["VAWA"]},
+    received_at=datetime(2026, 10, 17, 12, tzinfo=timezone.utc).isoformat(),
+)
+
+
+@pytest.mark.asyncio
+async def test_processor_alerts_only_affected_and_notifies_immediate(monkeypatch) -> None:
+    processor, generator, distributor = _processor(monkeypatch)
+
+    alerts = await processor.process(EVENT)
+
+    assert generator.seen == ["a", "b"]
+    assert [c["to_emails"] for c in distributor.sent] == [["a@example.org"]]
+    assert {a["stakeholder_id"]: a["status"] for a in alerts} == {"a": "sent", "b": "pending"}
+    assert {a["created_at"] for a in alerts} == {EVENT.received_at}
+    # Stored as pending first, then only the delivered alert is flipped to sent.
+    id_a, id_b = alert_id("1-0", "a"), alert_id("1-0", "b")
+    assert _RecordingAlerts.calls == [
+        ("insert", sorted([(id_a, "pending"), (id_b, "pending")])),
+        ("set_status", ([id_a], "sent", "pending")),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_redelivered_event_is_not_stored_or_sent_twice(monkeypatch) -> None:
+    processor, _, distributor = _processor(monkeypatch)
+
+    await processor.process(EVENT)
+    again = await processor.process(EVENT)
+
+    assert len(_RecordingAlerts.stored) == 2
+    assert len(distributor.sent) == 1
+    assert {a["stakeholder_id"]: a["status"] for a in again} == {"a": "sent", "b": "pending"}
+    assert [call for call, _ in _RecordingAlerts.calls] == ["insert", "set_status", "insert"]
+
+
+@pytest.mark.asyncio
+async def test_partial_failure_keeps_the_event_for_retry(monkeypatch) -> None:
+    processor, generator, distributor = _processor(monkeypatch)
+    queue = _FakeQueue()
+    generator.failing = {"b"}
+
+    await handle_event(queue, processor, EVENT)  # type: ignore[arg-type]
+
+    # The failure reaches the queue, but the alert that was generated is kept and sent.
+    assert queue.failures == ["1-0"]
+    assert queue.processed == queue.acked == []
+    assert set(_RecordingAlerts.stored) == {uuid.UUID(alert_id("1-0", "a"))}
+    assert len(distributor.sent) == 1
+
+    generator.failing = set()
+    await handle_event(queue, processor, EVENT)  # type: ignore[arg-type]
+
+    assert queue.processed == queue.acked == ["1-0"]
+    assert len(_RecordingAlerts.stored) == 2
+    assert len(distributor.sent) == 1
+
+
+def test_alert_ids_are_stable_per_event_and_stakeholder() -> None:
+    assert alert_id("1-0", "a") == alert_id("1-0", "a")
+    assert alert_id("1-0", "a") != alert_id("2-0", "a")
+    assert alert_id("1-0", "a") != alert_id("1-0", "b")
@@ -0,0 +1,209 @@
+"""Tests for asynchronous job state and callbacks."""
+
+from __future__ import annotations
+
+import hashlib
+import hmac
+import json
+
+import httpx
+import pytest
+
+from src.distribution import job_store as job_store_module
+from src.distribution.job_store import (
+    DEDUPE_PREFIX,
+    JOB_PREFIX,
+    SIGNATURE_HEADER,
+    JobStatus,
+    JobStore,
+    deliver_callback,
+    resolves_publicly,
+)
+from src.integrations.cache import MemoryCacheBackend
+
+REQUEST = {"content_type": "Policy_Brief", "jurisdiction": "Denver, CO", "force_fresh": False}
+
+
+@pytest.fixture
+def store() -> JobStore:
+    return JobStore(MemoryCacheBackend(), ttl=60)
+
+
+class TestJobStore:
+    @pytest.mark.asyncio
+    async def test_submit_and_get(self, store) -> None:
+        job, created = await store.submit("content", REQUEST)
+
+        assert created
+        fetched = await store.get(job.id)
+        assert fetched is not None
+        assert fetched.status == JobStatus.QUEUED
+        assert fetched.request == REQUEST
+
+    @pytest.mark.asyncio
+    async def test_identical_request_returns_live_job(self, store) -> None:
+        first, _ = await store.submit("content", REQUEST, callback_url="https://example.org/a")
+        second, created = await store.submit(
+            "content", REQUEST, callback_url="https://example.org/b"
+        )
+        await store.submit("content", REQUEST, callback_url="https://example.org/a")
+
+        assert not created
+        assert second.id == first.id
+        assert await store.callbacks(first.id) == [
+            "https://example.org/a",
+            "https://example.org/b",
+        ]
+
+    @pytest.mark.asyncio
+    async def test_finished_job_takes_no_new_callbacks(self, store) -> None:
+        first, _ = await store.submit("content", REQUEST)
+        await store.mark_succeeded(first, {"headline": "Parking Costs"})
+
+        again, created = await store.submit(
+            "content", REQUEST, callback_url="https://example.org/late"
+        )
+        assert not created
+        assert again.result == {"headline": "Parking Costs"}
+        assert await store.callbacks(first.id) == []
+
+    @pytest.mark.asyncio
+    async def test_job_is_saved_before_the_dedupe_key(self) -> None:
+        class Backend(MemoryCacheBackend):
+            async def add(self, key, value, ttl):  # type: ignore[no-untyped-def]
+                if key.startswith(DEDUPE_PREFIX):
+                    assert await self.get(JOB_PREFIX + value) is not None
+                return await super().add(key, value, ttl)
+
+        store = JobStore(Backend(), ttl=60)
+        job, created = await store.submit("content", REQUEST)
+        assert created
+        assert (await store.submit("content", REQUEST))[0].id == job.id
+
+    @pytest.mark.asyncio
+    async def test_deduplicated_submit_leaves_no_extra_job(self) -> None:
+        backend = MemoryCacheBackend()
+        store = JobStore(backend, ttl=60)
+        await store.submit("content", REQUEST)
+        keys = len(backend)
+
+        await store.submit("content", REQUEST)
+        assert len(backend) == keys
+
+    @pytest.mark.asyncio
+    async def test_overrunning_job_counts_as_failed(self) -> None:
+        store = JobStore(MemoryCacheBackend(), ttl=60, running_timeout=0)
+        first, _ = await store.submit("content", REQUEST)
+        await store.mark_running(first)
+
+        stale = await store.get(first.id)
+        assert stale.status == JobStatus.FAILED
+        assert "did not finish" in stale.error
+        second, created = await store.submit("content", REQUEST)
+        assert created
+        assert second.id != first.id
+
+    @pytest.mark.asyncio
+    async def test_failed_job_is_not_reused(self, store) -> None:
+        first, _ = await store.submit("content", REQUEST)
+        await store.mark_failed(first, "boom")
+
+        second, created = await store.submit("content", REQUEST)
+        assert created
+        assert second.id != first.id
+        again, created = await store.submit("content", REQUEST)
+        assert not created
+        assert again.id == second.id
+
+    @pytest.mark.asyncio
+    async def test_dedupe_off_always_creates(self, store) -> None:
+        first, _ = await store.submit("content", REQUEST)
+        second, created = await store.submit("content", REQUEST, dedupe=False)
+
+        assert created
+        assert second.id != first.id
+
+    @pytest.mark.asyncio
+    async def test_result_round_trips(self, store) -> None:
+        job, _ = await store.submit("content", REQUEST)
+        await store.mark_running(job)
+        await store.mark_succeeded(job, {"headline": "Parking Costs"})
+
+        fetched = await store.get(job.id)
+        assert fetched.status == JobStatus.SUCCEEDED
+        assert fetched.result == {"headline": "Parking Costs"}
+
+    @pytest.mark.asyncio
+    async def test_unknown_job(self, store) -> None:
+        assert await store.get("missing") is None
+
+
+class TestDeliverCallback:
+    @pytest.fixture(autouse=True)
+    def _public_dns(self, monkeypatch) -> None:
+        async def resolves(host: str) -> bool:
+            return host == "example.org"
+
+        monkeypatch.setattr(job_store_module, "resolves_publicly", resolves)
+
+    @pytest.mark.asyncio
+    async def test_signed_post(self, store, monkeypatch) -> None:
+        monkeypatch.setattr(job_store_module.settings, "job_callback_secret", "s3cret")
+        seen: list[httpx.Request] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            seen.append(request)
+            return httpx.Response(204)
+
+        job, _ = await store.submit("content", REQUEST, callback_url="https://example.org/hook")
+        await store.mark_succeeded(job, {"headline": "Parking Costs"})
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+            assert await store.notify(job, client) == 1
+
+        body = seen[0].content
+        expected = hmac.new(b"s3cret", body, hashlib.sha256).hexdigest()
+        assert seen[0].headers[SIGNATURE_HEADER] == f"sha256={expected}"
+        assert json.loads(body)["status"] == "succeeded"
+
+    @pytest.mark.asyncio
+    async def test_failure_is_reported_not_raised(self, store) -> None:
+        transport = httpx.MockTransport(lambda request: httpx.Response(500))
+        job, _ = await store.submit("content", REQUEST)
+        async with httpx.AsyncClient(transport=transport) as client:
+            assert not await deliver_callback(job, "https://example.org/hook", client)
+
+    @pytest.mark.asyncio
+    async def test_every_submitter_is_called_back(self, store) -> None:
+        seen: list[str] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            seen.append(str(request.url))
+            return httpx.Response(204)
+
+        job, _ = await store.submit("content", REQUEST, callback_url="https://example.org/a")
+        await store.submit("content", REQUEST, callback_url="https://example.org/b")
+        await store.mark_succeeded(job, {"headline": "Parking Costs"})
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+            assert await store.notify(job, client) == 2
+        assert seen == ["https://example.org/a", "https://example.org/b"]
+
+    @pytest.mark.asyncio
+    async def test_no_callback_url(self, store) -> None:
+        job, _ = await store.submit("content", REQUEST)
+        assert await store.notify(job) == 0
+
+    @pytest.mark.asyncio
+    async def test_internal_host_is_not_called(self, store) -> None:
+        seen: list[httpx.Request] = []
+        transport = httpx.MockTransport(lambda request: seen.append(request) or httpx.Response(204))
+        job, _ = await store.submit("content", REQUEST)
+        async with httpx.AsyncClient(transport=transport) as client:
+            assert not await deliver_callback(job, "https://intranet.test/hook", client)
+        assert seen == []
+
+
+@pytest.mark.asyncio
+async def test_resolves_publicly_rejects_private_addresses() -> None:
+    assert not await resolves_publicly("127.0.0.1")
+    assert not await resolves_publicly("10.1.2.3")
+    assert await resolves_publicly("93.184.215.14")
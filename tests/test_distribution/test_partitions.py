@@ -0,0 +1,113 @@
+"""Tests for the monthly alert partition maintenance."""
+
+from __future__ import annotations
+
+import gzip
+from contextlib import asynccontextmanager
+from datetime import date
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+
+from src.distribution.partitions import (
+    add_months,
+    archive_partitions,
+    ensure_partitions,
+    expired,
+    partition_month,
+    partition_name,
+    upcoming_months,
+)
+
+
+class TestMonths:
+    def test_add_months_crosses_years(self) -> None:
+        assert add_months(date(2026, 11, 1), 3) == date(2027, 2, 1)
+        assert add_months(date(2026, 1, 1), -1) == date(2025, 12, 1)
+
+    def test_partition_names_round_trip(self) -> None:
+        assert partition_name(date(2026, 3, 1)) == "alerts_y2026m03"
+        assert partition_month("alerts_y2026m03") == date(2026, 3, 1)
+        assert partition_month("alerts_unpartitioned") is None
+
+    def test_upcoming_months_include_current(self) -> None:
+        assert upcoming_months(date(2026, 12, 17), 2) == [
+            date(2026, 12, 1),
+            date(2027, 1, 1),
+            date(2027, 2, 1),
+        ]
+
+    def test_expired_keeps_the_retention_window(self) -> None:
+        names = ["alerts_y2025m09", "alerts_y2025m10", "alerts_y2026m10", "alerts_other"]
+        assert expired(names, date(2026, 10, 17), retention_months=12) == ["alerts_y2025m09"]
+
+
+class _FakeConn:
+    def __init__(self, db: _FakeDb) -> None:
+        self.db = db
+
+    async def scalars(self, stmt: Any, params: dict | None = None) -> list[str]:
+        if "pg_inherits" in str(stmt):
+            return sorted(self.db.attached)
+        return sorted(self.db.attached | self.db.detached) + ["alerts_archive_notes"]
+
+    async def execute(self, stmt: Any) -> None:
+        self.db.statements.append(str(stmt))
+
+    async def get_raw_connection(self) -> SimpleNamespace:
+        return SimpleNamespace(driver_connection=self)
+
+    async def copy_from_table(self, table: str, output: Any, **options: Any) -> None:
+        assert options == {"format": "csv", "header": True}
+        self.db.statements.append(f"COPY {table}")
+        output.write(f"id,created_at\n1,{table}\n".encode())
+
+
+class _FakeDb:
+    def __init__(self, attached: set[str], detached: set[str] = frozenset()) -> None:
+        self.attached = set(attached)
+        self.detached = set(detached)
+        self.statements: list[str] = []
+
+    @asynccontextmanager
+    async def begin(self):  # type: ignore[no-untyped-def]
+        yield _FakeConn(self)
+
+    connect = begin
+
+
+@pytest.mark.asyncio
+async def test_ensure_partitions_creates_only_missing_months() -> None:
+    db = _FakeDb({"alerts_y2026m10", "alerts_y2026m11"})
+    created = await ensure_partitions(db, today=date(2026, 10, 17), months_ahead=2)  # type: ignore[arg-type]
+
+    assert created == ["alerts_y2026m12"]
+    assert db.statements == [
+        "CREATE TABLE alerts_y2026m12 PARTITION OF alerts FOR VALUES "
+        "FROM ('2026-12-01 00:00:00+00') TO ('2027-01-01 00:00:00+00')"
+    ]
+
+
+@pytest.mark.asyncio
+async def test_archive_detaches_exports_then_drops(tmp_path) -> None:
+    # alerts_y2025m08 was detached by an earlier run that failed before dropping it.
+    db = _FakeDb({"alerts_y2025m09", "alerts_y2026m10"}, detached={"alerts_y2025m08"})
+    paths = await archive_partitions(
+        db,  # type: ignore[arg-type]
+        today=date(2026, 10, 17),
+        retention_months=12,
+        archive_dir=tmp_path,
+    )
+
+    assert [p.name for p in paths] == ["alerts_y2025m08.csv.gz", "alerts_y2025m09.csv.gz"]
+    assert db.statements == [
+        "COPY alerts_y2025m08",
+        "DROP TABLE alerts_y2025m08",
+        "ALTER TABLE alerts DETACH PARTITION alerts_y2025m09",
+        "COPY alerts_y2025m09",
+        "DROP TABLE alerts_y2025m09",
+    ]
+    with gzip.open(paths[1], "rt") as archived:
+        assert archived.read() == "id,created_at\n1,alerts_y2025m09\n"
+    assert sorted(p.name for p in tmp_path.iterdir()) == [p.name for p in paths]
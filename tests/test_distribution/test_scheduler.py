@@ -0,0 +1,260 @@
+"""Tests for the Celery task bodies, run in-process."""
+
+from __future__ import annotations
+
+import asyncio
+from contextlib import asynccontextmanager
+from datetime import datetime, timedelta, timezone
+from typing import Any
+
+import pytest
+
+from src import database
+from src.distribution import event_processor as event_processor_module
+from src.distribution import event_queue as event_queue_module
+from src.distribution import job_store as job_store_module
+from src.distribution import scheduler
+from src.distribution.event_queue import QueuedEvent
+from src.distribution.job_store import Job, JobStatus, JobStore
+from src.distribution.stakeholder_index import StakeholderIndex
+from src.generators import stakeholder_report
+from src.integrations import claude_api, distribution_channels
+from src.integrations.cache import MemoryCacheBackend
+from src.integrations.distribution_channels import DistributionResult
+from src.models.content import AudienceType, ContentType
+
+REQUEST = {
+    "content_type": "Policy_Brief",
+    "audience": "City_Council",
+    "jurisdiction": "Denver, CO",
+    "friction_data": [{"topic": "Parking", "friction_score": 847}],
+}
+RESULT = {
+    "id": "6f1c1f5e-6a55-4d1a-9d0e-2f9f1d0c7a10",
+    "content_type": "Policy_Brief",
+    "audience": "City_Council",
+    "jurisdiction": "Denver, CO",
+    "headline": "Parking Costs",
+    "body": "Body",
+    "status": "draft",
+    "version": 1,
+    "created_at": "2026-10-17T00:00:00+00:00",
+}
+
+
+class _Services:
+    def __init__(self, error: Exception | None = None) -> None:
+        self.error = error
+        self.requests: list[Any] = []
+
+    async def generate_content(self, req: Any) -> dict:
+        self.requests.append(req)
+        if self.error is not None:
+            raise self.error
+        return dict(RESULT)
+
+
+class _Session:
+    def __init__(self) -> None:
+        self.added: list[Any] = []
+        self.commits = 0
+
+    def add(self, row: Any) -> None:
+        self.added.append(row)
+
+    async def commit(self) -> None:
+        self.commits += 1
+
+
+@pytest.fixture
+def worker(monkeypatch) -> tuple[JobStore, _Session, list[tuple[str, JobStatus]]]:
+    store = JobStore(MemoryCacheBackend(), ttl=60)
+    session = _Session()
+    delivered: list[tuple[str, JobStatus]] = []
+
+    @asynccontextmanager
+    async def async_session():  # type: ignore[no-untyped-def]
+        yield session
+
+    async def deliver(job: Job, url: str, client: Any = None) -> bool:
+        delivered.append((url, job.status))
+        return True
+
+    monkeypatch.setattr(job_store_module, "job_store", store)
+    monkeypatch.setattr(job_store_module, "deliver_callback", deliver)
+    monkeypatch.setattr(database, "async_session", async_session)
+    monkeypatch.setattr(scheduler, "_run_async", asyncio.run)
+    return store, session, delivered
+
+
+def test_content_job_runs_saves_and_calls_back(worker, monkeypatch) -> None:
+    store, session, delivered = worker
+    services = _Services()
+    monkeypatch.setattr(scheduler, "_get_worker_services", lambda: services)
+    job, _ = asyncio.run(store.submit("content", REQUEST, callback_url="https://example.org/a"))
+
+    payload = scheduler.generate_content_task("Policy_Brief", "Denver, CO", "City_Council", job.id)
+
+    finished = asyncio.run(store.get(job.id))
+    assert finished.status == JobStatus.SUCCEEDED
+    assert finished.result == payload
+    assert payload["headline"] == "Parking Costs"
+    assert services.requests[0].friction_data == REQUEST["friction_data"]
+    assert [row.headline for row in session.added] == ["Parking Costs"]
+    assert session.commits == 1
+    assert delivered == [("https://example.org/a", JobStatus.SUCCEEDED)]
+
+    # A redelivered task returns the stored result without generating again.
+    assert scheduler.generate_content_task("Policy_Brief", "Denver, CO", "x", job.id) == payload
+    assert len(services.requests) == 1
+
+
+def test_failed_content_job_is_recorded_and_called_back(worker, monkeypatch) -> None:
+    store, session, delivered = worker
+    monkeypatch.setattr(scheduler, "_get_worker_services", lambda: _Services(RuntimeError("boom")))
+    job, _ = asyncio.run(store.submit("content", REQUEST, callback_url="https://example.org/a"))
+
+    assert scheduler.generate_content_task("Policy_Brief", "Denver, CO", "x", job.id) == {}
+
+    failed = asyncio.run(store.get(job.id))
+    assert failed.status == JobStatus.FAILED
+    assert failed.error == "boom"
+    assert session.added == []
+    assert delivered == [("https://example.org/a", JobStatus.FAILED)]
+
+
+def test_expired_job_is_skipped(worker, monkeypatch) -> None:
+    services = _Services()
+    monkeypatch.setattr(scheduler, "_get_worker_services", lambda: services)
+
+    assert scheduler.generate_content_task("Policy_Brief", "Denver, CO", "x", "gone") == {}
+    assert services.requests == []
+
+
+class TestArguments:
+    def test_content_type_and_audience_become_enums(self) -> None:
+        kind = scheduler._content_type("policy_brief")
+        assert kind is ContentType.POLICY_BRIEF
+        assert scheduler._audience("city_council", kind) is AudienceType.CITY_COUNCIL
+
+    def test_public_content_is_for_the_general_public(self) -> None:
+        kind = scheduler._content_type("op_ed")
+        assert scheduler._audience("", kind) is AudienceType.GENERAL_PUBLIC
+        assert scheduler._audience("City_Council", kind) is AudienceType.GENERAL_PUBLIC
+
+    def test_unknown_values_are_rejected(self) -> None:
+        with pytest.raises(ValueError, match="content type"):
+            scheduler._content_type("press_release")
+        with pytest.raises(ValueError, match="audience"):
+            scheduler._audience("Planning_Staff", ContentType.TESTIMONY)
+
+
+class _Reports:
+    calls: list[list[str]] = []
+
+    async def generate_many(self, stakeholders: list[dict], job_key: str) -> list[dict]:
+        self.calls.append([s["id"] for s in stakeholders])
+        return [{"stakeholder_id": s["id"], "headline": "H", "body": "B"} for s in stakeholders]
+
+
+class _Distributor:
+    def __init__(self, failing: set[str]) -> None:
+        self.failing = failing
+        self.sent: list[str] = []
+
+    async def distribute(self, content: dict, channels: list[str]) -> list[DistributionResult]:
+        email = content["to_emails"][0]
+        self.sent.append(email)
+        return [DistributionResult(channel="email", success=email not in self.failing)]
+
+
+def test_retried_digest_skips_stakeholders_already_emailed(worker, monkeypatch) -> None:
+    index = StakeholderIndex()
+    for sid in ("a", "b"):
+        index.upsert(
+            {
+                "id": sid,
+                "jurisdiction": "Denver, CO",
+                "notification_frequency": "weekly_digest",
+                "contact_email": f"{sid}@example.org",
+            }
+        )
+
+    async def rebuild(session: object) -> int:
+        return len(index.all_profiles())
+
+    monkeypatch.setattr(index, "rebuild", rebuild)
+    monkeypatch.setattr("src.distribution.stakeholder_index.stakeholder_index", index)
+    monkeypatch.setattr(claude_api, "batch_state_store", MemoryCacheBackend())
+    monkeypatch.setattr(_Reports, "calls", [])
+    monkeypatch.setattr(stakeholder_report, "StakeholderReportGenerator", _Reports)
+    distributor = _Distributor(failing={"b@example.org"})
+    monkeypatch.setattr(distribution_channels, "DistributionManager", lambda: distributor)
+
+    scheduler.generate_weekly_digest()
+    distributor.failing.clear()
+    scheduler.generate_weekly_digest()
+    scheduler.generate_weekly_digest()
+
+    assert _Reports.calls == [["a", "b"], ["b"]]
+    assert distributor.sent == ["a@example.org", "b@example.org", "b@example.org"]
+
+
+class _Queue:
+    def __init__(self, events: list[QueuedEvent], dead: set[str]) -> None:
+        self.events = events
+        self.dead = dead
+        self.processed: list[str] = []
+        self.failures: list[str] = []
+
+    async def since(self, moment: datetime) -> list[QueuedEvent]:
+        return self.events
+
+    async def dead_lettered_since(self, moment: datetime) -> set[str]:
+        return self.dead
+
+    async def is_processed(self, event: QueuedEvent) -> bool:
+        return event.id in self.processed
+
+    async def mark_processed(self, event: QueuedEvent) -> None:
+        self.processed.append(event.id)
+
+    async def record_failure(self, event: QueuedEvent) -> bool:
+        self.failures.append(event.id)
+        return False
+
+
+class _Processor:
+    seen: list[str] = []
+
+    async def process(self, event: QueuedEvent) -> list[dict]:
+        self.seen.append(event.id)
+        if event.payload.get("broken"):
+            raise RuntimeError("bad payload")
+        return []
+
+
+def test_alert_scan_survives_failing_events(worker, monkeypatch, caplog) -> None:
+    received = (datetime.now(timezone.utc) - timedelta(hours=2)).isoformat()
+    events = [
+        QueuedEvent(f"{n}-0", "housing_ear", "policy_update", payload, received)
+        for n, payload in enumerate([{}, {"broken": True}, {}, {}], start=1)
+    ]
+    queue = _Queue(events, dead={"3-0"})
+    queue.processed.append("4-0")
+
+    async def rebuild(session: object) -> int:
+        return 0
+
+    monkeypatch.setattr(event_queue_module, "event_queue", queue)
+    monkeypatch.setattr(event_processor_module, "EventProcessor", _Processor)
+    monkeypatch.setattr(_Processor, "seen", [])
+    monkeypatch.setattr("src.distribution.stakeholder_index.stakeholder_index.rebuild", rebuild)
+
+    with caplog.at_level("INFO"):
+        scheduler.scan_and_alert()
+
+    assert _Processor.seen == ["1-0", "2-0"]
+    assert queue.processed == ["4-0", "1-0"]
+    assert queue.failures == ["2-0"]
+    assert "1 events replayed, 1 failed" in caplog.text
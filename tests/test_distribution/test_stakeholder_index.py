@@ -0,0 +1,190 @@
+"""Tests for the stakeholder inverted index."""
+
+from __future__ import annotations
+
+import uuid
+from datetime import datetime, timezone
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+
+from src.distribution.stakeholder_index import (
+    StakeholderIndex,
+    _index_stakeholder,
+    _unindex_stakeholder,
+    stakeholder_index,
+    stakeholder_to_profile,
+)
+from src.models.stakeholder import Stakeholder, StakeholderType
+
+
+def _index(*profiles: dict) -> StakeholderIndex:
+    index = StakeholderIndex()
+    for profile in profiles:
+        index.upsert(profile)
+    return index
+
+
+DENVER_PHA = {
+    "id": "a",
+    "jurisdiction": "Denver, CO",
+    "interests": ["VAWA", "Capital_Fund"],
+    "projects": [{"project_id": "proj_123", "location": "Aurora, CO"}],
+}
+DENVER_DEV = {"id": "b", "jurisdiction": "Denver, CO", "interests": ["Parking"], "projects": []}
+AUSTIN_ALL = {"id": "c", "jurisdiction": "Austin, TX", "interests": [], "projects": []}
+
+
+class TestMatch:
+    def test_jurisdiction_and_topic(self) -> None:
+        index = _index(DENVER_PHA, DENVER_DEV, AUSTIN_ALL)
+        assert index.match("denver, co", ["vawa"]) == {"a"}
+
+    def test_jurisdiction_only_matches_everyone_there(self) -> None:
+        index = _index(DENVER_PHA, DENVER_DEV, AUSTIN_ALL)
+        assert index.match("Denver, CO") == {"a", "b"}
+
+    def test_project_location_counts_as_jurisdiction(self) -> None:
+        index = _index(DENVER_PHA, DENVER_DEV)
+        assert index.match("Aurora, CO", ["Capital_Fund"]) == {"a"}
+
+    def test_no_interests_matches_any_topic(self) -> None:
+        index = _index(DENVER_PHA, AUSTIN_ALL)
+        assert index.match("Austin, TX", ["Zoning"]) == {"c"}
+
+    def test_national_event_matches_on_topic(self) -> None:
+        index = _index(DENVER_PHA, DENVER_DEV, AUSTIN_ALL)
+        assert index.match(None, ["Parking"]) == {"b", "c"}
+
+    def test_project_id_match(self) -> None:
+        index = _index(DENVER_PHA, DENVER_DEV)
+        assert index.match("Boise, ID", ["Zoning"], project_ids=["proj_123"]) == {"a"}
+
+
+class TestMaintenance:
+    def test_upsert_replaces_old_postings(self) -> None:
+        index = _index(DENVER_DEV)
+        index.upsert({**DENVER_DEV, "jurisdiction": "Austin, TX"})
+        assert index.match("Denver, CO") == set()
+        assert index.match("Austin, TX", ["Parking"]) == {"b"}
+        assert len(index) == 1
+
+    def test_remove(self) -> None:
+        index = _index(DENVER_PHA, DENVER_DEV)
+        index.remove("a")
+        assert "a" not in index
+        assert index.match("Aurora, CO") == set()
+        assert index.profiles(["a", "b"]) == [DENVER_DEV]
+
+
+def _stakeholder(**overrides: object) -> Stakeholder:
+    values = {
+        "id": uuid.uuid4(),
+        "stakeholder_type": StakeholderType.DEVELOPER,
+        "organization": "Front Range Builders",
+        "jurisdiction": "Denver, CO",
+        "interests": ["Parking"],
+        "projects": [],
+    }
+    values.update(overrides)
+    return Stakeholder(**values)
+
+
+class TestTransactions:
+    """Flush-time ORM events only reach the index once the transaction commits."""
+
+    def _flush(self, session: Session, row: Stakeholder, deleted: bool = False) -> None:
+        # Stands in for the mapper events a real flush would fire.
+        session.add(row)
+        listener = _unindex_stakeholder if deleted else _index_stakeholder
+        listener(None, None, row)
+        # No database here, so keep the commit from flushing the row.
+        session.expunge(row)
+
+    def test_committed_insert_is_indexed(self) -> None:
+        row = _stakeholder()
+        session = Session()
+        session.begin()
+        self._flush(session, row)
+        assert row.id not in stakeholder_index
+
+        session.commit()
+        assert str(row.id) in stakeholder_index
+        stakeholder_index.remove(str(row.id))
+
+    def test_rolled_back_insert_is_not_indexed(self) -> None:
+        row = _stakeholder()
+        session = Session()
+        session.begin()
+        self._flush(session, row)
+        session.rollback()
+
+        assert str(row.id) not in stakeholder_index
+        # Nothing is left over to leak into the session's next commit.
+        session.begin()
+        session.commit()
+        assert str(row.id) not in stakeholder_index
+
+    def test_committed_delete_is_removed(self) -> None:
+        row = _stakeholder()
+        stakeholder_index.upsert(stakeholder_to_profile(row))
+        session = Session()
+        session.begin()
+        self._flush(session, row, deleted=True)
+        session.commit()
+        assert str(row.id) not in stakeholder_index
+
+    def test_rolled_back_savepoint_keeps_outer_changes(self) -> None:
+        kept, dropped, released = _stakeholder(), _stakeholder(), _stakeholder()
+        session = Session(create_engine("sqlite://"))
+        session.begin()
+        self._flush(session, kept)
+        savepoint = session.begin_nested()
+        self._flush(session, dropped)
+        savepoint.rollback()
+        savepoint = session.begin_nested()
+        self._flush(session, released)
+        savepoint.commit()
+        # A released savepoint still waits for the outer commit.
+        assert str(released.id) not in stakeholder_index
+
+        session.commit()
+        assert str(kept.id) in stakeholder_index
+        assert str(released.id) in stakeholder_index
+        assert str(dropped.id) not in stakeholder_index
+        stakeholder_index.remove(str(kept.id))
+        stakeholder_index.remove(str(released.id))
+
+
+class _VersionSession:
+    """Answers the version query, then the full reload, from a list of rows."""
+
+    def __init__(self, rows: list[Stakeholder], updated_at: datetime) -> None:
+        self.rows = rows
+        self.updated_at = updated_at
+        self.reloads = 0
+
+    async def execute(self, stmt):  # type: ignore[no-untyped-def]
+        if "count" in str(stmt):
+            return SimpleNamespace(one=lambda: (len(self.rows), self.updated_at))
+        self.reloads += 1
+        return SimpleNamespace(scalars=lambda: SimpleNamespace(all=lambda: self.rows))
+
+
+@pytest.mark.asyncio
+async def test_refresh_rebuilds_only_when_the_table_changed() -> None:
+    index = StakeholderIndex()
+    session = _VersionSession([_stakeholder()], datetime(2026, 10, 1, tzinfo=timezone.utc))
+    await index.rebuild(session)  # type: ignore[arg-type]
+
+    assert not await index.refresh_if_changed(session)  # type: ignore[arg-type]
+    # Another process added a stakeholder.
+    added = _stakeholder(jurisdiction="Austin, TX")
+    session.rows.append(added)
+    session.updated_at = datetime(2026, 10, 2, tzinfo=timezone.utc)
+    assert await index.refresh_if_changed(session)  # type: ignore[arg-type]
+
+    assert session.reloads == 2
+    assert index.match("Austin, TX") == {str(added.id)}
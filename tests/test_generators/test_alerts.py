@@ -2,7 +2,19 @@
 
 from __future__ import annotations
 
-from src.generators.alerts import _build_headline, _classify, _recommend_actions
+import asyncio
+from typing import Any
+
+import pytest
+
+from src.generators.alerts import (
+    AlertGenerationError,
+    AlertGenerator,
+    _build_headline,
+    _classify,
+    _plan_fetches,
+    _recommend_actions,
+)
 from src.models.alert import AlertPriority, AlertType
 
 
@@ -40,3 +52,98 @@ class TestRecommendActions:
     def test_federal_change_includes_comment(self) -> None:
         actions = _recommend_actions(AlertPriority.HIGH, AlertType.FEDERAL_REGISTER_CHANGE)
         assert any("comment" in a.lower() for a in actions)
+
+
+class _FakeEar:
+    def __init__(self) -> None:
+        self.calls = 0
+
+    async def get_federal_register_changes(self, jurisdiction: str, **_: Any) -> list[dict]:
+        self.calls += 1
+        await asyncio.sleep(0.01)
+        if jurisdiction == "Quiet, ND":
+            return []
+        return [{"title": f"Rule for {jurisdiction}"}]
+
+    async def get_policy_updates(self, **_: Any) -> list[dict]:
+        self.calls += 1
+        return []
+
+
+class _FakeLens:
+    async def get_trend_alerts(self, **_: Any) -> list[dict]:
+        return []
+
+
+class _FakeLLM:
+    async def generate_alert_summary(self, changes: list[dict], **_: Any) -> str:
+        await asyncio.sleep(0.01)
+        if changes[0]["title"] == "Rule for Broken, CO":
+            raise RuntimeError("529 overloaded")
+        return changes[0]["title"]
+
+
+def _generator() -> AlertGenerator:
+    gen = AlertGenerator()
+    gen.ear, gen.lens, gen.llm = _FakeEar(), _FakeLens(), _FakeLLM()  # type: ignore[assignment]
+    return gen
+
+
+class TestGenerateAlerts:
+    @pytest.mark.asyncio
+    async def test_preserves_stakeholder_order(self) -> None:
+        profiles = [
+            {"id": str(i), "jurisdiction": j, "interests": []}
+            for i, j in enumerate(["Denver, CO", "Quiet, ND", "Austin, TX"])
+        ]
+        alerts = await _generator().generate_alerts(profiles)
+        assert [a["stakeholder_id"] for a in alerts] == ["0", "2"]
+        assert alerts[1]["summary"] == "Rule for Austin, TX"
+
+    @pytest.mark.asyncio
+    async def test_records_stage_timings(self) -> None:
+        gen = _generator()
+        await gen.generate_alerts([{"id": "1", "jurisdiction": "Denver, CO"}])
+        assert {"upstream_fetch", "llm_summary", "wall"} <= set(gen.last_run_timings)
+        assert gen.last_run_timings["llm_summary"]["count"] == 1
+
+    @pytest.mark.asyncio
+    async def test_raises_after_attempting_every_stakeholder(self) -> None:
+        profiles = [
+            {"id": str(i), "jurisdiction": j, "interests": []}
+            for i, j in enumerate(["Denver, CO", "Broken, CO", "Austin, TX"])
+        ]
+        with pytest.raises(AlertGenerationError) as caught:
+            await _generator().generate_alerts(profiles)
+        assert [str(e) for e in caught.value.exceptions] == ["529 overloaded"]
+        assert [a["stakeholder_id"] for a in caught.value.alerts] == ["0", "2"]
+
+    @pytest.mark.asyncio
+    async def test_skip_failures_leaves_failed_stakeholders_out(self) -> None:
+        profiles = [
+            {"id": str(i), "jurisdiction": j, "interests": []}
+            for i, j in enumerate(["Broken, CO", "Austin, TX"])
+        ]
+        alerts = await _generator().generate_alerts(profiles, skip_failures=True)
+        assert [a["stakeholder_id"] for a in alerts] == ["1"]
+
+
+class TestPlanFetches:
+    def test_groups_identical_signatures(self) -> None:
+        profiles = [
+            {"jurisdiction": "Denver, CO", "interests": ["VAWA", "Capital_Fund"]},
+            {"jurisdiction": "Denver, CO", "interests": ["Capital_Fund", "VAWA"]},
+            {"jurisdiction": "Austin, TX", "interests": ["VAWA"]},
+        ]
+        plan = _plan_fetches(profiles, since="2026-01-01")
+        assert list(plan.values()) == [[0, 1], [2]]
+
+    @pytest.mark.asyncio
+    async def test_shared_signature_fetched_once(self) -> None:
+        gen = _generator()
+        profiles = [
+            {"id": str(i), "jurisdiction": "Denver, CO", "interests": ["VAWA"]} for i in range(5)
+        ]
+        alerts = await gen.generate_alerts(profiles)
+        assert len(alerts) == 5
+        assert gen.ear.calls == 2  # one federal-register + one policy-update fetch
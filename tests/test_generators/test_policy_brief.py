@@ -2,7 +2,51 @@
 
 from __future__ import annotations
 
-from src.generators.policy_brief import _extract_headline, _extract_section, _merge_cost_data
+import asyncio
+
+import pytest
+
+from src.generators.policy_brief import (
+    PolicyBriefGenerator,
+    _extract_headline,
+    _extract_section,
+    _merge_cost_data,
+)
+from src.models.content import AudienceType
+
+
+class _FakeLens:
+    """Records the order in which fetches start and finish."""
+
+    def __init__(self) -> None:
+        self.events: list[str] = []
+
+    async def get_friction_scores(self, jurisdiction, topics=None):
+        self.events.append("friction:start")
+        await asyncio.sleep(0.01)
+        self.events.append("friction:end")
+        return [
+            {"topic": "Parking", "friction_score": 800},
+            {"topic": "Zoning", "friction_score": 600},
+        ]
+
+    async def get_cost_estimates(self, jurisdiction, topics=None):
+        self.events.append("costs:start")
+        await asyncio.sleep(0.01)
+        self.events.append("costs:end")
+        return [{"topic": t, "estimated_cost": 1000} for t in topics or []]
+
+
+class _FakeLLM:
+    async def run(self, request) -> str:
+        return "# Brief\nBody."
+
+
+def _generator() -> tuple[PolicyBriefGenerator, _FakeLens]:
+    gen = PolicyBriefGenerator.__new__(PolicyBriefGenerator)
+    gen.lens = _FakeLens()
+    gen.llm = _FakeLLM()
+    return gen, gen.lens
 
 
 class TestExtractHeadline:
@@ -45,3 +89,32 @@ class TestMergeCostData:
         issues = [{"topic": "Zoning", "friction_score": 600}]
         merged = _merge_cost_data(issues, [])
         assert "estimated_cost" not in merged[0]
+
+
+class TestDataGathering:
+    @pytest.mark.asyncio
+    async def test_costs_fetched_alongside_friction_when_topics_known(self) -> None:
+        gen, lens = _generator()
+
+        brief = await gen.generate("Denver, CO", AudienceType.CITY_COUNCIL, topics=["Parking"])
+
+        assert lens.events.index("costs:start") < lens.events.index("friction:end")
+        assert [c["topic"] for c in brief["source_data"]["cost_estimates"]] == ["Parking"]
+
+    @pytest.mark.asyncio
+    async def test_costs_wait_for_top_issues_without_topics(self) -> None:
+        gen, lens = _generator()
+
+        brief = await gen.generate("Denver, CO", AudienceType.CITY_COUNCIL)
+
+        assert lens.events.index("friction:end") < lens.events.index("costs:start")
+        assert brief["source_data"]["topics"] == ["Parking", "Zoning"]
+
+    @pytest.mark.asyncio
+    async def test_stage_timings_recorded(self) -> None:
+        gen, _ = _generator()
+
+        brief = await gen.generate("Denver, CO", AudienceType.CITY_COUNCIL, topics=["Parking"])
+
+        timings = brief["supporting_data"]["timings"]
+        assert {"friction_scores", "cost_estimates", "llm_generation", "wall"} <= set(timings)
@@ -2,7 +2,46 @@
 
 from __future__ import annotations
 
-from src.generators.public_content import _extract_cta, _extract_headline, _extract_keywords
+import asyncio
+
+import pytest
+
+from src.generators.public_content import (
+    SOCIAL_PLATFORMS,
+    PublicContentGenerator,
+    _extract_cta,
+    _extract_headline,
+    _extract_keywords,
+    _truncate_post,
+)
+
+
+class _FakeLLM:
+    """Answers each platform with a canned post; *replies* lists them in call order."""
+
+    def __init__(self, replies: dict[str, list[str]]) -> None:
+        self.replies = replies
+        self.calls: list[tuple[str, str]] = []
+        self.force_fresh: list[bool] = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def generate(self, system_prompt: str, user_prompt: str, **kwargs) -> str:
+        platform = next(p for p in self.replies if p in system_prompt)
+        self.calls.append((platform, user_prompt))
+        self.force_fresh.append(kwargs.get("force_fresh", False))
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(0.01)
+        self.in_flight -= 1
+        replies = self.replies[platform]
+        return replies.pop(0) if len(replies) > 1 else replies[0]
+
+
+def _generator(llm: _FakeLLM) -> PublicContentGenerator:
+    gen = PublicContentGenerator.__new__(PublicContentGenerator)
+    gen.llm = llm
+    return gen
 
 
 class TestExtractHeadline:
@@ -34,3 +73,60 @@ class TestExtractKeywords:
         kw = _extract_keywords(data, "Denver, CO")
         assert "parking requirements" in kw
         assert "zoning" in kw
+
+
+class TestSocialVariants:
+    @pytest.mark.asyncio
+    async def test_platforms_generated_concurrently(self) -> None:
+        llm = _FakeLLM({"twitter": ["short"], "linkedin": ["longer post"]})
+
+        variants = await _generator(llm)._generate_social_variants([], "Denver, CO")
+
+        assert variants == {"twitter": "short", "linkedin": "longer post"}
+        assert llm.max_in_flight == len(SOCIAL_PLATFORMS)
+
+    @pytest.mark.asyncio
+    async def test_over_length_variant_retried_alone(self) -> None:
+        llm = _FakeLLM({"twitter": ["x" * 400, "fits"], "linkedin": ["ok"]})
+
+        variants = await _generator(llm)._generate_social_variants([], "Denver, CO")
+
+        assert variants["twitter"] == "fits"
+        assert [p for p, _ in llm.calls].count("twitter") == 2
+        assert [p for p, _ in llm.calls].count("linkedin") == 1
+        assert "400 characters" in llm.calls[-1][1]
+        assert "x" * 400 in llm.calls[-1][1]
+
+    @pytest.mark.asyncio
+    async def test_truncates_after_retries(self) -> None:
+        llm = _FakeLLM({"twitter": ["word " * 100], "linkedin": ["ok"]})
+
+        variants = await _generator(llm)._generate_social_variants([], "Denver, CO")
+
+        assert len(variants["twitter"]) <= 280
+        assert variants["twitter"].endswith("...")
+
+    @pytest.mark.asyncio
+    async def test_force_fresh_reaches_every_variant_request(self) -> None:
+        llm = _FakeLLM({"twitter": ["x" * 400, "fits"], "linkedin": ["ok"]})
+        context = {
+            "jurisdiction": "Denver, CO",
+            "content_type": "social_media",
+            "friction_data": [],
+        }
+
+        result = await _generator(llm).assemble(context, "# Headline", force_fresh=True)
+
+        assert result["supporting_data"]["social_media_versions"]["twitter"] == "fits"
+        assert llm.force_fresh == [True, True, True]
+
+        await _generator(llm).assemble(context, "# Headline")
+        assert llm.force_fresh[3:] == [False, False]
+
+
+class TestTruncatePost:
+    def test_cuts_at_word_boundary(self) -> None:
+        assert _truncate_post("one two three", 10) == "one..."
+
+    def test_leaves_short_text(self) -> None:
+        assert _truncate_post("short", 10) == "short"
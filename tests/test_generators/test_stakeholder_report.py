@@ -0,0 +1,79 @@
+"""Tests for the stakeholder report generator."""
+
+from __future__ import annotations
+
+from typing import Any
+
+import pytest
+
+from src.generators.stakeholder_report import StakeholderReportGenerator
+from src.integrations.claude_api import BatchOutcome, GenerationRequest
+
+
+class _FakeLens:
+    async def get_friction_scores(self, jurisdiction: str, topics: Any = None) -> list[dict]:
+        if jurisdiction == "Offline, XX":
+            raise ConnectionError("upstream down")
+        return [{"topic": "parking", "friction_score": 7.5}]
+
+
+class _FakeBatchLLM:
+    def __init__(self, failing: set[str] | None = None) -> None:
+        self.failing = failing or set()
+        self.submitted: list[GenerationRequest] = []
+        self.job_key: str | None = None
+
+    async def generate_batch(
+        self, requests: list[GenerationRequest], job_key: str | None = None
+    ) -> BatchOutcome:
+        self.submitted = requests
+        self.job_key = job_key
+        outcome = BatchOutcome(batch_id="msgbatch_test")
+        for req in requests:
+            if req.custom_id in self.failing:
+                outcome.errors[req.custom_id] = "errored"
+            else:
+                outcome.texts[req.custom_id] = f"Report for {req.custom_id}"
+        return outcome
+
+
+def _stakeholder(sid: str, jurisdiction: str = "Denver, CO") -> dict[str, Any]:
+    return {
+        "id": sid,
+        "organization": f"Org {sid}",
+        "jurisdiction": jurisdiction,
+        "interests": ["parking"],
+        "projects": [],
+        "stakeholder_type": "Developer",
+    }
+
+
+def _generator(llm: _FakeBatchLLM) -> StakeholderReportGenerator:
+    gen = StakeholderReportGenerator()
+    gen.lens, gen.llm = _FakeLens(), llm  # type: ignore[assignment]
+    return gen
+
+
+class TestGenerateMany:
+    @pytest.mark.asyncio
+    async def test_one_batch_mapped_back_in_order(self) -> None:
+        llm = _FakeBatchLLM()
+        reports = await _generator(llm).generate_many(
+            [_stakeholder("b"), _stakeholder("a")], job_key="weekly-digest:2024-W01"
+        )
+
+        assert [r["stakeholder_id"] for r in reports] == ["b", "a"]
+        assert reports[0]["body"] == "Report for b"
+        assert reports[0]["audience"] == "Developers"
+        assert llm.job_key == "weekly-digest:2024-W01"
+        assert [r.custom_id for r in llm.submitted] == ["b", "a"]
+
+    @pytest.mark.asyncio
+    async def test_failed_stakeholders_left_out(self) -> None:
+        llm = _FakeBatchLLM(failing={"c"})
+        reports = await _generator(llm).generate_many(
+            [_stakeholder("a"), _stakeholder("b", "Offline, XX"), _stakeholder("c")]
+        )
+
+        assert [r["stakeholder_id"] for r in reports] == ["a"]
+        assert [r.custom_id for r in llm.submitted] == ["a", "c"]
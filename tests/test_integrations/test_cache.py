@@ -0,0 +1,100 @@
+"""Tests for the HousingLens response cache."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+
+import pytest
+
+from src.integrations.cache import (
+    MemoryCacheBackend,
+    ResponseCache,
+    cache_key,
+    normalize_params,
+)
+
+
+class TestCacheKey:
+    def test_topic_order_does_not_matter(self) -> None:
+        a = cache_key("/api/v1/friction-scores", {"jurisdiction": "Denver, CO", "topics": "B,A"})
+        b = cache_key("/api/v1/friction-scores", {"jurisdiction": "Denver, CO", "topics": "A,B,A"})
+        assert a == b
+
+    def test_jurisdiction_is_readable_in_key(self) -> None:
+        key = cache_key("/api/v1/cost-estimates", {"jurisdiction": "Denver, CO"})
+        assert ":/api/v1/cost-estimates:denver, co:" in key
+
+    def test_normalize_drops_empty_values(self) -> None:
+        assert normalize_params({"jurisdiction": "X", "since": None, "topics": ""}) == {
+            "jurisdiction": "X"
+        }
+
+
+class TestMemoryCacheBackend:
+    @pytest.mark.asyncio
+    async def test_evicts_least_recently_used(self) -> None:
+        backend = MemoryCacheBackend(max_entries=2)
+        await backend.set("a", 1, ttl=60)
+        await backend.set("b", 2, ttl=60)
+        await backend.get("a")
+        await backend.set("c", 3, ttl=60)
+        assert await backend.get("b") is None
+        assert await backend.get("a") == 1
+
+    @pytest.mark.asyncio
+    async def test_reads_are_copies(self) -> None:
+        backend = MemoryCacheBackend()
+        await backend.set("k", {"scores": [1]}, ttl=60)
+        (await backend.get("k"))["scores"].append(2)
+        assert await backend.get("k") == {"scores": [1]}
+
+
+class TestResponseCache:
+    @pytest.mark.asyncio
+    async def test_fresh_entry_skips_fetch(self) -> None:
+        cache = ResponseCache(MemoryCacheBackend(), default_ttl=60)
+        calls = 0
+
+        async def fetch() -> dict:
+            nonlocal calls
+            calls += 1
+            return {"scores": [calls]}
+
+        first = await cache.get_or_fetch("/x", {"jurisdiction": "A"}, fetch)
+        second = await cache.get_or_fetch("/x", {"jurisdiction": "A"}, fetch)
+        assert first == second == {"scores": [1]}
+        assert calls == 1
+        assert cache.stats.hits == 1 and cache.stats.misses == 1
+
+    @pytest.mark.asyncio
+    async def test_stale_entry_served_while_refreshing(self) -> None:
+        backend = MemoryCacheBackend()
+        cache = ResponseCache(backend, default_ttl=10, stale_seconds=60)
+        key = cache_key("/x", {"jurisdiction": "A"})
+        await backend.set(key, {"stored_at": time.time() - 30, "value": "old"}, ttl=60)
+
+        async def fetch() -> str:
+            return "new"
+
+        assert await cache.get_or_fetch("/x", {"jurisdiction": "A"}, fetch) == "old"
+        await asyncio.sleep(0)
+        await asyncio.sleep(0)
+        assert await cache.get_or_fetch("/x", {"jurisdiction": "A"}, fetch) == "new"
+        assert cache.stats.stale_hits == 1
+        assert cache.stats.refreshes == 1
+
+    @pytest.mark.asyncio
+    async def test_invalidate_by_jurisdiction(self) -> None:
+        cache = ResponseCache(
+            MemoryCacheBackend(), ttls={"/x": 60, "/y": 60}, default_ttl=60
+        )
+
+        async def fetch() -> str:
+            return "v"
+
+        await cache.get_or_fetch("/x", {"jurisdiction": "Denver, CO"}, fetch)
+        await cache.get_or_fetch("/y", {"jurisdiction": "Denver, CO"}, fetch)
+        await cache.get_or_fetch("/x", {"jurisdiction": "Austin, TX"}, fetch)
+        assert await cache.invalidate(jurisdiction="Denver, CO") == 2
+        assert len(cache.backend) == 1  # type: ignore[arg-type]
@@ -0,0 +1,174 @@
+"""Tests for request layout and usage accounting in the Claude client."""
+
+from __future__ import annotations
+
+from types import SimpleNamespace
+
+import pytest
+
+from src.config import settings
+from src.integrations.claude_api import (
+    ClaudeContentGenerator,
+    LLMUsageStats,
+    build_system_blocks,
+    llm_usage,
+    min_cacheable_tokens,
+)
+
+
+class _RecordingMessages:
+    def __init__(self, usage: SimpleNamespace | None = None) -> None:
+        self.requests: list[dict] = []
+        self.usage = usage
+
+    async def create(self, **kwargs):
+        self.requests.append(kwargs)
+        return SimpleNamespace(content=[SimpleNamespace(text="ok")], usage=self.usage)
+
+
+def _generator(
+    usage: SimpleNamespace | None = None,
+) -> tuple[ClaudeContentGenerator, _RecordingMessages]:
+    gen = ClaudeContentGenerator(api_key="test", model="test-model")
+    gen.cache = None
+    gen.limiter = None
+    messages = _RecordingMessages(usage)
+    gen.client = SimpleNamespace(messages=messages)
+    return gen, messages
+
+
+# About 1100 tokens by ``estimate_tokens``: cacheable for Sonnet, not for Haiku.
+LONG_PROMPT = "x" * 4400
+
+
+class TestBuildSystemBlocks:
+    def test_breakpoint_on_last_static_block(self) -> None:
+        blocks = build_system_blocks(LONG_PROMPT, "audience", "claude-sonnet-4-20250514")
+        assert [b["text"] for b in blocks] == [LONG_PROMPT, "audience"]
+        assert "cache_control" not in blocks[0]
+        assert blocks[1]["cache_control"] == {"type": "ephemeral"}
+
+    def test_without_audience_context(self) -> None:
+        blocks = build_system_blocks(LONG_PROMPT, model="claude-sonnet-4-20250514")
+        assert len(blocks) == 1
+        assert blocks[0]["cache_control"] == {"type": "ephemeral"}
+
+    def test_prefix_below_the_model_minimum_is_not_marked(self) -> None:
+        assert all("cache_control" not in b for b in build_system_blocks("system", "audience"))
+        haiku = build_system_blocks(LONG_PROMPT, "audience", "claude-3-5-haiku-20241022")
+        assert all("cache_control" not in b for b in haiku)
+
+    def test_minimum_per_model(self) -> None:
+        assert min_cacheable_tokens("claude-sonnet-4-20250514") == 1024
+        assert min_cacheable_tokens("claude-3-5-haiku-20241022") == 2048
+        assert min_cacheable_tokens("claude-haiku-4-5") == 4096
+
+    def test_disabled(self, monkeypatch) -> None:
+        monkeypatch.setattr(settings, "prompt_cache_enabled", False)
+        blocks = build_system_blocks(LONG_PROMPT, "audience", "claude-sonnet-4-20250514")
+        assert all("cache_control" not in b for b in blocks)
+
+
+class TestGenerate:
+    @pytest.mark.asyncio
+    async def test_audience_context_follows_system_prompt(self) -> None:
+        gen, messages = _generator()
+        await gen.generate("system", "user", audience="City_Council")
+
+        system = messages.requests[0]["system"]
+        assert system[0]["text"] == "system"
+        assert system[1]["text"].startswith("Audience: City Council Members")
+        assert messages.requests[0]["messages"] == [{"role": "user", "content": "user"}]
+
+    @pytest.mark.asyncio
+    async def test_prefix_is_stable_across_requests(self) -> None:
+        gen, messages = _generator()
+        await gen.generate("system", "first brief", audience="Developers")
+        await gen.generate("system", "second brief", audience="Developers")
+        assert messages.requests[0]["system"] == messages.requests[1]["system"]
+
+    @pytest.mark.asyncio
+    async def test_records_cache_usage(self) -> None:
+        usage = SimpleNamespace(
+            input_tokens=20,
+            output_tokens=300,
+            cache_read_input_tokens=1500,
+            cache_creation_input_tokens=0,
+        )
+        gen, _ = _generator(usage)
+        before = llm_usage.cache_read_input_tokens
+
+        await gen.generate("system", "user")
+
+        assert gen.last_usage["cache_read_input_tokens"] == 1500
+        assert llm_usage.cache_read_input_tokens == before + 1500
+
+
+class TestLLMUsageStats:
+    def test_cache_read_ratio(self) -> None:
+        stats = LLMUsageStats()
+        stats.record(
+            SimpleNamespace(
+                input_tokens=100,
+                output_tokens=10,
+                cache_read_input_tokens=0,
+                cache_creation_input_tokens=900,
+            )
+        )
+        stats.record(
+            SimpleNamespace(
+                input_tokens=100,
+                output_tokens=10,
+                cache_read_input_tokens=900,
+                cache_creation_input_tokens=0,
+            )
+        )
+        snapshot = stats.snapshot()
+        assert snapshot["requests"] == 2
+        assert snapshot["cache_creation_input_tokens"] == 900
+        assert snapshot["cache_read_ratio"] == 0.45
+
+    def test_missing_usage_counts_request(self) -> None:
+        stats = LLMUsageStats()
+        assert stats.record(None)["input_tokens"] == 0
+        assert stats.requests == 1
+
+
+class _FakeStream:
+    def __init__(self, deltas: list[str]) -> None:
+        self.deltas = deltas
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    @property
+    async def text_stream(self):
+        for delta in self.deltas:
+            yield delta
+
+    async def get_final_message(self):
+        return SimpleNamespace(usage=SimpleNamespace(input_tokens=5, output_tokens=7))
+
+
+class TestStream:
+    @pytest.mark.asyncio
+    async def test_yields_deltas_and_records_usage(self) -> None:
+        gen = ClaudeContentGenerator(api_key="test", model="test-model")
+        gen.cache = None
+        gen.limiter = None
+        requests: list[dict] = []
+
+        def _stream(**kwargs):
+            requests.append(kwargs)
+            return _FakeStream(["Hello", ", ", "world"])
+
+        gen.client = SimpleNamespace(messages=SimpleNamespace(stream=_stream))
+
+        deltas = [d async for d in gen.stream(LONG_PROMPT, "user", audience="Media")]
+
+        assert deltas == ["Hello", ", ", "world"]
+        assert requests[0]["system"][-1]["cache_control"] == {"type": "ephemeral"}
+        assert gen.last_usage["output_tokens"] == 7
@@ -2,7 +2,21 @@
 
 from __future__ import annotations
 
-from src.integrations.housing_lens_client import HousingLensClient
+import asyncio
+from collections.abc import AsyncIterator, Callable
+
+import httpx
+import pytest
+
+from src.config import settings
+from src.integrations import housing_lens_client
+from src.integrations.cache import MemoryCacheBackend, ResponseCache
+from src.integrations.housing_lens_client import (
+    FRICTION_SCORES_BATCH_PATH,
+    FRICTION_SCORES_PATH,
+    HousingLensClient,
+)
+from src.integrations.http_pool import SharedHttpPool
 
 
 class TestHousingLensClientInit:
@@ -14,3 +28,115 @@ class TestHousingLensClientInit:
     def test_strips_trailing_slash(self) -> None:
         client = HousingLensClient(base_url="http://test:8001/", api_key="")
         assert client.base_url == "http://test:8001"
+
+
+class _FlakyLensClient(HousingLensClient):
+    """Returns canned scores and fails for jurisdictions named ``Broken``."""
+
+    def __init__(self) -> None:
+        super().__init__(base_url="http://test:8001", api_key="")
+        self.in_flight = 0
+        self.peak_in_flight = 0
+
+    async def get_friction_scores(
+        self, jurisdiction: str, topics: list[str] | None = None
+    ) -> list[dict]:
+        self.in_flight += 1
+        self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+        await asyncio.sleep(0.01)
+        self.in_flight -= 1
+        if jurisdiction.startswith("Broken"):
+            raise RuntimeError("upstream 500")
+        return [{"topic": "Parking", "friction_score": len(jurisdiction)}]
+
+
+class TestGetFrictionScoresMany:
+    @pytest.mark.asyncio
+    async def test_returns_scores_keyed_by_jurisdiction(self) -> None:
+        client = _FlakyLensClient()
+        batch = await client.get_friction_scores_many(["Denver", "Austin", "Denver"])
+        assert list(batch.scores) == ["Denver", "Austin"]
+        assert batch.ok
+
+    @pytest.mark.asyncio
+    async def test_reports_partial_failures(self) -> None:
+        client = _FlakyLensClient()
+        batch = await client.get_friction_scores_many(["Denver", "Broken City"])
+        assert "Denver" in batch.scores
+        assert isinstance(batch.errors["Broken City"], RuntimeError)
+        assert not batch.ok
+
+    @pytest.mark.asyncio
+    async def test_respects_max_concurrency(self) -> None:
+        client = _FlakyLensClient()
+        jurisdictions = [f"City{i}" for i in range(10)]
+        await client.get_friction_scores_many(jurisdictions, max_concurrency=3)
+        assert client.peak_in_flight == 3
+
+
+Handler = Callable[[httpx.Request], httpx.Response]
+
+
+@pytest.fixture
+async def serve(monkeypatch: pytest.MonkeyPatch) -> AsyncIterator[Callable[[Handler], None]]:
+    """Route the client's requests to a handler through a MockTransport pool."""
+    pool = SharedHttpPool()
+
+    async def _serve(handler: Handler) -> None:
+        await pool.open(transport=httpx.MockTransport(handler))
+
+    monkeypatch.setattr(housing_lens_client, "http_pool", pool)
+    monkeypatch.setattr(settings, "housing_lens_batch_enabled", True)
+    yield _serve
+    await pool.close()
+
+
+class TestBatchedFrictionScores:
+    @pytest.mark.asyncio
+    async def test_parses_results_and_upstream_errors(self, serve) -> None:
+        seen: list[httpx.Request] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            seen.append(request)
+            return httpx.Response(
+                200,
+                json={
+                    "results": {"Denver": {"scores": [{"topic": "Parking"}]}},
+                    "errors": {"Austin": "unknown jurisdiction"},
+                },
+            )
+
+        await serve(handler)
+        cache = ResponseCache(MemoryCacheBackend(), default_ttl=60)
+        client = HousingLensClient(base_url="http://test:8001", api_key="", cache=cache)
+        batch = await client.get_friction_scores_many(["Denver", "Austin", "Boise"], ["Parking"])
+
+        assert [r.url.path for r in seen] == [FRICTION_SCORES_BATCH_PATH]
+        assert seen[0].url.params.get_list("jurisdiction") == ["Denver", "Austin", "Boise"]
+        assert batch.scores == {"Denver": [{"topic": "Parking"}]}
+        assert str(batch.errors["Austin"]) == "Austin: unknown jurisdiction"
+        assert str(batch.errors["Boise"]) == "Boise: missing from batch response"
+
+        # The batch seeded the single-jurisdiction cache entry, so this is not fetched.
+        assert await client.get_friction_scores("Denver", ["Parking"]) == [{"topic": "Parking"}]
+        assert len(seen) == 1
+
+    @pytest.mark.asyncio
+    async def test_falls_back_to_fan_out_when_batch_unreachable(self, serve) -> None:
+        def handler(request: httpx.Request) -> httpx.Response:
+            if request.url.path == FRICTION_SCORES_BATCH_PATH:
+                raise httpx.ConnectError("connection refused", request=request)
+            assert request.url.path == FRICTION_SCORES_PATH
+            jurisdiction = request.url.params["jurisdiction"]
+            return httpx.Response(200, json={"scores": [{"jurisdiction": jurisdiction}]})
+
+        await serve(handler)
+        client = HousingLensClient(base_url="http://test:8001", api_key="")
+        client.cache = None
+        batch = await client.get_friction_scores_many(["Denver", "Austin"])
+
+        assert batch.ok
+        assert batch.scores == {
+            "Denver": [{"jurisdiction": "Denver"}],
+            "Austin": [{"jurisdiction": "Austin"}],
+        }
@@ -0,0 +1,95 @@
+"""Tests for the shared HTTP connection pool."""
+
+from __future__ import annotations
+
+import threading
+from collections.abc import Iterator
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import httpx
+import pytest
+
+from src.config import settings
+from src.integrations.http_pool import SharedHttpPool
+
+
+def _transport() -> httpx.MockTransport:
+    return httpx.MockTransport(lambda request: httpx.Response(200, json={"ok": True}))
+
+
+@pytest.mark.asyncio
+async def test_open_is_idempotent_and_close_resets() -> None:
+    pool = SharedHttpPool()
+    await pool.open(transport=_transport())
+    client = pool._client
+    await pool.open(transport=_transport())
+    assert pool._client is client
+    await pool.close()
+    assert pool.is_open is False
+
+
+@pytest.mark.asyncio
+async def test_requests_through_open_pool_count_as_hits() -> None:
+    # MockTransport never opens a connection, so every request is a hit.
+    pool = SharedHttpPool()
+    await pool.open(transport=_transport())
+    try:
+        resp = await pool.get("http://lens.test/api/v1/trends")
+    finally:
+        await pool.close()
+    assert resp.json() == {"ok": True}
+    assert pool.stats.requests == 1
+    assert pool.stats.hits == 1
+    assert pool.stats.misses == 0
+
+
+class _KeepAliveHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self) -> None:
+        body = b'{"ok": true}'
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args: object) -> None:
+        pass
+
+
+@pytest.fixture
+def local_server(monkeypatch: pytest.MonkeyPatch) -> Iterator[str]:
+    """A keep-alive HTTP/1.1 server on localhost; yields its base URL."""
+    for name in ("HTTP_PROXY", "HTTPS_PROXY", "ALL_PROXY", "http_proxy", "https_proxy"):
+        monkeypatch.delenv(name, raising=False)
+    monkeypatch.setattr(settings, "http2_enabled", False)
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _KeepAliveHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield f"http://127.0.0.1:{server.server_address[1]}"
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+@pytest.mark.asyncio
+async def test_new_connection_counts_as_miss_then_reuse_as_hit(local_server: str) -> None:
+    pool = SharedHttpPool()
+    await pool.open()
+    try:
+        first = await pool.get(f"{local_server}/api/v1/trends")
+        second = await pool.get(f"{local_server}/api/v1/trends")
+    finally:
+        await pool.close()
+    assert first.json() == second.json() == {"ok": True}
+    assert pool.stats.requests == 2
+    assert pool.stats.misses == 1
+    assert pool.stats.hits == 1
+
+
+def test_snapshot_reports_closed_pool() -> None:
+    snapshot = SharedHttpPool().snapshot()
+    assert snapshot["open"] is False
+    assert snapshot["requests"] == 0
@@ -0,0 +1,147 @@
+"""Tests for the Claude response cache."""
+
+from __future__ import annotations
+
+import os
+from types import SimpleNamespace
+
+import pytest
+
+from src.integrations.cache import MemoryCacheBackend
+from src.integrations.claude_api import ClaudeContentGenerator
+from src.integrations.llm_cache import DiskCacheBackend, LLMResponseCache, llm_cache_key
+
+
+class _FakeMessages:
+    def __init__(self) -> None:
+        self.calls = 0
+
+    async def create(self, **kwargs):
+        self.calls += 1
+        return SimpleNamespace(content=[SimpleNamespace(text=f"response {self.calls}")])
+
+
+def _generator(cache: LLMResponseCache | None) -> tuple[ClaudeContentGenerator, _FakeMessages]:
+    gen = ClaudeContentGenerator(api_key="test", model="test-model", cache=cache)
+    gen.limiter = None
+    messages = _FakeMessages()
+    gen.client = SimpleNamespace(messages=messages)
+    return gen, messages
+
+
+class TestLLMCacheKey:
+    def test_identical_inputs_share_key(self) -> None:
+        assert llm_cache_key("m", "sys", "user", 100, 0.7) == llm_cache_key(
+            "m", "sys", "user", 100, 0.7
+        )
+
+    @pytest.mark.parametrize(
+        "args",
+        [
+            ("other", "sys", "user", 100, 0.7),
+            ("m", "sys2", "user", 100, 0.7),
+            ("m", "sys", "user2", 100, 0.7),
+            ("m", "sys", "user", 200, 0.7),
+            ("m", "sys", "user", 100, 0.2),
+        ],
+    )
+    def test_any_input_changes_key(self, args) -> None:
+        assert llm_cache_key(*args) != llm_cache_key("m", "sys", "user", 100, 0.7)
+
+
+class TestDiskCacheBackend:
+    @pytest.mark.asyncio
+    async def test_round_trip(self, tmp_path) -> None:
+        backend = DiskCacheBackend(tmp_path)
+        await backend.set("k", "value", ttl=60)
+        assert await backend.get("k") == "value"
+
+    @pytest.mark.asyncio
+    async def test_expired_entry_is_dropped(self, tmp_path) -> None:
+        backend = DiskCacheBackend(tmp_path)
+        await backend.set("k", "value", ttl=-1)
+        assert await backend.get("k") is None
+        assert len(backend) == 0
+
+    @pytest.mark.asyncio
+    async def test_evicts_least_recently_used(self, tmp_path) -> None:
+        backend = DiskCacheBackend(tmp_path, max_entries=2)
+        await backend.set("a", 1, ttl=60)
+        await backend.set("b", 2, ttl=60)
+        # Make "b" the oldest entry so "a" survives the next eviction.
+        os.utime(backend._path("b"), (0, 0))
+        await backend.set("c", 3, ttl=60)
+        assert len(backend) == 2
+        assert await backend.get("a") == 1
+        assert await backend.get("b") is None
+
+    @pytest.mark.asyncio
+    async def test_delete_prefix(self, tmp_path) -> None:
+        backend = DiskCacheBackend(tmp_path)
+        await backend.set("housingspeak:llm:a", 1, ttl=60)
+        await backend.set("other:b", 2, ttl=60)
+        assert await backend.delete_prefix("housingspeak:llm:") == 1
+        assert await backend.get("other:b") == 2
+
+
+class TestCachedGenerate:
+    @pytest.mark.asyncio
+    async def test_identical_request_served_from_cache(self, tmp_path) -> None:
+        cache = LLMResponseCache(DiskCacheBackend(tmp_path), ttl=60)
+        gen, messages = _generator(cache)
+
+        first = await gen.generate("sys", "user")
+        second = await gen.generate("sys", "user")
+
+        assert first == second == "response 1"
+        assert messages.calls == 1
+        assert cache.snapshot()["hits"] == 1
+        assert cache.snapshot()["misses"] == 1
+
+    @pytest.mark.asyncio
+    async def test_different_params_miss(self) -> None:
+        cache = LLMResponseCache(MemoryCacheBackend(), ttl=60)
+        gen, messages = _generator(cache)
+
+        await gen.generate("sys", "user", max_tokens=100)
+        await gen.generate("sys", "user", max_tokens=200)
+
+        assert messages.calls == 2
+
+    @pytest.mark.asyncio
+    async def test_force_fresh_bypasses_and_refreshes(self) -> None:
+        cache = LLMResponseCache(MemoryCacheBackend(), ttl=60)
+        gen, messages = _generator(cache)
+
+        await gen.generate("sys", "user")
+        fresh = await gen.generate("sys", "user", force_fresh=True)
+        again = await gen.generate("sys", "user")
+
+        assert fresh == again == "response 2"
+        assert messages.calls == 2
+        assert cache.snapshot()["bypassed"] == 1
+
+    @pytest.mark.asyncio
+    async def test_backend_failure_falls_through(self) -> None:
+        class _Broken(MemoryCacheBackend):
+            async def get(self, key):
+                raise ConnectionError("down")
+
+            async def set(self, key, value, ttl):
+                raise ConnectionError("down")
+
+        cache = LLMResponseCache(_Broken(), ttl=60)
+        gen, messages = _generator(cache)
+
+        assert await gen.generate("sys", "user") == "response 1"
+        assert cache.snapshot()["errors"] == 2
+
+    @pytest.mark.asyncio
+    async def test_disabled_cache_always_calls_api(self) -> None:
+        gen, messages = _generator(None)
+        gen.cache = None
+
+        await gen.generate("sys", "user")
+        await gen.generate("sys", "user")
+
+        assert messages.calls == 2
@@ -0,0 +1,225 @@
+"""Tests for Message Batch generation against a local fake batch server."""
+
+from __future__ import annotations
+
+import json
+
+import httpx
+import pytest
+
+from src.integrations.cache import MemoryCacheBackend
+from src.integrations.claude_api import (
+    BatchTimeoutError,
+    ClaudeContentGenerator,
+    GenerationRequest,
+)
+
+
+class FakeBatchServer:
+    """Minimal stand-in for the Message Batches endpoints.
+
+    A batch reports ``in_progress`` for *polls_until_ended* retrievals and
+    then ``ended``. Requests whose user prompt contains ``FAIL`` error out.
+    """
+
+    def __init__(self, polls_until_ended: int = 1) -> None:
+        self.polls_until_ended = polls_until_ended
+        self.batches: dict[str, dict] = {}
+        self.created = 0
+        self.retrievals: dict[str, int] = {}
+
+    def handler(self, request: httpx.Request) -> httpx.Response:
+        path = request.url.path
+        if request.method == "POST" and path == "/v1/messages/batches":
+            self.created += 1
+            batch_id = f"msgbatch_{self.created:04d}"
+            self.batches[batch_id] = json.loads(request.content)
+            self.retrievals[batch_id] = 0
+            return httpx.Response(200, json=self._batch(batch_id, "in_progress"))
+        if path.endswith("/results"):
+            batch_id = path.split("/")[-2]
+            return httpx.Response(200, content=self._results(batch_id))
+        if request.method == "GET" and path.startswith("/v1/messages/batches/"):
+            batch_id = path.rsplit("/", 1)[-1]
+            self.retrievals[batch_id] += 1
+            ended = self.retrievals[batch_id] > self.polls_until_ended
+            return httpx.Response(
+                200, json=self._batch(batch_id, "ended" if ended else "in_progress")
+            )
+        return httpx.Response(404, json={"type": "error", "error": {"type": "not_found_error"}})
+
+    def _batch(self, batch_id: str, status: str) -> dict:
+        return {
+            "id": batch_id,
+            "type": "message_batch",
+            "processing_status": status,
+            "request_counts": {
+                "processing": 0,
+                "succeeded": 0,
+                "errored": 0,
+                "canceled": 0,
+                "expired": 0,
+            },
+            "created_at": "2024-01-01T00:00:00Z",
+            "expires_at": "2024-01-02T00:00:00Z",
+            "ended_at": None,
+            "archived_at": None,
+            "cancel_initiated_at": None,
+            "results_url": (
+                f"https://api.anthropic.com/v1/messages/batches/{batch_id}/results"
+                if status == "ended"
+                else None
+            ),
+        }
+
+    def _results(self, batch_id: str) -> bytes:
+        lines = []
+        for item in self.batches[batch_id]["requests"]:
+            user = item["params"]["messages"][0]["content"]
+            if "FAIL" in user:
+                result = {
+                    "type": "errored",
+                    "error": {
+                        "type": "error",
+                        "error": {"type": "invalid_request_error", "message": "bad prompt"},
+                    },
+                }
+            else:
+                result = {
+                    "type": "succeeded",
+                    "message": {
+                        "id": f"msg_{item['custom_id']}",
+                        "type": "message",
+                        "role": "assistant",
+                        "model": item["params"]["model"],
+                        "content": [{"type": "text", "text": f"report for {item['custom_id']}"}],
+                        "stop_reason": "end_turn",
+                        "stop_sequence": None,
+                        "usage": {"input_tokens": 10, "output_tokens": 20},
+                    },
+                }
+            lines.append(json.dumps({"custom_id": item["custom_id"], "result": result}))
+        return ("\n".join(lines) + "\n").encode("utf-8")
+
+
+def _generator(server: FakeBatchServer, state: MemoryCacheBackend) -> ClaudeContentGenerator:
+    client = httpx.AsyncClient(transport=httpx.MockTransport(server.handler))
+    return ClaudeContentGenerator(
+        api_key="test", model="test-model", http_client=client, batch_state=state
+    )
+
+
+def _requests(*prompts: str) -> list[GenerationRequest]:
+    return [
+        GenerationRequest(custom_id=f"s{i}", system_prompt="system", user_prompt=p)
+        for i, p in enumerate(prompts)
+    ]
+
+
+@pytest.fixture(autouse=True)
+def _no_poll_delay(monkeypatch):
+    from src.config import settings
+
+    monkeypatch.setattr(settings, "llm_batch_poll_seconds", 0.0)
+
+
+class TestGenerateBatch:
+    @pytest.mark.asyncio
+    async def test_maps_results_by_custom_id(self) -> None:
+        server = FakeBatchServer(polls_until_ended=2)
+        gen = _generator(server, MemoryCacheBackend())
+
+        outcome = await gen.generate_batch(_requests("a", "b", "c"))
+
+        assert outcome.texts == {
+            "s0": "report for s0",
+            "s1": "report for s1",
+            "s2": "report for s2",
+        }
+        assert outcome.errors == {}
+        # Three polls, plus the lookup of the results URL.
+        assert server.retrievals[outcome.batch_id] == 4
+
+    @pytest.mark.asyncio
+    async def test_errored_requests_reported(self) -> None:
+        server = FakeBatchServer()
+        gen = _generator(server, MemoryCacheBackend())
+
+        outcome = await gen.generate_batch(_requests("ok", "FAIL"))
+
+        assert set(outcome.texts) == {"s0"}
+        assert outcome.errors == {"s1": "bad prompt"}
+
+    @pytest.mark.asyncio
+    async def test_request_params_carry_cacheable_prefix(self) -> None:
+        server = FakeBatchServer()
+        gen = _generator(server, MemoryCacheBackend())
+        system = "x" * 4400  # over the 1024-token cacheable minimum
+        request = GenerationRequest(
+            custom_id="s0", system_prompt=system, user_prompt="u", audience="Developers"
+        )
+
+        outcome = await gen.generate_batch([request])
+
+        params = server.batches[outcome.batch_id]["requests"][0]["params"]
+        assert params["model"] == "test-model"
+        assert params["system"][0]["text"] == system
+        assert params["system"][-1]["cache_control"] == {"type": "ephemeral"}
+
+    @pytest.mark.asyncio
+    async def test_resumes_submitted_batch_after_restart(self, monkeypatch) -> None:
+        from src.config import settings
+
+        monkeypatch.setattr(settings, "llm_batch_timeout_seconds", 0.0)
+        server = FakeBatchServer(polls_until_ended=100)
+        state = MemoryCacheBackend()
+        gen = _generator(server, state)
+
+        with pytest.raises(BatchTimeoutError):
+            await gen.generate_batch(_requests("a", "b"), job_key="weekly-digest:2024-W01")
+        assert server.created == 1
+
+        # A fresh generator (new worker process) sharing the state store.
+        server.polls_until_ended = 0
+        restarted = _generator(server, state)
+        outcome = await restarted.generate_batch(
+            _requests("a", "b"), job_key="weekly-digest:2024-W01"
+        )
+
+        assert server.created == 1
+        assert set(outcome.texts) == {"s0", "s1"}
+
+    @pytest.mark.asyncio
+    async def test_new_job_key_submits_new_batch(self) -> None:
+        server = FakeBatchServer(polls_until_ended=0)
+        state = MemoryCacheBackend()
+        gen = _generator(server, state)
+
+        await gen.generate_batch(_requests("a"), job_key="weekly-digest:2024-W01")
+        await gen.generate_batch(_requests("a"), job_key="weekly-digest:2024-W02")
+
+        assert server.created == 2
+
+    @pytest.mark.asyncio
+    async def test_resume_submits_missing_and_errored_requests(self) -> None:
+        server = FakeBatchServer(polls_until_ended=0)
+        state = MemoryCacheBackend()
+        gen = _generator(server, state)
+        job_key = "weekly-digest:2024-W01"
+
+        first = await gen.generate_batch(_requests("a", "FAIL"), job_key=job_key)
+        assert first.errors == {"s1": "bad prompt"}
+
+        # The retry has s1's data again and a stakeholder who joined in between.
+        retried = await gen.generate_batch(_requests("a", "b", "c"), job_key=job_key)
+
+        assert server.created == 2
+        follow_up = server.batches[retried.batch_id]["requests"]
+        assert [item["custom_id"] for item in follow_up] == ["s1", "s2"]
+        assert set(retried.texts) == {"s0", "s1", "s2"}
+        assert retried.errors == {}
+
+        # Every request is now covered by a stored batch, so nothing new is submitted.
+        again = await gen.generate_batch(_requests("a", "b", "c"), job_key=job_key)
+        assert server.created == 2
+        assert set(again.texts) == {"s0", "s1", "s2"}
@@ -0,0 +1,138 @@
+"""Tests for per-task model routing."""
+
+from __future__ import annotations
+
+from types import SimpleNamespace
+
+import anthropic
+import httpx
+import pytest
+
+from src.integrations.cache import MemoryCacheBackend
+from src.integrations.claude_api import ClaudeContentGenerator
+from src.integrations.llm_cache import LLMResponseCache
+from src.integrations.model_router import ModelRouter, model_router
+
+ROUTING = """
+default:
+  model: null
+  max_tokens: 4096
+  temperature: 0.7
+tasks:
+  alert_summary:
+    model: small-model
+    max_tokens: 512
+    temperature: 0.2
+    fallbacks: [big-model, backup-model]
+  policy_brief:
+    fallbacks: [backup-model]
+"""
+
+
+def _overloaded() -> anthropic.APIStatusError:
+    request = httpx.Request("POST", "https://api.anthropic.com/v1/messages")
+    response = httpx.Response(529, request=request)
+    return anthropic.InternalServerError("overloaded", response=response, body=None)
+
+
+class _Messages:
+    def __init__(self, overloaded_models: set[str] = frozenset()) -> None:
+        self.overloaded_models = overloaded_models
+        self.requests: list[dict] = []
+
+    async def create(self, **kwargs):
+        self.requests.append(kwargs)
+        if kwargs["model"] in self.overloaded_models:
+            raise _overloaded()
+        return SimpleNamespace(content=[SimpleNamespace(text=kwargs["model"])], usage=None)
+
+
+@pytest.fixture
+def router(tmp_path) -> ModelRouter:
+    (tmp_path / "model_routing.yaml").write_text(ROUTING, encoding="utf-8")
+    return ModelRouter(tmp_path)
+
+
+def _generator(router: ModelRouter, messages: _Messages) -> ClaudeContentGenerator:
+    gen = ClaudeContentGenerator(api_key="test", model="test-model", router=router)
+    gen.cache = None
+    gen.limiter = None
+    gen.client = SimpleNamespace(messages=messages)
+    return gen
+
+
+class TestModelRouter:
+    def test_task_route(self, router) -> None:
+        route = router.route("alert_summary")
+        assert route.model == "small-model"
+        assert route.max_tokens == 512
+        assert route.models("test-model") == ("small-model", "big-model", "backup-model")
+
+    def test_route_inherits_default(self, router) -> None:
+        route = router.route("policy_brief")
+        assert route.model is None
+        assert route.temperature == 0.7
+        assert route.models("test-model") == ("test-model", "backup-model")
+
+    def test_unknown_task_uses_default(self, router) -> None:
+        assert router.route("no_such_task") is router.default
+        assert router.route(None) is router.default
+
+    def test_shipped_config_routes_every_task(self) -> None:
+        tasks = {"alert_summary", "social_variant", "policy_brief", "ordinance"}
+        assert tasks | {"narrative_summary"} <= set(model_router.routes())
+
+
+class TestRoutedGenerate:
+    @pytest.mark.asyncio
+    async def test_task_sets_model_and_sampling(self, router) -> None:
+        messages = _Messages()
+        gen = _generator(router, messages)
+
+        assert await gen.generate("system", "user", task="alert_summary") == "small-model"
+        assert messages.requests[0]["max_tokens"] == 512
+        assert messages.requests[0]["temperature"] == 0.2
+
+    @pytest.mark.asyncio
+    async def test_explicit_arguments_win(self, router) -> None:
+        messages = _Messages()
+        gen = _generator(router, messages)
+
+        await gen.generate("system", "user", max_tokens=100, task="alert_summary")
+        assert messages.requests[0]["max_tokens"] == 100
+
+    @pytest.mark.asyncio
+    async def test_no_task_uses_generator_model(self, router) -> None:
+        messages = _Messages()
+        gen = _generator(router, messages)
+
+        assert await gen.generate("system", "user") == "test-model"
+        assert messages.requests[0]["max_tokens"] == 4096
+
+    @pytest.mark.asyncio
+    async def test_overload_falls_back_in_order(self, router) -> None:
+        messages = _Messages(overloaded_models={"small-model", "big-model"})
+        gen = _generator(router, messages)
+
+        assert await gen.generate("system", "user", task="alert_summary") == "backup-model"
+        assert [r["model"] for r in messages.requests] == [
+            "small-model",
+            "big-model",
+            "backup-model",
+        ]
+        assert router.snapshot()["fallbacks"] == 1
+        assert router.snapshot()["requests_by_model"] == {"backup-model": 1}
+
+    @pytest.mark.asyncio
+    async def test_fallback_answer_not_cached_as_primary(self, router) -> None:
+        messages = _Messages(overloaded_models={"small-model", "big-model"})
+        gen = _generator(router, messages)
+        gen.cache = LLMResponseCache(MemoryCacheBackend(), ttl=60)
+
+        assert await gen.generate("system", "user", task="alert_summary") == "backup-model"
+        messages.overloaded_models = set()
+
+        # The primary model is asked, not answered from the fallback's cached text.
+        assert await gen.generate("system", "user", task="alert_summary") == "small-model"
+        assert await gen.generate("system", "user", task="alert_summary") == "small-model"
+        assert [r["model"] for r in messages.requests][3:] == ["small-model"]
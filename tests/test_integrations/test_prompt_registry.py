@@ -0,0 +1,85 @@
+"""Tests for the prompt registry."""
+
+import os
+
+import pytest
+
+from src.integrations.prompt_registry import PromptRegistry, prompt_registry
+from src.models.content import AudienceType
+
+
+@pytest.fixture
+def prompts_dir(tmp_path):
+    (tmp_path / "brief.txt").write_text("Write for [AUDIENCE] readers.", encoding="utf-8")
+    (tmp_path / "plain.txt").write_text("No placeholder here.", encoding="utf-8")
+    return tmp_path
+
+
+class TestPromptRegistry:
+    def test_prerenders_every_audience(self, prompts_dir):
+        registry = PromptRegistry(prompts_dir)
+        template = registry.get("brief.txt")
+        assert set(template.variants) == {a.value for a in AudienceType}
+        assert registry.render("brief.txt", "Media") == "Write for Media readers."
+
+    def test_unknown_audience_still_renders(self, prompts_dir):
+        registry = PromptRegistry(prompts_dir)
+        assert registry.render("brief.txt", "planners") == "Write for planners readers."
+
+    def test_prompt_without_placeholder_ignores_audience(self, prompts_dir):
+        registry = PromptRegistry(prompts_dir)
+        assert registry.render("plain.txt", "legislators") == "No placeholder here."
+
+    def test_version_is_content_hash(self, prompts_dir):
+        registry = PromptRegistry(prompts_dir)
+        version = registry.version("brief.txt")
+        assert len(version) == 12
+        assert PromptRegistry(prompts_dir).version("brief.txt") == version
+        assert registry.versions()["plain.txt"] != version
+
+    def test_templates_are_immutable(self, prompts_dir):
+        template = PromptRegistry(prompts_dir).get("brief.txt")
+        with pytest.raises(TypeError):
+            template.variants["Media"] = "changed"
+        with pytest.raises(AttributeError):
+            template.text = "changed"
+
+    def test_unknown_prompt_raises(self, prompts_dir):
+        with pytest.raises(KeyError):
+            PromptRegistry(prompts_dir).get("missing.txt")
+
+    def test_hot_reload_picks_up_edits(self, prompts_dir):
+        registry = PromptRegistry(prompts_dir, hot_reload=True)
+        before = registry.version("plain.txt")
+        path = prompts_dir / "plain.txt"
+        path.write_text("Edited prompt.", encoding="utf-8")
+        stat = path.stat()
+        os.utime(path, (stat.st_atime, stat.st_mtime + 5))
+        assert registry.render("plain.txt") == "Edited prompt."
+        assert registry.version("plain.txt") != before
+
+    def test_without_hot_reload_edits_are_ignored(self, prompts_dir):
+        registry = PromptRegistry(prompts_dir)
+        path = prompts_dir / "plain.txt"
+        path.write_text("Edited prompt.", encoding="utf-8")
+        stat = path.stat()
+        os.utime(path, (stat.st_atime, stat.st_mtime + 5))
+        assert registry.render("plain.txt") == "No placeholder here."
+
+    def test_shipped_prompts_are_loaded(self):
+        versions = prompt_registry.versions()
+        assert "policy_brief_system_prompt.txt" in versions
+        assert "[AUDIENCE]" not in prompt_registry.render(
+            "policy_brief_system_prompt.txt", AudienceType.CITY_COUNCIL.value
+        )
+
+    def test_audience_context_from_config(self):
+        context = prompt_registry.audience_context(AudienceType.GENERAL_PUBLIC.value)
+        assert context.startswith("Audience: General Public")
+        assert 'write "red tape" rather than "regulatory friction"' in context
+        assert "Always lead with the most impactful finding" in context
+
+    def test_unknown_audience_has_no_context(self, prompts_dir):
+        registry = PromptRegistry(prompts_dir, config_dir=prompts_dir)
+        assert registry.audience_context("Media") == ""
+        assert registry.audience_context(None) == ""
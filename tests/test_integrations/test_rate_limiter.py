@@ -0,0 +1,295 @@
+"""Tests for the Claude rate limiter."""
+
+from __future__ import annotations
+
+import asyncio
+from types import SimpleNamespace
+
+import anthropic
+import httpx
+import pytest
+
+from src.config import settings
+from src.integrations.claude_api import ClaudeContentGenerator
+from src.integrations.rate_limiter import (
+    Limits,
+    MemoryBucketStore,
+    Priority,
+    RateLimiter,
+    Reservation,
+    estimate_tokens,
+    retry_delay,
+)
+
+LIMITS = Limits(
+    requests_per_minute=60, input_tokens_per_minute=1000, output_tokens_per_minute=1000
+)
+
+
+def _status_error(status: int, headers: dict[str, str] | None = None) -> anthropic.APIStatusError:
+    request = httpx.Request("POST", "https://api.anthropic.com/v1/messages")
+    response = httpx.Response(status, headers=headers or {}, request=request)
+    cls = {429: anthropic.RateLimitError, 400: anthropic.BadRequestError}.get(
+        status, anthropic.InternalServerError
+    )
+    return cls("error", response=response, body=None)
+
+
+class _BrokenStore:
+    async def take(self, costs, floor):
+        raise ConnectionError("redis down")
+
+    async def refund(self, costs):
+        raise ConnectionError("redis down")
+
+    async def block(self, seconds):
+        raise ConnectionError("redis down")
+
+
+class TestMemoryBucketStore:
+    @pytest.mark.asyncio
+    async def test_grants_until_bucket_is_empty(self) -> None:
+        store = MemoryBucketStore(LIMITS)
+        assert await store.take((1, 600, 100), floor=0.0) == 0
+        wait = await store.take((1, 600, 100), floor=0.0)
+        # 200 more input tokens at 1000/minute is about 12 seconds.
+        assert 11_000 < wait <= 12_100
+
+    @pytest.mark.asyncio
+    async def test_batch_floor_keeps_headroom(self) -> None:
+        store = MemoryBucketStore(LIMITS)
+        assert await store.take((1, 700, 0), floor=0.0) == 0
+        # 300 left: a 150-token batch request would leave less than the 20% reserve.
+        assert await store.take((1, 150, 0), floor=0.2) > 0
+        assert await store.take((1, 150, 0), floor=0.0) == 0
+
+    @pytest.mark.asyncio
+    async def test_refund_restores_capacity(self) -> None:
+        store = MemoryBucketStore(LIMITS)
+        await store.take((1, 1000, 0), floor=0.0)
+        await store.refund((0, 500, 0))
+        assert await store.take((1, 400, 0), floor=0.0) == 0
+
+    @pytest.mark.asyncio
+    async def test_block_holds_every_caller(self) -> None:
+        store = MemoryBucketStore(LIMITS)
+        await store.block(5)
+        assert 4_000 < await store.take((1, 1, 1), floor=0.0) <= 5_000
+
+
+class TestRateLimiter:
+    @pytest.mark.asyncio
+    async def test_acquire_and_settle_refunds_unused_output(self) -> None:
+        store = MemoryBucketStore(LIMITS)
+        limiter = RateLimiter(store)
+        reservation = await limiter.acquire(100, 900)
+        await limiter.settle(reservation, SimpleNamespace(input_tokens=100, output_tokens=100))
+        assert await store.take((1, 0, 800), floor=0.0) == 0
+
+    @pytest.mark.asyncio
+    async def test_failed_request_refunds_everything(self) -> None:
+        store = MemoryBucketStore(LIMITS)
+        limiter = RateLimiter(store)
+        await limiter.settle(await limiter.acquire(1000, 1000), None)
+        assert await store.take((1, 1000, 1000), floor=0.0) == 0
+
+    @pytest.mark.asyncio
+    async def test_falls_back_when_store_fails(self) -> None:
+        limiter = RateLimiter(_BrokenStore(), fallback=MemoryBucketStore(LIMITS))
+        assert await limiter.acquire(10, 10) == Reservation(10, 10)
+        await limiter.acquire(10, 10)
+        assert limiter.snapshot()["store_errors"] == 1
+
+    @pytest.mark.asyncio
+    async def test_interactive_goes_first(self) -> None:
+        fast = Limits(60_000, 60_000, 60_000)  # refills 1,000 per second
+        limiter = RateLimiter(MemoryBucketStore(fast), batch_reserve=0.0, max_wait_seconds=0.05)
+        await limiter.acquire(60_000, 0)  # drain the input bucket
+        order: list[str] = []
+
+        async def _call(name: str, priority: Priority) -> None:
+            await limiter.acquire(20, 0, priority)
+            order.append(name)
+
+        batch = asyncio.create_task(_call("batch", Priority.BATCH))
+        await asyncio.sleep(0)
+        interactive = asyncio.create_task(_call("interactive", Priority.INTERACTIVE))
+        await asyncio.sleep(0.01)
+        assert limiter.snapshot()["waiting"] == {"interactive": 1, "batch": 1}
+        await asyncio.wait_for(asyncio.gather(batch, interactive), timeout=5)
+        assert order[0] == "interactive"
+
+
+class TestRetryDelay:
+    def test_honors_retry_after(self) -> None:
+        delay = retry_delay(_status_error(429, {"retry-after": "7"}), attempt=0)
+        assert delay is not None
+        assert 7 <= delay <= 7 + settings.claude_backoff_base_seconds
+
+    def test_overload_backs_off_exponentially(self) -> None:
+        delay = retry_delay(_status_error(529), attempt=3)
+        assert delay is not None
+        assert 0 <= delay <= settings.claude_backoff_base_seconds * 8
+
+    def test_client_errors_are_final(self) -> None:
+        assert retry_delay(_status_error(400), attempt=0) is None
+
+
+def test_estimate_tokens() -> None:
+    assert estimate_tokens("x" * 400) == 100
+    assert estimate_tokens("") == 1
+
+
+class _FlakyMessages:
+    def __init__(self, failures: list[Exception]) -> None:
+        self.failures = failures
+        self.calls = 0
+
+    async def create(self, **_: object):
+        self.calls += 1
+        if self.failures:
+            raise self.failures.pop(0)
+        return SimpleNamespace(
+            content=[SimpleNamespace(text="ok")],
+            usage=SimpleNamespace(input_tokens=10, output_tokens=5),
+        )
+
+
+class TestGenerateRetries:
+    @pytest.mark.asyncio
+    async def test_retries_after_rate_limit(self, monkeypatch) -> None:
+        monkeypatch.setattr(settings, "claude_backoff_base_seconds", 0.0)
+        limiter = RateLimiter(MemoryBucketStore(LIMITS))
+        gen = ClaudeContentGenerator(api_key="test", limiter=limiter)
+        gen.cache = None
+        messages = _FlakyMessages([_status_error(429, {"retry-after": "0"}), _status_error(529)])
+        gen.client = SimpleNamespace(messages=messages)
+
+        assert await gen.generate("system", "user") == "ok"
+
+        snapshot = limiter.snapshot()
+        assert messages.calls == 3
+        assert snapshot["retries"] == 2
+        assert snapshot["rate_limited"] == 1
+        assert snapshot["granted"] == 3
+
+    @pytest.mark.asyncio
+    async def test_gives_up_after_max_retries(self, monkeypatch) -> None:
+        monkeypatch.setattr(settings, "claude_backoff_base_seconds", 0.0)
+        monkeypatch.setattr(settings, "claude_max_retries", 1)
+        limiter = RateLimiter(MemoryBucketStore(LIMITS))
+        gen = ClaudeContentGenerator(api_key="test", limiter=limiter)
+        gen.cache = None
+        gen.client = SimpleNamespace(messages=_FlakyMessages([_status_error(529)] * 3))
+
+        with pytest.raises(anthropic.InternalServerError):
+            await gen.generate("system", "user")
+
+    @pytest.mark.asyncio
+    async def test_client_error_not_retried(self) -> None:
+        limiter = RateLimiter(MemoryBucketStore(LIMITS))
+        gen = ClaudeContentGenerator(api_key="test", limiter=limiter)
+        gen.cache = None
+        messages = _FlakyMessages([_status_error(400)])
+        gen.client = SimpleNamespace(messages=messages)
+
+        with pytest.raises(anthropic.BadRequestError):
+            await gen.generate("system", "user")
+        assert messages.calls == 1
+
+
+class _SettlingLimiter(RateLimiter):
+    """Records every settled reservation and the usage it was settled with."""
+
+    def __init__(self) -> None:
+        super().__init__(MemoryBucketStore(LIMITS))
+        self.settled: list[object] = []
+
+    async def settle(self, reservation: Reservation, usage: object) -> None:
+        self.settled.append(usage)
+        await super().settle(reservation, usage)
+
+
+class _Stream:
+    def __init__(self, deltas: list[str], error: Exception | None = None) -> None:
+        self.deltas = deltas
+        self.error = error
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    @property
+    async def text_stream(self):
+        for delta in self.deltas:
+            yield delta
+        if self.error is not None:
+            raise self.error
+
+    async def get_final_message(self):
+        return SimpleNamespace(usage=SimpleNamespace(input_tokens=5, output_tokens=7))
+
+
+def _limited(messages: object) -> tuple[ClaudeContentGenerator, _SettlingLimiter]:
+    limiter = _SettlingLimiter()
+    gen = ClaudeContentGenerator(api_key="test", limiter=limiter)
+    gen.cache = None
+    gen.client = SimpleNamespace(messages=messages)
+    return gen, limiter
+
+
+class TestReservationsSettled:
+    @pytest.mark.asyncio
+    async def test_every_attempt_is_settled_once(self, monkeypatch) -> None:
+        monkeypatch.setattr(settings, "claude_backoff_base_seconds", 0.0)
+        gen, limiter = _limited(_FlakyMessages([_status_error(529)]))
+
+        assert await gen.generate("system", "user") == "ok"
+
+        assert limiter.settled[0] is None
+        assert limiter.settled[1].output_tokens == 5
+        assert len(limiter.settled) == 2
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("error", [RuntimeError("bug"), asyncio.CancelledError()])
+    async def test_other_exceptions_return_the_reservation(self, error) -> None:
+        gen, limiter = _limited(_FlakyMessages([error]))
+
+        with pytest.raises(type(error)):
+            await gen.generate("system", "user")
+
+        assert limiter.settled == [None]
+
+    @pytest.mark.asyncio
+    async def test_stream_error_after_text_is_settled(self) -> None:
+        stream = _Stream(["Hello"], error=_status_error(529))
+        gen, limiter = _limited(SimpleNamespace(stream=lambda **kwargs: stream))
+
+        deltas = []
+        with pytest.raises(anthropic.InternalServerError):
+            async for delta in gen.stream("system", "user"):
+                deltas.append(delta)
+
+        assert deltas == ["Hello"]
+        assert limiter.settled == [None]
+
+    @pytest.mark.asyncio
+    async def test_abandoned_stream_is_settled(self) -> None:
+        stream = _Stream(["Hello", ", ", "world"])
+        gen, limiter = _limited(SimpleNamespace(stream=lambda **kwargs: stream))
+
+        deltas = gen.stream("system", "user")
+        assert await deltas.__anext__() == "Hello"
+        await deltas.aclose()
+
+        assert limiter.settled == [None]
+
+    @pytest.mark.asyncio
+    async def test_finished_stream_settles_with_usage(self) -> None:
+        stream = _Stream(["Hello"])
+        gen, limiter = _limited(SimpleNamespace(stream=lambda **kwargs: stream))
+
+        assert [d async for d in gen.stream("system", "user")] == ["Hello"]
+        assert [u.output_tokens for u in limiter.settled] == [7]
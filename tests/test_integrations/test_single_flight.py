@@ -0,0 +1,69 @@
+"""Tests for single-flight request coalescing."""
+
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from src.integrations.single_flight import SingleFlight
+
+
+@pytest.mark.asyncio
+async def test_concurrent_calls_share_one_execution() -> None:
+    flight = SingleFlight()
+    calls = 0
+
+    async def fetch() -> dict:
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return {"scores": []}
+
+    results = await asyncio.gather(*(flight.do("k", fetch) for _ in range(5)))
+    assert calls == 1
+    assert all(r == {"scores": []} for r in results)
+    assert flight.stats.coalesced == 4
+    assert flight.inflight == 0
+
+
+@pytest.mark.asyncio
+async def test_different_keys_run_independently() -> None:
+    flight = SingleFlight()
+
+    async def fetch() -> int:
+        await asyncio.sleep(0)
+        return 1
+
+    await asyncio.gather(flight.do("a", fetch), flight.do("b", fetch))
+    assert flight.stats.executions == 2
+    assert flight.stats.coalesced == 0
+
+
+@pytest.mark.asyncio
+async def test_errors_propagate_to_all_waiters() -> None:
+    flight = SingleFlight()
+
+    async def fail() -> None:
+        await asyncio.sleep(0)
+        raise RuntimeError("upstream down")
+
+    results = await asyncio.gather(
+        flight.do("k", fail), flight.do("k", fail), return_exceptions=True
+    )
+    assert all(isinstance(r, RuntimeError) for r in results)
+
+
+@pytest.mark.asyncio
+async def test_cancelled_caller_does_not_cancel_shared_request() -> None:
+    flight = SingleFlight()
+
+    async def fetch() -> str:
+        await asyncio.sleep(0.01)
+        return "done"
+
+    first = asyncio.ensure_future(flight.do("k", fetch))
+    second = asyncio.ensure_future(flight.do("k", fetch))
+    await asyncio.sleep(0)
+    first.cancel()
+    assert await second == "done"
@@ -0,0 +1,292 @@
+"""Tests for the repository layer and engine configuration."""
+
+from __future__ import annotations
+
+import json
+import re
+import uuid
+from datetime import datetime, timezone
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from src.database import engine_options
+from src.models.alert import AlertPriority, AlertStatus, AlertType
+from src.models.content import AudienceType, ContentStatus, ContentType
+from src.repositories import (
+    ALERT_COPY_COLUMNS,
+    AlertRepository,
+    ContentRepository,
+    StakeholderRepository,
+    alert_row,
+    alert_values,
+    content_row,
+    copy_record,
+    decode_cursor,
+    encode_cursor,
+)
+
+
+class _CapturingSession:
+    def __init__(self, rows: list[dict] | None = None) -> None:
+        self.rows = rows or []
+        self.statements: list[str] = []
+        self.params: list[object] = []
+        self.commits = 0
+
+    async def scalars(self, stmt):  # type: ignore[no-untyped-def]
+        self.statements.append(str(stmt.compile(dialect=postgresql.dialect())))
+        return []
+
+    async def execute(self, stmt, params=None):  # type: ignore[no-untyped-def]
+        compiled = stmt.compile(dialect=postgresql.dialect())
+        self.statements.append(str(compiled))
+        self.params.append(params if params is not None else compiled.params)
+        return SimpleNamespace(
+            rowcount=len(compiled.params.get("ids") or []),
+            mappings=lambda: self.rows,
+            all=lambda: [SimpleNamespace(**row) for row in self.rows],
+        )
+
+    async def connection(self):  # type: ignore[no-untyped-def]
+        return SimpleNamespace(dialect=SimpleNamespace(driver="psycopg"))
+
+    async def commit(self) -> None:
+        self.commits += 1
+
+
+def _alert(**overrides: object) -> dict:
+    alert = {
+        "stakeholder_id": str(uuid.uuid4()),
+        "priority": "high",
+        "alert_type": "policy_update",
+        "headline": "VAWA rule change",
+        "summary": "Summary.",
+        "recommended_actions": ["Review the rule"],
+        "source_data": {"event_type": "policy_update"},
+    }
+    alert.update(overrides)
+    return alert
+
+
+class TestEngineOptions:
+    def test_asyncpg_statement_cache(self) -> None:
+        options = engine_options("postgresql+asyncpg://u:p@db/housingspeak")
+        assert options["pool_size"] == 10
+        assert options["connect_args"] == {
+            "prepared_statement_cache_size": 500,
+            "statement_cache_size": 500,
+        }
+
+    def test_other_drivers_get_pool_settings_only(self) -> None:
+        options = engine_options("postgresql+psycopg://u:p@db/housingspeak")
+        assert "connect_args" not in options
+        assert options["pool_recycle"] == 1_800.0
+
+
+class TestRows:
+    def test_content_row(self, sample_content) -> None:
+        stakeholder_id = uuid.uuid4()
+        row = content_row(sample_content, stakeholder_id=str(stakeholder_id))
+
+        assert row.id == uuid.UUID(sample_content["id"])
+        assert row.content_type == ContentType.POLICY_BRIEF
+        assert row.audience == AudienceType.CITY_COUNCIL
+        assert row.status == ContentStatus.DRAFT
+        assert row.stakeholder_id == stakeholder_id
+        # No timestamp in the result, so the server default applies.
+        assert row.created_at is None
+
+    def test_alert_row(self) -> None:
+        stakeholder_id = uuid.uuid4()
+        row = alert_row(
+            {
+                "stakeholder_id": str(stakeholder_id),
+                "priority": "high",
+                "alert_type": "policy_update",
+                "headline": "VAWA rule change",
+                "summary": "Summary.",
+                "action_required": True,
+                "action_deadline": "2026-03-01",
+                "related_project_ids": ["proj_123"],
+                "created_at": "2026-01-05T12:00:00+00:00",
+            }
+        )
+
+        assert isinstance(row.id, uuid.UUID)
+        assert row.stakeholder_id == stakeholder_id
+        assert row.priority == AlertPriority.HIGH
+        assert row.status == AlertStatus.PENDING
+        assert row.action_deadline.tzinfo is not None
+        assert row.created_at.isoformat() == "2026-01-05T12:00:00+00:00"
+
+
+class TestQueries:
+    """Each lookup is one statement shaped to hit the migration 0002 indexes."""
+
+    @pytest.mark.asyncio
+    async def test_stakeholders_by_interest_and_project(self) -> None:
+        session = _CapturingSession()
+        await StakeholderRepository(session).find(
+            jurisdiction="Denver, CO", interests=["VAWA"], project_id="proj_123"
+        )
+
+        (sql,) = session.statements
+        assert "stakeholders.jurisdiction = " in sql
+        assert "stakeholders.interests && " in sql
+        assert "stakeholders.projects @> " in sql
+
+    @pytest.mark.asyncio
+    async def test_alerts_for_stakeholder(self) -> None:
+        session = _CapturingSession()
+        await AlertRepository(session).for_stakeholder(
+            uuid.uuid4(),
+            status=AlertStatus.PENDING,
+            since=datetime(2026, 10, 1, tzinfo=timezone.utc),
+        )
+
+        (sql,) = session.statements
+        assert "alerts.stakeholder_id = " in sql
+        assert "alerts.status = " in sql
+        # Bounds created_at so older monthly partitions are pruned.
+        assert "alerts.created_at >= " in sql
+        assert "ORDER BY alerts.created_at DESC" in sql
+
+    @pytest.mark.asyncio
+    async def test_content_by_jurisdiction_type_status(self) -> None:
+        session = _CapturingSession()
+        await ContentRepository(session).find(
+            "Denver, CO", content_type=ContentType.POLICY_BRIEF, status=ContentStatus.DRAFT
+        )
+
+        (sql,) = session.statements
+        for column in ("jurisdiction", "content_type", "status"):
+            assert f"content.{column} = " in sql
+
+
+class TestBulkAlerts:
+    def test_copy_record_uses_enum_names_and_json_text(self) -> None:
+        values = alert_values(_alert(created_at="2026-01-05T12:00:00+00:00"))
+        record = dict(zip(ALERT_COPY_COLUMNS, copy_record(values), strict=True))
+
+        assert record["priority"] == AlertPriority.HIGH.name
+        assert record["alert_type"] == AlertType.POLICY_UPDATE.name
+        assert record["status"] == "PENDING"
+        assert json.loads(record["source_data"]) == {"event_type": "policy_update"}
+        assert json.loads(record["recommended_actions"]) == ["Review the rule"]
+        assert record["created_at"].isoformat() == "2026-01-05T12:00:00+00:00"
+
+    @pytest.mark.asyncio
+    async def test_insert_many_chunks_in_one_transaction(self) -> None:
+        session = _CapturingSession()
+        written = await AlertRepository(session).insert_many(
+            [_alert() for _ in range(5)], method="values", chunk_size=2
+        )
+
+        assert written == 5
+        assert [len(chunk) for chunk in session.params] == [2, 2, 1]
+        assert all(sql.startswith("INSERT INTO alerts") for sql in session.statements)
+        # COPY and multi-row INSERT skip server defaults, so created_at is always sent.
+        assert all(row["created_at"] is not None for chunk in session.params for row in chunk)
+        assert session.commits == 1
+
+    @pytest.mark.asyncio
+    async def test_insert_many_can_skip_existing_rows(self) -> None:
+        session = _CapturingSession(rows=[{"id": uuid.uuid4()}])
+        written = await AlertRepository(session).insert_many(
+            [_alert(), _alert()], method="copy", skip_existing=True
+        )
+
+        assert written == 1
+        assert session.statements[0].startswith("INSERT INTO alerts")
+        assert "ON CONFLICT (id, created_at) DO NOTHING RETURNING alerts.id" in (
+            session.statements[0]
+        )
+        assert session.commits == 1
+
+    @pytest.mark.asyncio
+    async def test_statuses_reads_one_partition(self) -> None:
+        alert_id = uuid.uuid4()
+        session = _CapturingSession(rows=[{"id": alert_id, "status": AlertStatus.SENT}])
+        created_at = datetime(2026, 10, 17, tzinfo=timezone.utc)
+
+        stored = await AlertRepository(session).statuses([str(alert_id)], created_at=created_at)
+
+        assert stored == {alert_id: AlertStatus.SENT}
+        assert "alerts.id = ANY (%(ids)s::UUID[])" in session.statements[0]
+        assert "alerts.created_at = %(created_at_1)s" in session.statements[0]
+
+    @pytest.mark.asyncio
+    async def test_insert_many_empty_is_a_no_op(self) -> None:
+        session = _CapturingSession()
+        assert await AlertRepository(session).insert_many([]) == 0
+        assert session.statements == [] and session.commits == 0
+
+    @pytest.mark.asyncio
+    async def test_set_status_updates_by_id_array(self) -> None:
+        session = _CapturingSession()
+        ids = [str(uuid.uuid4()) for _ in range(5)]
+        updated = await AlertRepository(session).set_status(
+            ids + ids[:1], AlertStatus.SENT, from_status=AlertStatus.PENDING, chunk_size=2
+        )
+
+        assert updated == 5
+        assert len(session.statements) == 3
+        sql = session.statements[0]
+        assert "UPDATE alerts SET status=" in sql
+        assert "sent_at=now()" in sql
+        assert "alerts.id = ANY (%(ids)s::UUID[])" in sql
+        assert "alerts.status = " in sql
+        assert session.params[0]["ids"] == [uuid.UUID(i) for i in ids[:2]]
+        assert session.commits == 3
+
+
+class TestKeysetPages:
+    def _rows(self, count: int) -> list[dict]:
+        return [
+            {"id": uuid.uuid4(), "created_at": datetime(2026, 10, 31 - n, tzinfo=timezone.utc)}
+            for n in range(count)
+        ]
+
+    def test_cursor_round_trip(self) -> None:
+        created_at, row_id = datetime(2026, 10, 1, 8, tzinfo=timezone.utc), uuid.uuid4()
+        assert decode_cursor(encode_cursor(created_at, row_id)) == (created_at, row_id)
+
+    @pytest.mark.parametrize("cursor", ["", "not-a-cursor", "WyIiLCAiIl0"])
+    def test_malformed_cursor(self, cursor: str) -> None:
+        with pytest.raises(ValueError):
+            decode_cursor(cursor)
+
+    @pytest.mark.asyncio
+    async def test_first_page_loads_only_requested_columns(self) -> None:
+        rows = self._rows(3)
+        session = _CapturingSession(rows)
+        page = await ContentRepository(session).page(
+            ["headline"], limit=2, jurisdiction="Denver, CO", status=ContentStatus.DRAFT
+        )
+
+        (sql,) = session.statements
+        assert sql.startswith("SELECT content.id, content.created_at, content.headline \nFROM")
+        assert "content.jurisdiction = " in sql and "content.status = " in sql
+        assert "ORDER BY content.created_at DESC, content.id DESC" in sql
+        # One extra row tells whether another page follows.
+        limit = re.search(r"LIMIT %\((\w+)\)s", sql)[1]
+        assert session.params[0][limit] == 3
+        assert page.items == rows[:2]
+        assert page.next_cursor == encode_cursor(rows[1]["created_at"], rows[1]["id"])
+
+    @pytest.mark.asyncio
+    async def test_next_page_seeks_past_the_cursor(self) -> None:
+        rows = self._rows(1)
+        session = _CapturingSession(rows)
+        cursor = encode_cursor(datetime(2026, 10, 2, tzinfo=timezone.utc), uuid.uuid4())
+        page = await AlertRepository(session).page(
+            ["status"], limit=2, cursor=cursor, priority=AlertPriority.URGENT
+        )
+
+        (sql,) = session.statements
+        assert "alerts.created_at <= " in sql
+        assert "(alerts.created_at, alerts.id) < (" in sql
+        assert "OFFSET" not in sql
+        assert page.items == rows and page.next_cursor is None
@@ -2,12 +2,18 @@
 
 from __future__ import annotations
 
+import asyncio
+
+import pytest
+
 from src.utils.fact_checking import FactCheckResult, check_content
 from src.utils.narrative_construction import (
     build_executive_summary,
     format_for_audience,
     translate_friction_to_impact,
 )
+from src.utils.task_graph import Step, run_steps
+from src.utils.timing import StageTimer
 
 
 class TestTranslateFrictionToImpact:
@@ -74,3 +80,75 @@ class TestFactCheckResult:
         r = FactCheckResult()
         r.unverified.append("bad claim")
         assert r.passed is False
+
+
+class TestStageTimer:
+    def test_accumulates_repeated_stages(self) -> None:
+        timer = StageTimer()
+        for _ in range(3):
+            with timer.stage("fetch"):
+                pass
+        report = timer.as_dict()
+        assert report["fetch"]["count"] == 3
+        assert report["wall"]["seconds"] >= report["fetch"]["seconds"]
+
+
+class TestRunSteps:
+    @pytest.mark.asyncio
+    async def test_independent_steps_overlap(self) -> None:
+        running: list[int] = []
+        peak = 0
+
+        async def _fetch(value: int) -> int:
+            nonlocal peak
+            running.append(value)
+            peak = max(peak, len(running))
+            await asyncio.sleep(0.01)
+            running.remove(value)
+            return value
+
+        timer = StageTimer()
+        results = await run_steps(
+            {"a": Step(lambda: _fetch(1)), "b": Step(lambda: _fetch(2))}, timer
+        )
+
+        assert results == {"a": 1, "b": 2}
+        assert peak == 2
+        assert {"a", "b"} <= set(timer.as_dict())
+
+    @pytest.mark.asyncio
+    async def test_dependent_step_receives_results(self) -> None:
+        async def _base() -> int:
+            return 2
+
+        async def _double(base: int) -> int:
+            return base * 2
+
+        results = await run_steps({"base": Step(_base), "double": Step(_double, after=("base",))})
+        assert results["double"] == 4
+
+    @pytest.mark.asyncio
+    async def test_failure_cancels_other_steps(self) -> None:
+        cancelled = asyncio.Event()
+
+        async def _slow() -> None:
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+
+        async def _boom() -> None:
+            raise RuntimeError("upstream down")
+
+        with pytest.raises(RuntimeError, match="upstream down"):
+            await run_steps({"slow": Step(_slow), "boom": Step(_boom)})
+        assert cancelled.is_set()
+
+    @pytest.mark.asyncio
+    async def test_undeclared_dependency_rejected(self) -> None:
+        async def _step(**_: object) -> None:
+            return None
+
+        with pytest.raises(ValueError):
+            await run_steps({"late": Step(_step, after=("early",)), "early": Step(_step)})
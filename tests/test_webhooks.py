@@ -0,0 +1,74 @@
+"""Tests for webhook ingestion."""
+
+from __future__ import annotations
+
+from typing import Any
+
+import pytest
+from httpx import ASGITransport, AsyncClient
+
+from src.api import webhooks
+from src.api.endpoints import app
+from src.api.webhooks import idempotency_key
+from src.distribution.event_queue import EventQueue
+
+
+class _FakeRedis:
+    """In-memory stand-in for the claim-then-XADD publish script."""
+
+    def __init__(self) -> None:
+        self.claimed: set[str] = set()
+        self.stream: list[dict[str, Any]] = []
+
+    def register_script(self, script: str) -> Any:
+        async def publish_once(keys: list[str], args: list[Any]) -> bytes | None:
+            dedupe_key, _ = keys
+            if dedupe_key in self.claimed:
+                return None
+            self.claimed.add(dedupe_key)
+            self.stream.append({"source": args[2], "payload": args[3]})
+            return f"{len(self.stream)}-0".encode()
+
+        return publish_once
+
+
+class TestIdempotencyKey:
+    def test_prefers_upstream_event_id(self) -> None:
+        assert idempotency_key("housing_ear", {"event_id": "evt_1"}) == "housing_ear:evt_1"
+
+    def test_hash_ignores_key_order(self) -> None:
+        a = idempotency_key("housing_lens", {"event_type": "x", "jurisdiction": "Denver, CO"})
+        b = idempotency_key("housing_lens", {"jurisdiction": "Denver, CO", "event_type": "x"})
+        assert a == b
+        assert a.startswith("housing_lens:sha256:")
+
+    def test_hash_differs_by_source(self) -> None:
+        payload = {"event_type": "x"}
+        assert idempotency_key("housing_lens", payload) != idempotency_key("housing_ear", payload)
+
+
+@pytest.mark.asyncio
+async def test_webhook_rejects_payload_without_event_type() -> None:
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as client:
+        resp = await client.post("/api/v1/webhooks/housing-ear", json={"jurisdiction": "X"})
+    assert resp.status_code == 422
+
+
+@pytest.mark.asyncio
+async def test_duplicate_webhook_is_queued_once(monkeypatch: pytest.MonkeyPatch) -> None:
+    redis = _FakeRedis()
+    monkeypatch.setattr(webhooks, "event_queue", EventQueue(client=redis))  # type: ignore[arg-type]
+    event = {"event_id": "evt_42", "event_type": "policy_update", "jurisdiction": "Denver, CO"}
+
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as client:
+        first = await client.post("/api/v1/webhooks/housing-ear", json=event)
+        second = await client.post("/api/v1/webhooks/housing-ear", json=event)
+
+    assert (first.status_code, second.status_code) == (202, 202)
+    assert first.json()["status"] == "queued"
+    assert first.json()["stream_id"] == "1-0"
+    assert second.json()["status"] == "duplicate"
+    assert second.json()["idempotency_key"] == "housing_ear:evt_42"
+    assert len(redis.stream) == 1